@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Browser Startup Benchmark
+
+Compare Chrome launch times from an empty profile (cold) and from a copy of
+the scraper's pre-warmed profile template. Times are ScraperBrowser's
+``init_time`` (launching Chrome and connecting chromedriver); the template
+copy is timed separately, and the first navigation to the start page is
+reported too because first-run work in a fresh profile also slows it down.
+
+Examples:
+    python scripts/benchmark_browser_startup.py amazon
+    python scripts/benchmark_browser_startup.py orgill --runs 10 --rebuild
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scrapers.models.config import ScraperConfig
+from src.scrapers.parser.yaml_parser import ScraperConfigParser
+from src.utils.scraping.browser import create_browser
+from src.utils.scraping.profile_template import build_profile_template, get_template_dir
+from src.utils.scraping.scraping import get_profile_dir
+
+CONFIGS_DIR = Path(__file__).parent.parent / "src" / "scrapers" / "configs"
+
+
+def load_config(name_or_path: str) -> ScraperConfig:
+    path = Path(name_or_path)
+    if not path.exists():
+        path = CONFIGS_DIR / f"{name_or_path}.yaml"
+    return ScraperConfigParser().load_from_file(path)
+
+
+def launch(config: ScraperConfig, template: Path | None, headless: bool) -> tuple[float, float]:
+    """Start and quit one browser; returns (init seconds, first navigation seconds)."""
+    suffix = f"bench_{uuid.uuid4().hex[:8]}"
+    browser = create_browser(
+        config.name, headless=headless, profile_suffix=suffix, profile_template=template
+    )
+    try:
+        if template is not None and not browser.templated:
+            raise RuntimeError(f"Template {template} was not used")
+        started = time.perf_counter()
+        browser.get(config.base_url)
+        navigation = time.perf_counter() - started
+        return browser.init_time, navigation
+    finally:
+        browser.quit()
+        shutil.rmtree(get_profile_dir(suffix), ignore_errors=True)
+
+
+def main():
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Compare cold and templated Chrome startup")
+    parser.add_argument("scraper", help="Scraper config name (e.g. amazon) or YAML path")
+    parser.add_argument("--runs", type=int, default=5, help="Launches per mode (default: 5)")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the template first")
+    parser.add_argument("--no-headless", action="store_true", help="Show the Chrome windows")
+    args = parser.parse_args()
+
+    config = load_config(args.scraper)
+    headless = not args.no_headless
+    template = get_template_dir(config.name)
+    if args.rebuild or not template.exists():
+        started = time.perf_counter()
+        build_profile_template(
+            config.name, config.base_url, config.consent_selectors(), headless=headless
+        )
+        print(f"Built template in {time.perf_counter() - started:.2f}s: {template}")
+
+    # Cost of copying the template into a new profile directory
+    copy_times = []
+    for _ in range(args.runs):
+        target = Path(get_profile_dir(f"bench_copy_{uuid.uuid4().hex[:8]}"))
+        started = time.perf_counter()
+        shutil.copytree(template, target)
+        copy_times.append(time.perf_counter() - started)
+        shutil.rmtree(target, ignore_errors=True)
+
+    results: dict[str, list[tuple[float, float]]] = {"cold": [], "template": []}
+    for _ in range(args.runs):
+        results["cold"].append(launch(config, None, headless))
+        results["template"].append(launch(config, template, headless))
+
+    print(f"Scraper: {config.name}  Runs: {args.runs}")
+    print(f"Template copy: median {statistics.median(copy_times) * 1000:.0f} ms")
+    print(f"{'Mode':<10} {'Init s (median)':>16} {'Init s (max)':>13} {'First page s':>13}")
+    medians = {}
+    for mode, launches in results.items():
+        init = [i for i, _ in launches]
+        navigation = statistics.median(n for _, n in launches)
+        medians[mode] = statistics.median(init) + navigation
+        print(f"{mode:<10} {statistics.median(init):>16.2f} {max(init):>13.2f} {navigation:>13.2f}")
+
+    print(
+        f"\nTemplate saves {medians['cold'] - medians['template']:.2f}s per browser "
+        "(init + first page, before the copy time)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Extraction Benchmark
+
+Compare live and snapshot extraction (``extraction: live`` vs
+``extraction: snapshot``) for a scraper's extract fields on one product page.
+Reports WebDriver round trips and time per SKU for each mode, and checks
+that both modes extract the same values.
+
+By default the page is loaded from a saved HTML file and every WebDriver
+command is charged a simulated chromedriver latency, so no browser is
+needed. With --chrome the page is loaded in a real Chrome and the commands
+sent to chromedriver are counted.
+
+Examples:
+    python scripts/benchmark_extraction.py amazon --html saved/amazon_product.html \\
+        --url https://www.amazon.com/dp/B000000000
+    python scripts/benchmark_extraction.py bradley --html page.html --latency-ms 5 --runs 20
+    python scripts/benchmark_extraction.py amazon --chrome --url https://www.amazon.com/dp/B000000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scrapers.actions.handlers.extract import ExtractAction
+from src.scrapers.executor.workflow_executor import WorkflowExecutor
+from src.scrapers.models.config import ScraperConfig
+from src.scrapers.parser.yaml_parser import ScraperConfigParser
+from src.utils.scraping.http_browser import HttpDriver
+
+CONFIGS_DIR = Path(__file__).parent.parent / "src" / "scrapers" / "configs"
+
+
+class SimulatedElement:
+    """Element whose every WebElement call costs one simulated round trip."""
+
+    def __init__(self, driver: SimulatedDriver, element: Any):
+        self._driver = driver
+        self._element = element
+
+    @property
+    def text(self) -> str:
+        self._driver.round_trip()
+        return self._element.text
+
+    def get_attribute(self, name: str) -> str | None:
+        self._driver.round_trip()
+        return self._element.get_attribute(name)
+
+
+class SimulatedDriver:
+    """Chromedriver stand-in over a saved page that charges latency per command."""
+
+    def __init__(self, html: str, url: str, latency: float):
+        self._page = HttpDriver(client=None)
+        self._page.load_html(html, url)
+        self._html = html
+        self._url = url
+        self.latency = latency
+        self.commands = 0
+
+    def round_trip(self) -> None:
+        self.commands += 1
+        time.sleep(self.latency)
+
+    def find_element(self, by: str, value: str) -> SimulatedElement:
+        self.round_trip()
+        return SimulatedElement(self, self._page.find_element(by, value))
+
+    def find_elements(self, by: str, value: str) -> list[SimulatedElement]:
+        self.round_trip()
+        return [SimulatedElement(self, e) for e in self._page.find_elements(by, value)]
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        self.round_trip()
+        return [self._html, self._url]
+
+
+class BenchBrowser:
+    """Minimal browser holder so WorkflowExecutor can run extract steps."""
+
+    def __init__(self, driver: Any):
+        self.driver = driver
+
+    def quit(self) -> None:
+        pass
+
+
+class ChromeCommandCounter:
+    """Counts the commands a Selenium driver sends to chromedriver."""
+
+    def __init__(self, driver: Any):
+        self.commands = 0
+        execute = driver.execute
+
+        def counting_execute(*args: Any, **kwargs: Any) -> Any:
+            self.commands += 1
+            return execute(*args, **kwargs)
+
+        driver.execute = counting_execute
+
+
+def load_config(name_or_path: str) -> ScraperConfig:
+    path = Path(name_or_path)
+    if not path.exists():
+        path = CONFIGS_DIR / f"{name_or_path}.yaml"
+    return ScraperConfigParser().load_from_file(path)
+
+
+def extract_fields(config: ScraperConfig) -> list[str]:
+    """Fields of the config's extract steps (every selector if there are none)."""
+    fields = [
+        field
+        for step in config.workflows
+        if step.action == "extract"
+        for field in (step.params or {}).get("fields", [])
+    ]
+    return fields or [selector.name for selector in config.selectors]
+
+
+def run_mode(
+    config: ScraperConfig, mode: str, driver: Any, fields: list[str], runs: int
+) -> tuple[dict[str, Any], float]:
+    """Run the extract action ``runs`` times and return the results and mean seconds."""
+    mode_config = config.model_copy(update={"extraction": mode})
+    executor = WorkflowExecutor(mode_config, browser=BenchBrowser(driver))
+    action = ExtractAction(executor)
+    start = time.perf_counter()
+    for _ in range(runs):
+        executor.results = {}
+        executor._snapshot = None
+        action.execute({"fields": fields})
+    return executor.results, (time.perf_counter() - start) / runs
+
+
+def main():
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Benchmark live vs snapshot extraction")
+    parser.add_argument("scraper", help="Scraper config name (e.g. amazon) or YAML path")
+    parser.add_argument("--html", help="Saved product page (required without --chrome)")
+    parser.add_argument("--url", default="https://example.com/", help="URL of the page")
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=3.0,
+        help="Simulated chromedriver latency per command (default: 3)",
+    )
+    parser.add_argument("--runs", type=int, default=10, help="Extractions per mode (default: 10)")
+    parser.add_argument("--chrome", action="store_true", help="Load --url in a real Chrome")
+    parser.add_argument("--no-headless", action="store_true", help="Show the Chrome window")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    config = load_config(args.scraper)
+    fields = extract_fields(config)
+
+    browser = None
+    if args.chrome:
+        from src.utils.scraping.browser import create_browser
+
+        browser = create_browser(config.name, headless=not args.no_headless)
+        browser.get(args.url)
+        driver = browser.driver
+        counter: Any = ChromeCommandCounter(driver)
+    elif args.html:
+        html = Path(args.html).read_text(encoding="utf-8", errors="replace")
+        driver = counter = SimulatedDriver(html, args.url, args.latency_ms / 1000)
+    else:
+        parser.error("--html is required unless --chrome is given")
+
+    print(f"Scraper: {config.name}  Fields: {', '.join(fields)}  Runs: {args.runs}")
+    print(f"{'Mode':<10} {'Round trips/SKU':>16} {'ms/SKU':>10}")
+    results = {}
+    try:
+        for mode in ("live", "snapshot"):
+            before = counter.commands
+            results[mode], seconds = run_mode(config, mode, driver, fields, args.runs)
+            trips = (counter.commands - before) / args.runs
+            print(f"{mode:<10} {trips:>16.1f} {seconds * 1000:>10.1f}")
+    finally:
+        if browser is not None:
+            browser.quit()
+
+    mismatches = [f for f in fields if results["live"].get(f) != results["snapshot"].get(f)]
+    if mismatches:
+        print("\nValues differ between modes:")
+        for field in mismatches:
+            print(f"  {field}: live={results['live'].get(field)!r}")
+            print(f"  {' ' * len(field)}  snapshot={results['snapshot'].get(field)!r}")
+        return 1
+    print("\nBoth modes extracted identical values.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Resource Policy Benchmark
+
+Measure what a scraper's ``resource_policy`` saves. Each URL is loaded in
+Chrome with and without the policy (alternating, with the HTTP cache
+disabled); the bytes Chrome received and the time to the load event are
+compared. Scraping runs only report blocked request counts and downloaded
+bytes, because the size and timing of requests that were never made cannot
+be observed - this script measures the savings directly.
+
+Examples:
+    python scripts/benchmark_resource_policy.py amazon --url https://www.amazon.com/dp/B000000000
+    python scripts/benchmark_resource_policy.py bradley \\
+        --url "https://www.bradleycaldwell.com/search?term=035585499741" --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from src.scrapers.models.config import ScraperConfig
+from src.scrapers.parser.yaml_parser import ScraperConfigParser
+from src.utils.scraping.browser import ScraperBrowser, create_browser
+
+CONFIGS_DIR = Path(__file__).parent.parent / "src" / "scrapers" / "configs"
+
+# Milliseconds from navigation start to the end of the load event
+LOAD_TIME_SCRIPT = """
+var entry = performance.getEntriesByType("navigation")[0];
+return entry ? entry.loadEventEnd : null;
+"""
+
+
+def load_config(name_or_path: str) -> ScraperConfig:
+    path = Path(name_or_path)
+    if not path.exists():
+        path = CONFIGS_DIR / f"{name_or_path}.yaml"
+    return ScraperConfigParser().load_from_file(path)
+
+
+def load_page(browser: ScraperBrowser, url: str) -> tuple[int, float, int]:
+    """Load a page until its load event; returns (bytes, load ms, blocked requests)."""
+    browser.driver.get("about:blank")
+    browser.take_network_stats()
+    browser.get(url)
+    # Eager page loads return before the load event
+    load_ms = WebDriverWait(browser.driver, 60, poll_frequency=0.1).until(
+        lambda driver: driver.execute_script(LOAD_TIME_SCRIPT)
+    )
+    stats = browser.take_network_stats()
+    return stats["transferred_bytes"], float(load_ms), sum(stats["blocked_requests"].values())
+
+
+def main():
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Measure the savings of a resource policy")
+    parser.add_argument("scraper", help="Scraper config name (e.g. amazon) or YAML path")
+    parser.add_argument("--url", action="append", required=True, help="Page URL (repeatable)")
+    parser.add_argument("--runs", type=int, default=3, help="Loads per URL and mode (default: 3)")
+    parser.add_argument("--no-headless", action="store_true", help="Show the Chrome windows")
+    args = parser.parse_args()
+
+    config = load_config(args.scraper)
+    blocked_urls = config.resource_policy.blocked_urls()
+    if not blocked_urls:
+        parser.error(f"{config.name} has no active resource_policy")
+
+    browsers = {
+        "unblocked": create_browser(
+            config.name, headless=not args.no_headless, capture_http_status=True
+        ),
+        "policy": create_browser(
+            config.name,
+            headless=not args.no_headless,
+            capture_http_status=True,
+            blocked_urls=blocked_urls,
+        ),
+    }
+    results: dict[str, list[tuple[int, float, int]]] = {mode: [] for mode in browsers}
+    try:
+        for browser in browsers.values():
+            browser.driver.execute_cdp_cmd("Network.enable", {})
+            browser.driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+        for url in args.url:
+            for _ in range(args.runs):
+                for mode, browser in browsers.items():
+                    results[mode].append(load_page(browser, url))
+    finally:
+        for browser in browsers.values():
+            browser.quit()
+
+    print(f"Scraper: {config.name}  URLs: {len(args.url)}  Runs: {args.runs}")
+    print(f"{'Mode':<10} {'KB/page':>10} {'Load ms':>10} {'Blocked/page':>13}")
+    medians = {}
+    for mode, loads in results.items():
+        kb = statistics.median(b for b, _, _ in loads) / 1024
+        ms = statistics.median(t for _, t, _ in loads)
+        blocked = statistics.mean(n for _, _, n in loads)
+        medians[mode] = (kb, ms)
+        print(f"{mode:<10} {kb:>10.0f} {ms:>10.0f} {blocked:>13.1f}")
+
+    saved_kb = medians["unblocked"][0] - medians["policy"][0]
+    saved_ms = medians["unblocked"][1] - medians["policy"][1]
+    print(f"\nSaved per page: {saved_kb:.0f} KB, {saved_ms:.0f} ms to the load event")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
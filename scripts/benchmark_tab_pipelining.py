@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tab Pipelining Benchmark
+
+Scrape the same SKUs with K tabs in one browser and with K browsers of one
+tab each, and compare throughput per gigabyte of Chrome memory. Memory is
+the peak resident size of all Chrome and chromedriver processes started by
+this script, sampled while the SKUs are scraped.
+
+Examples:
+    python scripts/benchmark_tab_pipelining.py amazon
+    python scripts/benchmark_tab_pipelining.py orgill --tabs 4 --skus 123 456 789
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import psutil
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scrapers.models.config import ScraperConfig
+from src.scrapers.parser.yaml_parser import ScraperConfigParser
+from src.scrapers.site_runner import scrape_worker
+from src.scrapers.sku_queue import SKUWorkQueue
+from src.utils.scraping.browser_pool import BrowserPool
+
+CONFIGS_DIR = Path(__file__).parent.parent / "src" / "scrapers" / "configs"
+
+
+def load_config(name_or_path: str) -> ScraperConfig:
+    path = Path(name_or_path)
+    if not path.exists():
+        path = CONFIGS_DIR / f"{name_or_path}.yaml"
+    return ScraperConfigParser().load_from_file(path)
+
+
+def chrome_rss_mb() -> float:
+    """Resident memory of every process started by this script, in megabytes."""
+    total = 0
+    for process in psutil.Process().children(recursive=True):
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            continue
+    return total / 1024 / 1024
+
+
+def run(config: ScraperConfig, skus: list[str], workers: int, tabs: int) -> tuple[float, float]:
+    """Scrape the SKUs; returns (seconds, peak Chrome memory in MB)."""
+    config = config.model_copy(update={"tabs_per_browser": tabs})
+    pool = BrowserPool(
+        config.name,
+        size=workers,
+        spares=0,
+        capture_http_status=config.requires_http_status(),
+        blocked_urls=config.resource_policy.blocked_urls(),
+    )
+    work_queue = SKUWorkQueue(config.name, skus)
+    peak = 0.0
+    done = threading.Event()
+
+    def sample() -> None:
+        nonlocal peak
+        while not done.wait(0.5):
+            peak = max(peak, chrome_rss_mb())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for i in range(workers):
+                executor.submit(
+                    scrape_worker,
+                    config,
+                    f"W{i + 1}",
+                    pool,
+                    work_queue,
+                    lambda message, level: None,
+                    lambda message: None,
+                    lambda *outcome: None,
+                    lambda: None,
+                )
+        elapsed = time.perf_counter() - started
+    finally:
+        done.set()
+        sampler.join()
+        pool.shutdown()
+    return elapsed, peak
+
+
+def main():
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Compare K tabs in one browser with K browsers")
+    parser.add_argument("scraper", help="Scraper config name (e.g. amazon) or YAML path")
+    parser.add_argument("--tabs", type=int, default=3, help="Tabs / browsers (default: 3)")
+    parser.add_argument("--skus", nargs="+", help="SKUs to scrape (default: the test_skus)")
+    args = parser.parse_args()
+
+    config = load_config(args.scraper)
+    skus = args.skus or config.test_skus or []
+    if not skus:
+        print("No SKUs: pass --skus or add test_skus to the scraper config")
+        return 1
+    anti_detection = config.anti_detection
+    if anti_detection and (
+        anti_detection.enable_rate_limiting or anti_detection.enable_session_rotation
+    ):
+        print("Note: rate limiting/session rotation keep this scraper at one tab per browser")
+
+    modes = {
+        "1 browser, 1 tab": (1, 1),
+        f"1 browser, {args.tabs} tabs": (1, args.tabs),
+        f"{args.tabs} browsers": (args.tabs, 1),
+    }
+    print(f"Scraper: {config.name}  SKUs: {len(skus)}")
+    print(f"{'Mode':<22} {'Seconds':>8} {'SKUs/s':>7} {'Peak MB':>8} {'SKUs/s per GB':>14}")
+    for mode, (workers, tabs) in modes.items():
+        elapsed, peak = run(config, skus, workers, tabs)
+        rate = len(skus) / elapsed
+        per_gb = rate / (peak / 1024) if peak else 0.0
+        print(f"{mode:<22} {elapsed:>8.1f} {rate:>7.2f} {peak:>8.0f} {per_gb:>14.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Workflow Lint Tool
+
+Flag fixed sleeps in scraper workflows: ``wait`` steps without ``until`` and
+``wait_after`` without ``wait_until``. Each finding names the page condition
+that can end the wait as soon as the page is ready. Exits with status 1 when
+anything is found, so it can run in CI.
+
+Examples:
+    python scripts/lint_workflows.py
+    python scripts/lint_workflows.py src/scrapers/configs/bradley.yaml
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scrapers.parser.workflow_lint import lint_config_file
+
+CONFIG_DIR = Path(__file__).parent.parent / "src" / "scrapers" / "configs"
+
+
+def main():
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Flag fixed sleeps in scraper workflows")
+    parser.add_argument(
+        "configs", nargs="*", help="Scraper YAML files (default: src/scrapers/configs/*.yaml)"
+    )
+    args = parser.parse_args()
+
+    paths = [Path(p) for p in args.configs] or sorted(CONFIG_DIR.glob("*.yaml"))
+    total = 0
+    for path in paths:
+        for finding in lint_config_file(path):
+            total += 1
+            print(f"{path.name}: step {finding.step} ({finding.action}): {finding.message}")
+            if finding.suggestion:
+                print(f"    -> {finding.suggestion}")
+
+    print(f"{total} finding(s) in {len(paths)} config(s)")
+    sys.exit(1 if total else 0)
+
+
+if __name__ == "__main__":
+    main()
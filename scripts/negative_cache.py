@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Negative Cache Tool
+
+Inspect and purge the cache of site/SKU pairs that ended on a "no results"
+page. Cached pairs are skipped by scraping runs until their TTL expires.
+
+Examples:
+    python scripts/negative_cache.py stats
+    python scripts/negative_cache.py list --site amazon --limit 20
+    python scripts/negative_cache.py purge --expired
+    python scripts/negative_cache.py purge --site amazon --sku 012345678905
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scrapers.negative_cache import NegativeCache
+
+
+def format_time(timestamp: float) -> str:
+    """Format a Unix timestamp for display."""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+
+
+def main():
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(
+        description="Inspect and purge the negative (no results) cache"
+    )
+    parser.add_argument("--db", help="Path to the cache database (default: data/databases)")
+    parser.add_argument(
+        "--ttl-days", type=float, help="TTL used to flag expired entries (default: from settings)"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("stats", help="Show fresh and expired entry counts per site")
+
+    list_parser = subparsers.add_parser("list", help="List cache entries")
+    list_parser.add_argument("--site", "-s", help="Only list entries of this site")
+    list_parser.add_argument("--limit", "-n", type=int, default=50, help="Maximum entries shown")
+    list_parser.add_argument("--json", action="store_true", help="Output JSON")
+
+    purge_parser = subparsers.add_parser("purge", help="Delete cache entries")
+    purge_parser.add_argument("--site", "-s", help="Only delete entries of this site")
+    purge_parser.add_argument("--sku", help="Only delete entries of this SKU")
+    purge_parser.add_argument("--expired", action="store_true", help="Only delete expired entries")
+    purge_parser.add_argument(
+        "--all", action="store_true", help="Delete every entry (required without other filters)"
+    )
+
+    args = parser.parse_args()
+
+    ttl_days = args.ttl_days
+    if ttl_days is None:
+        from src.core.settings_manager import settings
+
+        ttl_days = settings.get("negative_cache_ttl_days", 14)
+
+    cache = NegativeCache(args.db, ttl_days=ttl_days)
+    try:
+        if args.command == "stats":
+            stats = cache.get_stats()
+            if not stats:
+                print("Negative cache is empty.")
+            for site, counts in stats.items():
+                print(f"{site}: {counts['fresh']} fresh, {counts['expired']} expired")
+
+        elif args.command == "list":
+            entries = cache.entries(args.site)[: args.limit]
+            if args.json:
+                print(json.dumps(entries, indent=2))
+                return
+            for entry in entries:
+                status = "expired" if entry["expired"] else "fresh"
+                print(
+                    f"{entry['site']:<20} {entry['sku']:<20} last seen "
+                    f"{format_time(entry['last_seen'])} ({entry['hits']}x, {status})"
+                )
+
+        elif args.command == "purge":
+            if not (args.site or args.sku or args.expired or args.all):
+                parser.error("purge needs --site, --sku, --expired or --all")
+            deleted = cache.purge(site=args.site, sku=args.sku, expired_only=args.expired)
+            print(f"Deleted {deleted} entries")
+    finally:
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -15,9 +15,10 @@ from selenium.webdriver.common.by import By
 
 from src.core.adaptive_retry_strategy import AdaptiveRetryStrategy, FailureContext
 from src.core.captcha_solver import CaptchaSolver, CaptchaSolverConfig
+from src.core.domain_rate_limiter import DomainRateLimiter, get_domain_limiter
 from src.core.failure_analytics import FailureAnalytics
 from src.core.failure_classifier import FailureClassifier, FailureType
-from src.utils.scraping.browser import ScraperBrowser, create_browser
+from src.utils.scraping.browser import ScraperBrowser, create_browser, no_implicit_wait
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +83,15 @@ class AntiDetectionConfig(BaseModel):
     )
     rate_limit_min_delay: float = Field(1.0, description="Minimum delay for rate limiting")
     rate_limit_max_delay: float = Field(5.0, description="Maximum delay for rate limiting")
+    requests_per_minute: float | None = Field(
+        None,
+        description="Request budget per domain shared by all workers "
+        "(None paces each worker on its own with the rate limit delays)",
+    )
+    rate_limit_burst: int = Field(1, description="Requests a domain may receive back to back")
+    max_concurrent_sessions: int | None = Field(
+        None, description="Maximum workers scraping the site at the same time"
+    )
     human_simulation_enabled: bool = Field(
         True, description="Enable human simulation (legacy alias)"
     )
@@ -109,6 +119,8 @@ class AntiDetectionManager:
         browser: ScraperBrowser,
         config: AntiDetectionConfig,
         site_name: str = "unknown",
+        domain: str | None = None,
+        failure_analytics: FailureAnalytics | None = None,
     ):
         """
         Initialize the anti-detection manager.
@@ -117,6 +129,8 @@ class AntiDetectionManager:
             browser: ScraperBrowser instance
             config: AntiDetectionConfig with module settings
             site_name: Name of the site being scraped (for adaptive learning)
+            domain: Domain whose request budget is shared with other workers (defaults to site_name)
+            failure_analytics: Analytics shared with other workers on the site (created if None)
         """
         self.browser = browser
         self.config = config
@@ -131,7 +145,7 @@ class AntiDetectionManager:
         )
 
         # Initialize failure analytics
-        self.failure_analytics = FailureAnalytics()
+        self.failure_analytics = failure_analytics or FailureAnalytics()
 
         # Initialize modules
         self.captcha_solver = (
@@ -151,8 +165,16 @@ class AntiDetectionManager:
                 FailureType.RATE_LIMITED, self.site_name
             )
 
+        # Shared by every manager (worker) scraping the same domain in this process
+        self.domain_limiter = get_domain_limiter(
+            domain or site_name,
+            requests_per_second=self._shared_request_rate(),
+            burst=config.rate_limit_burst,
+            max_concurrent_sessions=config.max_concurrent_sessions,
+        )
+
         self.rate_limiter = (
-            RateLimiter(self.config, rate_limit_adaptive_config)
+            RateLimiter(self.config, rate_limit_adaptive_config, self.domain_limiter)
             if config.enable_rate_limiting
             else None
         )
@@ -227,7 +249,7 @@ class AntiDetectionManager:
             # Apply rate limiting
             if self.rate_limiter and not skip_rate_limit_check:
                 start_time = time.time()
-                self.rate_limiter.apply_delay(self.browser.driver)
+                self.rate_limiter.apply_delay(self.browser.driver, action)
                 delay_duration = time.time() - start_time
                 if delay_duration > SIGNIFICANT_DELAY_THRESHOLD:  # Only log significant delays
                     logger.debug(f"Rate limiter applied {delay_duration:.2f}s delay")
@@ -240,12 +262,14 @@ class AntiDetectionManager:
             if self.blocking_handler and self._should_check_blocking(action):
                 if self.blocking_handler.detect_blocking(self.browser.driver):
                     logger.warning("Blocking page detected, attempting recovery")
+                    self._record_detection_event()
                     return self.blocking_handler.handle_blocking(self.browser.driver)
 
             # Check for CAPTCHA before proceeding
             if self.captcha_detector and self._should_check_captcha(action):
                 if self.captcha_detector.detect_captcha(self.browser.driver):
                     logger.warning("CAPTCHA detected, attempting resolution")
+                    self._record_detection_event()
                     return self.captcha_detector.handle_captcha(self.browser.driver)
 
             # Check session rotation
@@ -475,6 +499,24 @@ class AntiDetectionManager:
             logger.error(f"Error handling failed: {e}")
             return False
 
+    def _shared_request_rate(self) -> float | None:
+        """
+        Requests per second allowed for the whole domain, or None when unpaced.
+
+        Only an explicit requests_per_minute is shared: a rate derived from the
+        per-worker delays would be split between however many workers run.
+        """
+        if self.config.requests_per_minute:
+            return self.config.requests_per_minute / 60.0
+        return None
+
+    def _record_detection_event(self) -> None:
+        """Count a detection against the current browser so a pool can retire it."""
+        try:
+            self.browser.detection_events += 1
+        except Exception:
+            pass
+
     def _should_check_captcha(self, action: str) -> bool:
         """Determine if CAPTCHA check should be performed for this action."""
         return action in ["navigate", "click", "input_text", "login"]
@@ -494,14 +536,15 @@ class CaptchaDetector:
     def detect_captcha(self, driver) -> bool:
         """Detect if a CAPTCHA is present on the page."""
         try:
-            for selector in self.config.captcha_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        logger.info(f"CAPTCHA detected using selector: {selector}")
-                        return True
-                except Exception:
-                    continue
+            with no_implicit_wait(driver):
+                for selector in self.config.captcha_selectors:
+                    try:
+                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                        if elements:
+                            logger.info(f"CAPTCHA detected using selector: {selector}")
+                            return True
+                    except Exception:
+                        continue
             return False
         except Exception as e:
             logger.error(f"CAPTCHA detection failed: {e}")
@@ -562,9 +605,18 @@ class CaptchaDetector:
 class RateLimiter:
     """Manages rate limiting with intelligent delays."""
 
-    def __init__(self, config: AntiDetectionConfig, adaptive_config=None):
+    # Actions that send a request to the site and take a token from the domain budget
+    REQUEST_ACTIONS = frozenset({"navigate", "click", "login"})
+
+    def __init__(
+        self,
+        config: AntiDetectionConfig,
+        adaptive_config=None,
+        domain_limiter: DomainRateLimiter | None = None,
+    ):
         self.config = config
         self.adaptive_config = adaptive_config
+        self.domain_limiter = domain_limiter
         self.last_request_time: float = 0.0
         self.consecutive_failures = 0
 
@@ -572,14 +624,15 @@ class RateLimiter:
         """Detect if current page indicates rate limiting."""
         try:
             # Check selectors
-            for selector in self.config.rate_limiting_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        logger.info(f"Rate limiting detected using selector: {selector}")
-                        return True
-                except Exception:
-                    continue
+            with no_implicit_wait(driver):
+                for selector in self.config.rate_limiting_selectors:
+                    try:
+                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                        if elements:
+                            logger.info(f"Rate limiting detected using selector: {selector}")
+                            return True
+                    except Exception:
+                        continue
 
             # Check page content for text patterns
             page_text = driver.page_source.lower()
@@ -597,8 +650,26 @@ class RateLimiter:
             logger.error(f"Rate limiting detection failed: {e}")
             return False
 
-    def apply_delay(self, driver=None) -> None:
-        """Apply appropriate delay before next request using adaptive strategies."""
+    def _delay_range(self, is_ci: bool) -> tuple[float, float]:
+        """Minimum and maximum delay from the adaptive config, capped in CI."""
+        if self.adaptive_config is not None:
+            return float(self.adaptive_config.base_delay), float(self.adaptive_config.max_delay)
+        # Use reduced delays in CI environment to prevent timeouts
+        if is_ci:
+            return (
+                float(min(self.config.rate_limit_min_delay, 0.5)),  # Cap at 0.5s
+                float(min(self.config.rate_limit_max_delay, 2.0)),  # Cap at 2.0s
+            )
+        return float(self.config.rate_limit_min_delay), float(self.config.rate_limit_max_delay)
+
+    def apply_delay(self, driver=None, action: str | None = None) -> None:
+        """
+        Apply appropriate delay before next request using adaptive strategies.
+
+        Args:
+            driver: WebDriver whose page is checked for rate limiting
+            action: Workflow action about to run (None for an explicit rate_limit step)
+        """
         is_ci = os.getenv("CI") == "true"
         # Check for rate limiting indicators on the page before applying delay
         if driver and self.detect_rate_limiting(driver):
@@ -608,27 +679,33 @@ class RateLimiter:
                 extended_delay = float(self.adaptive_config.max_delay)
             else:
                 extended_delay = float(self.config.rate_limit_max_delay * 3)  # 3x normal max delay
-            time.sleep(extended_delay)
+            if self.domain_limiter:
+                # Hold back every worker on this domain, not just this one
+                self.domain_limiter.pause(extended_delay)
+                self.domain_limiter.acquire()
+            else:
+                time.sleep(extended_delay)
             self.consecutive_failures += 1  # Treat as failure to increase future delays
             self.last_request_time = time.time()
             return
 
+        if self.domain_limiter and self.domain_limiter.requests_per_second:
+            # Pace requests against the domain's shared token bucket; steps that
+            # stay on the loaded page (waits, extraction) cost nothing
+            if action is not None and action not in self.REQUEST_ACTIONS:
+                return
+            self.domain_limiter.acquire()
+            if self.consecutive_failures > 0:
+                # After failures this worker also backs off on its own
+                min_delay, _ = self._delay_range(is_ci)
+                time.sleep(random.uniform(0, min_delay) * float(2**self.consecutive_failures))
+            self.last_request_time = time.time()
+            return
+
         current_time = time.time()
         time_since_last = current_time - self.last_request_time
 
-        # Get adaptive configuration if available
-        min_delay: float
-        max_delay: float
-        if self.adaptive_config is not None:
-            min_delay = float(self.adaptive_config.base_delay)
-            max_delay = float(self.adaptive_config.max_delay)
-        # Use reduced delays in CI environment to prevent timeouts
-        elif is_ci:
-            min_delay = float(min(self.config.rate_limit_min_delay, 0.5))  # Cap at 0.5s
-            max_delay = float(min(self.config.rate_limit_max_delay, 2.0))  # Cap at 2.0s
-        else:
-            min_delay = float(self.config.rate_limit_min_delay)
-            max_delay = float(self.config.rate_limit_max_delay)
+        min_delay, max_delay = self._delay_range(is_ci)
 
         # Increase delay based on consecutive failures
         if self.consecutive_failures > 0:
@@ -750,14 +827,15 @@ class BlockingHandler:
     def detect_blocking(self, driver) -> bool:
         """Detect if current page is a blocking page."""
         try:
-            for selector in self.config.blocking_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        logger.info(f"Blocking page detected using selector: {selector}")
-                        return True
-                except Exception:
-                    continue
+            with no_implicit_wait(driver):
+                for selector in self.config.blocking_selectors:
+                    try:
+                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                        if elements:
+                            logger.info(f"Blocking page detected using selector: {selector}")
+                            return True
+                    except Exception:
+                        continue
 
             # Check page title/content for blocking indicators
             title = driver.title.lower()
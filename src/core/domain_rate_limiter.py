@@ -0,0 +1,176 @@
+"""
+Process-wide rate limiting shared by every worker scraping the same domain.
+
+Each AntiDetectionManager keeps its own RateLimiter for jitter and page-level
+rate-limit detection, but the request budget for a site has to be shared:
+four workers pacing themselves independently send four times the intended
+rate. DomainRateLimiter is a token bucket plus a concurrent-session cap, and
+get_domain_limiter hands out one instance per domain for the whole process.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class DomainRateLimiter:
+    """Token bucket and concurrency cap for one domain."""
+
+    def __init__(
+        self,
+        domain: str,
+        requests_per_second: float | None = None,
+        burst: int = 1,
+        max_concurrent_sessions: int | None = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            domain: Domain the limiter guards
+            requests_per_second: Sustained request rate for the domain (None disables pacing)
+            burst: Number of requests that may be sent back to back
+            max_concurrent_sessions: Maximum workers scraping the domain at once (None is unlimited)
+        """
+        self.domain = domain
+        self.requests_per_second = requests_per_second
+        self.burst = max(1, burst)
+        self.max_concurrent_sessions = max_concurrent_sessions
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._sessions = (
+            threading.BoundedSemaphore(max_concurrent_sessions) if max_concurrent_sessions else None
+        )
+
+        self.stats: dict[str, Any] = {"requests": 0, "waited_seconds": 0.0, "pauses": 0}
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.requests_per_second)
+
+    def acquire(self) -> float:
+        """
+        Take a token for one request, waiting until the domain allows it.
+
+        Tokens are reserved under the lock and the wait happens outside it, so
+        concurrent workers queue up fairly instead of waking together.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.requests_per_second:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1.0
+            wait = max(0.0, -self._tokens / self.requests_per_second)
+            wait = max(wait, self._paused_until - now)
+            self.stats["requests"] += 1
+            self.stats["waited_seconds"] += wait
+
+        if wait > 0:
+            logger.debug(f"[{self.domain}] Waiting {wait:.2f}s for rate limit token")
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold every worker on this domain for a while (e.g. after a rate-limit page).
+
+        Args:
+            seconds: How long to pause requests to the domain
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self.stats["pauses"] += 1
+        logger.info(f"[{self.domain}] Pausing all workers for {seconds:.1f}s")
+
+    @contextmanager
+    def session(self) -> Iterator[None]:
+        """Hold one of the domain's concurrent session slots for the duration."""
+        if self._sessions is None:
+            yield
+            return
+
+        start = time.monotonic()
+        self._sessions.acquire()
+        waited = time.monotonic() - start
+        if waited > 0.1:
+            logger.debug(f"[{self.domain}] Waited {waited:.2f}s for a session slot")
+        try:
+            yield
+        finally:
+            self._sessions.release()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get limiter statistics."""
+        with self._lock:
+            return {
+                "domain": self.domain,
+                "requests_per_second": self.requests_per_second,
+                "max_concurrent_sessions": self.max_concurrent_sessions,
+                **self.stats,
+            }
+
+
+_limiters: dict[str, DomainRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def domain_from_url(url: str, default: str = "unknown") -> str:
+    """Extract the domain used as limiter key from a URL."""
+    netloc = urlparse(url).netloc.lower()
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+    return netloc or default
+
+
+def get_domain_limiter(
+    domain: str,
+    requests_per_second: float | None = None,
+    burst: int = 1,
+    max_concurrent_sessions: int | None = None,
+) -> DomainRateLimiter:
+    """
+    Get the process-wide limiter for a domain, creating it on first use.
+
+    The first caller's settings win; later callers for the same domain share
+    that limiter, which is what keeps the combined rate of all workers in check.
+
+    Args:
+        domain: Domain to limit
+        requests_per_second: Sustained request rate for the domain
+        burst: Number of requests that may be sent back to back
+        max_concurrent_sessions: Maximum workers scraping the domain at once
+
+    Returns:
+        The shared DomainRateLimiter
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(domain)
+        if limiter is None:
+            limiter = DomainRateLimiter(domain, requests_per_second, burst, max_concurrent_sessions)
+            _limiters[domain] = limiter
+            logger.info(
+                f"Domain limiter for {domain}: {requests_per_second or 'unlimited'} req/s, "
+                f"max {max_concurrent_sessions or 'unlimited'} concurrent sessions"
+            )
+        return limiter
+
+
+def reset_domain_limiters() -> None:
+    """Forget every domain limiter (between runs and in tests)."""
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,187 @@
+"""
+Scrape Event Bus
+
+Typed events for a scraping run (logs, status, progress, SKU and worker
+lifecycle, step timings) published from worker threads and delivered to
+consumers in coalesced batches from a single flusher thread.
+
+Publishing only appends to a buffer under a lock, so a slow consumer such as
+the GUI log view can never hold up the workers; it just receives larger
+batches.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class EventType(Enum):
+    """Kinds of events published during a scraping run."""
+
+    LOG = "log"
+    STATUS = "status"
+    PROGRESS = "progress"
+    METRICS = "metrics"
+    WORKER_STARTED = "worker_started"
+    WORKER_STOPPED = "worker_stopped"
+    SKU_STARTED = "sku_started"
+    SKU_FINISHED = "sku_finished"
+    STEP_TIMING = "step_timing"
+
+
+# Only the latest event of these types in a batch is delivered
+COALESCED_TYPES = (EventType.STATUS, EventType.PROGRESS, EventType.METRICS)
+
+# Counter prefix for milliseconds spent in fixed (unconditional) sleeps, by source
+FIXED_SLEEP_COUNTER = "fixed_sleep_ms."
+
+# Counter prefix for requests blocked by the resource policy, by resource type
+BLOCKED_REQUESTS_COUNTER = "blocked_requests."
+
+
+@dataclass
+class ScrapeEvent:
+    """One event of a scraping run."""
+
+    type: EventType
+    message: str = ""
+    level: str = "INFO"
+    scraper: str | None = None
+    worker_id: str | None = None
+    sku: str | None = None
+    status: str | None = None
+    duration: float | None = None
+    data: Any = None
+    timestamp: float = field(default_factory=time.time)
+
+
+class EventCounters:
+    """Thread-safe named counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: dict[str, int] = defaultdict(int)
+
+    def increment(self, name: str, amount: int = 1) -> int:
+        """Add to a counter and return its new value."""
+        with self._lock:
+            self._counts[name] += amount
+            return self._counts[name]
+
+    def get(self, name: str) -> int:
+        """Get the current value of a counter."""
+        with self._lock:
+            return self._counts.get(name, 0)
+
+    def snapshot(self) -> dict[str, int]:
+        """Get a copy of every counter."""
+        with self._lock:
+            return dict(self._counts)
+
+
+class EventBus:
+    """Buffers published events and flushes them to subscribers in batches."""
+
+    def __init__(self, flush_interval: float = 0.2):
+        """
+        Initialize the bus.
+
+        Args:
+            flush_interval: Seconds between batch deliveries
+        """
+        self.flush_interval = flush_interval
+        self.counters = EventCounters()
+
+        self._subscribers: list[Callable[[list[ScrapeEvent]], None]] = []
+        self._buffer: list[ScrapeEvent] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def subscribe(self, callback: Callable[[list[ScrapeEvent]], None]) -> None:
+        """
+        Register a consumer of event batches.
+
+        Args:
+            callback: Called from the flusher thread with each non-empty batch
+        """
+        self._subscribers.append(callback)
+
+    def publish(self, event: ScrapeEvent) -> None:
+        """Queue an event for the next batch and update the counters."""
+        if event.type == EventType.SKU_FINISHED:
+            self.counters.increment(f"sku_finished.{event.status}")
+        elif event.type in (EventType.WORKER_STARTED, EventType.WORKER_STOPPED):
+            self.counters.increment(event.type.value)
+            if event.type == EventType.WORKER_STOPPED and isinstance(event.data, dict):
+                for source, seconds in event.data.get("fixed_sleep_seconds", {}).items():
+                    self.counters.increment(f"{FIXED_SLEEP_COUNTER}{source}", round(seconds * 1000))
+                for resource_type, count in event.data.get("blocked_requests", {}).items():
+                    self.counters.increment(f"{BLOCKED_REQUESTS_COUNTER}{resource_type}", count)
+                if event.data.get("transferred_bytes"):
+                    self.counters.increment("transferred_bytes", event.data["transferred_bytes"])
+                if event.data.get("cache_hit_bytes"):
+                    self.counters.increment("cache_hit_bytes", event.data["cache_hit_bytes"])
+        with self._lock:
+            self._buffer.append(event)
+
+    def start(self) -> "EventBus":
+        """Start the background flusher thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="event-bus", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Deliver everything published so far as one batch.
+
+        Returns:
+            Number of events delivered
+        """
+        with self._flush_lock:
+            with self._lock:
+                events, self._buffer = self._buffer, []
+            if not events:
+                return 0
+
+            batch = self._coalesce(events)
+            for subscriber in self._subscribers:
+                try:
+                    subscriber(batch)
+                except Exception as e:
+                    logger.warning(f"Event subscriber failed: {e}")
+            return len(batch)
+
+    @staticmethod
+    def _coalesce(events: list[ScrapeEvent]) -> list[ScrapeEvent]:
+        """Drop all but the latest status/progress/metrics event, keeping order."""
+        latest: dict[EventType, int] = {}
+        for index, event in enumerate(events):
+            if event.type in COALESCED_TYPES:
+                latest[event.type] = index
+        return [
+            event
+            for index, event in enumerate(events)
+            if event.type not in COALESCED_TYPES or latest[event.type] == index
+        ]
+
+    def close(self) -> None:
+        """Stop the flusher thread and deliver any remaining events."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
@@ -198,6 +198,8 @@ class FailureAnalytics:
         with self._lock:
             metrics = self._site_metrics[site_name]
             metrics.total_requests += 1
+            metrics.failure_rate = metrics.total_failures / metrics.total_requests
+            metrics.success_rate = 1.0 - metrics.failure_rate
             if duration:
                 # Update rolling average duration
                 metrics.avg_duration = (
@@ -217,6 +219,26 @@ class FailureAnalytics:
         with self._lock:
             return self._site_metrics[site_name]
 
+    def get_recent_failure_counts(self, site_name: str, since: float) -> dict[FailureType, int]:
+        """
+        Count a site's failures by type since a point in time.
+
+        Args:
+            site_name: Name of the site
+            since: Unix timestamp; only failures recorded at or after it are counted
+
+        Returns:
+            Dictionary mapping failure types to their counts
+        """
+        counts: dict[FailureType, int] = defaultdict(int)
+        with self._lock:
+            for record in reversed(self._records):
+                if record.timestamp < since:
+                    break
+                if record.site_name == site_name:
+                    counts[record.failure_type] += 1
+        return dict(counts)
+
     def get_all_site_metrics(self) -> dict[str, SiteMetrics]:
         """
         Get metrics for all sites.
@@ -19,6 +19,8 @@ from selenium.common.exceptions import (
 )
 from selenium.webdriver.common.by import By
 
+from src.utils.scraping.browser import no_implicit_wait
+
 logger = logging.getLogger(__name__)
 
 
@@ -427,13 +429,15 @@ class FailureClassifier:
     def _check_selectors(self, driver, selectors: list[str]) -> float:
         """Check if any of the selectors are present on the page."""
         try:
-            for selector in selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        return 0.8  # High confidence for *any* selector match (adjusted from 0.9)
-                except Exception:
-                    continue
+            with no_implicit_wait(driver):
+                for selector in selectors:
+                    try:
+                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                        if elements:
+                            # High confidence for *any* selector match (adjusted from 0.9)
+                            return 0.8
+                    except Exception:
+                        continue
             return 0.0
         except Exception:
             return 0.0
@@ -49,6 +49,26 @@ class SettingsManager:
         "auto_scroll_logs": True,
         "theme": "dark",  # 'dark' or 'light'
         "max_workers": 2,  # Number of concurrent scrapers
+        "browser_pool_spares": 1,  # Warm spare browsers kept per scraper
+        "browser_disk_cache_mb": 512,  # Persistent Chrome HTTP cache per scraper (0 disables)
+        "scraper_execution_mode": "thread",  # 'thread' (one process) or 'process' (one per site)
+        "adaptive_concurrency": False,  # Worker counts are ceilings; AIMD picks active workers
+        "site_routing": False,  # Order/skip site-SKU pairs by hit rates learned from journals
+        "routing_min_probability": 0.05,  # Skip pairs less likely than this (top site always kept)
+        "routing_exploration": 0.05,  # Share of skipped pairs scraped anyway to keep learning
+        "routing_history_sessions": 30,  # Most recent session journals to learn from (0 = all)
+        "routing_early_stop_fields": 3,  # Stop once a SKU has this many fields (0 disables)
+        "negative_cache_enabled": True,  # Skip site/SKU pairs recently seen with no results
+        "negative_cache_ttl_days": 14,  # Days a "no results" entry stays valid
+        "negative_cache_recheck_ratio": 0.1,  # Fraction of cached pairs scraped anyway
+        "result_cache_enabled": True,  # Reuse fresh results from earlier runs
+        "result_cache_ttl_hours": 72,  # Default freshness; scraper YAML cache_ttl_hours overrides
+        "product_url_index_enabled": True,  # Open known SKUs from learned product URLs
+        "event_flush_interval_ms": 200,  # How often logs/progress are delivered to the GUI
+        "log_viewer_max_lines": 5000,  # Older log lines are dropped from the log view
+        "stream_results": True,  # Append results to JSONL as they arrive
+        "result_compression": "",  # '', 'gzip' or 'zstd' for the result stream
+        "write_session_json": False,  # Also write scrape_session_*.json at the end of a run
     }
 
     def __init__(self):
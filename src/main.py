@@ -20,6 +20,17 @@ def main():
     parser.add_argument(
         "--file", type=str, help="Path to the Excel file to be processed by the scraper"
     )
+    parser.add_argument(
+        "--execution-mode",
+        type=str,
+        choices=["thread", "process"],
+        help="Run scrapers as threads in one process or with one process per site",
+    )
+    parser.add_argument(
+        "--resume-session",
+        type=str,
+        help="Resume an interrupted scraping session by its session ID",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -53,7 +64,11 @@ def main():
             from src.scrapers.main import run_scraping
 
         if args.file:
-            run_scraping(args.file)
+            run_scraping(
+                args.file,
+                execution_mode=args.execution_mode,
+                resume_session=args.resume_session,
+            )
         else:
             print("Please provide a file path using the --file argument.")
     else:
@@ -1,15 +1,14 @@
 import logging
 import re
-import time
 from typing import Any
 
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
 from src.scrapers.actions.base import BaseAction
 from src.scrapers.actions.registry import ActionRegistry
 from src.scrapers.exceptions import WorkflowExecutionError
+from src.utils.scraping.page_conditions import DEFAULT_QUIET_MS, scroll_into_view
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +35,7 @@ class ClickAction(BaseAction):
 
         # Initial wait for at least one element to be present
         try:
-            WebDriverWait(self.executor.browser.driver, self.executor.timeout).until(
+            self.executor._wait(self.executor.timeout).until(
                 EC.presence_of_element_located((locator_type, selector))
             )
             logger.info("At least one element is present, proceeding to filter and click")
@@ -78,23 +77,25 @@ class ClickAction(BaseAction):
 
             # Scroll element into view if needed
             try:
-                self.executor.browser.driver.execute_script(
-                    "arguments[0].scrollIntoView({block: 'center', inline: 'center'});",
-                    element_to_click,
-                )
-                time.sleep(0.5)  # Brief pause after scrolling
+                scroll_into_view(self.executor.browser.driver, element_to_click)
             except Exception as scroll_e:
                 logger.debug(f"Could not scroll element into view: {scroll_e}")
 
             # Attempt click
+            wait_until = params.get("wait_until")
+            driver = self.executor.browser.driver
+            from_url = driver.current_url if wait_until == "url_changed" else None
             element_to_click.click()
             logger.info(f"Successfully clicked element: {selector} at index {index}")
 
-            # Optional wait after click
-            wait_time = params.get("wait_after", 0)
-            if wait_time > 0:
-                logger.debug(f"Waiting {wait_time}s after click")
-                time.sleep(wait_time)
+            # Optional wait after click, ended early by a wait_until condition
+            self.executor._pause(
+                params.get("wait_after", 0),
+                wait_until,
+                "click wait_after",
+                quiet_ms=params.get("quiet_ms", DEFAULT_QUIET_MS),
+                from_url=from_url,
+            )
 
         except Exception as e:
             raise WorkflowExecutionError(f"Failed to click element after waiting: {e}")
@@ -40,7 +40,9 @@ class ConditionalAction(BaseAction):
             from selenium.webdriver.common.by import By
 
             try:
-                self.executor.browser.driver.find_element(By.CSS_SELECTOR, selector)
+                driver = self.executor.browser.driver
+                with self.executor._fast_miss(driver, params):
+                    driver.find_element(By.CSS_SELECTOR, selector)
                 condition_met = True
             except Exception:
                 condition_met = False
@@ -29,9 +29,9 @@ class ExtractSingleAction(BaseAction):
             raise WorkflowExecutionError(f"Selector '{selector_name}' not found in config")
 
         try:
-            element = self.executor.browser.driver.find_element(
-                By.CSS_SELECTOR, selector_config.selector
-            )
+            root = self.executor._extraction_root()
+            with self.executor._fast_miss(root, params, selector_config):
+                element = root.find_element(By.CSS_SELECTOR, selector_config.selector)
             value = self.executor._extract_value_from_element(element, selector_config.attribute)
             self.executor.results[field_name] = value
             logger.debug(f"Extracted {field_name}: {value}")
@@ -58,9 +58,9 @@ class ExtractMultipleAction(BaseAction):
             raise WorkflowExecutionError(f"Selector '{selector_name}' not found in config")
 
         try:
-            elements = self.executor.browser.driver.find_elements(
-                By.CSS_SELECTOR, selector_config.selector
-            )
+            root = self.executor._extraction_root()
+            with self.executor._fast_miss(root, params, selector_config):
+                elements = root.find_elements(By.CSS_SELECTOR, selector_config.selector)
             values = []
             for element in elements:
                 value = self.executor._extract_value_from_element(
@@ -82,6 +82,12 @@ class ExtractAction(BaseAction):
     def execute(self, params: dict[str, Any]) -> None:
         fields = params.get("fields", [])
         logger.debug(f"Starting extract action for fields: {fields}")
+        script_results = self.executor._extract_fields_in_browser(fields)
+        if script_results is not None:
+            self.executor.results.update(script_results)
+            logger.info(f"Extract action completed. Results: {self.executor.results}")
+            return
+        root = self.executor._extraction_root()
         for field_name in fields:
             selector_config = self.executor.selectors.get(field_name)
             if not selector_config:
@@ -91,9 +97,8 @@ class ExtractAction(BaseAction):
             try:
                 locator_type = self.executor._get_locator_type(selector_config.selector)
                 if selector_config.multiple:
-                    elements = self.executor.browser.driver.find_elements(
-                        locator_type, selector_config.selector
-                    )
+                    with self.executor._fast_miss(root, params, selector_config):
+                        elements = root.find_elements(locator_type, selector_config.selector)
                     values = []
                     for element in elements:
                         value = self.executor._extract_value_from_element(
@@ -110,9 +115,8 @@ class ExtractAction(BaseAction):
                             deduplicated_values.append(value)
                     self.executor.results[field_name] = deduplicated_values
                 else:
-                    element = self.executor.browser.driver.find_element(
-                        locator_type, selector_config.selector
-                    )
+                    with self.executor._fast_miss(root, params, selector_config):
+                        element = root.find_element(locator_type, selector_config.selector)
                     value = self.executor._extract_value_from_element(
                         element, selector_config.attribute
                     )
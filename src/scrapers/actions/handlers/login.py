@@ -54,28 +54,33 @@ class LoginAction(BaseAction):
             logger.warning(f"Missing credentials for {scraper_name}, skipping login")
             return
 
-        logger.info(f"Logging in to {scraper_name} at {login_url}")
+        success_indicator = params.get("success_indicator")
 
-        # Navigate
-        self.executor._action_navigate({"url": login_url})
+        def submit_login() -> None:
+            logger.info(f"Logging in to {scraper_name} at {login_url}")
 
-        # Input username
-        username_field = params.get("username_field")
-        if username_field:
-            self.executor._action_input_text({"selector": username_field, "text": username})
+            # Navigate
+            self.executor._action_navigate({"url": login_url})
 
-        # Input password
-        password_field = params.get("password_field")
-        if password_field:
-            self.executor._action_input_text({"selector": password_field, "text": password})
+            # Input username
+            username_field = params.get("username_field")
+            if username_field:
+                self.executor._action_input_text({"selector": username_field, "text": username})
 
-        # Click submit
-        submit_button = params.get("submit_button")
-        if submit_button:
-            self.executor._action_click({"selector": submit_button})
+            # Input password
+            password_field = params.get("password_field")
+            if password_field:
+                self.executor._action_input_text({"selector": password_field, "text": password})
 
-        # Wait for success
-        success_indicator = params.get("success_indicator")
-        if success_indicator:
-            self.executor._action_wait_for({"selector": success_indicator, "timeout": 15})
-            logger.info("Login successful")
+            # Click submit
+            submit_button = params.get("submit_button")
+            if submit_button:
+                self.executor._action_click({"selector": submit_button})
+
+            # Wait for success
+            if success_indicator:
+                self.executor._action_wait_for({"selector": success_indicator, "timeout": 15})
+                logger.info("Login successful")
+
+        # Reuse this browser's session or the site's stored cookies when possible
+        self.executor._login_session(success_indicator, submit_login)
@@ -1,10 +1,10 @@
 import logging
-import time
 from typing import Any
 
 from src.scrapers.actions.base import BaseAction
 from src.scrapers.actions.registry import ActionRegistry
 from src.scrapers.exceptions import WorkflowExecutionError
+from src.utils.scraping.page_conditions import DEFAULT_QUIET_MS
 
 logger = logging.getLogger(__name__)
 
@@ -25,10 +25,14 @@ class NavigateAction(BaseAction):
         if self.executor.config.http_status and self.executor.config.http_status.enabled:
             self.executor._check_http_status_after_navigation(url, params)
 
-        # Optional wait after navigation
-        wait_time = params.get("wait_after", 0)
-        if wait_time > 0:
-            time.sleep(wait_time)
+        # Optional wait after navigation, ended early by a wait_until condition
+        # (static HTTP pages are complete on arrival)
+        self.executor._pause(
+            params.get("wait_after", 0),
+            params.get("wait_until"),
+            "navigate wait_after",
+            quiet_ms=params.get("quiet_ms", DEFAULT_QUIET_MS),
+        )
 
         # Mark that first navigation is done
         self.executor.first_navigation_done = True
@@ -1,18 +1,27 @@
 import logging
-import time
 from typing import Any
 
 from src.scrapers.actions.base import BaseAction
 from src.scrapers.actions.registry import ActionRegistry
+from src.utils.scraping.page_conditions import DEFAULT_QUIET_MS
 
 logger = logging.getLogger(__name__)
 
 
 @ActionRegistry.register("wait")
 class WaitAction(BaseAction):
-    """Action to wait for a specified amount of time."""
+    """Action to wait for a fixed time, or until a page condition holds (``until``)."""
 
     def execute(self, params: dict[str, Any]) -> None:
         seconds = params.get("seconds", params.get("timeout", 1))
-        logger.debug(f"Waiting for {seconds} seconds")
-        time.sleep(seconds)
+        if self.executor.static_pages:
+            logger.debug(f"Skipping {seconds}s wait on a static HTTP page")
+            return
+        logger.debug(f"Waiting up to {seconds} seconds (until: {params.get('until')})")
+        self.executor._pause(
+            seconds,
+            params.get("until"),
+            "wait step",
+            quiet_ms=params.get("quiet_ms", DEFAULT_QUIET_MS),
+            selector=params.get("selector"),
+        )
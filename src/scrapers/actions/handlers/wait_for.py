@@ -2,10 +2,6 @@ import logging
 import time
 from typing import Any
 
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-
 from src.scrapers.actions.base import BaseAction
 from src.scrapers.actions.registry import ActionRegistry
 from src.scrapers.exceptions import WorkflowExecutionError
@@ -15,7 +11,7 @@ logger = logging.getLogger(__name__)
 
 @ActionRegistry.register("wait_for")
 class WaitForAction(BaseAction):
-    """Action to wait for an element to be present."""
+    """Action to wait for any of several elements to be present."""
 
     def execute(self, params: dict[str, Any]) -> None:
         selector_param = params.get("selector")
@@ -31,25 +27,22 @@ class WaitForAction(BaseAction):
         )
 
         start_time = time.time()
+        matched = self.executor._wait_for_any(selectors, timeout)
+        wait_duration = time.time() - start_time
+        if matched is not None:
+            self.executor.wait_match = (selectors, matched)
+            logger.info(f"✅ Element found after {wait_duration:.2f}s: {matched}")
+            return
+
+        logger.warning(
+            f"⏰ TIMEOUT: Element not found within {timeout}s (waited {wait_duration:.2f}s): {selectors}"
+        )
+
+        # Log debugging info
         try:
-            conditions = [
-                EC.presence_of_element_located((self.executor._get_locator_type(s), s))
-                for s in selectors
-            ]
-            WebDriverWait(self.executor.browser.driver, timeout).until(EC.any_of(*conditions))
-            wait_duration = time.time() - start_time
-            logger.info(f"✅ Element found after {wait_duration:.2f}s from selectors: {selectors}")
-        except TimeoutException:
-            wait_duration = time.time() - start_time
-            logger.warning(
-                f"⏰ TIMEOUT: Element not found within {timeout}s (waited {wait_duration:.2f}s): {selectors}"
-            )
-
-            # Log debugging info
-            try:
-                logger.debug(f"Current page URL: {self.executor.browser.driver.current_url}")
-                logger.debug(f"Page title: {self.executor.browser.driver.title}")
-            except Exception:
-                pass
-
-            raise WorkflowExecutionError(f"Element not found within {timeout}s: {selectors}")
+            logger.debug(f"Current page URL: {self.executor.browser.driver.current_url}")
+            logger.debug(f"Page title: {self.executor.browser.driver.title}")
+        except Exception:
+            pass
+
+        raise WorkflowExecutionError(f"Element not found within {timeout}s: {selectors}")
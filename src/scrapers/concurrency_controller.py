@@ -0,0 +1,162 @@
+"""
+Concurrency Controller Module
+
+Additive-increase / multiplicative-decrease (AIMD) control of how many workers
+of a scraper may scrape at once. The worker count chosen in the GUI becomes a
+ceiling: the controller starts low, adds a worker while the site stays healthy
+and latencies hold, and halves the count when rate limiting, access denied or
+CAPTCHA failures spike.
+"""
+
+import statistics
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from src.core.failure_analytics import FailureAnalytics
+from src.core.failure_classifier import FailureType
+
+# Failure types that mean the site is pushing back on our request rate
+BACKOFF_FAILURE_TYPES = (
+    FailureType.RATE_LIMITED,
+    FailureType.ACCESS_DENIED,
+    FailureType.CAPTCHA_DETECTED,
+)
+
+
+class ConcurrencyController:
+    """AIMD controller for the number of active workers on one site."""
+
+    def __init__(
+        self,
+        site_name: str,
+        max_workers: int,
+        failure_analytics: FailureAnalytics,
+        log: Callable[[str, str], None] | None = None,
+        min_workers: int = 1,
+        initial_workers: int = 1,
+        evaluation_interval: float = 30.0,
+        backoff_threshold: int = 2,
+        decrease_factor: float = 0.5,
+        healthy_score: float = 0.8,
+        latency_tolerance: float = 1.5,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            site_name: Name of the site (as recorded in FailureAnalytics)
+            max_workers: Ceiling for active workers (the workers started for the site)
+            failure_analytics: Analytics shared by every executor of the site
+            log: Callback receiving (message, level) for every adjustment
+            min_workers: Floor for active workers
+            initial_workers: Active workers at the start of the run
+            evaluation_interval: Seconds between adjustments
+            backoff_threshold: Backoff failures in one interval that trigger a decrease
+            decrease_factor: Multiplier applied to the worker count on a decrease
+            healthy_score: Minimum FailureAnalytics health score for an increase
+            latency_tolerance: Maximum ratio of median SKU latency to the baseline for an increase
+            clock: Time source (for tests)
+        """
+        self.site_name = site_name
+        self.max_workers = max(1, max_workers)
+        self.min_workers = max(1, min(min_workers, self.max_workers))
+        self.failure_analytics = failure_analytics
+        self.log = log
+        self.evaluation_interval = evaluation_interval
+        self.backoff_threshold = backoff_threshold
+        self.decrease_factor = decrease_factor
+        self.healthy_score = healthy_score
+        self.latency_tolerance = latency_tolerance
+        self.clock = clock
+
+        self.limit = max(self.min_workers, min(initial_workers, self.max_workers))
+        self.active = 0
+        self.baseline_latency: float | None = None
+        self.adjustments: list[dict[str, Any]] = []
+
+        self._condition = threading.Condition()
+        self._latencies: list[float] = []
+        self._window_start = clock()
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """
+        Wait for an active worker slot.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if a slot was taken, False on timeout
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self.active < self.limit, timeout):
+                return False
+            self.active += 1
+            return True
+
+    def release(self) -> None:
+        """Give back an active worker slot."""
+        with self._condition:
+            self.active = max(0, self.active - 1)
+            self._condition.notify()
+
+    def record(self, latency: float) -> None:
+        """
+        Record the latency of one scraped SKU and adjust the limit when an interval ends.
+
+        Args:
+            latency: Seconds the SKU took
+        """
+        with self._condition:
+            self._latencies.append(latency)
+            if self.clock() - self._window_start >= self.evaluation_interval:
+                self._evaluate()
+
+    def _evaluate(self) -> None:
+        """Apply one AIMD step based on the interval that just ended."""
+        now = self.clock()
+        counts = self.failure_analytics.get_recent_failure_counts(
+            self.site_name, self._window_start
+        )
+        backoff_failures = sum(
+            counts.get(failure_type, 0) for failure_type in BACKOFF_FAILURE_TYPES
+        )
+        median_latency = statistics.median(self._latencies) if self._latencies else None
+        health = self.failure_analytics.get_health_score(self.site_name)
+
+        self._latencies = []
+        self._window_start = now
+
+        if median_latency is not None and self.baseline_latency is None:
+            self.baseline_latency = median_latency
+
+        previous = self.limit
+        if backoff_failures >= self.backoff_threshold:
+            self.limit = max(self.min_workers, int(self.limit * self.decrease_factor))
+            reason = f"{backoff_failures} rate limit/access denied/captcha failures"
+        elif (
+            health >= self.healthy_score
+            and median_latency is not None
+            and median_latency <= self.baseline_latency * self.latency_tolerance
+        ):
+            self.limit = min(self.max_workers, self.limit + 1)
+            reason = f"health {health:.2f}, median latency {median_latency:.1f}s"
+        else:
+            return
+
+        if self.limit == previous:
+            return
+
+        self.adjustments.append({"time": now, "from": previous, "to": self.limit, "reason": reason})
+        if self.limit > previous:
+            self._condition.notify(self.limit - previous)
+        if self.log:
+            icon = "📈" if self.limit > previous else "📉"
+            level = "INFO" if self.limit > previous else "WARNING"
+            self.log(
+                f"{icon} {self.site_name}: active workers {previous} → {self.limit} ({reason})",
+                level,
+            )
@@ -7,9 +7,16 @@ import logging
 import random
 import re
 import time
+from collections import Counter
+from collections.abc import Callable
+from contextlib import nullcontext
 from typing import Any
 
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
@@ -21,15 +28,42 @@ from src.core.adaptive_retry_strategy import (
     FailureContext as AdaptiveFailureContext,
 )
 from src.core.anti_detection_manager import AntiDetectionManager
+from src.core.domain_rate_limiter import domain_from_url
 from src.core.failure_analytics import FailureAnalytics
 from src.core.failure_classifier import FailureClassifier, FailureContext, FailureType
 from src.core.settings_manager import SettingsManager
 from src.scrapers.actions.registry import ActionRegistry
 from src.scrapers.models.config import ScraperConfig, WorkflowStep
-from src.utils.scraping.browser import ScraperBrowser, create_browser
+from src.scrapers.product_url_index import ProductUrlIndex
+from src.utils.general.cookies import get_cookie_store, inject_cookies
+from src.utils.scraping.browser import ScraperBrowser, create_browser, no_implicit_wait
+from src.utils.scraping.bulk_extract import bulk_extract
+from src.utils.scraping.http_browser import (
+    BrowserRequiredError,
+    HttpBrowser,
+    create_http_browser,
+)
+from src.utils.scraping.page_conditions import (
+    DEFAULT_QUIET_MS,
+    scroll_into_view,
+    wait_for_any,
+    wait_until,
+)
+from src.utils.scraping.page_snapshot import PageSnapshot
+from src.utils.scraping.profile_template import get_template_dir
 
 logger = logging.getLogger(__name__)
 
+# Actions that read the page without changing it (and can share one DOM snapshot)
+EXTRACT_ACTIONS = frozenset({"extract", "extract_single", "extract_multiple"})
+
+# Actions after which the last wait_for match still describes the page
+WAIT_MATCH_ACTIONS = frozenset({"wait_for", "check_no_results"})
+
+# Actions that may come before the first navigate of a prefetched workflow (they
+# run on the page loading in the tab and do not leave it)
+PREFETCH_SAFE_ACTIONS = frozenset({"conditional_click", "wait"})
+
 
 class WorkflowExecutionError(Exception):
     """Exception raised for workflow execution errors."""
@@ -50,6 +84,9 @@ class WorkflowExecutor:
         config: ScraperConfig,
         headless: bool = True,
         timeout: int | None = None,
+        browser: ScraperBrowser | None = None,
+        failure_analytics: FailureAnalytics | None = None,
+        product_urls: ProductUrlIndex | None = None,
     ):
         """
         Initialize the workflow executor.
@@ -58,11 +95,35 @@ class WorkflowExecutor:
             config: ScraperConfig instance with workflow definition
             headless: Whether to run browser in headless mode
             timeout: Default timeout in seconds (overrides config timeout)
+            browser: Optional pre-started browser (e.g. leased from a BrowserPool)
+            failure_analytics: Optional analytics shared by every worker on the site
+            product_urls: Optional index of learned product URLs; SKUs found in it
+                skip the search and click steps
         """
         self.config = config
+        self.headless = headless
         self.timeout = timeout or config.timeout
-        self.browser: ScraperBrowser
+        self.browser: ScraperBrowser | HttpBrowser
+        self._fallback_browser: ScraperBrowser | None = None  # Chrome for HTTP-engine fallbacks
+        self.http_fallbacks = 0
+        self.fixed_sleeps: dict[str, float] = {}  # Seconds slept unconditionally, by source
+        # (selectors, matched selector) of the last wait_for, until the page may change
+        self.wait_match: tuple[list[str], str] | None = None
+        # Requests blocked by the resource policy, by type, and bytes Chrome received
+        self.blocked_requests: Counter[str] = Counter()
+        self.transferred_bytes = 0
+        self.cache_hit_bytes = 0  # Read from the site's persistent disk cache
+        self.product_urls = product_urls
+        self.product_url: str | None = None  # Page the last click of the run led to
+        self.direct_hits = 0  # SKUs scraped from a learned product URL
+        self.direct_misses = 0  # Learned URLs that failed and fell back to the search path
+        self.logins = 0  # Login forms submitted
+        self.restored_logins = 0  # Browsers logged in from the site's stored session cookies
         self.results = {}  # type: dict[str, Any]
+        # Tabs driven by open_tabs and the context whose first page loads in each
+        self.tabs: list[str] = []
+        self._tab_contexts: dict[str, dict[str, Any]] = {}
+        self._snapshot: PageSnapshot | None = None  # DOM of the current page for extraction
         self.selectors = {selector.name: selector for selector in config.selectors}
         self.anti_detection_manager: AntiDetectionManager | None = None
         self.adaptive_retry_strategy = AdaptiveRetryStrategy(
@@ -78,7 +139,7 @@ class WorkflowExecutor:
             site_specific_no_results_selectors=no_results_selectors,
             site_specific_no_results_text_patterns=no_results_text_patterns,
         )
-        self.failure_analytics = FailureAnalytics()
+        self.failure_analytics = failure_analytics or FailureAnalytics()
         self.settings = SettingsManager()
 
         # Log environment details for debugging
@@ -100,12 +161,24 @@ class WorkflowExecutor:
         try:
             import uuid
 
-            self.browser = create_browser(
-                site_name=self.config.name,
-                headless=headless,
-                profile_suffix=f"workflow_{int(time.time())}_{uuid.uuid4().hex[:8]}",
-            )
-            logger.info(f"Browser initialized for scraper: {self.config.name}")
+            if browser is not None:
+                self.browser = browser
+                logger.info(f"Using provided browser for scraper: {self.config.name}")
+            elif config.engine == "http":
+                self.browser = create_http_browser(self.config.name, timeout=self.timeout)
+                logger.info(f"HTTP engine initialized for scraper: {self.config.name}")
+            else:
+                self.browser = create_browser(
+                    site_name=self.config.name,
+                    headless=headless,
+                    profile_suffix=f"workflow_{int(time.time())}_{uuid.uuid4().hex[:8]}",
+                    capture_http_status=config.requires_http_status(),
+                    blocked_urls=config.resource_policy.blocked_urls(),
+                    profile_template=(
+                        get_template_dir(config.name) if config.profile_template else None
+                    ),
+                )
+                logger.info(f"Browser initialized for scraper: {self.config.name}")
 
             # Log browser capabilities for debugging
             try:
@@ -128,7 +201,11 @@ class WorkflowExecutor:
         if config.anti_detection:
             try:
                 self.anti_detection_manager = AntiDetectionManager(
-                    self.browser, config.anti_detection, config.name
+                    self.browser,
+                    config.anti_detection,
+                    config.name,
+                    domain=domain_from_url(config.base_url, config.name),
+                    failure_analytics=self.failure_analytics,
                 )
                 logger.info(f"Anti-detection manager initialized for scraper: {self.config.name}")
             except Exception as e:
@@ -139,6 +216,296 @@ class WorkflowExecutor:
         self.first_navigation_done = False
         self.workflow_stopped = False
 
+    def attach_browser(self, browser: ScraperBrowser | HttpBrowser) -> None:
+        """
+        Swap the browser used by this executor without rebuilding its state.
+
+        Keeps analytics, retry history and settings loaded, which is what makes
+        recycling a pooled browser cheap compared to creating a new executor.
+
+        Args:
+            browser: The browser to use for subsequent workflow runs
+        """
+        tab_count = len(self.tabs)
+        self.browser = browser
+        if self.anti_detection_manager:
+            self.anti_detection_manager.browser = browser
+        if tab_count > 1:
+            self.open_tabs(tab_count)
+
+    def open_tabs(self, count: int | None = None) -> int:
+        """
+        Drive several tabs of the browser (``tabs_per_browser``).
+
+        Pipelining needs a Chrome browser, and is turned off for scrapers with
+        anti-detection rate limiting or session rotation, which assume one page
+        at a time.
+
+        Args:
+            count: Tabs wanted (defaults to the config's tabs_per_browser)
+
+        Returns:
+            Number of tabs in use (1 when the browser is not pipelined)
+        """
+        count = count or self.config.tabs_per_browser
+        self.tabs = []
+        self._tab_contexts = {}
+        if count <= 1 or self.static_pages:
+            return 1
+        manager = self.anti_detection_manager
+        if manager and (manager.rate_limiter or manager.session_manager):
+            logger.warning(
+                f"{self.config.name}: tabs_per_browser={count} ignored, anti-detection rate "
+                "limiting and session rotation need one tab"
+            )
+            return 1
+        try:
+            self.tabs = self.browser.open_tabs(count)
+        except Exception as e:
+            logger.warning(f"Could not open {count} tabs for {self.config.name}, using one: {e}")
+            self.tabs = []
+            return 1
+        return len(self.tabs)
+
+    def prefetch(self, context: dict[str, Any]) -> bool:
+        """
+        Start loading the first page of a context's workflow in a free tab.
+
+        ``execute_workflow`` with the same context later runs in that tab, so
+        the page loads while the current tab is being extracted. Steps only
+        see their own tab; results are kept per run as without tabs.
+
+        Args:
+            context: Context the workflow will run with (e.g. {'sku': '123'})
+
+        Returns:
+            True if a navigation was started
+        """
+        free = [tab for tab in self.tabs if tab not in self._tab_contexts]
+        url = self._first_navigation(context) if free else None
+        if url is None:
+            return False
+        try:
+            self.browser.switch_tab(free[0])
+            self.browser.prefetch(url)
+        except Exception as e:
+            logger.debug(f"Could not prefetch {url}: {e}")
+            return False
+        self._tab_contexts[free[0]] = context
+        return True
+
+    def _first_navigation(self, context: dict[str, Any]) -> str | None:
+        """URL the workflow for a context opens first, if nothing before it leaves the page."""
+        steps = self.config.workflows
+        sku = context.get("sku")
+        if self.product_urls is not None and sku:
+            product_url = self.product_urls.get(self.config.name, sku)
+            steps = (self._direct_workflow(product_url) if product_url else None) or steps
+        for step in steps:
+            action = step.action.lower()
+            if action == "navigate":
+                url = (step.params or {}).get("url")
+                return self._substitute_variables(url, context) if url else None
+            if action not in PREFETCH_SAFE_ACTIONS:
+                return None
+        return None
+
+    def _select_tab(self, context: dict[str, Any] | None) -> None:
+        """Switch to the tab prefetched for a context, or to a free one."""
+        if not self.tabs:
+            return
+        tab = next((t for t, c in self._tab_contexts.items() if c == context), None)
+        if tab is not None:
+            del self._tab_contexts[tab]
+        else:
+            free = [t for t in self.tabs if t not in self._tab_contexts]
+            tab = free[0] if free else self.tabs[0]
+        self.browser.switch_tab(tab)
+
+    @property
+    def static_pages(self) -> bool:
+        """Whether pages come from the HTTP engine and never change after loading."""
+        return isinstance(self.browser, HttpBrowser)
+
+    def _wait(self, timeout: float) -> WebDriverWait:
+        """
+        Create a WebDriverWait for the current page.
+
+        Static HTTP pages are checked once instead of polled until the timeout,
+        so a selector missing from the server-rendered HTML fails immediately.
+        """
+        if self.static_pages:
+            return WebDriverWait(self.browser.driver, 0, poll_frequency=0.01)
+        return WebDriverWait(self.browser.driver, timeout)
+
+    def _sleep(self, seconds: float, source: str) -> None:
+        """
+        Sleep for a fixed time and record it in the fixed-sleep report.
+
+        Args:
+            seconds: Seconds to sleep
+            source: What the sleep is for (e.g. "wait step", "click wait_after")
+        """
+        if seconds <= 0:
+            return
+        self.fixed_sleeps[source] = self.fixed_sleeps.get(source, 0.0) + seconds
+        time.sleep(seconds)
+
+    def _pause(
+        self,
+        seconds: float,
+        until: str | None,
+        source: str,
+        quiet_ms: int = DEFAULT_QUIET_MS,
+        selector: str | None = None,
+        from_url: str | None = None,
+    ) -> None:
+        """
+        Wait for up to ``seconds``, returning early once ``until`` holds.
+
+        Without a condition this is a fixed sleep. Static HTTP pages are
+        complete on arrival, so nothing is waited for.
+
+        Args:
+            seconds: Maximum seconds to wait
+            until: Page condition (see page_conditions.CONDITIONS) or None
+            source: What the wait is for, used in the fixed-sleep report
+            quiet_ms: Quiet period for the stable/idle conditions
+            selector: Selector for element_count_stable
+            from_url: Starting URL for url_changed
+        """
+        if seconds <= 0 or self.static_pages:
+            return
+        if not until:
+            self._sleep(seconds, source)
+            return
+        try:
+            wait_until(
+                self.browser.driver,
+                until,
+                seconds,
+                quiet_ms=quiet_ms,
+                selector=selector,
+                from_url=from_url,
+            )
+        except ValueError as e:
+            raise WorkflowExecutionError(str(e))
+
+    def _extraction_root(self) -> Any:
+        """
+        Get what extract actions look up selectors on.
+
+        With ``extraction: snapshot`` this is a PageSnapshot of the current page,
+        taken on the first extract step and reused until a non-extract step runs.
+        Otherwise (and on HTTP-engine pages, which are parsed already) it is the
+        live driver.
+        """
+        if self.config.extraction != "snapshot" or self.static_pages:
+            return self.browser.driver
+        if self._snapshot is None:
+            try:
+                self._snapshot = PageSnapshot.capture(self.browser.driver)
+            except Exception as e:
+                logger.warning(f"DOM snapshot failed, extracting from the live page: {e}")
+                return self.browser.driver
+        return self._snapshot
+
+    def _fast_miss(self, root: Any, params: dict[str, Any], selector_config: Any = None):
+        """
+        Get a context for element lookups on root that may miss immediately.
+
+        Lookups skip the implicit wait when the step has ``optional: true`` or
+        ``wait: 0`` or the selector has ``optional: true``. Snapshots and
+        HTTP-engine pages never wait, so they get a no-op context.
+
+        Args:
+            root: What the lookups run on (see _extraction_root)
+            params: Step parameters
+            selector_config: Selector being looked up, if any
+        """
+        wait = params.get("wait")
+        optional = (
+            bool(params.get("optional"))
+            or (wait is not None and float(wait) == 0)
+            or bool(getattr(selector_config, "optional", False))
+        )
+        if not optional or root is not self.browser.driver or self.static_pages:
+            return nullcontext()
+        return no_implicit_wait(root)
+
+    def _extract_fields_in_browser(self, fields: list[str]) -> dict[str, Any] | None:
+        """
+        Extract fields with one execute_script call (``extraction: script``).
+
+        Values get the same post-processing as the per-element path (strip,
+        dropping empty values and de-duplicating ``multiple`` fields).
+
+        Args:
+            fields: Names of the selectors to extract
+
+        Returns:
+            Extracted values by field name, or None when script extraction is
+            off or failed and the fields should be extracted element by element
+        """
+        if self.config.extraction != "script" or self.static_pages:
+            return None
+
+        specs = []
+        for field_name in fields:
+            selector_config = self.selectors.get(field_name)
+            if not selector_config:
+                logger.warning(f"Selector '{field_name}' not found in config")
+                continue
+            specs.append(
+                {
+                    "name": field_name,
+                    "selector": selector_config.selector,
+                    "xpath": self._get_locator_type(selector_config.selector) == By.XPATH,
+                    "attribute": selector_config.attribute,
+                    "multiple": selector_config.multiple,
+                }
+            )
+
+        try:
+            raw_values = bulk_extract(self.browser.driver, specs)
+        except Exception as e:
+            logger.warning(f"Script extraction failed, extracting element by element: {e}")
+            return None
+
+        results: dict[str, Any] = {}
+        for spec in specs:
+            raw = raw_values.get(spec["name"])
+            if isinstance(raw, dict):  # The selector itself failed in the page
+                logger.warning(
+                    f"Script extraction failed for {spec['name']}, "
+                    f"extracting element by element: {raw.get('error')}"
+                )
+                return None
+            if spec["multiple"]:
+                values = (self._value_from_script(value, spec["attribute"]) for value in raw or [])
+                results[spec["name"]] = list(dict.fromkeys(value for value in values if value))
+            else:
+                results[spec["name"]] = self._value_from_script(raw, spec["attribute"])
+            logger.debug(f"Extracted {spec['name']}: {results[spec['name']]}")
+        return results
+
+    def _value_from_script(self, raw: Any, attribute: str | None) -> str | None:
+        """Apply _extract_value_from_element's conversions to a value read by script."""
+        if isinstance(raw, dict):
+            logger.warning(f"Failed to extract value from element: {raw.get('error')}")
+            return None
+        if raw is None:
+            return None
+        if attribute == "text" or attribute is None:
+            return str(raw).strip()
+        return str(raw)
+
+    def close(self) -> None:
+        """Quit the Chrome browser started for HTTP-engine fallbacks, if any."""
+        if self._fallback_browser is not None:
+            self._fallback_browser.quit()
+            self._fallback_browser = None
+
     def execute_workflow(
         self, context: dict[str, Any] | None = None, quit_browser: bool = True
     ) -> dict[str, Any]:
@@ -156,40 +523,266 @@ class WorkflowExecutor:
             WorkflowExecutionError: If workflow execution fails
         """
         try:
-            logger.info(f"Starting workflow execution for: {self.config.name}")
-            self.results = {}  # Reset results for new run
-            self.workflow_stopped = False  # Reset stop flag for new run
+            try:
+                self._select_tab(context)
+                return self._run_workflow(context)
+            except Exception as e:
+                # Only errors that need a real browser go to Chrome; a failing
+                # site or workflow would fail there too
+                if not self.static_pages or not (
+                    isinstance(e, BrowserRequiredError) or self.browser.browser_required
+                ):
+                    raise
+                return self._run_workflow_in_browser(context, e)
+        except Exception as e:
+            logger.error(f"Workflow execution failed: {e}")
+            raise WorkflowExecutionError(f"Workflow execution failed: {e}")
+        finally:
+            if quit_browser and self.browser:
+                self.browser.quit()
+                self.close()
 
-            # Merge context into results so they are available
-            if context:
-                self.results.update(context)
+    def _run_workflow(self, context: dict[str, Any] | None) -> dict[str, Any]:
+        """
+        Run the workflow with the current browser.
 
-            for i, step in enumerate(self.config.workflows, 1):
-                if self.workflow_stopped:
-                    logger.info("Workflow stopped due to condition, skipping remaining steps.")
-                    break
-                logger.info(f"Step {i}/{len(self.config.workflows)}: Executing {step.action}")
-                self._execute_step(step, context)
-                logger.info(f"Step {i}/{len(self.config.workflows)}: Completed {step.action}")
+        A SKU with a learned product URL first runs the direct workflow; when
+        that fails or finds no product, the URL is dropped and the full
+        workflow runs. A full run that finds the product learns the URL its
+        last click led to.
+        """
+        sku = (context or {}).get("sku")
+        if self.product_urls is None or not sku:
+            return self._run_steps(self.config.workflows, context)
 
-            logger.info(f"Workflow execution completed for: {self.config.name}")
+        product_url = self.product_urls.get(self.config.name, sku)
+        direct_steps = self._direct_workflow(product_url) if product_url else None
+        if direct_steps is not None:
+            try:
+                result = self._run_steps(direct_steps, context)
+            except Exception as e:
+                logger.info(f"Learned product URL failed for SKU {sku} ({e}), searching instead")
+            else:
+                if self._found_product():
+                    self.direct_hits += 1
+                    self.product_urls.mark_used(self.config.name, sku)
+                    result["product_url"] = product_url
+                    return result
+                logger.info(f"Learned product URL for SKU {sku} has no product, searching instead")
+            self.direct_misses += 1
+            self.product_urls.discard(self.config.name, sku)
+
+        result = self._run_steps(self.config.workflows, context)
+        if self.product_url and self._found_product():
+            self.product_urls.put(self.config.name, sku, self.product_url)
+        return result
+
+    def _direct_workflow(self, product_url: str) -> list[WorkflowStep] | None:
+        """
+        Build the workflow that opens a product page directly.
 
-            # Apply normalization rules
-            self.apply_normalization()
+        The steps from the first navigate through the last click (the search
+        path) are replaced by one navigate to ``product_url``.
 
-            return {
-                "success": True,
-                "results": self.results,
-                "config_name": self.config.name,
-                "steps_executed": len(self.config.workflows),
-            }
+        Returns:
+            The direct steps, or None if the workflow has no search path
+        """
+        actions = [step.action.lower() for step in self.config.workflows]
+        if "navigate" not in actions or "click" not in actions:
+            return None
+        first_navigate = actions.index("navigate")
+        last_click = len(actions) - 1 - actions[::-1].index("click")
+        if last_click < first_navigate:
+            return None
+        return [
+            *self.config.workflows[:first_navigate],
+            WorkflowStep(action="navigate", params={"url": product_url}),
+            *self.config.workflows[last_click + 1 :],
+        ]
+
+    def _found_product(self) -> bool:
+        """Whether the last run extracted any configured field."""
+        if self.results.get("no_results_found"):
+            return False
+        return any(self.results.get(name) for name in self.selectors)
+
+    def _run_steps(
+        self, steps: list[WorkflowStep], context: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Run workflow steps with the current browser."""
+        logger.info(f"Starting workflow execution for: {self.config.name}")
+        self.results = {}  # Reset results for new run
+        self._snapshot = None
+        self.wait_match = None
+        self.product_url = None
+        self.workflow_stopped = False  # Reset stop flag for new run
+        if self.static_pages:
+            self.browser.browser_required = None
+
+        # Merge context into results so they are available
+        if context:
+            self.results.update(context)
+
+        # Hold one of the site's concurrent session slots while the workflow runs
+        session_slot = (
+            self.anti_detection_manager.domain_limiter.session()
+            if self.anti_detection_manager
+            else nullcontext()
+        )
+        step_timings = []  # (action, seconds) for every executed step
+        try:
+            with session_slot:
+                for i, step in enumerate(steps, 1):
+                    if self.workflow_stopped:
+                        logger.info("Workflow stopped due to condition, skipping remaining steps.")
+                        break
+                    logger.info(f"Step {i}/{len(steps)}: Executing {step.action}")
+                    step_start = time.perf_counter()
+                    from_url = self._current_url() if step.action.lower() == "click" else None
+                    self._execute_step(step, context)
+                    step_timings.append((step.action, time.perf_counter() - step_start))
+                    if from_url is not None:
+                        # A click that leaves the page leads to the product page
+                        url = self._current_url()
+                        self.product_url = url if url and url != from_url else None
+                    logger.info(f"Step {i}/{len(steps)}: Completed {step.action}")
+        finally:
+            self._collect_network_stats()
+
+        logger.info(f"Workflow execution completed for: {self.config.name}")
+
+        # Apply normalization rules
+        self.apply_normalization()
+
+        return {
+            "success": True,
+            "results": self.results,
+            "config_name": self.config.name,
+            "steps_executed": len(steps),
+            "step_timings": step_timings,
+            "engine": "http" if self.static_pages else "browser",
+        }
+
+    def _login_session(self, success_indicator: str | None, submit_login: Callable[[], None]):
+        """
+        Log the browser in once per session.
+
+        A browser already logged in is only checked for ``success_indicator``
+        on the page it is showing (no navigation). Otherwise the site's stored
+        session cookies are injected and the start page is loaded to check
+        ``success_indicator``; only without a stored session that is still
+        logged in is ``submit_login`` run, and its cookies are stored for the
+        other browsers.
+
+        Args:
+            success_indicator: CSS selector present on pages while logged in
+            submit_login: Fills and submits the login form
+        """
+        browser = self.browser
+        store = get_cookie_store(self.config.name)
+        session = getattr(browser, "login_session", None)
+        if session is not None:
+            if self._login_indicator_present(success_indicator):
+                logger.debug(f"Already logged in to {self.config.name}")
+                return
+            logger.info(f"Login session for {self.config.name} expired, logging in again")
+            browser.login_session = None
+            store.discard(session)
+
+        with store.lock:
+            saved = store.load()
+            if saved is not None:
+                inject_cookies(browser.driver, saved.cookies, use_cdp=not self.static_pages)
+                if self._restored_login_valid(success_indicator):
+                    browser.login_session = saved.saved_at
+                    self.restored_logins += 1
+                    logger.info(f"Restored stored login session for {self.config.name}")
+                    return
+                logger.info(f"Stored login session for {self.config.name} expired, logging in")
+                store.discard(saved.saved_at)
+            submit_login()
+            self.logins += 1
+            browser.login_session = store.save(browser.driver.get_cookies())
+
+    def _restored_login_valid(self, success_indicator: str | None) -> bool:
+        """Load the site's start page with injected cookies and check it is logged in."""
+        if not success_indicator:
+            return True
+        self._action_navigate({"url": self.config.base_url})
+        return self._login_indicator_present(success_indicator)
+
+    def _login_indicator_present(self, success_indicator: str | None) -> bool:
+        """Whether the current page shows the logged-in indicator (True if it cannot tell)."""
+        if not success_indicator or not self._current_url().startswith("http"):
+            return True
+        driver = self.browser.driver
+        with no_implicit_wait(driver):
+            try:
+                return bool(driver.find_elements(By.CSS_SELECTOR, success_indicator))
+            except WebDriverException:
+                return True
 
+    def _current_url(self) -> str:
+        """Current page URL, or an empty string if the browser cannot tell."""
+        try:
+            url = self.browser.driver.current_url
+        except Exception:
+            return ""
+        return url if isinstance(url, str) else ""
+
+    def _collect_network_stats(self) -> None:
+        """Add the browser's blocked-request and byte counters to the run totals."""
+        take_stats = getattr(self.browser, "take_network_stats", None)
+        if take_stats is None:
+            return
+        try:
+            stats = take_stats()
+            blocked = dict(stats["blocked_requests"])
+            transferred = int(stats["transferred_bytes"])
+            cache_hits = int(stats.get("cache_hit_bytes", 0))
         except Exception as e:
-            logger.error(f"Workflow execution failed: {e}")
-            raise WorkflowExecutionError(f"Workflow execution failed: {e}")
+            logger.debug(f"Could not read network stats: {e}")
+            return
+        self.blocked_requests.update(blocked)
+        self.transferred_bytes += transferred
+        self.cache_hit_bytes += cache_hits
+
+    def _run_workflow_in_browser(
+        self, context: dict[str, Any] | None, error: Exception
+    ) -> dict[str, Any]:
+        """
+        Re-run a workflow that failed on the HTTP engine in Chrome.
+
+        The Chrome browser is started on the first fallback and kept for later
+        ones; the HTTP browser is attached again afterwards so the next SKU
+        starts on the HTTP engine.
+        """
+        http_browser = self.browser
+        reason = getattr(http_browser, "browser_required", None) or str(error)
+        self.http_fallbacks += 1
+        logger.info(f"HTTP engine could not finish {self.config.name} ({reason}), using Chrome")
+
+        if self._fallback_browser is None or not self._fallback_browser.is_alive():
+            import uuid
+
+            self._fallback_browser = create_browser(
+                site_name=self.config.name,
+                headless=self.headless,
+                profile_suffix=f"fallback_{int(time.time())}_{uuid.uuid4().hex[:8]}",
+                capture_http_status=self.config.requires_http_status(),
+                blocked_urls=self.config.resource_policy.blocked_urls(),
+                profile_template=(
+                    get_template_dir(self.config.name) if self.config.profile_template else None
+                ),
+            )
+
+        self.attach_browser(self._fallback_browser)
+        try:
+            result = self._run_workflow(context)
         finally:
-            if quit_browser and self.browser:
-                self.browser.quit()
+            self.attach_browser(http_browser)
+        result["http_fallback_reason"] = reason
+        return result
 
     def execute_steps(
         self, steps: list[Any], context: dict[str, Any] | None = None
@@ -278,6 +871,11 @@ class WorkflowExecutor:
                     f"Pre-action anti-detection check failed for '{action}'"
                 )
 
+        if action not in EXTRACT_ACTIONS:
+            self._snapshot = None  # The page may change; snapshot again on the next extract
+        if action not in WAIT_MATCH_ACTIONS:
+            self.wait_match = None
+
         success = False
         try:
             # Dynamic action execution using registry
@@ -411,7 +1009,7 @@ class WorkflowExecutor:
                 )
 
                 # Apply the delay
-                time.sleep(delay)
+                self._sleep(delay, "retry backoff")
 
                 # Try anti-detection error handling as fallback
                 if self.anti_detection_manager:
@@ -529,10 +1127,13 @@ class WorkflowExecutor:
         if self.config.http_status and self.config.http_status.enabled:
             self._check_http_status_after_navigation(url, params)
 
-        # Optional wait after navigation
-        wait_time = params.get("wait_after", 0)
-        if wait_time > 0:
-            time.sleep(wait_time)
+        # Optional wait after navigation, ended early by a wait_until condition
+        self._pause(
+            params.get("wait_after", 0),
+            params.get("wait_until"),
+            "navigate wait_after",
+            quiet_ms=params.get("quiet_ms", DEFAULT_QUIET_MS),
+        )
 
         # Mark that first navigation is done
         self.first_navigation_done = True
@@ -542,10 +1143,15 @@ class WorkflowExecutor:
         if not self.config.http_status:
             return
 
-        # Give the page a moment to load
-        time.sleep(0.5)
-
         status_code = self.browser.check_http_status()
+        if status_code is None and not self.static_pages:
+            # The navigation entry can lag the page load briefly; poll instead of sleeping
+            try:
+                status_code = WebDriverWait(self.browser.driver, 0.5, poll_frequency=0.05).until(
+                    lambda _: self.browser.check_http_status()
+                )
+            except TimeoutException:
+                pass
         if status_code is None:
             logger.debug(f"Could not determine HTTP status for {url}")
             return
@@ -565,10 +1171,11 @@ class WorkflowExecutor:
                     f"HTTP {status_code} error encountered while navigating to {url}"
                 )
 
-        # Log warnings for redirect status codes
+        # Log warnings for redirect status codes, including redirects the browser followed
         warning_codes = self.config.http_status.warning_status_codes
-        if status_code in warning_codes:
-            logger.warning(f"HTTP redirect status {status_code} detected for {url}")
+        for code in [*getattr(self.browser, "redirect_statuses", []), status_code]:
+            if code in warning_codes:
+                logger.warning(f"HTTP redirect status {code} detected for {url}")
 
     def _action_wait_for(self, params: dict[str, Any]):
         """Wait for an element to be present."""
@@ -585,54 +1192,99 @@ class WorkflowExecutor:
         )
 
         start_time = time.time()
+        matched = self._wait_for_any(selectors, timeout)
+        wait_duration = time.time() - start_time
+        if matched is not None:
+            self.wait_match = (selectors, matched)
+            logger.info(f"✅ Element found after {wait_duration:.2f}s: {matched}")
+            return
+
+        logger.warning(
+            f"⏰ TIMEOUT: Element not found within {timeout}s (waited {wait_duration:.2f}s): {selectors}"
+        )
+        logger.debug(f"Current page URL: {self.browser.driver.current_url}")
+        logger.debug(f"Page title: {self.browser.driver.title}")
+
+        # Log available elements for debugging
         try:
-            conditions = [
-                EC.presence_of_element_located((self._get_locator_type(s), s)) for s in selectors
-            ]
-            WebDriverWait(self.browser.driver, timeout).until(EC.any_of(*conditions))
-            wait_duration = time.time() - start_time
-            logger.info(f"✅ Element found after {wait_duration:.2f}s from selectors: {selectors}")
-        except TimeoutException:
-            wait_duration = time.time() - start_time
-            logger.warning(
-                f"⏰ TIMEOUT: Element not found within {timeout}s (waited {wait_duration:.2f}s): {selectors}"
-            )
-            logger.debug(f"Current page URL: {self.browser.driver.current_url}")
-            logger.debug(f"Page title: {self.browser.driver.title}")
+            all_elements = self.browser.driver.find_elements(By.CSS_SELECTOR, "*")
+            logger.debug(f"Total elements on page: {len(all_elements)}")
+
+            # Try to find similar selectors
+            for selector in selectors:
+                if "." in selector or "#" in selector:
+                    similar_selectors = []
+                    for el in all_elements[:50]:  # Check first 50 elements
+                        try:
+                            el_classes = el.get_attribute("class") or ""
+                            el_id = el.get_attribute("id") or ""
+                            if selector.startswith(".") and selector[1:] in el_classes.split():
+                                similar_selectors.append(f".{selector[1:]}")
+                            elif selector.startswith("#") and selector[1:] == el_id:
+                                similar_selectors.append(selector)
+                        except Exception:
+                            pass
+                    if similar_selectors:
+                        logger.debug(
+                            f"Found similar elements for {selector}: {similar_selectors[:5]}"
+                        )
+        except Exception as debug_e:
+            logger.debug(f"Could not analyze page elements: {debug_e}")
 
-            # Log available elements for debugging
-            try:
-                all_elements = self.browser.driver.find_elements(By.CSS_SELECTOR, "*")
-                logger.debug(f"Total elements on page: {len(all_elements)}")
-
-                # Try to find similar selectors
-                for selector in selectors:
-                    if "." in selector or "#" in selector:
-                        similar_selectors = []
-                        for el in all_elements[:50]:  # Check first 50 elements
-                            try:
-                                el_classes = el.get_attribute("class") or ""
-                                el_id = el.get_attribute("id") or ""
-                                if selector.startswith(".") and selector[1:] in el_classes.split():
-                                    similar_selectors.append(f".{selector[1:]}")
-                                elif selector.startswith("#") and selector[1:] == el_id:
-                                    similar_selectors.append(selector)
-                            except Exception:
-                                pass
-                        if similar_selectors:
-                            logger.debug(
-                                f"Found similar elements for {selector}: {similar_selectors[:5]}"
-                            )
-            except Exception as debug_e:
-                logger.debug(f"Could not analyze page elements: {debug_e}")
+        raise WorkflowExecutionError(f"Element not found within {timeout}s: {selectors}")
+
+    def _wait_for_any(self, selectors: list[str], timeout: float) -> str | None:
+        """
+        Wait until any of the selectors matches an element.
 
-            raise WorkflowExecutionError(f"Element not found within {timeout}s: {selectors}")
+        In Chrome a MutationObserver reports the match as soon as the DOM
+        changes. If the page navigates away mid-wait or the script fails, the
+        rest of the timeout is spent polling with WebDriverWait instead.
+
+        Args:
+            selectors: CSS or XPath selectors
+            timeout: Maximum seconds to wait
+
+        Returns:
+            The first selector in list order that matched, or None on timeout
+        """
+        started = time.monotonic()
+        if not self.static_pages:
+            try:
+                return wait_for_any(self.browser.driver, selectors, timeout)
+            except (WebDriverException, ValueError) as e:
+                logger.debug(f"Observer wait failed, polling instead: {e}")
+
+        def first_match(driver):
+            for selector in selectors:
+                if driver.find_elements(self._get_locator_type(selector), selector):
+                    return selector
+            return False
+
+        remaining = max(timeout - (time.monotonic() - started), 0)
+        with no_implicit_wait(self.browser.driver):
+            try:
+                return self._wait(remaining).until(first_match)
+            except TimeoutException:
+                if self.static_pages:
+                    # Not in the server's HTML; most likely rendered by JavaScript
+                    self.browser.browser_required = f"{selectors} not found in the static HTML"
+                return None
 
     def _action_wait(self, params: dict[str, Any]):
-        """Simple wait/delay."""
+        """Wait for a fixed time, or until a page condition holds (``until``)."""
         seconds = params.get("seconds", params.get("timeout", 1))
-        logger.debug(f"Waiting for {seconds} seconds")
-        time.sleep(seconds)
+        if self.static_pages:
+            logger.debug(f"Skipping {seconds}s wait on a static HTTP page")
+            return
+        logger.debug(f"Waiting up to {seconds} seconds (until: {params.get('until')})")
+        self._pause(
+            seconds,
+            params.get("until"),
+            "wait step",
+            quiet_ms=params.get("quiet_ms", DEFAULT_QUIET_MS),
+            selector=params.get("selector"),
+        )
 
     def _process_field_value(self, field_name: str, value: str | None) -> str | None:
         """Process extracted field values based on field name."""
@@ -682,7 +1334,9 @@ class WorkflowExecutor:
             raise WorkflowExecutionError(f"Selector '{selector_name}' not found in config")
 
         try:
-            element = self.browser.driver.find_element(By.CSS_SELECTOR, selector_config.selector)
+            root = self._extraction_root()
+            with self._fast_miss(root, params, selector_config):
+                element = root.find_element(By.CSS_SELECTOR, selector_config.selector)
             value = self._extract_value_from_element(element, selector_config.attribute)
             # Process field value based on field name
             processed_value = self._process_field_value(field_name, value)
@@ -707,7 +1361,9 @@ class WorkflowExecutor:
             raise WorkflowExecutionError(f"Selector '{selector_name}' not found in config")
 
         try:
-            elements = self.browser.driver.find_elements(By.CSS_SELECTOR, selector_config.selector)
+            root = self._extraction_root()
+            with self._fast_miss(root, params, selector_config):
+                elements = root.find_elements(By.CSS_SELECTOR, selector_config.selector)
             values = []
             for element in elements:
                 value = self._extract_value_from_element(element, selector_config.attribute)
@@ -733,6 +1389,12 @@ class WorkflowExecutor:
         """Extract multiple fields at once (legacy compatibility)."""
         fields = params.get("fields", [])
         logger.debug(f"Starting extract action for fields: {fields}")
+        script_results = self._extract_fields_in_browser(fields)
+        if script_results is not None:
+            self.results.update(script_results)
+            logger.info(f"Extract action completed. Results: {self.results}")
+            return
+        root = self._extraction_root()
         for field_name in fields:
             selector_config = self.selectors.get(field_name)
             if not selector_config:
@@ -742,9 +1404,8 @@ class WorkflowExecutor:
             try:
                 locator_type = self._get_locator_type(selector_config.selector)
                 if selector_config.multiple:
-                    elements = self.browser.driver.find_elements(
-                        locator_type, selector_config.selector
-                    )
+                    with self._fast_miss(root, params, selector_config):
+                        elements = root.find_elements(locator_type, selector_config.selector)
                     values = []
                     for element in elements:
                         value = self._extract_value_from_element(element, selector_config.attribute)
@@ -759,9 +1420,8 @@ class WorkflowExecutor:
                             deduplicated_values.append(value)
                     self.results[field_name] = deduplicated_values
                 else:
-                    element = self.browser.driver.find_element(
-                        locator_type, selector_config.selector
-                    )
+                    with self._fast_miss(root, params, selector_config):
+                        element = root.find_element(locator_type, selector_config.selector)
                     value = self._extract_value_from_element(element, selector_config.attribute)
                     self.results[field_name] = value
                 logger.debug(f"Extracted {field_name}: {self.results[field_name]}")
@@ -807,9 +1467,7 @@ class WorkflowExecutor:
 
         # Initial wait for at least one element to be present
         try:
-            WebDriverWait(self.browser.driver, self.timeout).until(
-                EC.presence_of_element_located((locator_type, selector))
-            )
+            self._wait(self.timeout).until(EC.presence_of_element_located((locator_type, selector)))
             logger.info("At least one element is present, proceeding to filter and click")
         except TimeoutException:
             logger.warning(f"No elements found for selector '{selector}' within timeout period.")
@@ -849,23 +1507,24 @@ class WorkflowExecutor:
 
             # Scroll element into view if needed
             try:
-                self.browser.driver.execute_script(
-                    "arguments[0].scrollIntoView({block: 'center', inline: 'center'});",
-                    element_to_click,
-                )
-                time.sleep(0.5)  # Brief pause after scrolling
+                scroll_into_view(self.browser.driver, element_to_click)
             except Exception as scroll_e:
                 logger.debug(f"Could not scroll element into view: {scroll_e}")
 
             # Attempt click
+            wait_until = params.get("wait_until")
+            from_url = self.browser.driver.current_url if wait_until == "url_changed" else None
             element_to_click.click()
             logger.info(f"Successfully clicked element: {selector} at index {index}")
 
             # Optional wait after click
-            wait_time = params.get("wait_after", 0)
-            if wait_time > 0:
-                logger.debug(f"Waiting {wait_time}s after click")
-                time.sleep(wait_time)
+            self._pause(
+                params.get("wait_after", 0),
+                wait_until,
+                "click wait_after",
+                quiet_ms=params.get("quiet_ms", DEFAULT_QUIET_MS),
+                from_url=from_url,
+            )
 
         except Exception as e:
             raise WorkflowExecutionError(f"Failed to click element after waiting: {e}")
@@ -926,80 +1585,90 @@ class WorkflowExecutor:
                 "Login action requires username, password, url, username_field, password_field, and submit_button parameters"
             )
 
-        logger.info("Executing login workflow")
+        def submit_login() -> None:
+            logger.info("Executing login workflow")
 
-        # Navigate to login page
-        self.browser.get(login_url)
-        time.sleep(1)  # Brief wait for page load
-
-        # Input username
-        try:
-            username_element = self.browser.driver.find_element(By.CSS_SELECTOR, username_field)
-            username_element.clear()
-            username_element.send_keys(str(username))
-            logger.debug("Entered username")
-        except NoSuchElementException:
-            raise WorkflowExecutionError(f"Username field not found: {username_field}")
+            # Navigate to login page
+            self.browser.get(login_url)
+            try:
+                self._wait(self.timeout).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, username_field))
+                )
+            except TimeoutException:
+                pass  # Reported as a missing username field below
 
-        # Input password
-        try:
-            password_element = self.browser.driver.find_element(By.CSS_SELECTOR, password_field)
-            password_element.clear()
-            password_element.send_keys(str(password))
-            logger.debug("Entered password")
-        except NoSuchElementException:
-            raise WorkflowExecutionError(f"Password field not found: {password_field}")
+            # Input username
+            try:
+                username_element = self.browser.driver.find_element(By.CSS_SELECTOR, username_field)
+                username_element.clear()
+                username_element.send_keys(str(username))
+                logger.debug("Entered username")
+            except NoSuchElementException:
+                raise WorkflowExecutionError(f"Username field not found: {username_field}")
 
-        # Click submit button
-        try:
-            submit_element = self.browser.driver.find_element(By.CSS_SELECTOR, submit_button)
-            submit_element.click()
-            logger.debug("Clicked submit button")
-        except NoSuchElementException:
-            raise WorkflowExecutionError(f"Submit button not found: {submit_button}")
+            # Input password
+            try:
+                password_element = self.browser.driver.find_element(By.CSS_SELECTOR, password_field)
+                password_element.clear()
+                password_element.send_keys(str(password))
+                logger.debug("Entered password")
+            except NoSuchElementException:
+                raise WorkflowExecutionError(f"Password field not found: {password_field}")
 
-        # Wait for success indicator if provided
-        if success_indicator:
+            # Click submit button
             try:
-                WebDriverWait(self.browser.driver, self.timeout).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, success_indicator))
-                )
-                logger.info("Login successful - success indicator found")
-            except TimeoutException:
-                raise WorkflowExecutionError(
-                    f"Login failed - success indicator not found within {self.timeout}s: {success_indicator}"
-                )
-        else:
-            # If no success indicator, wait a bit for login to process
-            time.sleep(3)
-            logger.info("Login submitted (no success indicator configured)")
-
-        # Check for login failure indicators if configured
-        failure_indicators = params.get("failure_indicators")
-        if failure_indicators:
-            logger.debug("Checking for login failure indicators")
-            # Include HTTP status if available
-            context = {"action": "login"}
-            if "http_status" in self.results:
-                context["status_code"] = self.results["http_status"]
-            failure_context = self.failure_classifier.classify_page_content(
-                self.browser.driver, context
-            )
+                submit_element = self.browser.driver.find_element(By.CSS_SELECTOR, submit_button)
+                form_url = self.browser.driver.current_url
+                submit_element.click()
+                logger.debug("Clicked submit button")
+            except NoSuchElementException:
+                raise WorkflowExecutionError(f"Submit button not found: {submit_button}")
 
-            # Check if failure was detected with sufficient confidence
-            if (
-                failure_context.failure_type.value == "login_failed"
-                and failure_context.confidence > 0.5
-            ):
-                logger.error(f"Login failure detected: {failure_context.details}")
-                raise WorkflowExecutionError(
-                    f"Login failed - detected failure indicators: {failure_context.details}"
-                )
-            elif failure_context.confidence > 0.3:
-                logger.warning(
-                    f"Potential login failure detected (confidence: {failure_context.confidence}): {failure_context.details}"
+            # Wait for success indicator if provided
+            if success_indicator:
+                try:
+                    WebDriverWait(self.browser.driver, self.timeout).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, success_indicator))
+                    )
+                    logger.info("Login successful - success indicator found")
+                except TimeoutException:
+                    raise WorkflowExecutionError(
+                        f"Login failed - success indicator not found within {self.timeout}s: {success_indicator}"
+                    )
+            else:
+                # If no success indicator, wait up to 3s for the login redirect
+                self._pause(3, "url_changed", "login", from_url=form_url)
+                logger.info("Login submitted (no success indicator configured)")
+
+            # Check for login failure indicators if configured
+            failure_indicators = params.get("failure_indicators")
+            if failure_indicators:
+                logger.debug("Checking for login failure indicators")
+                # Include HTTP status if available
+                context = {"action": "login"}
+                if "http_status" in self.results:
+                    context["status_code"] = self.results["http_status"]
+                failure_context = self.failure_classifier.classify_page_content(
+                    self.browser.driver, context
                 )
 
+                # Check if failure was detected with sufficient confidence
+                if (
+                    failure_context.failure_type.value == "login_failed"
+                    and failure_context.confidence > 0.5
+                ):
+                    logger.error(f"Login failure detected: {failure_context.details}")
+                    raise WorkflowExecutionError(
+                        f"Login failed - detected failure indicators: {failure_context.details}"
+                    )
+                elif failure_context.confidence > 0.3:
+                    logger.warning(
+                        f"Potential login failure detected (confidence: {failure_context.confidence}): {failure_context.details}"
+                    )
+
+        # Reuse this browser's session or the site's stored cookies when possible
+        self._login_session(success_indicator, submit_login)
+
     def _action_detect_captcha(self, params: dict[str, Any]):
         """Detect CAPTCHA presence on current page."""
         if not self.anti_detection_manager or not self.anti_detection_manager.captcha_detector:
@@ -1042,7 +1711,7 @@ class WorkflowExecutor:
         delay = params.get("delay", None)
         if delay:
             # Custom delay
-            time.sleep(delay)
+            self._sleep(delay, "rate_limit")
             logger.debug(f"Applied custom rate limit delay: {delay}s")
         else:
             # Use rate limiter's intelligent delay
@@ -1059,19 +1728,20 @@ class WorkflowExecutor:
         duration = params.get("duration", 2.0)
 
         if behavior_type == "reading":
-            time.sleep(duration)
+            self._sleep(duration, "simulate_human")
             logger.debug(f"Simulated reading behavior for {duration}s")
         elif behavior_type == "typing":
             # Simulate typing delay
-            time.sleep(duration * 0.1)  # Shorter for typing
+            self._sleep(duration * 0.1, "simulate_human")  # Shorter for typing
             logger.debug(f"Simulated typing behavior for {duration * 0.1}s")
         elif behavior_type == "navigation":
-            time.sleep(duration)
+            self._sleep(duration, "simulate_human")
             logger.debug(f"Simulated navigation pause for {duration}s")
         else:
             # Random human-like pause
-            time.sleep(random.uniform(1, duration))
-            logger.debug(f"Simulated random human behavior for {random.uniform(1, duration):.2f}s")
+            pause = random.uniform(1, duration)
+            self._sleep(pause, "simulate_human")
+            logger.debug(f"Simulated random human behavior for {pause:.2f}s")
 
     def _action_rotate_session(self, params: dict[str, Any]):
         """Force session rotation."""
@@ -1148,20 +1818,35 @@ class WorkflowExecutor:
             config_no_results = []
             config_text_patterns = []
 
+        # A preceding wait_for already saw which of its selectors the page rendered:
+        # a no-results selector settles it, and the selectors listed before the
+        # match were absent, so they need not be probed again
+        if self.wait_match:
+            selectors, matched = self.wait_match
+            if matched in config_no_results:
+                logger.info(f"✅ No results detected by wait_for selector: {matched}")
+                self.results["no_results_found"] = True
+                return
+            absent = selectors[: selectors.index(matched)]
+            config_no_results = [s for s in config_no_results if s not in absent]
+
         try:
             page_source = self.browser.driver.page_source.lower()
             page_title = self.browser.driver.title.lower()
 
             # Check config selectors
-            for selector in config_no_results:
-                try:
-                    elements = self.browser.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        logger.info(f"✅ No results detected via config selector: {selector}")
-                        self.results["no_results_found"] = True
-                        return
-                except Exception as e:
-                    logger.debug(f"Error checking selector {selector}: {e}")
+            with no_implicit_wait(self.browser.driver):
+                for selector in config_no_results:
+                    try:
+                        elements = self.browser.driver.find_elements(
+                            self._get_locator_type(selector), selector
+                        )
+                        if elements:
+                            logger.info(f"✅ No results detected via config selector: {selector}")
+                            self.results["no_results_found"] = True
+                            return
+                    except Exception as e:
+                        logger.debug(f"Error checking selector {selector}: {e}")
 
             # Check config text patterns
             for pattern in config_text_patterns:
@@ -1295,12 +1980,19 @@ class WorkflowExecutor:
             raise WorkflowExecutionError("conditional_click requires 'selector' parameter")
 
         locator_type = self._get_locator_type(selector)  # type: ignore
+        wait = float(params.get("wait", params.get("timeout", 2)))
 
         try:
-            # Check for element presence with a very short timeout
-            WebDriverWait(self.browser.driver, 2).until(
-                EC.presence_of_element_located((locator_type, selector))  # type: ignore
-            )
+            if wait > 0:
+                # Check for element presence with a very short timeout
+                self._wait(wait).until(
+                    EC.presence_of_element_located((locator_type, selector))  # type: ignore
+                )
+            else:
+                # wait: 0 checks the current page once (e.g. a banner that is rarely shown)
+                with self._fast_miss(self.browser.driver, params):
+                    if not self.browser.driver.find_elements(locator_type, selector):
+                        raise TimeoutException(f"'{selector}' is not on the page")
 
             # If present, attempt the click using the main click action
             logger.info(f"Conditional element '{selector}' found. Attempting to click.")  # type: ignore
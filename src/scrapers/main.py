@@ -17,6 +17,21 @@ if project_root not in sys.path:
 import os
 
 from src.core.database.refresh import refresh_database_from_xml
+from src.core.event_bus import (
+    BLOCKED_REQUESTS_COUNTER,
+    FIXED_SLEEP_COUNTER,
+    EventBus,
+    EventType,
+    ScrapeEvent,
+)
+
+
+def _emit(callback, value) -> None:
+    """Deliver a value to a Qt signal or a plain callable."""
+    try:
+        callback.emit(value)
+    except AttributeError:
+        callback(value)
 
 
 def run_scraping(
@@ -26,6 +41,8 @@ def run_scraping(
     status_callback=None,
     progress_callback=None,
     scraper_workers: dict[str, int] | None = None,
+    execution_mode: str | None = None,
+    resume_session: str | None = None,
     **kwargs,
 ) -> None:
     """
@@ -38,27 +55,79 @@ def run_scraping(
         status_callback: Optional callback for status updates
         progress_callback: Optional callback for progress updates
         scraper_workers: Dictionary mapping scraper names to worker counts
-        **kwargs: Additional arguments passed to individual scrapers
+        execution_mode: "thread" runs every worker in this process, "process" runs
+            each site in its own process (defaults to the scraper_execution_mode setting)
+        resume_session: ID of an interrupted session to resume; SKUs already journaled
+            as found or not found are skipped and only the rest are scraped
+        **kwargs: Additional arguments passed to individual scrapers. ``event_callback``
+            receives every batch of ScrapeEvents (instead of the log, status, progress
+            and metrics callbacks); ``metrics_callback`` receives queue metrics
     """
     print("🚀 Starting scraping with new modular scraper system...")
 
+    from src.core.settings_manager import settings
+
+    event_callback = kwargs.pop("event_callback", None)
+    metrics_callback = kwargs.pop("metrics_callback", None)
+
+    # Logs, status and progress are published as events from the workers and
+    # delivered in batches by the bus thread, so slow consumers (the GUI log
+    # view, the console) never throttle scraping
+    bus = EventBus(flush_interval=float(settings.get("event_flush_interval_ms", 200)) / 1000)
+
+    def deliver(batch):
+        lines = [f"[{e.level}] {e.message}" for e in batch if e.type == EventType.LOG]
+        if lines:
+            print("\n".join(lines))
+
+        if event_callback:
+            _emit(event_callback, batch)
+            return
+
+        for event in batch:
+            if event.type == EventType.LOG and log_callback:
+                _emit(log_callback, f"[{event.level}] {event.message}")
+            elif event.type == EventType.STATUS and status_callback:
+                _emit(status_callback, event.message)
+            elif event.type == EventType.PROGRESS and progress_callback:
+                _emit(progress_callback, event.data)
+            elif event.type == EventType.METRICS and metrics_callback:
+                _emit(metrics_callback, event.data)
+
+    bus.subscribe(deliver)
+    bus.start()
+    try:
+        _run_scraping(
+            bus,
+            file_path,
+            selected_sites,
+            scraper_workers,
+            execution_mode,
+            resume_session,
+            **kwargs,
+        )
+    finally:
+        bus.close()
+
+
+def _run_scraping(
+    bus: EventBus,
+    file_path: str,
+    selected_sites: list[str] | None,
+    scraper_workers: dict[str, int] | None,
+    execution_mode: str | None,
+    resume_session: str | None,
+    **kwargs,
+) -> None:
+    """Body of run_scraping; every log, status and progress update goes through the bus."""
+
     # Helper for logging
     def log(msg, level="INFO"):
-        formatted_msg = f"[{level}] {msg}"
-        print(formatted_msg)
-        if log_callback:
-            try:
-                log_callback.emit(formatted_msg)
-            except AttributeError:
-                log_callback(formatted_msg)
+        bus.publish(ScrapeEvent(EventType.LOG, message=msg, level=level))
 
     # Helper for status updates
     def update_status(msg):
-        if status_callback:
-            try:
-                status_callback.emit(msg)
-            except AttributeError:
-                status_callback(msg)
+        bus.publish(ScrapeEvent(EventType.STATUS, message=msg))
 
     # Load available scraper configurations
     config_dir = os.path.join(project_root, "src", "scrapers", "configs")
@@ -114,12 +183,18 @@ def run_scraping(
 
     # Load scraper configurations
     update_status("Loading scraper configurations...")
-    from src.scrapers.executor.workflow_executor import WorkflowExecutor
+    from src.core.settings_manager import settings
     from src.scrapers.parser import ScraperConfigParser
     from src.scrapers.result_collector import ResultCollector
 
     parser = ScraperConfigParser()
-    collector = ResultCollector()  # Collect results instead of saving to DB
+    # Collect results instead of saving to DB. In streaming mode results are
+    # appended to a JSONL file as they arrive instead of being held in memory.
+    collector = ResultCollector(
+        session_id=resume_session,
+        stream=settings.get("stream_results", True),
+        compression=settings.get("result_compression", "") or None,
+    )
     configs = []
 
     for site_name in available_sites:
@@ -141,8 +216,136 @@ def run_scraping(
         log("❌ No valid scraper configurations loaded", "ERROR")
         return
 
+    # Per-SKU completion journal, written as outcomes arrive so an interrupted
+    # session can be picked up again with resume_session=<session id>
+    from src.scrapers.session_journal import COMPLETED_STATUSES, SessionJournal
+
+    journal = SessionJournal(collector.session_id, collector.output_dir)
+    site_skus: dict[str, list[str]] = {config.name: list(skus) for config in configs}
+    entries = {}
+
+    if resume_session:
+        entries = journal.load()
+        if entries:
+            log(f"♻️ Resuming session {resume_session} ({len(entries)} journaled results)", "INFO")
+        else:
+            log(f"⚠️ No journal found for session {resume_session}, starting fresh", "WARNING")
+
+        # Restore results found before the interruption
+        for (scraper_name, sku), entry in entries.items():
+            if entry["status"] == "success" and not collector.has_result(sku, scraper_name):
+                collector.add_result(sku, scraper_name, entry.get("data", {}))
+
+        completed = {key for key, entry in entries.items() if entry["status"] in COMPLETED_STATUSES}
+        for config in configs:
+            site_skus[config.name] = [sku for sku in skus if (config.name, sku) not in completed]
+            skipped = len(skus) - len(site_skus[config.name])
+            if skipped:
+                log(f"⏭️ {config.name}: skipping {skipped} completed SKUs", "INFO")
+
+        configs = [config for config in configs if site_skus[config.name]]
+        if not configs:
+            log("✅ Every SKU in this session is already complete", "INFO")
+
+    # Learned routing: each site works through its likely SKUs first, pairs that
+    # past sessions say almost never produce a result are skipped, and a SKU
+    # found with enough fields is not looked up on the remaining sites
+    found_skus = None
+    if settings.get("site_routing", False) and configs:
+        from src.scrapers.site_router import FoundSKUs, SiteRouter
+
+        router = SiteRouter()
+        learned = router.learn_from_journals(
+            collector.output_dir, int(settings.get("routing_history_sessions", 30))
+        )
+        plan = router.plan(
+            [config.name for config in configs],
+            records,
+            min_probability=float(settings.get("routing_min_probability", 0.05)),
+            exploration=float(settings.get("routing_exploration", 0.05)),
+        )
+        planned_before = sum(len(site_skus[config.name]) for config in configs)
+        for config in configs:
+            remaining = set(site_skus[config.name])
+            site_skus[config.name] = [sku for sku in plan[config.name] if sku in remaining]
+        routed_out = planned_before - sum(len(site_skus[config.name]) for config in configs)
+        log(
+            f"🧭 Routing from {learned} past outcomes ({router.sessions_loaded} sessions): "
+            f"skipping {routed_out} unlikely site/SKU pairs",
+            "INFO",
+        )
+        configs = [config for config in configs if site_skus[config.name]]
+
+        early_stop_fields = settings.get("routing_early_stop_fields", 3)
+        if early_stop_fields:
+            found_skus = FoundSKUs(early_stop_fields)
+            for (_, sku), entry in entries.items():
+                if entry["status"] == "success":
+                    found_skus.add(sku, entry.get("data"))
+
+    # Serve results scraped recently with the same version of the site config
+    result_cache = None
+    config_hashes: dict[str, str] = {}  # Sites whose results are cached
+    cached_results = 0
+    if settings.get("result_cache_enabled", True) and configs:
+        from src.scrapers.result_cache import ResultCache, config_hash
+
+        result_cache = ResultCache()
+        default_ttl_hours = float(settings.get("result_cache_ttl_hours", 72))
+        for config in configs:
+            digest = config_hash(config)
+            invalidated = result_cache.invalidate_stale_configs(config.name, digest)
+            if invalidated:
+                log(
+                    f"♻️ {config.name}: config changed, dropped {invalidated} cached results", "INFO"
+                )
+
+            ttl_hours = (
+                config.cache_ttl_hours if config.cache_ttl_hours is not None else default_ttl_hours
+            )
+            if ttl_hours <= 0:
+                # Caching is off for this site: nothing is read or stored
+                continue
+            config_hashes[config.name] = digest
+            cached = result_cache.get_fresh(
+                config.name, site_skus[config.name], digest, ttl_hours * 3600
+            )
+            for sku, data in cached.items():
+                collector.add_result(sku, config.name, data)
+                journal.record(config.name, sku, "success", data, cached=True)
+                if found_skus is not None:
+                    found_skus.add(sku, data)
+            if cached:
+                site_skus[config.name] = [
+                    sku for sku in site_skus[config.name] if sku not in cached
+                ]
+                cached_results += len(cached)
+                log(f"💾 {config.name}: using {len(cached)} cached results", "INFO")
+        configs = [config for config in configs if site_skus[config.name]]
+
+    # Skip site/SKU pairs that recently ended on an explicit "no results" page;
+    # a fraction of them is rechecked so products added to a site are found
+    negative_cache = None
+    if settings.get("negative_cache_enabled", True) and configs:
+        from src.scrapers.negative_cache import NegativeCache
+
+        negative_cache = NegativeCache(
+            ttl_days=float(settings.get("negative_cache_ttl_days", 14)),
+            recheck_ratio=float(settings.get("negative_cache_recheck_ratio", 0.1)),
+        )
+        for config in configs:
+            site_skus[config.name], cached = negative_cache.filter(
+                config.name, site_skus[config.name]
+            )
+            if cached:
+                log(f"🚫 {config.name}: skipping {len(cached)} SKUs cached as not found", "INFO")
+        configs = [config for config in configs if site_skus[config.name]]
+
+    # Open SKUs whose product page was found by an earlier search directly
+    product_url_index = bool(settings.get("product_url_index_enabled", True))
+
     # Execute scraping
-    total_operations = len(configs) * len(skus)
+    total_operations = sum(len(site_skus[config.name]) for config in configs)
     completed_operations = 0
     successful_results = 0
     failed_results = 0
@@ -151,11 +354,19 @@ def run_scraping(
         f"🚀 Starting scraping: {len(configs)} scrapers × {len(skus)} SKUs = {total_operations} operations",
         "INFO",
     )
+    log(f"📝 Session {collector.session_id} journal: {journal.path}", "INFO")
 
-    import math
+    import threading
+    from collections import defaultdict
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
-    from src.core.settings_manager import settings
+    from src.scrapers.site_runner import (
+        EXECUTION_MODES,
+        create_browser_pool,
+        format_pool_stats,
+        run_sites_in_processes,
+        scrape_worker,
+    )
 
     max_workers = settings.get("max_workers", 2)
 
@@ -171,156 +382,242 @@ def run_scraping(
         log(f"⚙️ Using max {max_workers} concurrent workers (Automatic allocation)", "INFO")
 
     # Allocation Strategy: Explicit User Control
-    tasks = []
-    workers_used = 0
+    # All workers of a scraper pull from one shared SKU queue (work stealing),
+    # so a slow worker never leaves the others idle at the end of the run.
+    worker_counts: dict[str, int] = {}
 
     for config in configs:
         # Get requested workers for this scraper (default to 1)
         count = 1
         if scraper_workers and config.name in scraper_workers:
             count = scraper_workers[config.name]
+        count = max(1, min(count, len(site_skus[config.name])))
+        worker_counts[config.name] = count
 
         if count > 1:
-            # Split SKUs for this scraper
-            chunk_size = math.ceil(len(skus) / count)
-            sku_chunks = [skus[i : i + chunk_size] for i in range(0, len(skus), chunk_size)]
-
-            log(f"⚡ {config.name}: {len(sku_chunks)} workers (SKU splitting enabled)", "INFO")
-
-            for i, chunk in enumerate(sku_chunks):
-                tasks.append((config, chunk, f"W{i + 1}"))
-                workers_used += 1
+            log(f"⚡ {config.name}: {count} workers (shared SKU queue)", "INFO")
         else:
-            # Single worker
-            tasks.append((config, skus, "Main"))
-            workers_used += 1
             log(f"⚡ {config.name}: 1 worker (sequential)", "INFO")
 
-    log(f"📊 Total active workers: {workers_used}", "INFO")
-
-    def process_scraper(args):
-        """Process a scraper configuration with a specific list of SKUs."""
-        config, target_skus, worker_id = args
-        scraper_success = 0
-        scraper_failed = 0
-
-        prefix = f"[{config.name}:{worker_id}]"
+    log(f"📊 Total active workers: {sum(worker_counts.values())}", "INFO")
 
-        log(f"\n{'=' * 60}", "INFO")
-        log(f"📌 Starting scraper: {config.name} ({worker_id}) - {len(target_skus)} SKUs", "INFO")
-        log(f"{'=' * 60}", "INFO")
+    # Adaptive mode: worker counts become ceilings and each site starts with one
+    # active worker, growing while healthy and halving on rate limits/blocks
+    adaptive_concurrency = settings.get("adaptive_concurrency", False)
+    if adaptive_concurrency:
+        log("📶 Adaptive concurrency enabled: worker counts are per-site maximums", "INFO")
 
-        update_status(f"Running {config.name} ({worker_id})...")
+    execution_mode = execution_mode or settings.get("scraper_execution_mode", "thread")
+    if execution_mode not in EXECUTION_MODES:
+        log(f"⚠️ Unknown execution mode '{execution_mode}', using 'thread'", "WARNING")
+        execution_mode = "thread"
 
-        # Initialize executor for this scraper
-        try:
-            executor = WorkflowExecutor(config, headless=True)
-        except Exception as e:
-            log(f"❌ {prefix} Failed to initialize: {e}", "ERROR")
-            return 0, len(target_skus)
-
-        # Process each SKU
-        batch_size = 10
-        for idx, sku in enumerate(target_skus, 1):
-            # Check for cancellation
-            stop_event = kwargs.get("stop_event")
-            if stop_event and stop_event.is_set():
-                log(f"🛑 {prefix} Cancellation requested. Stopping...", "WARNING")
-                break
-
-            # Restart browser every batch_size items
-            if idx > 1 and (idx - 1) % batch_size == 0:
-                log(f"🔄 {prefix} Restarting browser (batch limit {batch_size} reached)...", "INFO")
-                try:
-                    if executor.browser:
-                        executor.browser.quit()
-                    # Re-initialize executor (which creates new browser)
-                    executor = WorkflowExecutor(config, headless=True)
-                except Exception as e:
-                    log(f"❌ {prefix} Failed to restart browser: {e}", "ERROR")
-                    pass
-
-            update_status(
-                f"{config.name} ({worker_id}): Processing SKU {idx}/{len(target_skus)} ({sku})"
-            )
+    # Per-domain request budgets are shared by all workers of this run only
+    from src.core.domain_rate_limiter import reset_domain_limiters
 
-            try:
-                # Execute workflow with SKU context
-                result = executor.execute_workflow(
-                    context={"sku": sku},
-                    quit_browser=False,  # Reuse browser for efficiency
-                )
+    reset_domain_limiters()
 
-                if result.get("success"):
-                    extracted_data = result.get("results", {})
+    # Profiles and Chrome processes left behind by crashed or killed runs
+    from src.utils.scraping.browser_lifecycle import (
+        get_browser_lifecycle,
+        reset_browser_lifecycle,
+        sweep_orphans,
+    )
 
-                    # Check if we actually found product data (not just "no results")
-                    has_data = any(
-                        extracted_data.get(field) for field in ["Name", "Brand", "Price", "Weight"]
-                    )
+    reset_browser_lifecycle()
+    try:
+        swept = sweep_orphans()
+        if swept.profiles_removed or swept.processes_killed:
+            log(f"🧹 Cleaned up after earlier runs: {swept}", "INFO")
+    except Exception as e:
+        log(f"⚠️ Failed to clean up old browser profiles: {e}", "WARNING")
+
+    pool_spares = settings.get("browser_pool_spares", 1)
+    disk_cache_mb = int(settings.get("browser_disk_cache_mb", 512))
+    stop_event = kwargs.get("stop_event")
+    progress_lock = threading.Lock()
+    queue_metrics: dict[str, dict] = {}  # Latest queue snapshot per scraper
+
+    def record_progress(queue_snapshot):
+        """Advance overall progress by one SKU and publish queue metrics."""
+        nonlocal completed_operations
+        with progress_lock:
+            completed_operations += 1
+            progress_pct = int((completed_operations / total_operations) * 100)
+            queue_metrics[queue_snapshot["scraper"]] = queue_snapshot
+            metrics = {"queues": list(queue_metrics.values())}
 
-                    if has_data:
-                        # Add to collector (JSON storage)
-                        collector.add_result(sku, config.name, extracted_data)
-                        scraper_success += 1
-
-                        # Log product details (Price is from input file, not scraped)
-                        name = extracted_data.get("Name", "N/A")
-                        brand = extracted_data.get("Brand", "N/A")
-                        weight = extracted_data.get("Weight", "N/A")
-                        log(
-                            f"✅ {prefix} Found: {name} | Brand: {brand} | Weight: {weight}", "INFO"
-                        )
-                    else:
-                        # SKU not found on this site - skip (per user requirement #4)
-                        # log(f"⚠️ {prefix} No data found for SKU: {sku}", "WARNING") # Suppressed per user request
-                        scraper_failed += 1
-                else:
-                    scraper_failed += 1
-                    log(f"❌ {prefix} Failed to scrape SKU: {sku}", "ERROR")
+        # Queue depth and in-flight counts for every scraper, plus SKU/worker counters
+        metrics["counters"] = bus.counters.snapshot()
+        bus.publish(ScrapeEvent(EventType.PROGRESS, data=progress_pct))
+        bus.publish(ScrapeEvent(EventType.METRICS, data=metrics))
 
-            except Exception as e:
-                scraper_failed += 1
-                log(f"❌ {prefix} Error scraping SKU {sku}: {e}", "ERROR")
+    early_stopped = 0
 
-            # Update progress (thread-safe way needed ideally, but simple increment works for rough progress)
-            nonlocal completed_operations
-            completed_operations += 1
-            if progress_callback:
-                progress_pct = int((completed_operations / total_operations) * 100)
-                try:
-                    progress_callback.emit(progress_pct)
-                except AttributeError:
-                    progress_callback(progress_pct)
-
-        # Cleanup browser for this scraper
+    def record_outcome(sku, scraper_name, status, data):
+        """Journal the outcome of one SKU and collect found products."""
+        nonlocal early_stopped
         try:
-            if executor.browser:
-                executor.browser.quit()
+            journal.record(scraper_name, sku, status, data)
         except Exception as e:
-            log(f"⚠️ {prefix} Error closing browser: {e}", "WARNING")
+            log(f"⚠️ Failed to journal {scraper_name}/{sku}: {e}", "WARNING")
+        if status == "success":
+            collector.add_result(sku, scraper_name, data)
+            if found_skus is not None:
+                found_skus.add(sku, data)
+            if negative_cache is not None:
+                negative_cache.discard(scraper_name, sku)
+            if result_cache is not None and scraper_name in config_hashes:
+                result_cache.put(scraper_name, sku, config_hashes[scraper_name], data)
+        elif status == "no_result" and negative_cache is not None:
+            if data and data.get("no_results_found"):
+                negative_cache.add(scraper_name, sku)
+        elif status == "skipped":
+            with progress_lock:
+                early_stopped += 1
+
+    if execution_mode == "process":
+        # One process per site: each site's workers, browser pool and SKU queue
+        # live in their own interpreter and stream events back to this one.
+        site_successes: dict[str, int] = defaultdict(int)
+
+        def handle_event(event):
+            nonlocal successful_results, failed_results
+            kind = event[0]
+            if kind == "log":
+                log(event[1], event[2])
+            elif kind == "status":
+                update_status(event[1])
+            elif kind == "result":
+                _, sku, scraper_name, status, data = event
+                record_outcome(sku, scraper_name, status, data)
+                if status == "success":
+                    site_successes[scraper_name] += 1
+            elif kind == "progress":
+                record_progress(event[1])
+            elif kind == "event":
+                bus.publish(event[1])
+            elif kind == "done":
+                _, scraper_name, s_success, s_failed = event
+                if s_success is None:
+                    # Site process crashed: keep what it streamed, fail the rest
+                    s_success = site_successes[scraper_name]
+                    s_failed = len(site_skus[scraper_name]) - s_success
+                successful_results += s_success
+                failed_results += s_failed
 
-        log(f"✅ Completed task: {config.name} ({worker_id})", "INFO")
-        return scraper_success, scraper_failed
+        max_processes = min(len(configs), max_workers)
+        if found_skus is not None:
+            log("ℹ️ Routing early stop is not applied across site processes", "INFO")
+        log(f"🧩 Process mode: {len(configs)} site processes (max {max_processes} at once)", "INFO")
+        run_sites_in_processes(
+            [(config, site_skus[config.name], worker_counts[config.name]) for config in configs],
+            max_processes,
+            pool_spares,
+            handle_event,
+            stop_event,
+            adaptive_concurrency=adaptive_concurrency,
+            product_url_index=product_url_index,
+            disk_cache_mb=disk_cache_mb,
+        )
+    else:
+        # Warm browser pools: one per scraper, sized to its worker count.
+        # Browsers are only recycled by health policy instead of every N SKUs.
+        from src.core.failure_analytics import FailureAnalytics
+        from src.scrapers.concurrency_controller import ConcurrencyController
+        from src.scrapers.product_url_index import ProductUrlIndex
+        from src.scrapers.sku_queue import SKUWorkQueue
+        from src.utils.scraping.browser_pool import BrowserPool
+        from src.utils.scraping.http_browser import close_http_clients
+
+        pools: dict[str, BrowserPool] = {}
+        work_queues: dict[str, SKUWorkQueue] = {}
+        controllers: dict[str, ConcurrencyController] = {}
+        product_urls = ProductUrlIndex() if product_url_index and configs else None
+        tasks = []
+        for config in configs:
+            count = worker_counts[config.name]
+            pools[config.name] = create_browser_pool(config, count, pool_spares, disk_cache_mb)
+            work_queues[config.name] = SKUWorkQueue(config.name, site_skus[config.name])
+            if adaptive_concurrency:
+                controllers[config.name] = ConcurrencyController(
+                    config.name, count, FailureAnalytics(), log
+                )
+            worker_ids = [f"W{i + 1}" for i in range(count)] if count > 1 else ["Main"]
+            tasks.extend((config, worker_id) for worker_id in worker_ids)
+
+        def process_scraper(args):
+            """Process SKUs from the scraper's shared work queue until it is drained."""
+            config, worker_id = args
+            work_queue = work_queues[config.name]
+            return scrape_worker(
+                config,
+                worker_id,
+                pools[config.name],
+                work_queue,
+                log,
+                update_status,
+                record_outcome,
+                lambda: record_progress(work_queue.snapshot()),
+                stop_event,
+                controllers.get(config.name),
+                found_skus.__contains__ if found_skus is not None else None,
+                bus.publish,
+                product_urls,
+            )
 
-    # Run scrapers in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as thread_executor:
-        # Submit all tasks
-        futures = [thread_executor.submit(process_scraper, task) for task in tasks]
+        # Run scrapers in parallel
+        with ThreadPoolExecutor(max_workers=max_workers) as thread_executor:
+            # Submit all tasks
+            futures = [thread_executor.submit(process_scraper, task) for task in tasks]
 
-        for future in as_completed(futures):
-            try:
-                s_success, s_failed = future.result()
-                successful_results += s_success
-                failed_results += s_failed
-            except Exception as exc:
-                log(f"❌ Scraper task generated an exception: {exc}", "ERROR")
+            for future in as_completed(futures):
+                try:
+                    s_success, s_failed = future.result()
+                    successful_results += s_success
+                    failed_results += s_failed
+                except Exception as exc:
+                    log(f"❌ Scraper task generated an exception: {exc}", "ERROR")
+
+        # SKUs left behind when every worker of a scraper failed to start
+        cancelled = bool(stop_event and stop_event.is_set())
+        for work_queue in work_queues.values():
+            remaining = work_queue.drain()
+            if remaining and not cancelled:
+                failed_results += len(remaining)
+                log(
+                    f"⚠️ {work_queue.scraper_name}: {len(remaining)} SKUs were not processed",
+                    "WARNING",
+                )
+
+        # Close every pooled browser
+        for pool in pools.values():
+            log(format_pool_stats(pool.get_stats()), "INFO")
+            pool.shutdown()
+        close_http_clients()
+        if product_urls is not None:
+            product_urls.close()
+
+    journal.close()
+    if negative_cache is not None:
+        negative_cache.close()
+    if result_cache is not None:
+        result_cache.close()
+    if early_stopped:
+        log(f"🧭 Skipped {early_stopped} lookups for SKUs already found on another site", "INFO")
+    if stop_event and stop_event.is_set():
+        log(f"▶️ Session {collector.session_id} can be resumed from {journal.path}", "INFO")
 
     # Save results to JSON file
-    log("\n💾 Saving results to JSON file...", "INFO")
     try:
-        json_file = collector.save_session(metadata={"price": price_metadata})
-        log(f"✅ Results saved to: {json_file}", "INFO")
+        if collector.stream and not settings.get("write_session_json", False):
+            # The Results Hub writes the session JSON when the session is opened
+            collector.close(metadata={"price": price_metadata})
+            log(f"✅ Results streamed to: {collector.stream_path}", "INFO")
+        else:
+            log("\n💾 Saving results to JSON file...", "INFO")
+            json_file = collector.save_session(metadata={"price": price_metadata})
+            log(f"✅ Results saved to: {json_file}", "INFO")
 
         # Display collection stats
         stats = collector.get_stats()
@@ -338,7 +635,52 @@ def run_scraping(
     log(f"📊 Total operations: {total_operations}", "INFO")
     log(f"✅ Successful: {successful_results}", "INFO")
     log(f"❌ Failed: {failed_results}", "INFO")
-    log(f"📈 Success rate: {(successful_results / total_operations * 100):.1f}%", "INFO")
+    if cached_results:
+        log(f"💾 Served from cache: {cached_results}", "INFO")
+    if total_operations:
+        log(f"📈 Success rate: {(successful_results / total_operations * 100):.1f}%", "INFO")
+
+    cleanup = get_browser_lifecycle().totals
+    if cleanup.profiles_removed or cleanup.processes_killed:
+        log(f"🧹 Browser cleanup: {cleanup}", "INFO")
+
+    counters = bus.counters.snapshot()
+
+    # Requests the resource policy kept Chrome from making (see resource_policy)
+    blocked = {
+        name[len(BLOCKED_REQUESTS_COUNTER) :]: count
+        for name, count in counters.items()
+        if name.startswith(BLOCKED_REQUESTS_COUNTER)
+    }
+    if blocked:
+        log(
+            f"🚫 Blocked requests: {sum(blocked.values())} ("
+            + ", ".join(f"{t}: {n}" for t, n in sorted(blocked.items()))
+            + f"); {counters.get('transferred_bytes', 0) / 1024 / 1024:.1f} MB downloaded",
+            "INFO",
+        )
+
+    # Bytes the site's persistent HTTP cache saved downloading (see disk_cache)
+    cache_hit_bytes = counters.get("cache_hit_bytes", 0)
+    if cache_hit_bytes:
+        network_bytes = counters.get("transferred_bytes", 0)
+        log(
+            f"💾 Disk cache: {cache_hit_bytes / 1024 / 1024:.1f} MB read from cache, "
+            f"{network_bytes / 1024 / 1024:.1f} MB from the network "
+            f"({cache_hit_bytes / (cache_hit_bytes + network_bytes) * 100:.0f}% of bytes)",
+            "INFO",
+        )
+
+    # Time spent in fixed sleeps that a wait condition could replace (scripts/lint_workflows.py)
+    fixed_sleeps = {
+        name[len(FIXED_SLEEP_COUNTER) :]: ms
+        for name, ms in counters.items()
+        if name.startswith(FIXED_SLEEP_COUNTER)
+    }
+    if fixed_sleeps:
+        log(f"💤 Fixed sleeps: {sum(fixed_sleeps.values()) / 1000:.1f}s", "INFO")
+        for source, ms in sorted(fixed_sleeps.items(), key=lambda item: -item[1]):
+            log(f"   {source}: {ms / 1000:.1f}s", "INFO")
 
     update_status("Scraping complete!")
 
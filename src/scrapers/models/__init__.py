@@ -1,3 +1,3 @@
-from .config import LoginConfig, ScraperConfig, SelectorConfig, WorkflowStep
+from .config import PRODUCT_FIELDS, LoginConfig, ScraperConfig, SelectorConfig, WorkflowStep
 
-__all__ = ["LoginConfig", "ScraperConfig", "SelectorConfig", "WorkflowStep"]
+__all__ = ["PRODUCT_FIELDS", "LoginConfig", "ScraperConfig", "SelectorConfig", "WorkflowStep"]
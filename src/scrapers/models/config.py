@@ -1,8 +1,12 @@
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.core.anti_detection_manager import AntiDetectionConfig
+from src.utils.scraping.resource_policy import blocked_url_patterns
+
+# Fields that must be present for a result to count as a found product
+PRODUCT_FIELDS = ("Name", "Brand", "Price", "Weight")
 
 
 class SelectorConfig(BaseModel):
@@ -14,6 +18,10 @@ class SelectorConfig(BaseModel):
         None, description="Attribute to extract (e.g., 'text', 'href', 'src')"
     )
     multiple: bool = Field(False, description="Whether to extract multiple elements")
+    optional: bool = Field(
+        False,
+        description="Whether the field is often absent (look it up without the implicit wait)",
+    )
 
 
 class WorkflowStep(BaseModel):
@@ -57,6 +65,36 @@ class HttpStatusConfig(BaseModel):
     )
 
 
+class ResourcePolicyConfig(BaseModel):
+    """Resources Chrome does not download for this scraper."""
+
+    enabled: bool = Field(True, description="Whether to block resources at all")
+    block_types: list[Literal["image", "media", "font", "stylesheet"]] = Field(
+        default_factory=lambda: ["image", "media", "font"],
+        description="Resource types to block (image URLs are still read from src attributes)",
+    )
+    block_trackers: bool = Field(True, description="Whether to block known ad/analytics hosts")
+    block_hosts: list[str] = Field(default_factory=list, description="Extra hosts to block")
+    allow_hosts: list[str] = Field(
+        default_factory=list, description="Hosts the site needs, exempted from host blocking"
+    )
+    block_patterns: list[str] = Field(
+        default_factory=list, description="Extra URL patterns to block ('*' wildcards)"
+    )
+
+    def blocked_urls(self) -> list[str]:
+        """URL patterns for Network.setBlockedURLs (empty when disabled)."""
+        if not self.enabled:
+            return []
+        return blocked_url_patterns(
+            self.block_types,
+            block_trackers=self.block_trackers,
+            block_hosts=self.block_hosts,
+            allow_hosts=self.allow_hosts,
+            block_patterns=self.block_patterns,
+        )
+
+
 class ValidationConfig(BaseModel):
     """Configuration for data validation and no-results detection."""
 
@@ -96,6 +134,21 @@ class ScraperConfig(BaseModel):
         None, description="List of normalization rules"
     )
     login: LoginConfig | None = Field(None, description="Login configuration if required")
+    engine: Literal["browser", "http"] = Field(
+        "browser",
+        description=(
+            "'browser' drives Chrome; 'http' fetches server-rendered pages with a pooled "
+            "HTTP client and falls back to Chrome for SKUs that need JavaScript"
+        ),
+    )
+    extraction: Literal["live", "snapshot", "script"] = Field(
+        "live",
+        description=(
+            "'live' queries Chrome for every field; 'snapshot' pulls the rendered DOM once "
+            "per page and evaluates all extract selectors in-process; 'script' evaluates "
+            "all fields of an extract step in the page with one execute_script call"
+        ),
+    )
     timeout: int = Field(30, description="Default timeout in seconds")
     retries: int = Field(3, description="Number of retries on failure")
     anti_detection: AntiDetectionConfig | None = Field(
@@ -107,7 +160,61 @@ class ScraperConfig(BaseModel):
     validation: ValidationConfig | None = Field(
         None, description="Data validation and no-results configuration"
     )
+    resource_policy: ResourcePolicyConfig = Field(
+        default_factory=ResourcePolicyConfig,
+        description="Images, media, fonts and tracker hosts Chrome does not download",
+    )
+    profile_template: bool = Field(
+        True,
+        description=(
+            "Start browsers from a copy of a pre-warmed profile (start page visited, "
+            "cookie banner accepted) instead of an empty one"
+        ),
+    )
+    tabs_per_browser: int = Field(
+        1,
+        ge=1,
+        description=(
+            "Tabs each browser drives: the next SKUs' first pages load in the other tabs "
+            "while one is being extracted"
+        ),
+    )
+    disk_cache: bool = Field(
+        True,
+        description=(
+            "Keep Chrome's HTTP cache (stylesheets, scripts, fonts) across browser "
+            "restarts in data/browser_cache"
+        ),
+    )
     test_skus: list[str] | None = Field(None, description="List of SKUs to use for testing")
+    cache_ttl_hours: float | None = Field(
+        None,
+        description="Hours a cached result stays fresh (overrides the global setting, 0 disables)",
+    )
+
+    def requires_http_status(self) -> bool:
+        """Check if this scraper reads the HTTP status of its pages.
+
+        Returns:
+            True if HTTP status monitoring is enabled or a step validates the status
+        """
+        if self.http_status is not None and self.http_status.enabled:
+            return True
+        return any(step.action == "validate_http_status" for step in self.workflows)
+
+    def consent_selectors(self) -> list[str]:
+        """Get the cookie banner selectors clicked before the workflow's first navigate.
+
+        Returns:
+            Selectors of the leading conditional_click steps
+        """
+        selectors = []
+        for step in self.workflows:
+            if step.action == "navigate":
+                break
+            if step.action == "conditional_click" and step.params.get("selector"):
+                selectors.append(step.params["selector"])
+        return selectors
 
     def requires_login(self) -> bool:
         """Check if this scraper requires authentication/login.
@@ -0,0 +1,249 @@
+"""
+Negative Cache Module
+
+Persistent record of site/SKU pairs whose workflow ended with
+``no_results_found``, so later runs can skip the navigate/wait/classify cycle
+for SKUs a site is known not to carry. Entries expire after a TTL, and a
+configurable fraction of fresh entries is rechecked anyway so products that
+appear on a site later are eventually picked up.
+"""
+
+import random
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+
+def normalize_sku(sku: str) -> str:
+    """Normalize a SKU for cache keys (case, whitespace and dashes are ignored)."""
+    return "".join(str(sku).split()).replace("-", "").upper()
+
+
+class NegativeCache:
+    """SQLite-backed cache of (site, SKU) pairs known to have no results."""
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        ttl_days: float = 14.0,
+        recheck_ratio: float = 0.1,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: Path to the SQLite cache. If None, uses data/databases/negative_cache.db.
+            ttl_days: Days after which an entry no longer causes a skip
+            recheck_ratio: Fraction of fresh entries scheduled anyway (0.0 to 1.0)
+        """
+        if db_path is None:
+            # src/scrapers/negative_cache.py -> src/scrapers -> src -> root
+            project_root = Path(__file__).parent.parent.parent
+            db_path = project_root / "data" / "databases" / "negative_cache.db"
+
+        self.db_path = Path(db_path).resolve()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_days * 86400
+        self.recheck_ratio = recheck_ratio
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS negative_cache (
+                site TEXT NOT NULL,
+                sku TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 1,
+                PRIMARY KEY (site, sku)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def add(self, site: str, sku: str, now: float | None = None) -> None:
+        """
+        Record that a site has no results for a SKU.
+
+        Args:
+            site: Scraper name
+            sku: Product SKU
+            now: Timestamp of the observation (defaults to the current time)
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO negative_cache (site, sku, first_seen, last_seen, hits)
+                VALUES (?, ?, ?, ?, 1)
+                ON CONFLICT (site, sku) DO UPDATE SET last_seen = excluded.last_seen,
+                    hits = hits + 1
+                """,
+                (site, normalize_sku(sku), now, now),
+            )
+            self._conn.commit()
+
+    def discard(self, site: str, sku: str) -> bool:
+        """
+        Remove a pair (e.g. after a recheck found the product).
+
+        Returns:
+            True if an entry was removed
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM negative_cache WHERE site = ? AND sku = ?",
+                (site, normalize_sku(sku)),
+            )
+            self._conn.commit()
+            return cursor.rowcount > 0
+
+    def is_fresh(self, site: str, sku: str, now: float | None = None) -> bool:
+        """Check whether a pair has an entry younger than the TTL."""
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_seen FROM negative_cache WHERE site = ? AND sku = ?",
+                (site, normalize_sku(sku)),
+            ).fetchone()
+        return row is not None and now - row[0] < self.ttl_seconds
+
+    def filter(
+        self,
+        site: str,
+        skus: list[str],
+        now: float | None = None,
+        rng: Callable[[], float] = random.random,
+    ) -> tuple[list[str], list[str]]:
+        """
+        Split a site's SKUs into those to scrape and those to skip.
+
+        Args:
+            site: Scraper name
+            skus: SKUs that would be scheduled for the site
+            now: Current timestamp (defaults to the current time)
+            rng: Random source deciding rechecks (for tests)
+
+        Returns:
+            Tuple of (SKUs to scrape, SKUs skipped because of a fresh entry)
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            fresh = {
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT sku FROM negative_cache WHERE site = ? AND last_seen > ?",
+                    (site, now - self.ttl_seconds),
+                )
+            }
+
+        scheduled: list[str] = []
+        skipped: list[str] = []
+        for sku in skus:
+            if normalize_sku(sku) in fresh and rng() >= self.recheck_ratio:
+                skipped.append(sku)
+            else:
+                scheduled.append(sku)
+        return scheduled, skipped
+
+    def entries(self, site: str | None = None, now: float | None = None) -> list[dict[str, Any]]:
+        """
+        List cache entries, most recently seen first.
+
+        Args:
+            site: Only list entries of this scraper
+            now: Current timestamp used to flag expired entries
+
+        Returns:
+            List of entry dictionaries with an "expired" flag
+        """
+        now = time.time() if now is None else now
+        query = "SELECT site, sku, first_seen, last_seen, hits FROM negative_cache"
+        params: tuple = ()
+        if site:
+            query += " WHERE site = ?"
+            params = (site,)
+        query += " ORDER BY last_seen DESC"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            {
+                "site": row[0],
+                "sku": row[1],
+                "first_seen": row[2],
+                "last_seen": row[3],
+                "hits": row[4],
+                "expired": now - row[3] >= self.ttl_seconds,
+            }
+            for row in rows
+        ]
+
+    def purge(
+        self,
+        site: str | None = None,
+        sku: str | None = None,
+        expired_only: bool = False,
+        now: float | None = None,
+    ) -> int:
+        """
+        Delete cache entries. Without filters every entry is deleted.
+
+        Args:
+            site: Only delete entries of this scraper
+            sku: Only delete entries of this SKU
+            expired_only: Only delete entries older than the TTL
+            now: Current timestamp (defaults to the current time)
+
+        Returns:
+            Number of deleted entries
+        """
+        now = time.time() if now is None else now
+        conditions = []
+        params: list[Any] = []
+        if site:
+            conditions.append("site = ?")
+            params.append(site)
+        if sku:
+            conditions.append("sku = ?")
+            params.append(normalize_sku(sku))
+        if expired_only:
+            conditions.append("last_seen <= ?")
+            params.append(now - self.ttl_seconds)
+
+        query = "DELETE FROM negative_cache"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+            self._conn.commit()
+            return cursor.rowcount
+
+    def get_stats(self, now: float | None = None) -> dict[str, dict[str, int]]:
+        """
+        Get entry counts per site.
+
+        Returns:
+            Dictionary mapping site names to {"fresh", "expired"} counts
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT site, SUM(last_seen > ?), SUM(last_seen <= ?)
+                FROM negative_cache GROUP BY site ORDER BY site
+                """,
+                (now - self.ttl_seconds, now - self.ttl_seconds),
+            ).fetchall()
+        return {row[0]: {"fresh": row[1], "expired": row[2]} for row in rows}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,126 @@
+"""
+Lint scraper workflows for fixed sleeps.
+
+A fixed sleep always costs its full duration, even when the page was ready
+long before. Every ``wait`` step without ``until`` and every ``wait_after``
+without ``wait_until`` is reported together with the page condition
+(see ``src.utils.scraping.page_conditions``) that can end it early.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from src.utils.scraping.page_conditions import CONDITIONS
+
+# Condition suggested for a fixed wait_after, by action
+WAIT_AFTER_SUGGESTIONS = {
+    "click": "url_changed",
+    "navigate": "network_idle",
+}
+
+
+@dataclass
+class LintFinding:
+    """One problem found in a workflow step."""
+
+    step: str  # Position of the step, e.g. "3" or "5.then.0"
+    action: str
+    message: str
+    suggestion: str = ""
+
+
+def _lint_condition(step: str, action: str, params: dict[str, Any], key: str) -> list[LintFinding]:
+    condition = params.get(key)
+    if condition not in CONDITIONS:
+        return [
+            LintFinding(
+                step,
+                action,
+                f"Unknown {key} condition '{condition}'",
+                f"Use one of: {', '.join(CONDITIONS)}",
+            )
+        ]
+    if condition == "element_count_stable" and not params.get("selector"):
+        return [LintFinding(step, action, f"{key}: element_count_stable requires 'selector'")]
+    return []
+
+
+def lint_steps(steps: list[dict[str, Any]], prefix: str = "") -> list[LintFinding]:
+    """
+    Find fixed sleeps and invalid wait conditions in workflow steps.
+
+    Args:
+        steps: Raw workflow steps (``action`` and ``params`` dicts)
+        prefix: Position prefix for nested steps
+
+    Returns:
+        Findings in step order
+    """
+    findings: list[LintFinding] = []
+    for index, step_data in enumerate(steps):
+        position = f"{prefix}{index}"
+        action = step_data.get("action", "")
+        params = step_data.get("params") or {}
+        next_action = steps[index + 1].get("action") if index + 1 < len(steps) else None
+
+        if action == "wait":
+            seconds = params.get("seconds", params.get("timeout", 1))
+            if "until" in params:
+                findings += _lint_condition(position, action, params, "until")
+            elif next_action == "wait_for":
+                findings.append(
+                    LintFinding(
+                        position,
+                        action,
+                        f"Fixed sleep of {seconds}s before a wait_for",
+                        "Remove it (wait_for already waits for the page) "
+                        "or add 'until: network_idle'",
+                    )
+                )
+            else:
+                findings.append(
+                    LintFinding(
+                        position,
+                        action,
+                        f"Fixed sleep of {seconds}s",
+                        "Add 'until: dom_stable' (or network_idle / element_count_stable)",
+                    )
+                )
+
+        if params.get("wait_after"):
+            if "wait_until" in params:
+                findings += _lint_condition(position, action, params, "wait_until")
+            else:
+                suggestion = WAIT_AFTER_SUGGESTIONS.get(action, "dom_stable")
+                findings.append(
+                    LintFinding(
+                        position,
+                        action,
+                        f"Fixed wait_after of {params['wait_after']}s",
+                        f"Add 'wait_until: {suggestion}'",
+                    )
+                )
+
+        for branch in ("then", "else"):
+            nested = params.get(branch)
+            if isinstance(nested, list):
+                findings += lint_steps(nested, prefix=f"{position}.{branch}.")
+    return findings
+
+
+def lint_config_file(path: str | Path) -> list[LintFinding]:
+    """
+    Lint the workflows of a scraper YAML config.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Findings in step order
+    """
+    with open(path, encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+    return lint_steps(config.get("workflows") or [])
@@ -0,0 +1,133 @@
+"""
+Product URL Index Module
+
+Persistent per-site index of the product page each SKU led to. Most workflows
+navigate to a search page and click the first result, which costs two page
+loads; once a run has followed that path, later runs jump straight to the
+learned product URL and only fall back to the search path when the page no
+longer yields a product.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from src.scrapers.negative_cache import normalize_sku
+
+
+class ProductUrlIndex:
+    """SQLite-backed mapping of (site, SKU) to the SKU's product page URL."""
+
+    def __init__(self, db_path: str | Path | None = None):
+        """
+        Initialize the index.
+
+        Args:
+            db_path: Path to the SQLite index. If None, uses data/databases/product_urls.db.
+        """
+        if db_path is None:
+            # src/scrapers/product_url_index.py -> src/scrapers -> src -> root
+            project_root = Path(__file__).parent.parent.parent
+            db_path = project_root / "data" / "databases" / "product_urls.db"
+
+        self.db_path = Path(db_path).resolve()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS product_urls (
+                site TEXT NOT NULL,
+                sku TEXT NOT NULL,
+                url TEXT NOT NULL,
+                learned_at REAL NOT NULL,
+                last_used REAL,
+                uses INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (site, sku)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, site: str, sku: str) -> str | None:
+        """Get the learned product URL of a SKU on a site."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url FROM product_urls WHERE site = ? AND sku = ?",
+                (site, normalize_sku(sku)),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, site: str, sku: str, url: str, now: float | None = None) -> None:
+        """
+        Store (or replace) the product URL a search for a SKU led to.
+
+        Args:
+            site: Scraper name
+            sku: Product SKU
+            url: Product page URL
+            now: Timestamp of the observation (defaults to the current time)
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO product_urls (site, sku, url, learned_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT (site, sku) DO UPDATE SET url = excluded.url,
+                    learned_at = excluded.learned_at, last_used = NULL, uses = 0
+                WHERE url != excluded.url
+                """,
+                (site, normalize_sku(sku), url, now),
+            )
+            self._conn.commit()
+
+    def mark_used(self, site: str, sku: str, now: float | None = None) -> None:
+        """Record that a learned URL yielded the product again."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._conn.execute(
+                "UPDATE product_urls SET last_used = ?, uses = uses + 1 WHERE site = ? AND sku = ?",
+                (now, site, normalize_sku(sku)),
+            )
+            self._conn.commit()
+
+    def discard(self, site: str, sku: str) -> bool:
+        """
+        Remove a URL (e.g. after it no longer led to the product).
+
+        Returns:
+            True if an entry was removed
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM product_urls WHERE site = ? AND sku = ?",
+                (site, normalize_sku(sku)),
+            )
+            self._conn.commit()
+            return cursor.rowcount > 0
+
+    def purge(self, site: str | None = None) -> int:
+        """
+        Delete learned URLs.
+
+        Args:
+            site: Only delete entries of this scraper (all entries if None)
+
+        Returns:
+            Number of deleted entries
+        """
+        with self._lock:
+            if site:
+                cursor = self._conn.execute("DELETE FROM product_urls WHERE site = ?", (site,))
+            else:
+                cursor = self._conn.execute("DELETE FROM product_urls")
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
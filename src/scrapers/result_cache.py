@@ -0,0 +1,184 @@
+"""
+Result Cache Module
+
+Persistent cache of successfully extracted results, keyed by scraper, SKU and
+a hash of the scraper's extraction config. Re-running a file within a site's
+freshness TTL serves the cached fields instead of scraping the SKU again, and
+editing a site's selectors or workflow changes the hash, which invalidates
+that site's entries.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from src.scrapers.models.config import ScraperConfig
+from src.scrapers.negative_cache import normalize_sku
+
+# Parts of a scraper config that determine what gets extracted
+CACHE_KEY_FIELDS = ("base_url", "selectors", "workflows", "normalization")
+
+
+def config_hash(config: ScraperConfig) -> str:
+    """
+    Hash the extraction-relevant parts of a scraper config.
+
+    Args:
+        config: Scraper configuration
+
+    Returns:
+        Short hex digest that changes whenever selectors, workflows,
+        normalization or the base URL change
+    """
+    relevant = config.model_dump(mode="json", include=set(CACHE_KEY_FIELDS))
+    encoded = json.dumps(relevant, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class ResultCache:
+    """SQLite-backed cache of extracted results across scraping runs."""
+
+    def __init__(self, db_path: str | Path | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: Path to the SQLite cache. If None, uses data/databases/result_cache.db.
+        """
+        if db_path is None:
+            # src/scrapers/result_cache.py -> src/scrapers -> src -> root
+            project_root = Path(__file__).parent.parent.parent
+            db_path = project_root / "data" / "databases" / "result_cache.db"
+
+        self.db_path = Path(db_path).resolve()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS result_cache (
+                site TEXT NOT NULL,
+                sku TEXT NOT NULL,
+                config_hash TEXT NOT NULL,
+                data TEXT NOT NULL,
+                scraped_at REAL NOT NULL,
+                PRIMARY KEY (site, sku)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def put(
+        self,
+        site: str,
+        sku: str,
+        config_digest: str,
+        data: dict[str, Any],
+        now: float | None = None,
+    ) -> None:
+        """
+        Store (or replace) the result of a SKU on a site.
+
+        Args:
+            site: Scraper name
+            sku: Product SKU
+            config_digest: config_hash() of the scraper config that produced the result
+            data: Extracted fields
+            now: Timestamp of the scrape (defaults to the current time)
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO result_cache VALUES (?, ?, ?, ?, ?)",
+                (
+                    site,
+                    normalize_sku(sku),
+                    config_digest,
+                    json.dumps(data, ensure_ascii=False),
+                    now,
+                ),
+            )
+            self._conn.commit()
+
+    def get_fresh(
+        self,
+        site: str,
+        skus: list[str],
+        config_digest: str,
+        ttl_seconds: float,
+        now: float | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Look up cached results that are still fresh.
+
+        Args:
+            site: Scraper name
+            skus: SKUs to look up
+            config_digest: config_hash() of the current scraper config
+            ttl_seconds: Maximum age of a usable result
+            now: Current timestamp (defaults to the current time)
+
+        Returns:
+            Dictionary mapping the requested SKUs to their cached fields
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT sku, data FROM result_cache
+                WHERE site = ? AND config_hash = ? AND scraped_at > ?
+                """,
+                (site, config_digest, now - ttl_seconds),
+            ).fetchall()
+        cached = {sku: data for sku, data in rows}
+
+        fresh = {}
+        for sku in skus:
+            data = cached.get(normalize_sku(sku))
+            if data is not None:
+                fresh[sku] = json.loads(data)
+        return fresh
+
+    def invalidate_stale_configs(self, site: str, config_digest: str) -> int:
+        """
+        Delete a site's entries produced by a different version of its config.
+
+        Returns:
+            Number of deleted entries
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM result_cache WHERE site = ? AND config_hash != ?",
+                (site, config_digest),
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def purge(self, site: str | None = None) -> int:
+        """
+        Delete cached results.
+
+        Args:
+            site: Only delete entries of this scraper (all entries if None)
+
+        Returns:
+            Number of deleted entries
+        """
+        with self._lock:
+            if site:
+                cursor = self._conn.execute("DELETE FROM result_cache WHERE site = ?", (site,))
+            else:
+                cursor = self._conn.execute("DELETE FROM result_cache")
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
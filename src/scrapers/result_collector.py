@@ -2,38 +2,139 @@
 Result Collector Module
 
 Collects and stores scraper results as JSON files for later consolidation.
+
+Results are either kept in memory and written as one JSON file at the end of a
+session, or (in streaming mode) appended to a JSONL file as they arrive so that
+memory stays flat regardless of how many SKUs are scraped.
 """
 
+import contextlib
+import gzip
+import io
 import json
+import os
+import shutil
+import tempfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+# File suffix for each supported stream compression
+STREAM_SUFFIXES = {
+    None: ".results.jsonl",
+    "gzip": ".results.jsonl.gz",
+    "zstd": ".results.jsonl.zst",
+}
+
+
+def _open_stream(path: Path, mode: str, compression: str | None) -> IO[str]:
+    """Open a (possibly compressed) JSONL stream in text mode."""
+    if compression is None:
+        return open(path, mode, encoding="utf-8")
+    if compression == "gzip":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "zstandard library is required for zstd compression.\n"
+                "Install with: pip install zstandard"
+            )
+        raw = open(path, mode + "b")
+        if mode == "r":
+            # Each append session adds a frame, so read across frames
+            reader = zstandard.ZstdDecompressor().stream_reader(
+                raw, read_across_frames=True, closefd=True
+            )
+            return io.TextIOWrapper(io.BufferedReader(reader), encoding="utf-8")
+        return io.TextIOWrapper(
+            zstandard.ZstdCompressor().stream_writer(raw, closefd=True), encoding="utf-8"
+        )
+    raise ValueError(f"Unsupported compression: {compression}")
 
 
 class ResultCollector:
     """Utility class to collect and store scraper results as JSON."""
 
-    def __init__(self, output_dir: str | Path | None = None):
+    def __init__(
+        self,
+        output_dir: str | Path | None = None,
+        session_id: str | None = None,
+        stream: bool = False,
+        compression: str | None = None,
+        fsync_interval: float = 5.0,
+    ):
         """
         Initialize result collector.
 
         Args:
             output_dir: Directory to save result JSON files. If None, uses default.
+            session_id: Existing session to continue. If None, starts a new session.
+            stream: Append results to a JSONL file instead of keeping them in memory
+            compression: Stream compression: None, "gzip" or "zstd"
+            fsync_interval: Seconds between fsyncs of the stream file (0 syncs every result)
         """
         if output_dir is None:
-            # Default to project data/scraper_results/
             # Default to project data/scraper_results/
             # src/scrapers/result_collector.py -> src/scrapers -> src -> root
             project_root = Path(__file__).parent.parent.parent
             output_dir = project_root / "data" / "scraper_results"
 
+        if compression not in STREAM_SUFFIXES:
+            raise ValueError(f"Unsupported compression: {compression}")
+
         self.output_dir = Path(output_dir).resolve()
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         # Current session results
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S")
         self.results: dict[str, dict[str, Any]] = {}  # {scraper_name: {sku: result}}
 
+        # Streaming sink: results live on disk, only a small index stays in memory
+        self.stream = stream
+        self.compression = compression
+        self.fsync_interval = fsync_interval
+        self.stream_path = self.output_dir / (
+            f"scrape_session_{self.session_id}{STREAM_SUFFIXES[compression]}"
+        )
+        # {sku: {scraper_name: (line number, byte offset)}} of the latest result
+        self._index: dict[str, dict[str, tuple[int, int]]] = {}
+        self._scrapers: dict[str, int] = {}  # {scraper_name: result count}
+        self._stream_file: IO[str] | None = None
+        self._line_count = 0
+        self._byte_offset = 0
+        self._last_fsync = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.metadata_path = self.output_dir / f"scrape_session_{self.session_id}.meta.json"
+
+        if stream and self.stream_path.exists():
+            # Continuing a session: rebuild the index from what is already on disk
+            self._rebuild_index()
+
+    @classmethod
+    def from_stream(cls, stream_path: str | Path) -> "ResultCollector":
+        """
+        Open an existing result stream, e.g. to finalize it into the legacy JSON.
+
+        Args:
+            stream_path: Path to a scrape_session_<id>.results.jsonl[.gz|.zst] file
+
+        Returns:
+            Streaming ResultCollector for that session
+        """
+        stream_path = Path(stream_path)
+        for compression, suffix in STREAM_SUFFIXES.items():
+            if stream_path.name.startswith("scrape_session_") and stream_path.name.endswith(suffix):
+                session_id = stream_path.name[len("scrape_session_") : -len(suffix)]
+                return cls(
+                    stream_path.parent, session_id=session_id, stream=True, compression=compression
+                )
+        raise ValueError(f"Not a result stream: {stream_path}")
+
     def add_result(self, sku: str, scraper_name: str, result_data: dict[str, Any]) -> None:
         """
         Add a scraper result to the collection.
@@ -43,20 +144,145 @@ class ResultCollector:
             scraper_name: Name of scraper that produced the result
             result_data: Dictionary of extracted fields
         """
-        if scraper_name not in self.results:
-            self.results[scraper_name] = {}
-
-        self.results[scraper_name][sku] = {
+        entry = {
             "sku": sku,
             "scraper": scraper_name,
             "timestamp": datetime.now().isoformat(),
             "data": result_data,
         }
 
+        if not self.stream:
+            if scraper_name not in self.results:
+                self.results[scraper_name] = {}
+            self.results[scraper_name][sku] = entry
+            return
+
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._stream_file is None:
+                self._stream_file = _open_stream(self.stream_path, "a", self.compression)
+            self._stream_file.write(line)
+            self._index_entry(sku, scraper_name, self._line_count, self._byte_offset)
+            self._line_count += 1
+            self._byte_offset += len(line.encode("utf-8"))
+
+            now = time.monotonic()
+            if now - self._last_fsync >= self.fsync_interval:
+                self._sync()
+                self._last_fsync = now
+
+    def _index_entry(self, sku: str, scraper_name: str, line_number: int, offset: int) -> None:
+        scrapers = self._index.setdefault(sku, {})
+        if scraper_name not in scrapers:
+            self._scrapers[scraper_name] = self._scrapers.get(scraper_name, 0) + 1
+        scrapers[scraper_name] = (line_number, offset)
+
+    def _sync(self) -> None:
+        """Flush the stream and force it to disk."""
+        if self._stream_file is None:
+            return
+        self._stream_file.flush()
+        if self.compression is None:
+            os.fsync(self._stream_file.fileno())
+
+    def _read_lines(self):
+        """Yield (line number, byte offset, entry) for every stream line (entry None if corrupt)."""
+        line_number = 0
+        offset = 0
+        try:
+            with _open_stream(self.stream_path, "r", self.compression) as f:
+                for line in iter(f.readline, ""):
+                    line_offset = offset
+                    offset += len(line.encode("utf-8"))
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A crash mid-write can leave a truncated last line
+                        entry = None
+                    yield line_number, line_offset, entry
+                    line_number += 1
+        except (EOFError, OSError):
+            # Truncated compressed stream; everything before the damage is usable
+            pass
+
+    def _rebuild_index(self) -> None:
+        for line_number, offset, entry in self._read_lines():
+            self._line_count = line_number + 1
+            if entry is not None:
+                self._index_entry(entry["sku"], entry["scraper"], line_number, offset)
+
+        if self.compression is None:
+            self._byte_offset = self.stream_path.stat().st_size
+            if self._byte_offset:
+                with open(self.stream_path, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        # Terminate a truncated last line so new results start cleanly
+                        with open(self.stream_path, "a", encoding="utf-8") as out:
+                            out.write("\n")
+                        self._byte_offset += 1
+
+    def iter_results(self):
+        """
+        Iterate over every collected result entry.
+
+        Yields:
+            Result entries ({"sku", "scraper", "timestamp", "data"}); in streaming
+            mode only the latest entry for each (scraper, SKU) pair is yielded
+        """
+        if not self.stream:
+            for scraper_skus in self.results.values():
+                yield from scraper_skus.values()
+            return
+
+        with self._lock:
+            self._sync()
+
+        if not self.stream_path.exists():
+            return
+
+        for line_number, _, entry in self._read_lines():
+            if entry is None:
+                continue
+            latest = self._index.get(entry["sku"], {}).get(entry["scraper"])
+            if latest is None or latest[0] != line_number:
+                # Superseded by a later result for the same pair
+                continue
+            yield entry
+
+    def has_result(self, sku: str, scraper_name: str) -> bool:
+        """Check whether a result for this SKU and scraper was collected."""
+        if self.stream:
+            return scraper_name in self._index.get(sku, {})
+        return sku in self.results.get(scraper_name, {})
+
+    def close(self, metadata: dict[str, Any] | None = None) -> None:
+        """
+        Flush and close the stream file (streaming mode only).
+
+        Args:
+            metadata: Optional metadata kept next to the stream so a later
+                save_session can include it
+        """
+        with self._lock:
+            if self._stream_file is not None:
+                self._sync()
+                self._stream_file.close()
+                self._stream_file = None
+
+        if self.stream and metadata:
+            with open(self.metadata_path, "w", encoding="utf-8") as f:
+                json.dump(metadata, f, ensure_ascii=False)
+
     def save_session(self, metadata: dict[str, Any] | None = None) -> Path:
         """
         Save current session results to JSON file.
 
+        In streaming mode this is the finalize step: the stream is closed and the
+        legacy JSON is written entry by entry: one pass over the stream groups the
+        results by scraper in temporary files, so the full result set is never
+        held in memory.
+
         Args:
             metadata: Optional metadata dictionary (e.g., Price data keyed by SKU)
 
@@ -65,18 +291,67 @@ class ResultCollector:
         """
         output_file = self.output_dir / f"scrape_session_{self.session_id}.json"
 
-        # Prepare output structure
-        output_data = {
+        if not self.stream:
+            # Prepare output structure
+            output_data = {
+                "session_id": self.session_id,
+                "timestamp": datetime.now().isoformat(),
+                "scrapers": list(self.results.keys()),
+                "total_results": sum(len(skus) for skus in self.results.values()),
+                "metadata": metadata or {},  # Store metadata (e.g., Price data)
+                "results": self.results,
+            }
+
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+            return output_file
+
+        self.close()
+        if metadata is None and self.metadata_path.exists():
+            with open(self.metadata_path, encoding="utf-8") as f:
+                metadata = json.load(f)
+
+        scrapers = list(self._scrapers.keys())
+        header = {
             "session_id": self.session_id,
             "timestamp": datetime.now().isoformat(),
-            "scrapers": list(self.results.keys()),
-            "total_results": sum(len(skus) for skus in self.results.values()),
-            "metadata": metadata or {},  # Store metadata (e.g., Price data)
-            "results": self.results,
+            "scrapers": scrapers,
+            "total_results": sum(self._scrapers.values()),
+            "metadata": metadata or {},
         }
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        with contextlib.ExitStack() as stack:
+            # Group the results by scraper in one pass over the stream, spooling
+            # each scraper's entries to a temporary file instead of memory
+            spools: dict[str, IO[str]] = {}
+            for entry in self.iter_results():
+                spool = spools.get(entry["scraper"])
+                if spool is None:
+                    spool = stack.enter_context(
+                        tempfile.TemporaryFile("w+", encoding="utf-8", dir=self.output_dir)
+                    )
+                    spools[entry["scraper"]] = spool
+                else:
+                    spool.write(", ")
+                spool.write(f"{json.dumps(entry['sku'], ensure_ascii=False)}: ")
+                spool.write(json.dumps(entry, ensure_ascii=False))
+
+            with open(output_file, "w", encoding="utf-8") as f:
+                # Same structure as the in-memory dump, written incrementally:
+                # the header object without its closing brace, then the results
+                f.write(json.dumps(header, ensure_ascii=False)[:-1])
+                f.write(', "results": {')
+                for scraper_index, scraper_name in enumerate(scrapers):
+                    if scraper_index:
+                        f.write(", ")
+                    f.write(f"{json.dumps(scraper_name, ensure_ascii=False)}: {{")
+                    spool = spools.get(scraper_name)
+                    if spool is not None:
+                        spool.seek(0)
+                        shutil.copyfileobj(spool, f)
+                    f.write("}")
+                f.write("}}")
 
         return output_file
 
@@ -90,12 +365,34 @@ class ResultCollector:
         Returns:
             Dictionary mapping scraper names to their results for this SKU
         """
+        if self.stream:
+            return self._read_stream_results(sku)
+
         sku_results = {}
         for scraper_name, scraper_skus in self.results.items():
             if sku in scraper_skus:
                 sku_results[scraper_name] = scraper_skus[sku]
         return sku_results
 
+    def _read_stream_results(self, sku: str) -> dict[str, Any]:
+        offsets = self._index.get(sku)
+        if not offsets:
+            return {}
+
+        with self._lock:
+            self._sync()
+
+        if self.compression is not None:
+            # Compressed streams are not seekable; scan them
+            return {entry["scraper"]: entry for entry in self.iter_results() if entry["sku"] == sku}
+
+        sku_results = {}
+        with open(self.stream_path, encoding="utf-8") as f:
+            for scraper_name, (_, offset) in offsets.items():
+                f.seek(offset)
+                sku_results[scraper_name] = json.loads(f.readline())
+        return sku_results
+
     def get_all_skus(self) -> set[str]:
         """
         Get set of all unique SKUs across all scrapers.
@@ -103,6 +400,9 @@ class ResultCollector:
         Returns:
             Set of SKU strings
         """
+        if self.stream:
+            return set(self._index.keys())
+
         all_skus = set()
         for scraper_skus in self.results.values():
             all_skus.update(scraper_skus.keys())
@@ -115,18 +415,27 @@ class ResultCollector:
         Returns:
             Dictionary with stats
         """
-        all_skus = self.get_all_skus()
+        if self.stream:
+            # Computed from the index, without reading results back
+            with self._lock:
+                sku_coverage = {sku: len(scrapers) for sku, scrapers in self._index.items()}
+                scrapers_used = list(self._scrapers.keys())
+                total_results = sum(self._scrapers.values())
+        else:
+            all_skus = self.get_all_skus()
 
-        # Count how many scrapers found each SKU
-        sku_coverage = {}
-        for sku in all_skus:
-            sku_results = self.get_results_by_sku(sku)
-            sku_coverage[sku] = len(sku_results)
+            # Count how many scrapers found each SKU
+            sku_coverage = {}
+            for sku in all_skus:
+                sku_results = self.get_results_by_sku(sku)
+                sku_coverage[sku] = len(sku_results)
+            scrapers_used = list(self.results.keys())
+            total_results = sum(len(skus) for skus in self.results.values())
 
         return {
-            "total_unique_skus": len(all_skus),
-            "total_results": sum(len(skus) for skus in self.results.values()),
-            "scrapers_used": list(self.results.keys()),
+            "total_unique_skus": len(sku_coverage),
+            "total_results": total_results,
+            "scrapers_used": scrapers_used,
             "skus_found_on_multiple_sites": sum(1 for count in sku_coverage.values() if count > 1),
             "skus_not_found": sum(1 for count in sku_coverage.values() if count == 0),
         }
@@ -0,0 +1,132 @@
+"""
+Session Journal Module
+
+Append-only JSONL journal recording the outcome of every (scraper, SKU) pair
+as soon as it is known, so an interrupted scraping session can be resumed
+instead of being re-run from the start.
+"""
+
+import json
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Outcomes that do not need to be retried when a session is resumed
+# ("skipped" means the SKU was already found on another site)
+COMPLETED_STATUSES = ("success", "no_result", "skipped")
+JOURNAL_STATUSES = ("success", "no_result", "failed", "skipped")
+
+
+class SessionJournal:
+    """Durable per-SKU completion journal for one scraping session."""
+
+    def __init__(self, session_id: str, journal_dir: str | Path | None = None):
+        """
+        Initialize the journal.
+
+        Args:
+            session_id: Scraping session the journal belongs to
+            journal_dir: Directory holding journal files. If None, uses data/scraper_results/.
+        """
+        if journal_dir is None:
+            # src/scrapers/session_journal.py -> src/scrapers -> src -> root
+            project_root = Path(__file__).parent.parent.parent
+            journal_dir = project_root / "data" / "scraper_results"
+
+        self.session_id = session_id
+        self.journal_dir = Path(journal_dir)
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.journal_dir / f"scrape_session_{session_id}.journal.jsonl"
+
+        self._lock = threading.Lock()
+        self._file = None
+
+    def record(
+        self,
+        scraper_name: str,
+        sku: str,
+        status: str,
+        data: dict[str, Any] | None = None,
+        cached: bool = False,
+    ) -> None:
+        """
+        Append the outcome of one SKU on one scraper.
+
+        Args:
+            scraper_name: Name of the scraper
+            sku: Product SKU
+            status: One of "success", "no_result", "failed" or "skipped"
+            data: Extracted fields (for successful results)
+            cached: The result was served from the result cache, not scraped
+        """
+        if status not in JOURNAL_STATUSES:
+            raise ValueError(f"Unknown journal status: {status}")
+
+        entry = {
+            "session": self.session_id,
+            "scraper": scraper_name,
+            "sku": sku,
+            "status": status,
+            "timestamp": datetime.now().isoformat(),
+        }
+        if data:
+            entry["data"] = data
+        if cached:
+            entry["cached"] = True
+
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            # Flush every entry so a crash loses at most the SKU in flight
+            self._file.flush()
+
+    def load(self) -> dict[tuple[str, str], dict[str, Any]]:
+        """
+        Read the journal back.
+
+        Later entries for the same (scraper, SKU) replace earlier ones, so a SKU
+        that failed and then succeeded on resume counts as a success.
+
+        Returns:
+            Dictionary mapping (scraper_name, sku) to the latest journal entry
+        """
+        entries: dict[tuple[str, str], dict[str, Any]] = {}
+        if not self.path.exists():
+            return entries
+
+        with open(self.path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write can leave a truncated last line
+                    logger.warning(f"Skipping corrupt journal line {line_number} in {self.path}")
+                    continue
+                entries[(entry["scraper"], entry["sku"])] = entry
+
+        return entries
+
+    def completed_keys(self) -> set[tuple[str, str]]:
+        """
+        Get the (scraper, SKU) pairs that do not need to be scraped again.
+
+        Returns:
+            Set of (scraper_name, sku) tuples with a success, no-result or skipped outcome
+        """
+        return {key for key, entry in self.load().items() if entry["status"] in COMPLETED_STATUSES}
+
+    def close(self) -> None:
+        """Close the journal file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,261 @@
+"""
+Site Router Module
+
+Learns how likely each site is to carry a SKU from the outcomes journaled by
+past sessions, so a run can try the likely sites first, skip site/SKU pairs
+that almost never produce a result, and stop once a SKU has been found.
+
+Estimates come from the most specific feature with enough history:
+the SKU's own past outcomes on the site, then its brand, then its UPC
+manufacturer prefix, and finally the site's overall hit rate.
+"""
+
+import json
+import logging
+import random
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from src.scrapers.models.config import PRODUCT_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# Input columns that may hold a product's brand
+BRAND_COLUMNS = ("Brand", "BRAND", "brand", "MANUFACTURER", "Manufacturer")
+
+# Leading digits of a UPC/EAN identifying the manufacturer
+UPC_PREFIX_LENGTH = 6
+
+
+def upc_prefix(sku: str) -> str | None:
+    """Get the manufacturer prefix of a UPC/EAN-like SKU (None for other SKUs)."""
+    sku = sku.strip()
+    if sku.isdigit() and len(sku) >= 11:
+        return sku[:UPC_PREFIX_LENGTH]
+    return None
+
+
+class SiteRouter:
+    """Per-site hit probabilities learned from session journals."""
+
+    def __init__(
+        self,
+        min_samples: int = 3,
+        default_probability: float = 0.5,
+        seed: int | None = None,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            min_samples: Attempts a feature needs before its hit rate is trusted
+            default_probability: Hit probability for sites without any history
+            seed: Seed for choosing which pruned pairs are explored
+        """
+        self.min_samples = min_samples
+        self.default_probability = default_probability
+        self._random = random.Random(seed)
+
+        # {feature key: {site: [hits, attempts]}}
+        self._counts: dict[tuple[str, str], dict[str, list[int]]] = defaultdict(
+            lambda: defaultdict(lambda: [0, 0])
+        )
+        self._site_counts: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+        self._brands: dict[str, str] = {}  # Brands seen in past results, by SKU
+        self.sessions_loaded = 0
+
+    def learn_from_journals(self, journal_dir: str | Path, max_sessions: int | None = None) -> int:
+        """
+        Learn from the session journals in a directory.
+
+        Args:
+            journal_dir: Directory holding scrape_session_*.journal.jsonl files
+            max_sessions: Only read this many of the most recent sessions (None reads all)
+
+        Returns:
+            Number of outcomes learned
+        """
+        # Session ids are timestamps, so name order is chronological
+        paths = sorted(Path(journal_dir).glob("scrape_session_*.journal.jsonl"))
+        if max_sessions:
+            paths = paths[-max_sessions:]
+
+        learned = 0
+        for path in paths:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        if entry.get("cached"):
+                            # Served from the result cache; the scrape was learned already
+                            continue
+                        if self.observe(
+                            entry["scraper"], entry["sku"], entry["status"], entry.get("data")
+                        ):
+                            learned += 1
+            except OSError as e:
+                logger.warning(f"Could not read journal {path}: {e}")
+                continue
+            self.sessions_loaded += 1
+        return learned
+
+    def observe(
+        self,
+        site: str,
+        sku: str,
+        status: str,
+        data: dict[str, Any] | None = None,
+        brand: str | None = None,
+    ) -> bool:
+        """
+        Learn from one site/SKU outcome.
+
+        Args:
+            site: Scraper name
+            sku: Product SKU
+            status: Journal status; only "success" and "no_result" are informative
+            data: Extracted fields of a successful result
+            brand: Brand of the product, if known from the input
+
+        Returns:
+            True if the outcome was used
+        """
+        if status not in ("success", "no_result"):
+            return False
+
+        hit = status == "success"
+        if hit and data and data.get("Brand"):
+            self._brands.setdefault(sku, str(data["Brand"]))
+
+        for key in self._feature_keys(sku, brand):
+            counts = self._counts[key][site]
+            counts[0] += hit
+            counts[1] += 1
+        self._site_counts[site][0] += hit
+        self._site_counts[site][1] += 1
+        return True
+
+    def _feature_keys(self, sku: str, brand: str | None = None) -> list[tuple[str, str]]:
+        """Feature keys of a SKU, most specific first."""
+        keys = [("sku", sku)]
+        brand = brand or self._brands.get(sku)
+        if brand:
+            keys.append(("brand", brand.strip().lower()))
+        prefix = upc_prefix(sku)
+        if prefix:
+            keys.append(("upc", prefix))
+        return keys
+
+    def hit_probability(self, site: str, sku: str, brand: str | None = None) -> float:
+        """
+        Estimate the probability that a site has a SKU.
+
+        Args:
+            site: Scraper name
+            sku: Product SKU
+            brand: Brand of the product, if known from the input
+
+        Returns:
+            Probability between 0.0 and 1.0
+        """
+        site_hits, site_attempts = self._site_counts.get(site, (0, 0))
+        if not site_attempts:
+            return self.default_probability
+
+        # Smooth towards the site's overall hit rate
+        prior = (site_hits + 1) / (site_attempts + 2)
+        for key in self._feature_keys(sku, brand):
+            counts = self._counts.get(key, {}).get(site)
+            if not counts:
+                continue
+            hits, attempts = counts
+            # A SKU's own history is trusted from the first observation
+            if key[0] == "sku" or attempts >= self.min_samples:
+                return (hits + 2 * prior) / (attempts + 2)
+        return prior
+
+    def plan(
+        self,
+        sites: list[str],
+        records: list[dict[str, Any]],
+        min_probability: float = 0.0,
+        exploration: float = 0.0,
+    ) -> dict[str, list[str]]:
+        """
+        Order and prune each site's SKU list.
+
+        Every SKU keeps at least its most likely site. Each site's list is
+        ordered by the site's rank for the SKU and then by probability, so the
+        first choice for a SKU gets to it before the fallbacks do.
+
+        Pruned pairs are never scraped again, so their hit rates would never
+        change; a random ``exploration`` share of them is kept to keep
+        learning about them.
+
+        Args:
+            sites: Scraper names to plan for
+            records: Input rows with a "SKU" key and optional brand columns
+            min_probability: Pairs less likely than this are skipped
+            exploration: Share of the skipped pairs (0.0 to 1.0) kept anyway
+
+        Returns:
+            Dictionary mapping each site to its ordered SKUs
+        """
+        ranked: dict[str, list[tuple[int, float, int, str]]] = {site: [] for site in sites}
+
+        for position, record in enumerate(records):
+            sku = record["SKU"]
+            brand = next((record[c] for c in BRAND_COLUMNS if record.get(c)), None)
+            scores = sorted(
+                ((self.hit_probability(site, sku, brand), site) for site in sites),
+                key=lambda item: -item[0],
+            )
+            for rank, (probability, site) in enumerate(scores):
+                if rank and probability < min_probability and self._random.random() >= exploration:
+                    continue
+                ranked[site].append((rank, -probability, position, sku))
+
+        return {site: [item[3] for item in sorted(items)] for site, items in ranked.items()}
+
+
+class FoundSKUs:
+    """Thread-safe set of SKUs already found with enough fields to stop looking."""
+
+    def __init__(self, required_fields: int):
+        """
+        Initialize the set.
+
+        Args:
+            required_fields: Product fields a result needs for its SKU to count as found
+        """
+        self.required_fields = required_fields
+        self._skus: set[str] = set()
+        self._lock = threading.Lock()
+
+    def add(self, sku: str, data: dict[str, Any] | None) -> bool:
+        """
+        Record a result, marking its SKU found if it is complete enough.
+
+        Returns:
+            True if the SKU is now considered found
+        """
+        if not data:
+            return False
+        if sum(1 for field in PRODUCT_FIELDS if data.get(field)) < self.required_fields:
+            return False
+        with self._lock:
+            self._skus.add(sku)
+        return True
+
+    def __contains__(self, sku: str) -> bool:
+        with self._lock:
+            return sku in self._skus
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._skus)
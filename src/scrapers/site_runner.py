@@ -0,0 +1,560 @@
+"""
+Site Runner Module
+
+Runs the workers of one scraper against its shared SKU queue. The same worker
+loop is used by the in-process thread mode of ``run_scraping`` and by the
+process mode, where every site gets its own interpreter and streams events
+(logs, status, results, progress) back to the parent over a queue.
+"""
+
+import multiprocessing as mp
+import queue
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from src.core.event_bus import EventType, ScrapeEvent
+from src.core.failure_analytics import FailureAnalytics
+from src.scrapers.concurrency_controller import ConcurrencyController
+from src.scrapers.models.config import PRODUCT_FIELDS, ScraperConfig
+from src.scrapers.product_url_index import ProductUrlIndex
+from src.scrapers.sku_queue import SKUWorkQueue
+from src.utils.scraping.browser_pool import BrowserPool
+from src.utils.scraping.disk_cache import SiteDiskCache
+from src.utils.scraping.http_browser import close_http_clients
+
+EXECUTION_MODES = ("thread", "process")
+
+
+def scrape_worker(
+    config: ScraperConfig,
+    worker_id: str,
+    pool: BrowserPool,
+    work_queue: SKUWorkQueue,
+    log: Callable[[str, str], None],
+    update_status: Callable[[str], None],
+    on_outcome: Callable[[str, str, str, dict[str, Any] | None], None],
+    on_progress: Callable[[], None],
+    stop_event: Any = None,
+    controller: ConcurrencyController | None = None,
+    skip_sku: Callable[[str], bool] | None = None,
+    publish: Callable[[ScrapeEvent], None] | None = None,
+    product_urls: ProductUrlIndex | None = None,
+) -> tuple[int, int]:
+    """
+    Process SKUs from a scraper's shared work queue until it is drained.
+
+    Args:
+        config: Scraper configuration
+        worker_id: Identifier of this worker (e.g. "W1" or "Main")
+        pool: Browser pool for the scraper
+        work_queue: Shared SKU queue for the scraper
+        log: Callback receiving (message, level)
+        update_status: Callback receiving a status message
+        on_outcome: Callback receiving (sku, scraper_name, status, extracted_data) for every
+            SKU, where status is "success", "no_result", "failed" or "skipped"; a
+            "no_result" carries {"no_results_found": True} for explicit no-results pages
+        on_progress: Callback invoked once per processed SKU
+        stop_event: Optional event that cancels the worker when set
+        controller: Optional adaptive concurrency controller for the scraper; the
+            worker waits for an active slot before each SKU
+        skip_sku: Optional predicate for SKUs that no longer need this scraper (e.g.
+            already found on another site); they are reported with status "skipped"
+        publish: Optional sink for worker lifecycle, SKU and step timing events
+        product_urls: Optional index of learned product URLs shared by the workers
+
+    Returns:
+        Tuple of (successful, failed) SKU counts
+    """
+    from src.scrapers.executor.workflow_executor import WorkflowExecutor
+
+    def emit(event_type: EventType, **fields: Any) -> None:
+        if publish:
+            publish(ScrapeEvent(event_type, scraper=config.name, worker_id=worker_id, **fields))
+
+    scraper_success = 0
+    scraper_failed = 0
+    prefix = f"[{config.name}:{worker_id}]"
+
+    log(f"\n{'=' * 60}", "INFO")
+    log(
+        f"📌 Starting scraper: {config.name} ({worker_id}) - {work_queue.depth} SKUs queued",
+        "INFO",
+    )
+    log(f"{'=' * 60}", "INFO")
+
+    update_status(f"Running {config.name} ({worker_id})...")
+
+    # Initialize executor for this scraper with a warm browser from the pool
+    try:
+        executor = WorkflowExecutor(
+            config,
+            headless=True,
+            browser=pool.acquire(),
+            failure_analytics=controller.failure_analytics if controller else None,
+            product_urls=product_urls,
+        )
+    except Exception as e:
+        # Other workers on this scraper keep draining the shared queue
+        log(f"❌ {prefix} Failed to initialize: {e}", "ERROR")
+        emit(EventType.WORKER_STOPPED, message=f"Failed to initialize: {e}", level="ERROR")
+        return 0, 0
+
+    emit(EventType.WORKER_STARTED)
+
+    # With several tabs, the next SKUs' first pages load while one is extracted
+    tabs = max(1, int(executor.open_tabs()))
+    if tabs > 1:
+        log(f"🗂️ {prefix} Pipelining {tabs} tabs in one browser", "INFO")
+    pending: deque[str] = deque()  # SKUs taken from the queue, in the order taken
+
+    # Process SKUs until the shared queue is empty
+    while True:
+        # Check for cancellation
+        if stop_event and stop_event.is_set():
+            log(f"🛑 {prefix} Cancellation requested. Stopping...", "WARNING")
+            break
+
+        # Take SKUs until every tab has one
+        queue_drained = False
+        while len(pending) < tabs:
+            # Idle until the controller allows another active SKU
+            if controller and not controller.acquire(timeout=0 if pending else 1.0):
+                queue_drained = work_queue.depth == 0
+                break
+
+            sku = work_queue.get(worker_id)
+            if sku is None:
+                if controller:
+                    controller.release()
+                queue_drained = True
+                break
+
+            if skip_sku and skip_sku(sku):
+                on_outcome(sku, config.name, "skipped", None)
+                emit(EventType.SKU_FINISHED, sku=sku, status="skipped", duration=0.0)
+                if controller:
+                    controller.release()
+                work_queue.task_done(worker_id, sku)
+                on_progress()
+                continue
+
+            if tabs > 1:
+                executor.prefetch({"sku": sku})
+            pending.append(sku)
+
+        if not pending:
+            if queue_drained:
+                break
+            continue
+        sku = pending.popleft()
+
+        # Swap in a warm browser if the current one is unhealthy
+        recycle_reason = pool.needs_recycle(executor.browser)
+        if recycle_reason:
+            log(f"🔄 {prefix} Recycling browser ({recycle_reason})...", "INFO")
+            try:
+                executor.attach_browser(pool.recycle(executor.browser, recycle_reason))
+            except Exception as e:
+                log(f"❌ {prefix} Failed to recycle browser: {e}", "ERROR")
+                # Another worker picks the SKU up; it is requeued with the other pending SKUs
+                pending.appendleft(sku)
+                break
+
+        queue_stats = work_queue.snapshot()
+        update_status(
+            f"{config.name} ({worker_id}): Processing SKU {sku} "
+            f"({queue_stats['completed']}/{queue_stats['total']} done, "
+            f"{queue_stats['depth']} queued, {queue_stats['in_flight']} in flight)"
+        )
+
+        started = time.monotonic()
+        emit(EventType.SKU_STARTED, sku=sku)
+        outcome = "failed"
+        try:
+            # Execute workflow with SKU context
+            result = executor.execute_workflow(
+                context={"sku": sku},
+                quit_browser=False,  # Reuse browser for efficiency
+            )
+
+            for action, seconds in result.get("step_timings", []):
+                emit(EventType.STEP_TIMING, sku=sku, message=action, duration=seconds)
+
+            if result.get("success"):
+                extracted_data = result.get("results", {})
+
+                # Check if we actually found product data (not just "no results")
+                has_data = any(extracted_data.get(field) for field in PRODUCT_FIELDS)
+
+                if has_data:
+                    outcome = "success"
+                    on_outcome(sku, config.name, "success", extracted_data)
+                    scraper_success += 1
+
+                    # Log product details (Price is from input file, not scraped)
+                    name = extracted_data.get("Name", "N/A")
+                    brand = extracted_data.get("Brand", "N/A")
+                    weight = extracted_data.get("Weight", "N/A")
+                    log(f"✅ {prefix} Found: {name} | Brand: {brand} | Weight: {weight}", "INFO")
+                else:
+                    # SKU not found on this site - skip (per user requirement #4).
+                    # Pass on an explicit "no results" page so it can be cached.
+                    outcome = "no_result"
+                    no_results = {"no_results_found": True}
+                    on_outcome(
+                        sku,
+                        config.name,
+                        "no_result",
+                        no_results if extracted_data.get("no_results_found") else None,
+                    )
+                    scraper_failed += 1
+            else:
+                on_outcome(sku, config.name, "failed", None)
+                scraper_failed += 1
+                log(f"❌ {prefix} Failed to scrape SKU: {sku}", "ERROR")
+
+        except Exception as e:
+            on_outcome(sku, config.name, "failed", None)
+            scraper_failed += 1
+            if BrowserPool.is_crash_error(e):
+                executor.browser.crashed = True
+            log(f"❌ {prefix} Error scraping SKU {sku}: {e}", "ERROR")
+
+        elapsed = time.monotonic() - started
+        emit(EventType.SKU_FINISHED, sku=sku, status=outcome, duration=elapsed)
+        if controller:
+            controller.record(elapsed)
+            controller.release()
+        work_queue.task_done(worker_id, sku)
+        on_progress()
+
+    # SKUs still loading in other tabs go back to the queue
+    for sku in pending:
+        work_queue.requeue(worker_id, sku)
+        if controller:
+            controller.release()
+
+    # Hand the browser back to the pool (it is closed when the pool shuts down);
+    # this worker is done, so an unhealthy browser is retired without a replacement
+    try:
+        pool.release(executor.browser, replace=False)
+    except Exception as e:
+        log(f"⚠️ {prefix} Error releasing browser: {e}", "WARNING")
+    if executor.http_fallbacks:
+        log(f"🌐 {prefix} {executor.http_fallbacks} SKUs fell back from HTTP to Chrome", "INFO")
+    if executor.logins or executor.restored_logins:
+        log(
+            f"🔑 {prefix} {executor.logins} logins, "
+            f"{executor.restored_logins} sessions restored from stored cookies",
+            "INFO",
+        )
+    if product_urls is not None and (executor.direct_hits or executor.direct_misses):
+        log(
+            f"🔗 {prefix} {executor.direct_hits} SKUs opened from learned product URLs, "
+            f"{executor.direct_misses} fell back to search",
+            "INFO",
+        )
+    fixed_sleeps = dict(executor.fixed_sleeps)
+    if fixed_sleeps:
+        log(f"💤 {prefix} {sum(fixed_sleeps.values()):.1f}s spent in fixed sleeps", "INFO")
+    blocked_requests = dict(executor.blocked_requests)
+    transferred_bytes = int(executor.transferred_bytes)
+    cache_hit_bytes = int(executor.cache_hit_bytes)
+    if blocked_requests:
+        blocked = ", ".join(f"{n} {t}" for t, n in sorted(blocked_requests.items()))
+        log(
+            f"🚫 {prefix} Blocked {blocked} requests; "
+            f"{transferred_bytes / 1024 / 1024:.1f} MB downloaded",
+            "INFO",
+        )
+    if cache_hit_bytes:
+        log(
+            f"💾 {prefix} {cache_hit_bytes / 1024 / 1024:.1f} MB read from the disk cache",
+            "INFO",
+        )
+    executor.close()
+
+    log(f"✅ Completed task: {config.name} ({worker_id})", "INFO")
+    emit(
+        EventType.WORKER_STOPPED,
+        data={
+            "success": scraper_success,
+            "failed": scraper_failed,
+            "fixed_sleep_seconds": fixed_sleeps,
+            "blocked_requests": blocked_requests,
+            "transferred_bytes": transferred_bytes,
+            "cache_hit_bytes": cache_hit_bytes,
+        },
+    )
+    return scraper_success, scraper_failed
+
+
+def create_browser_pool(
+    config: ScraperConfig, size: int, spares: int, disk_cache_mb: int = 0
+) -> BrowserPool:
+    """
+    Create the browser pool for a scraper.
+
+    Scrapers with ``engine: http`` get HttpBrowsers sharing the site's HTTP
+    client instead of Chrome instances. Chrome browsers start from the site's
+    pre-warmed profile template, which is built first if it is missing or stale,
+    and share the site's persistent HTTP cache.
+
+    Args:
+        config: Scraper configuration
+        size: Number of browsers leased concurrently
+        spares: Warm spare browsers kept for instant replacement
+        disk_cache_mb: Size limit of the site's persistent HTTP cache (0 disables it)
+
+    Returns:
+        The scraper's BrowserPool
+    """
+    browser_factory = None
+    profile_template = None
+    disk_cache = None
+    if config.engine == "http":
+        from src.utils.scraping.http_browser import create_http_browser
+
+        def browser_factory():
+            return create_http_browser(config.name, timeout=config.timeout)
+
+    elif config.profile_template:
+        from src.utils.scraping.profile_template import ensure_profile_template
+
+        profile_template = ensure_profile_template(
+            config.name, config.base_url, config.consent_selectors()
+        )
+    if config.engine != "http" and config.disk_cache and disk_cache_mb > 0:
+        disk_cache = SiteDiskCache(config.name, disk_cache_mb * 1024 * 1024, size + spares)
+
+    return BrowserPool(
+        config.name,
+        size=size,
+        headless=True,
+        spares=spares,
+        browser_factory=browser_factory,
+        capture_http_status=config.requires_http_status(),
+        blocked_urls=config.resource_policy.blocked_urls(),
+        profile_template=profile_template,
+        disk_cache=disk_cache,
+    )
+
+
+def format_pool_stats(stats: dict[str, Any]) -> str:
+    """Format BrowserPool statistics as a single log line."""
+    reasons = ", ".join(f"{k}={v}" for k, v in stats["recycle_reasons"].items())
+    return (
+        f"🌐 {stats['site']}: {stats['spawned']} browsers started, "
+        f"{stats['recycled']} recycled" + (f" ({reasons})" if reasons else "")
+    )
+
+
+def run_site(
+    config: ScraperConfig,
+    skus: list[str],
+    worker_count: int,
+    pool_spares: int,
+    event_queue: Any,
+    stop_event: Any,
+    adaptive_concurrency: bool = False,
+    product_url_index: bool = False,
+    disk_cache_mb: int = 0,
+) -> None:
+    """
+    Process entry point: scrape every SKU for one site and stream events back.
+
+    Events put on ``event_queue`` are tuples whose first item is the event type:
+    ``("log", message, level)``, ``("status", message)``,
+    ``("result", sku, scraper_name, status, data)``, ``("progress", queue_snapshot)``,
+    ``("event", ScrapeEvent)`` and finally ``("done", scraper_name, successful, failed)``.
+
+    Args:
+        config: Scraper configuration for the site
+        skus: SKUs to scrape
+        worker_count: Number of worker threads (browsers) inside this process
+        pool_spares: Warm spare browsers kept by the site's pool
+        event_queue: multiprocessing queue shared with the parent
+        stop_event: multiprocessing event set by the parent to cancel the run
+        adaptive_concurrency: Treat worker_count as a ceiling and let a
+            ConcurrencyController pick the number of active workers
+        product_url_index: Open SKUs from learned product URLs (see ProductUrlIndex)
+        disk_cache_mb: Size limit of the site's persistent HTTP cache (0 disables it)
+    """
+    successful = 0
+    failed = 0
+
+    def log(msg: str, level: str = "INFO") -> None:
+        event_queue.put(("log", msg, level))
+
+    def update_status(msg: str) -> None:
+        event_queue.put(("status", msg))
+
+    def on_outcome(sku: str, scraper_name: str, status: str, data: dict[str, Any] | None) -> None:
+        event_queue.put(("result", sku, scraper_name, status, data))
+
+    def publish(event: ScrapeEvent) -> None:
+        event_queue.put(("event", event))
+
+    product_urls = None
+    try:
+        work_queue = SKUWorkQueue(config.name, skus)
+        pool = create_browser_pool(config, worker_count, pool_spares, disk_cache_mb)
+        product_urls = ProductUrlIndex() if product_url_index else None
+        controller = (
+            ConcurrencyController(config.name, worker_count, FailureAnalytics(), log)
+            if adaptive_concurrency
+            else None
+        )
+
+        def on_progress() -> None:
+            event_queue.put(("progress", work_queue.snapshot()))
+
+        worker_ids = [f"W{i + 1}" for i in range(worker_count)] if worker_count > 1 else ["Main"]
+        try:
+            with ThreadPoolExecutor(max_workers=worker_count) as thread_executor:
+                futures = [
+                    thread_executor.submit(
+                        scrape_worker,
+                        config,
+                        worker_id,
+                        pool,
+                        work_queue,
+                        log,
+                        update_status,
+                        on_outcome,
+                        on_progress,
+                        stop_event,
+                        controller,
+                        None,
+                        publish,
+                        product_urls,
+                    )
+                    for worker_id in worker_ids
+                ]
+                for future in futures:
+                    try:
+                        s_success, s_failed = future.result()
+                        successful += s_success
+                        failed += s_failed
+                    except Exception as exc:
+                        log(f"❌ Scraper task generated an exception: {exc}", "ERROR")
+
+            remaining = work_queue.drain()
+            if remaining and not stop_event.is_set():
+                failed += len(remaining)
+                log(f"⚠️ {config.name}: {len(remaining)} SKUs were not processed", "WARNING")
+        finally:
+            log(format_pool_stats(pool.get_stats()), "INFO")
+            pool.shutdown()
+            close_http_clients()
+    except Exception as e:
+        log(f"❌ {config.name}: site process failed: {e}", "ERROR")
+    finally:
+        if product_urls is not None:
+            product_urls.close()
+        event_queue.put(("done", config.name, successful, failed))
+
+
+def run_sites_in_processes(
+    site_jobs: list[tuple[ScraperConfig, list[str], int]],
+    max_processes: int,
+    pool_spares: int,
+    handle_event: Callable[[tuple], None],
+    stop_event: Any = None,
+    target: Callable[..., None] = run_site,
+    adaptive_concurrency: bool = False,
+    product_url_index: bool = False,
+    disk_cache_mb: int = 0,
+) -> None:
+    """
+    Run each site in its own process and pump their events to the caller.
+
+    A site process that dies without reporting back is logged through a
+    ``("log", ...)`` event and reported as ``("done", site_name, None, None)``,
+    so one crashing site does not take down the rest of the run.
+    The caller's ``stop_event`` (a ``threading.Event``) is bridged to the
+    child processes.
+
+    Args:
+        site_jobs: List of (config, skus, worker_count) tuples, one per site
+        max_processes: Maximum number of site processes running at once
+        pool_spares: Warm spare browsers kept per site
+        handle_event: Callback invoked in the calling thread for every event
+        stop_event: Optional threading event that cancels the run when set
+        target: Process entry point with the signature of ``run_site``
+        adaptive_concurrency: Let each site adapt its number of active workers
+        product_url_index: Let each site open SKUs from learned product URLs
+        disk_cache_mb: Size limit of each site's persistent HTTP cache (0 disables it)
+    """
+    ctx = mp.get_context("spawn")
+    event_queue = ctx.Queue()
+    child_stop = ctx.Event()
+
+    pending = list(site_jobs)
+    running: dict[str, Any] = {}  # {site_name: Process}
+    max_processes = max(1, max_processes)
+    site_kwargs = {}
+    if adaptive_concurrency:
+        site_kwargs["adaptive_concurrency"] = True
+    if product_url_index:
+        site_kwargs["product_url_index"] = True
+    if disk_cache_mb:
+        site_kwargs["disk_cache_mb"] = disk_cache_mb
+
+    def start_next() -> None:
+        while pending and len(running) < max_processes and not child_stop.is_set():
+            config, skus, worker_count = pending.pop(0)
+            process = ctx.Process(
+                target=target,
+                args=(config, skus, worker_count, pool_spares, event_queue, child_stop),
+                kwargs=site_kwargs,
+                name=f"scraper-{config.name}",
+                daemon=True,
+            )
+            process.start()
+            running[config.name] = process
+
+    start_next()
+    while running:
+        if stop_event is not None and stop_event.is_set() and not child_stop.is_set():
+            child_stop.set()
+
+        try:
+            event = event_queue.get(timeout=0.5)
+        except queue.Empty:
+            # Site processes that died without a "done" event. Anything a dead
+            # process put on the queue is already readable, so only declare a
+            # crash once the queue is empty.
+            dead = [name for name, process in running.items() if not process.is_alive()]
+            if dead and event_queue.empty():
+                for site_name in dead:
+                    process = running.pop(site_name)
+                    handle_event(
+                        (
+                            "log",
+                            f"❌ {site_name}: site process exited unexpectedly "
+                            f"(exit code {process.exitcode})",
+                            "ERROR",
+                        )
+                    )
+                    handle_event(("done", site_name, None, None))
+            start_next()
+            continue
+
+        if event[0] == "done":
+            site_name = event[1]
+            process = running.pop(site_name, None)
+            if process is not None:
+                process.join(timeout=5)
+            start_next()
+
+        handle_event(event)
+
+    # Sites that never started because the run was cancelled
+    for config, _, _ in pending:
+        handle_event(("done", config.name, 0, 0))
+
+    event_queue.close()
@@ -0,0 +1,124 @@
+"""
+SKU Work Queue Module
+
+Shared per-scraper work queue that workers pull SKUs from, so that a slow
+worker (captchas, long retry backoffs) does not leave the others idle at the
+end of a run the way fixed SKU chunks did.
+"""
+
+import threading
+from collections import deque
+from typing import Any
+
+
+class SKUWorkQueue:
+    """Thread-safe queue of SKUs shared by all workers of one scraper."""
+
+    def __init__(self, scraper_name: str, skus: list[str]):
+        """
+        Initialize the work queue.
+
+        Args:
+            scraper_name: Name of the scraper this queue feeds
+            skus: SKUs to process, in order
+        """
+        self.scraper_name = scraper_name
+        self.total = len(skus)
+        self.completed = 0
+        self._pending: deque[str] = deque(skus)
+        self._in_flight: dict[str, deque[str]] = {}  # {worker_id: SKUs in the order taken}
+        self._lock = threading.Lock()
+
+    def get(self, worker_id: str) -> str | None:
+        """
+        Take the next SKU for a worker.
+
+        Args:
+            worker_id: Identifier of the worker pulling work
+
+        Returns:
+            The next SKU, or None when the queue is drained
+        """
+        with self._lock:
+            if not self._pending:
+                return None
+            sku = self._pending.popleft()
+            self._in_flight.setdefault(worker_id, deque()).append(sku)
+            return sku
+
+    def task_done(self, worker_id: str, sku: str | None = None) -> None:
+        """
+        Mark a SKU held by a worker as finished.
+
+        Args:
+            worker_id: Identifier of the worker that finished its SKU
+            sku: The finished SKU, for workers holding several (pipelined tabs);
+                defaults to the worker's oldest
+        """
+        with self._lock:
+            if self._release(worker_id, sku):
+                self.completed += 1
+
+    def requeue(self, worker_id: str, sku: str) -> None:
+        """
+        Put a SKU a worker took but did not process back at the front of the queue.
+
+        Args:
+            worker_id: Identifier of the worker giving the SKU back
+            sku: The SKU
+        """
+        with self._lock:
+            if self._release(worker_id, sku):
+                self._pending.appendleft(sku)
+
+    def _release(self, worker_id: str, sku: str | None) -> bool:
+        skus = self._in_flight.get(worker_id)
+        if not skus or (sku is not None and sku not in skus):
+            return False
+        if sku is None:
+            skus.popleft()
+        else:
+            skus.remove(sku)
+        if not skus:
+            del self._in_flight[worker_id]
+        return True
+
+    def drain(self) -> list[str]:
+        """
+        Remove and return every SKU that has not been handed out yet.
+
+        Returns:
+            List of SKUs that were still pending
+        """
+        with self._lock:
+            remaining = list(self._pending)
+            self._pending.clear()
+            return remaining
+
+    @property
+    def depth(self) -> int:
+        """Number of SKUs waiting to be picked up."""
+        with self._lock:
+            return len(self._pending)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of SKUs currently being scraped."""
+        with self._lock:
+            return sum(len(skus) for skus in self._in_flight.values())
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Get a consistent view of the queue metrics.
+
+        Returns:
+            Dictionary with scraper name, total, depth, in-flight and completed counts
+        """
+        with self._lock:
+            return {
+                "scraper": self.scraper_name,
+                "total": self.total,
+                "depth": len(self._pending),
+                "in_flight": sum(len(skus) for skus in self._in_flight.values()),
+                "completed": self.completed,
+            }
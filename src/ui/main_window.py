@@ -169,10 +169,8 @@ class MainWindow(QMainWindow):
             stop_event=self.stop_event,
         )
 
-        # Connect signals
-        self.worker.signals.log.connect(self.scraper_view.log_message)
-        self.worker.signals.progress.connect(self.scraper_view.update_progress)
-        self.worker.signals.status.connect(self.scraper_view.update_status)
+        # Connect signals (logs, status and progress arrive as batched events)
+        self.worker.signals.events.connect(self.scraper_view.handle_events)
         self.worker.signals.finished.connect(self.on_scraping_finished)
         self.worker.signals.error.connect(self.on_scraping_error)
 
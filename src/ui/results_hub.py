@@ -740,14 +740,25 @@ class ResultsHub(QWidget):
         if not results_dir.exists():
             results_dir.mkdir(parents=True, exist_ok=True)
 
-        files = sorted(
-            results_dir.glob("scrape_session_*.json"), key=os.path.getmtime, reverse=True
-        )
+        # Skip the .meta.json sidecars kept next to result streams
+        files = [
+            path
+            for path in results_dir.glob("scrape_session_*.json")
+            if not path.name.endswith(".meta.json")
+        ]
+
+        # Streamed sessions whose JSON has not been written yet
+        for stream_path in results_dir.glob("scrape_session_*.results.jsonl*"):
+            session_id = stream_path.name.replace("scrape_session_", "").split(".")[0]
+            if not (results_dir / f"scrape_session_{session_id}.json").exists():
+                files.append(stream_path)
+
+        files.sort(key=os.path.getmtime, reverse=True)
 
         for file_path in files:
             # Parse filename for display
             try:
-                timestamp_str = file_path.stem.replace("scrape_session_", "")
+                timestamp_str = file_path.name.replace("scrape_session_", "").split(".")[0]
                 # Format: YYYYMMDD_HHMMSS -> YYYY-MM-DD HH:MM
                 display_text = f"{timestamp_str[:4]}-{timestamp_str[4:6]}-{timestamp_str[6:8]} {timestamp_str[9:11]}:{timestamp_str[11:13]}"
             except:
@@ -765,6 +776,13 @@ class ResultsHub(QWidget):
     def load_session_file(self, file_path):
         """Load and parse a session JSON file."""
         try:
+            if ".results.jsonl" in os.path.basename(file_path):
+                # Finalize a streamed session into the session JSON on first use
+                from src.scrapers.result_collector import ResultCollector
+
+                file_path = str(ResultCollector.from_stream(file_path).save_session())
+                self.load_session_history()
+
             with open(file_path, encoding="utf-8") as f:
                 data = json.load(f)
 
@@ -1316,9 +1334,11 @@ class ResultsHub(QWidget):
 
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                import os
-
-                os.remove(file_path)
+                # Remove the session JSON with its result stream, metadata and journal
+                session_path = Path(file_path)
+                session_id = session_path.name.replace("scrape_session_", "").split(".")[0]
+                for session_file in session_path.parent.glob(f"scrape_session_{session_id}.*"):
+                    session_file.unlink()
 
                 # Clear current session if it was the deleted one
                 if self.current_session_file == file_path:
@@ -285,7 +285,7 @@ class ScraperView(QWidget):
         logs_label.setProperty("class", "h2")
         logs_layout.addWidget(logs_label)
 
-        self.log_viewer = LogViewer()
+        self.log_viewer = LogViewer(max_lines=int(settings.get("log_viewer_max_lines", 5000)))
         logs_layout.addWidget(self.log_viewer)
 
         self.right_panel_stack.addWidget(logs_page)
@@ -600,3 +600,19 @@ class ScraperView(QWidget):
 
     def log_message(self, message, level="INFO"):
         self.log_viewer.log(message, level)
+
+    def handle_events(self, events):
+        """Apply a batch of scraping events (see src.core.event_bus) to the view."""
+        from src.core.event_bus import EventType
+
+        self.log_viewer.log_batch(
+            (event.message, event.level, event.timestamp)
+            for event in events
+            if event.type == EventType.LOG
+        )
+        # Status and progress are coalesced by the bus: at most one of each per batch
+        for event in events:
+            if event.type == EventType.STATUS:
+                self.update_status(event.message)
+            elif event.type == EventType.PROGRESS:
+                self.update_progress(event.data)
@@ -3,6 +3,7 @@ This module contains shared custom widgets and utility classes for the UI.
 """
 
 import asyncio
+import html
 import inspect
 import traceback
 from datetime import datetime
@@ -24,6 +25,7 @@ class WorkerSignals(QObject):
     log = pyqtSignal(str)
     status = pyqtSignal(str)
     metrics = pyqtSignal(dict)
+    events = pyqtSignal(list)  # Batches of ScrapeEvent from the scraping event bus
     request_editor_sync = pyqtSignal(
         list, object, str
     )  # products_list, result_container, editor_type
@@ -47,6 +49,7 @@ class Worker(QThread):
         self.kwargs["log_callback"] = self.signals.log
         self.kwargs["status_callback"] = self.signals.status
         self.kwargs["metrics_callback"] = self.signals.metrics
+        self.kwargs["event_callback"] = self.signals.events
         self.kwargs["editor_callback"] = self._request_editor_sync
         self.kwargs["confirmation_callback"] = self._request_confirmation_sync
 
@@ -119,7 +122,11 @@ class Worker(QThread):
 
 
 class LogViewer(QTextEdit):
-    """Professional log viewer with color-coded messages."""
+    """Professional log viewer with color-coded messages.
+
+    Keeps at most ``max_lines`` entries (oldest are dropped) and accepts whole
+    batches of entries so a busy scraping run costs one append per batch.
+    """
 
     LOG_COLORS = {
         "DEBUG": "#888888",
@@ -137,11 +144,13 @@ class LogViewer(QTextEdit):
         "ERROR": "❌",
     }
 
-    def __init__(self):
+    def __init__(self, max_lines=5000):
         super().__init__()
         self.setReadOnly(True)
         self.setFont(QFont("Consolas", 9))
         self.auto_scroll = True
+        # Ring buffer: the document drops its oldest blocks beyond this count
+        self.document().setMaximumBlockCount(max_lines)
         self.setStyleSheet(
             """
             QTextEdit {
@@ -154,14 +163,41 @@ class LogViewer(QTextEdit):
         """
         )
 
-    def log(self, message, level="INFO"):
-        """Add a timestamped, color-coded log entry."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+    def _format(self, message, level, timestamp=None):
+        time_text = datetime.fromtimestamp(timestamp or datetime.now().timestamp())
         color = self.LOG_COLORS.get(level, "#ffffff")
         icon = self.LOG_ICONS.get(level, "•")
+        message = html.escape(str(message)).replace("\n", "<br>")
+        return (
+            f'<span style="color: {color}"><b>[{time_text.strftime("%H:%M:%S")}]</b> '
+            f"{icon} {message}</span>"
+        )
 
-        formatted = f'<span style="color: {color}"><b>[{timestamp}]</b> {icon} {message}</span>'
-        self.append(formatted)
+    def log(self, message, level="INFO"):
+        """Add a timestamped, color-coded log entry."""
+        self.log_batch([(message, level, None)])
+
+    def log_batch(self, entries):
+        """
+        Add several log entries with a single document update.
+
+        Args:
+            entries: Iterable of (message, level, timestamp) tuples; a timestamp of
+                None uses the current time
+        """
+        lines = [self._format(message, level, timestamp) for message, level, timestamp in entries]
+        if not lines:
+            return
+
+        # One edit block per batch: a single layout pass however many lines arrive
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for line in lines:
+            if not self.document().isEmpty():
+                cursor.insertBlock()
+            cursor.insertHtml(line)
+        cursor.endEditBlock()
 
         if self.auto_scroll:
             self.moveCursor(QTextCursor.MoveOperation.End)
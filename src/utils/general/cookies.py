@@ -1,7 +1,184 @@
 # cookies.py - centralized cookie manager
 
+import json
 import os
 import pickle
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+# src/utils/general/cookies.py -> src/utils/general -> src/utils -> src -> root
+COOKIES_DIR = Path(__file__).parent.parent.parent.parent / "data" / "cookies"
+
+# Stored login sessions older than this are not reused (servers expire sessions
+# independently of cookie expiry dates)
+SESSION_MAX_AGE = 12 * 3600.0
+
+# WebDriver sameSite values accepted by DevTools Network.setCookies
+CDP_SAME_SITE = {"strict": "Strict", "lax": "Lax", "none": "None"}
+
+
+@dataclass
+class SavedSession:
+    """Cookies of a logged-in session and when they were saved."""
+
+    cookies: list[dict[str, Any]]
+    saved_at: float
+
+
+class CookieStore:
+    """
+    Logged-in session cookies of one site, shared by all of its browsers.
+
+    Cookies are saved as JSON with an atomic replace, so workers in other
+    processes never read a partial file. ``lock`` is held by the worker that
+    logs in, so the other workers of the process wait and reuse its session.
+    """
+
+    def __init__(
+        self,
+        site_name: str,
+        path: str | Path | None = None,
+        max_age_seconds: float = SESSION_MAX_AGE,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            site_name: Scraper name
+            path: JSON file of the session. If None, uses data/cookies/<site>_session.json.
+            max_age_seconds: Age after which a saved session is not reused
+        """
+        self.site_name = site_name
+        self.path = Path(path) if path else COOKIES_DIR / f"{site_name}_session.json"
+        self.max_age_seconds = max_age_seconds
+        self.lock = threading.RLock()
+
+    def load(self, now: float | None = None) -> SavedSession | None:
+        """
+        Load the saved session.
+
+        Returns:
+            The session without expired cookies, or None if there is no usable session
+        """
+        now = time.time() if now is None else now
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            saved_at = float(data["saved_at"])
+            cookies = [
+                cookie
+                for cookie in data["cookies"]
+                if not cookie.get("expiry") or cookie["expiry"] > now
+            ]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"⚠️ Ignoring unreadable session cookies for {self.site_name}: {e}")
+            return None
+        if not cookies or now - saved_at > self.max_age_seconds:
+            return None
+        return SavedSession(cookies, saved_at)
+
+    def save(self, cookies: list[dict[str, Any]], now: float | None = None) -> float:
+        """
+        Save the cookies of a freshly logged-in session.
+
+        Returns:
+            The session's saved_at timestamp
+        """
+        now = time.time() if now is None else now
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        # Live session cookies: readable by the owner only
+        tmp_path.unlink(missing_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"saved_at": now, "cookies": cookies}, f)
+        os.replace(tmp_path, self.path)
+        return now
+
+    def discard(self, saved_at: float | None = None) -> bool:
+        """
+        Delete the saved session (e.g. after it stopped being logged in).
+
+        Args:
+            saved_at: Only delete the session saved at this time, so a session
+                another worker has just refreshed is kept
+
+        Returns:
+            True if the session was deleted
+        """
+        with self.lock:
+            if saved_at is not None:
+                try:
+                    with open(self.path, encoding="utf-8") as f:
+                        if json.load(f).get("saved_at") != saved_at:
+                            return False
+                except (OSError, ValueError, AttributeError):
+                    pass  # Missing or unreadable: nothing worth keeping
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                return False
+            return True
+
+
+def inject_cookies(driver, cookies: list[dict[str, Any]], use_cdp: bool = True) -> int:
+    """
+    Add saved cookies to a browser without navigating.
+
+    WebDriver's add_cookie only accepts cookies for the current page's domain,
+    so Chrome gets them through DevTools ``Network.setCookies`` instead.
+
+    Args:
+        driver: WebDriver (or HttpDriver, with use_cdp=False)
+        cookies: Cookies in WebDriver's get_cookies() shape
+        use_cdp: Whether the driver supports DevTools commands
+
+    Returns:
+        Number of cookies added
+    """
+    if not use_cdp:
+        for cookie in cookies:
+            driver.add_cookie(cookie)
+        return len(cookies)
+
+    params = []
+    for cookie in cookies:
+        param = {
+            key: cookie[key]
+            for key in ("name", "value", "domain", "path", "secure", "httpOnly")
+            if key in cookie
+        }
+        if cookie.get("expiry"):
+            param["expires"] = cookie["expiry"]
+        same_site = CDP_SAME_SITE.get(str(cookie.get("sameSite", "")).lower())
+        if same_site:
+            param["sameSite"] = same_site
+        params.append(param)
+    driver.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+    return len(params)
+
+
+_stores: dict[str, CookieStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_cookie_store(site_name: str) -> CookieStore:
+    """Get the shared session cookie store of a site."""
+    with _stores_lock:
+        if site_name not in _stores:
+            _stores[site_name] = CookieStore(site_name)
+        return _stores[site_name]
+
+
+def reset_cookie_stores() -> None:
+    """Forget the shared cookie stores (the saved files are kept)."""
+    with _stores_lock:
+        _stores.clear()
 
 
 def save_cookies(driver, filename):
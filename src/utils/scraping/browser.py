@@ -3,14 +3,60 @@ Browser utility for scrapers - provides default browser setup and management.
 Scrapers can use this as a base and customize as needed.
 """
 
+import json
 import os
 import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
 
+import psutil
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 
-from src.utils.scraping.scraping import get_standard_chrome_options
+from src.utils.scraping.browser_lifecycle import release_profile, write_owner_file
+from src.utils.scraping.disk_cache import SiteDiskCache
+from src.utils.scraping.profile_template import copy_profile_template
+from src.utils.scraping.scraping import get_profile_dir, get_standard_chrome_options
+
+# Seconds find_element(s) keeps polling for an element before giving up
+DEFAULT_IMPLICIT_WAIT = 2
+
+# Starts a navigation in the current tab without waiting for it (see ScraperBrowser.prefetch)
+PREFETCH_SCRIPT = "window.location.assign(arguments[0]);"
+
+# Navigation Timing carries the document's status without another request (Chrome 109+)
+NAVIGATION_STATUS_SCRIPT = """
+var entries = performance.getEntriesByType("navigation");
+return entries.length && entries[0].responseStatus ? entries[0].responseStatus : null;
+"""
+
+
+@contextmanager
+def no_implicit_wait(driver) -> Iterator[None]:
+    """
+    Let find_element(s) on a driver miss immediately inside the block.
+
+    Used for lookups where a missing element is an expected answer (optional
+    fields, cookie banners, CAPTCHA/blocking/no-results probes), which would
+    otherwise each wait out the implicit wait. Nested blocks cost nothing.
+
+    Args:
+        driver: WebDriver whose implicit wait is DEFAULT_IMPLICIT_WAIT
+    """
+    if driver.__dict__.get("_implicit_wait_disabled"):
+        yield
+        return
+    driver.implicitly_wait(0)
+    driver.__dict__["_implicit_wait_disabled"] = True
+    try:
+        yield
+    finally:
+        driver.__dict__["_implicit_wait_disabled"] = False
+        driver.implicitly_wait(DEFAULT_IMPLICIT_WAIT)
 
 
 @dataclass
@@ -31,6 +77,11 @@ class ScraperBrowser:
         profile_suffix=None,
         custom_options=None,
         devtools_config: DevToolsConfig | None = None,
+        capture_http_status: bool = False,
+        blocked_urls: list[str] | None = None,
+        profile_template: str | Path | None = None,
+        keep_profile: bool = False,
+        disk_cache: SiteDiskCache | None = None,
     ):
         """
         Initialize browser for scraping.
@@ -41,11 +92,63 @@ class ScraperBrowser:
             profile_suffix: Optional suffix for profile directory
             custom_options: Additional Chrome options to add
             devtools_config: Configuration for Chrome DevTools
+            capture_http_status: Record DevTools Network events so check_http_status
+                reads the real status of each navigation
+            blocked_urls: URL patterns Chrome must not request (see resource_policy)
+            profile_template: Pre-warmed profile to start from (see profile_template);
+                ignored if it has not been built
+            keep_profile: Keep the profile directory when the browser quits
+            disk_cache: Site's persistent HTTP cache; the browser leases one of its
+                slots until it quits
         """
         self.site_name = site_name
         self.headless = headless
         self.profile_suffix = profile_suffix or f"{int(time.time() * 1000)}"
+        self.profile_dir = get_profile_dir(self.profile_suffix)
+        self.keep_profile = keep_profile
         self.devtools_config = devtools_config or DevToolsConfig()
+        self.capture_http_status = capture_http_status
+        self.blocked_urls = blocked_urls or []
+        self.disk_cache = disk_cache
+        self.capture_network = (
+            capture_http_status or bool(self.blocked_urls) or disk_cache is not None
+        )
+
+        # Main-frame document responses of the current navigation (from the performance log)
+        self.last_http_status: int | None = None
+        self.redirect_statuses: list[int] = []
+
+        # Tabs opened by open_tabs: the current one, saved statuses of the others and
+        # the URL each tab was sent to by prefetch
+        self.current_tab: str | None = None
+        self._tab_statuses: dict[str, tuple[int | None, list[int]]] = {}
+        self._prefetched: dict[str, str] = {}
+
+        # Requests blocked by resource type and bytes received, since take_network_stats
+        self.blocked_requests: dict[str, int] = defaultdict(int)
+        self.transferred_bytes = 0
+
+        # Bytes of responses Chrome read from its disk cache, since take_network_stats
+        self.cache_hit_bytes = 0
+        self._disk_cache_requests: set[str] = set()
+
+        # saved_at of the stored login session this browser uses (see utils.general.cookies)
+        self.login_session: float | None = None
+
+        # Health bookkeeping used by BrowserPool recycling policies
+        self.navigation_count = 0
+        self.detection_events = 0
+        self.crashed = False
+        self.created_at = time.time()
+        self.baseline_rss_mb = 0.0
+
+        # Start from a copy of the site's pre-warmed profile when one exists
+        self.templated = False
+        if profile_template:
+            try:
+                self.templated = copy_profile_template(profile_template, self.profile_dir)
+            except Exception as e:
+                print(f"[WEB] [{site_name}] Failed to copy profile template: {e}")
 
         # Get standard options
         options = get_standard_chrome_options(
@@ -53,6 +156,7 @@ class ScraperBrowser:
             profile_suffix=self.profile_suffix,
             enable_devtools=self.devtools_config.enabled,
             devtools_port=self.devtools_config.port,
+            capture_network=self.capture_network,
         )
 
         # Set Chrome binary location for CI environments
@@ -74,6 +178,17 @@ class ScraperBrowser:
             for option in custom_options:
                 options.add_argument(option)
 
+        # Keep the HTTP cache outside the profile so the next browser of the site reuses it
+        self.disk_cache_slot = None
+        if disk_cache is not None:
+            try:
+                self.disk_cache_slot = disk_cache.lease()
+            except Exception as e:
+                print(f"[WEB] [{site_name}] Failed to lease disk cache: {e}")
+            if self.disk_cache_slot is not None:
+                for option in disk_cache.chrome_arguments(self.disk_cache_slot):
+                    options.add_argument(option)
+
         # Create service with suppressed logs
         service = ChromeService(log_path=os.devnull)
 
@@ -91,7 +206,16 @@ class ScraperBrowser:
         except Exception as e:
             init_time = time.time() - start_time
             print(f"[WEB] [{site_name}] Browser initialization failed after {init_time:.2f}s: {e}")
+            self._release_disk_cache()
             raise
+        self.init_time = init_time  # Seconds to launch Chrome and connect chromedriver
+
+        # Record the profile and processes so a crashed run's leftovers can be swept
+        if os.path.isdir(self.profile_dir):
+            try:
+                write_owner_file(self.profile_dir, self.driver.service.process.pid)
+            except Exception as e:
+                print(f"[WEB] [{site_name}] Failed to record browser ownership: {e}")
 
         # Ensure consistent window size for responsive design consistency
         try:
@@ -103,12 +227,17 @@ class ScraperBrowser:
         # PERFORMANCE OPTIMIZATION: Add small implicit wait for dynamic content
         # Works with eager page load to catch late-loading elements
         # Explicit waits in workflow_executor still take precedence
-        self.driver.implicitly_wait(2)  # 2 seconds for dynamic elements
+        self.driver.implicitly_wait(DEFAULT_IMPLICIT_WAIT)
+
+        self._apply_resource_blocking()
+
+        self.baseline_rss_mb = self.get_memory_usage_mb()
 
         is_ci = os.getenv("CI") == "true"
         print(
             f"[WEB] [{site_name}] Browser initialized in {init_time:.2f}s "
-            f"(headless={headless}, devtools={self.devtools_config.enabled}, CI={is_ci}, size=1920x1080, page_load=eager)"
+            f"(headless={headless}, devtools={self.devtools_config.enabled}, CI={is_ci}, "
+            f"size=1920x1080, page_load=eager, template={self.templated})"
         )
 
     def __getattr__(self, name):
@@ -116,91 +245,247 @@ class ScraperBrowser:
         return getattr(self.driver, name)
 
     def get(self, url):
-        """Navigate to URL."""
+        """Navigate to URL, or wait for the page if prefetch already started loading it."""
+        if self._prefetched.pop(self.current_tab, None) == url:
+            # chromedriver waits for the pending navigation before running the script
+            self.driver.execute_script("return document.readyState;")
+            return
+        self.navigation_count += 1
+        if self.capture_network:
+            # Keep chromedriver's log buffer small and the per-page counters complete
+            try:
+                self._read_network_log()
+            except Exception as e:
+                print(f"[WEB] [{self.site_name}] Failed to read network events: {e}")
+        self.last_http_status = None
+        self.redirect_statuses = []
         self.driver.get(url)
 
-    def check_http_status(self) -> int | None:
+    def _apply_resource_blocking(self) -> None:
+        """Block blocked_urls in the current tab; CDP network settings are per tab."""
+        if not self.blocked_urls:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+        except Exception as e:
+            print(f"[WEB] [{self.site_name}] Failed to apply resource blocking: {e}")
+
+    def open_tabs(self, count: int) -> list[str]:
         """
-        Check the HTTP status code of the current page using JavaScript.
+        Open tabs until the browser has ``count`` of them.
 
-        Uses the Performance API to get the response status. Falls back to
-        attempting a fetch request if Performance API is not available.
+        Args:
+            count: Number of tabs wanted
 
         Returns:
-            HTTP status code (int) or None if unable to determine
+            Window handles of the tabs, the current tab first
+        """
+        current = self.driver.current_window_handle
+        handles = [current, *(h for h in self.driver.window_handles if h != current)]
+        while len(handles) < count:
+            self.driver.switch_to.new_window("tab")
+            self._apply_resource_blocking()
+            handles.append(self.driver.current_window_handle)
+        self.driver.switch_to.window(current)
+        self.current_tab = current
+        return handles[:count]
+
+    def switch_tab(self, handle: str) -> None:
+        """Make a tab opened by open_tabs the one WebDriver commands go to."""
+        if handle == self.current_tab:
+            return
+        if self.capture_network:
+            # Attribute the buffered Network events while the current tab is known
+            try:
+                self._read_network_log()
+            except Exception as e:
+                print(f"[WEB] [{self.site_name}] Failed to read network events: {e}")
+        if self.current_tab is not None:
+            self._tab_statuses[self.current_tab] = (self.last_http_status, self.redirect_statuses)
+        self.driver.switch_to.window(handle)
+        self.current_tab = handle
+        self.last_http_status, self.redirect_statuses = self._tab_statuses.pop(handle, (None, []))
+
+    def prefetch(self, url: str) -> None:
+        """
+        Start loading a URL in the current tab without waiting for it.
+
+        The page loads while other tabs are used; the tab's next ``get`` of the
+        same URL only waits for it to finish.
+
+        Args:
+            url: Page the tab's next workflow navigates to first
+        """
+        self.navigation_count += 1
+        if self.capture_network:
+            try:
+                self._read_network_log()
+            except Exception as e:
+                print(f"[WEB] [{self.site_name}] Failed to read network events: {e}")
+        self.last_http_status = None
+        self.redirect_statuses = []
+        self.driver.execute_script(PREFETCH_SCRIPT, url)
+        self._prefetched[self.current_tab] = url
+
+    def get_memory_usage_mb(self) -> float:
+        """
+        Get the resident memory of chromedriver and all Chrome child processes.
+
+        Returns:
+            Combined RSS in megabytes, or 0.0 if the process tree cannot be inspected
         """
         try:
-            # First try using Performance API (most reliable)
-            script = """
-            try {
-                var entries = performance.getEntriesByType('navigation');
-                if (entries.length > 0 && entries[0].responseStatus) {
-                    return entries[0].responseStatus;
-                }
-
-                // Fallback: try to get status from document properties
-                if (document.status) {
-                    return document.status;
-                }
-
-                // Another fallback: check for error indicators in the page
-                var bodyText = document.body ? document.body.textContent.toLowerCase() : '';
-                var titleText = document.title ? document.title.toLowerCase() : '';
-
-                if (bodyText.includes('404') || titleText.includes('404') ||
-                    bodyText.includes('not found') || titleText.includes('not found')) {
-                    return 404;
-                }
-                if (bodyText.includes('403') || titleText.includes('403') ||
-                    bodyText.includes('forbidden') || bodyText.includes('access denied')) {
-                    return 403;
-                }
-                if (bodyText.includes('500') || bodyText.includes('internal server error')) {
-                    return 500;
-                }
-
-                return null;
-            } catch (e) {
-                return null;
-            }
-            """
-
-            result = self.driver.execute_script(script)
-            if result is not None:
-                return int(result)
-
-            # Second fallback: try a fetch request (may fail due to CORS)
+            root = psutil.Process(self.driver.service.process.pid)
+            processes = [root, *root.children(recursive=True)]
+        except Exception:
+            return 0.0
+
+        total = 0
+        for process in processes:
             try:
-                fetch_script = """
-                try {
-                    var xhr = new XMLHttpRequest();
-                    xhr.open('HEAD', window.location.href, false);
-                    xhr.send();
-                    return xhr.status;
-                } catch (e) {
-                    return null;
-                }
-                """
-                result = self.driver.execute_script(fetch_script)
-                if result is not None:
-                    return int(result)
-            except Exception:
-                pass
+                total += process.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return total / 1024 / 1024
+
+    def is_alive(self) -> bool:
+        """Check whether the chromedriver process is still running without a WebDriver call."""
+        if self.crashed:
+            return False
+        try:
+            return self.driver.service.process.poll() is None
+        except Exception:
+            return False
 
-            return None
+    def check_http_status(self) -> int | None:
+        """
+        Get the HTTP status code of the current page without another request.
+
+        With ``capture_http_status`` the status comes from the main frame's
+        ``Network.responseReceived`` DevTools event; otherwise (or if the event
+        is missing) from the Navigation Timing entry of the page.
+
+        Returns:
+            HTTP status code (int) or None if unable to determine
+        """
+        if self.capture_http_status:
+            try:
+                self._read_network_log()
+            except Exception as e:
+                print(f"[WEB] [{self.site_name}] Failed to read network events: {e}")
+            if self.last_http_status is not None:
+                return self.last_http_status
 
+        try:
+            result = self.driver.execute_script(NAVIGATION_STATUS_SCRIPT)
+            return int(result) if result else None
         except Exception as e:
             print(f"[WEB] [{self.site_name}] Failed to check HTTP status: {e}")
             return None
 
+    def _read_network_log(self) -> None:
+        """Drain the performance log into the status and resource counters."""
+        for entry in self.driver.get_log("performance"):
+            log = json.loads(entry["message"])
+            message = log.get("message", {})
+            method = message.get("method")
+            params = message.get("params", {})
+
+            if method == "Network.dataReceived":
+                if params.get("requestId") in self._disk_cache_requests:
+                    self.cache_hit_bytes += int(params.get("dataLength", 0))
+                continue
+            if method == "Network.loadingFinished":
+                if params.get("requestId") in self._disk_cache_requests:
+                    self._disk_cache_requests.discard(params["requestId"])
+                else:
+                    self.transferred_bytes += int(params.get("encodedDataLength", 0))
+                continue
+            if method == "Network.responseReceived" and params["response"].get("fromDiskCache"):
+                self._disk_cache_requests.add(params.get("requestId"))
+            if method == "Network.loadingFailed":
+                if params.get("blockedReason") == "inspector":  # Network.setBlockedURLs
+                    self.blocked_requests[params.get("type", "Other").lower()] += 1
+                continue
+
+            if params.get("type") != "Document":
+                continue
+            # The main frame's id is the page target's id ("webview")
+            webview = log.get("webview")
+            if webview and params.get("frameId") != webview:
+                continue
+            # Events of another tab update that tab's saved status
+            other_tab = webview if webview and self.current_tab not in (None, webview) else None
+            status, redirects = (
+                self._tab_statuses.get(other_tab, (None, []))
+                if other_tab
+                else (self.last_http_status, self.redirect_statuses)
+            )
+            if method == "Network.requestWillBeSent":
+                if params.get("requestId") != params.get("loaderId"):
+                    continue
+                redirect = params.get("redirectResponse")
+                if redirect:
+                    redirects = [*redirects, int(redirect["status"])]
+                else:  # A new navigation starts
+                    status, redirects = None, []
+            elif method == "Network.responseReceived":
+                status = int(params["response"]["status"])
+            if other_tab:
+                self._tab_statuses[other_tab] = (status, redirects)
+            else:
+                self.last_http_status, self.redirect_statuses = status, redirects
+
+    def take_network_stats(self) -> dict[str, Any]:
+        """
+        Get and reset the resource counters.
+
+        Returns:
+            ``blocked_requests`` (count by resource type), ``transferred_bytes``
+            (encoded bytes received from the network) and ``cache_hit_bytes``
+            (bytes read from the disk cache) since the previous call
+        """
+        if self.capture_network:
+            try:
+                self._read_network_log()
+            except Exception as e:
+                print(f"[WEB] [{self.site_name}] Failed to read network events: {e}")
+        stats = {
+            "blocked_requests": dict(self.blocked_requests),
+            "transferred_bytes": self.transferred_bytes,
+            "cache_hit_bytes": self.cache_hit_bytes,
+        }
+        self.blocked_requests = defaultdict(int)
+        self.transferred_bytes = 0
+        self.cache_hit_bytes = 0
+        return stats
+
+    def _release_disk_cache(self) -> None:
+        """Hand the disk cache slot back to the site."""
+        if self.disk_cache is None or self.disk_cache_slot is None:
+            return
+        try:
+            self.disk_cache.release(self.disk_cache_slot)
+        except Exception as e:
+            print(f"[WARN] [{self.site_name}] Error releasing disk cache: {e}")
+        self.disk_cache_slot = None
+
     def quit(self):
-        """Close the browser."""
+        """Close the browser and delete its profile directory."""
         if self.driver:
             try:
                 self.driver.quit()
                 print(f"[LOCK] [{self.site_name}] Browser closed")
             except Exception as e:
                 print(f"[WARN] [{self.site_name}] Error closing browser: {e}")
+        if not self.keep_profile and os.path.isdir(self.profile_dir):
+            # Also stops Chrome processes that outlived a crashed chromedriver
+            try:
+                release_profile(self.profile_dir)
+            except Exception as e:
+                print(f"[WARN] [{self.site_name}] Error removing browser profile: {e}")
+        self._release_disk_cache()
 
     def __enter__(self):
         """Context manager entry."""
@@ -217,6 +502,11 @@ def create_browser(
     profile_suffix=None,
     custom_options=None,
     devtools_config: DevToolsConfig | None = None,
+    capture_http_status: bool = False,
+    blocked_urls: list[str] | None = None,
+    profile_template: str | Path | None = None,
+    keep_profile: bool = False,
+    disk_cache: SiteDiskCache | None = None,
 ):
     """
     Factory function to create a browser instance.
@@ -227,6 +517,11 @@ def create_browser(
         profile_suffix: Optional profile suffix
         custom_options: Additional Chrome options
         devtools_config: Configuration for Chrome DevTools
+        capture_http_status: Capture navigation statuses from DevTools Network events
+        blocked_urls: URL patterns Chrome must not request
+        profile_template: Pre-warmed profile to start from
+        keep_profile: Keep the profile directory when the browser quits
+        disk_cache: Site's persistent HTTP cache
 
     Returns:
         ScraperBrowser instance
@@ -237,4 +532,9 @@ def create_browser(
         profile_suffix,
         custom_options,
         devtools_config,
+        capture_http_status,
+        blocked_urls,
+        profile_template,
+        keep_profile,
+        disk_cache,
     )
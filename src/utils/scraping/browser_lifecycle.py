@@ -0,0 +1,298 @@
+"""
+Lifecycle of Chrome profile directories and processes.
+
+Every ScraperBrowser launches chromedriver and Chrome with a profile
+directory of its own. The browser records what it owns in an owner file
+inside its profile directory, and ``quit`` stops any process that outlived
+``driver.quit()`` and deletes the directory. Browsers whose Python process
+died (crashes, killed runs) leave their owner file behind; ``sweep_orphans``
+finds those at startup and cleans them up, together with profile
+directories from before owner files existed and Chrome processes still
+using a removed profile.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import psutil
+
+from src.utils.scraping.scraping import get_profiles_root
+
+# Written into each profile directory by the browser that uses it
+OWNER_FILE = "scraper_owner.json"
+
+# Profile directories without an owner file are only removed once this old
+LEGACY_PROFILE_AGE = 3600.0
+
+# Directories under the profiles root that are not browser profiles
+RESERVED_DIRS = frozenset({"_templates"})
+
+
+@dataclass
+class CleanupReport:
+    """What a cleanup removed."""
+
+    profiles_removed: int = 0
+    bytes_reclaimed: int = 0
+    processes_killed: int = 0
+
+    def add(self, other: "CleanupReport") -> None:
+        self.profiles_removed += other.profiles_removed
+        self.bytes_reclaimed += other.bytes_reclaimed
+        self.processes_killed += other.processes_killed
+
+    def __str__(self) -> str:
+        return (
+            f"{self.profiles_removed} browser profiles "
+            f"({self.bytes_reclaimed / 1024 / 1024:.1f} MB), "
+            f"{self.processes_killed} Chrome/chromedriver processes"
+        )
+
+
+def _process_entry(process: psutil.Process) -> dict[str, Any]:
+    return {"pid": process.pid, "create_time": process.create_time()}
+
+
+def _alive(entry: dict[str, Any]) -> psutil.Process | None:
+    """The recorded process if it still runs (and the PID was not reused)."""
+    try:
+        process = psutil.Process(entry["pid"])
+        if abs(process.create_time() - entry["create_time"]) > 1:
+            return None
+        if process.status() == psutil.STATUS_ZOMBIE:
+            return None
+        return process
+    except (psutil.Error, KeyError, TypeError):
+        return None
+
+
+def current_process_entry() -> dict[str, Any]:
+    """Record of this Python process for ownership files."""
+    return _process_entry(psutil.Process())
+
+
+def is_running(entry: dict[str, Any]) -> bool:
+    """Whether the process of a recorded entry still runs."""
+    return _alive(entry) is not None
+
+
+def _kill_tree(process: psutil.Process) -> int:
+    """Kill a process and its descendants; returns the number killed."""
+    try:
+        processes = [*process.children(recursive=True), process]
+    except psutil.Error:
+        processes = [process]
+    killed = 0
+    for target in processes:
+        try:
+            target.kill()
+            killed += 1
+        except psutil.Error:
+            continue
+    psutil.wait_procs(processes, timeout=3)
+    return killed
+
+
+def dir_size(path: Path) -> int:
+    """Total size of the files under a directory, in bytes."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                continue
+    return total
+
+
+def _remove_profile(path: Path) -> CleanupReport:
+    size = dir_size(path)
+    shutil.rmtree(path, ignore_errors=True)
+    if path.exists():
+        return CleanupReport()
+    return CleanupReport(profiles_removed=1, bytes_reclaimed=size)
+
+
+def write_owner_file(profile_dir: str | Path, driver_pid: int | None) -> None:
+    """
+    Record the processes of a freshly launched browser in its profile directory.
+
+    Args:
+        profile_dir: The browser's profile directory
+        driver_pid: PID of its chromedriver (Chrome processes are its children)
+    """
+    owner = current_process_entry()
+    processes = []
+    if driver_pid:
+        try:
+            driver = psutil.Process(driver_pid)
+            processes = [_process_entry(driver)]
+            processes += [_process_entry(child) for child in driver.children()]
+        except psutil.Error:
+            pass
+    path = Path(profile_dir) / OWNER_FILE
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"owner": owner, "processes": processes, "started_at": time.time()}, f)
+
+
+def release_profile(profile_dir: str | Path) -> CleanupReport:
+    """
+    Stop a browser's leftover processes and delete its profile directory.
+
+    Called after ``driver.quit()``, which normally already ended the
+    processes; after a crash it may not have.
+
+    Args:
+        profile_dir: The browser's profile directory
+
+    Returns:
+        What was removed
+    """
+    path = Path(profile_dir)
+    report = CleanupReport()
+    try:
+        with open(path / OWNER_FILE, encoding="utf-8") as f:
+            processes = json.load(f).get("processes", [])
+    except (OSError, ValueError):
+        processes = []
+    for entry in processes:
+        process = _alive(entry)
+        if process is not None:
+            report.processes_killed += _kill_tree(process)
+    if path.exists():
+        report.add(_remove_profile(path))
+    get_browser_lifecycle().record(report)
+    return report
+
+
+def _chrome_processes_by_profile(root: Path) -> dict[Path, list[psutil.Process]]:
+    """Running Chrome processes whose --user-data-dir is under root."""
+    prefix = "--user-data-dir="
+    by_profile: dict[Path, list[psutil.Process]] = {}
+    for process in psutil.process_iter(["cmdline"]):
+        try:
+            for arg in process.info["cmdline"] or []:
+                if arg.startswith(prefix):
+                    profile = Path(arg[len(prefix) :])
+                    if profile.parent == root:
+                        by_profile.setdefault(profile, []).append(process)
+                    break
+        except (psutil.Error, TypeError):
+            continue
+    return by_profile
+
+
+def _is_fresh_legacy(profile: Path, now: float) -> bool:
+    """Whether a profile without an owner file may still be in use."""
+    try:
+        return now - profile.stat().st_mtime <= LEGACY_PROFILE_AGE
+    except OSError:
+        return False
+
+
+def sweep_orphans(root: str | Path | None = None, now: float | None = None) -> CleanupReport:
+    """
+    Remove profiles and processes of browsers whose Python process is gone.
+
+    A profile is abandoned when its owner file names a process that no
+    longer runs, or when it has no owner file and was not modified for
+    LEGACY_PROFILE_AGE. Chrome processes still using an abandoned (or already
+    deleted) profile are killed together with their orphaned chromedriver.
+
+    Args:
+        root: Profiles directory (defaults to data/browser_profiles)
+        now: Current timestamp (defaults to the current time)
+
+    Returns:
+        What was removed
+    """
+    root = Path(root) if root else Path(get_profiles_root())
+    now = time.time() if now is None else now
+    report = CleanupReport()
+    if not root.is_dir():
+        return report
+
+    chrome_by_profile = _chrome_processes_by_profile(root)
+    live_profiles: set[Path] = set()
+    for path in root.iterdir():
+        if not path.is_dir() or path.name in RESERVED_DIRS:
+            continue
+        try:
+            with open(path / OWNER_FILE, encoding="utf-8") as f:
+                record = json.load(f)
+        except FileNotFoundError:
+            record = None
+        except (OSError, ValueError):
+            record = {}  # Unreadable: treat as abandoned
+
+        if record is None:
+            abandoned = not _is_fresh_legacy(path, now)
+            processes = []
+        else:
+            abandoned = _alive(record.get("owner", {})) is None
+            processes = record.get("processes", [])
+        if not abandoned:
+            live_profiles.add(path)
+            continue
+
+        for entry in processes:
+            process = _alive(entry)
+            if process is not None:
+                report.processes_killed += _kill_tree(process)
+        report.add(_remove_profile(path))
+
+    # Chrome still running on a removed profile, e.g. when the owner file was never written
+    for profile, processes in chrome_by_profile.items():
+        if profile in live_profiles or (profile.exists() and _is_fresh_legacy(profile, now)):
+            continue
+        for process in processes:
+            try:
+                parent = process.parent()
+                if parent is not None and parent.name().startswith("chromedriver"):
+                    if parent.ppid() in (0, 1) or not psutil.pid_exists(parent.ppid()):
+                        report.processes_killed += _kill_tree(parent)
+                        continue
+                report.processes_killed += _kill_tree(process)
+            except psutil.Error:
+                continue
+
+    get_browser_lifecycle().record(report)
+    return report
+
+
+class BrowserLifecycle:
+    """Process-wide totals of browser cleanups."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.totals = CleanupReport()
+
+    def record(self, report: CleanupReport) -> None:
+        with self._lock:
+            self.totals.add(report)
+
+
+_lifecycle: BrowserLifecycle | None = None
+_lifecycle_lock = threading.Lock()
+
+
+def get_browser_lifecycle() -> BrowserLifecycle:
+    """Get the process-wide cleanup totals."""
+    global _lifecycle
+    with _lifecycle_lock:
+        if _lifecycle is None:
+            _lifecycle = BrowserLifecycle()
+        return _lifecycle
+
+
+def reset_browser_lifecycle() -> None:
+    """Forget the cleanup totals (between runs and in tests)."""
+    global _lifecycle
+    with _lifecycle_lock:
+        _lifecycle = None
@@ -0,0 +1,326 @@
+"""
+Warm browser pool for scrapers.
+
+Keeps a set of ready ScraperBrowser instances per site so workers can lease a
+browser instead of paying Chrome start-up and teardown on a fixed SKU cadence.
+Browsers are only recycled when a health policy says so, and replacements are
+spawned in the background so a recycle does not block the worker.
+"""
+
+import logging
+import queue
+import threading
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.utils.scraping.browser import ScraperBrowser, create_browser
+from src.utils.scraping.disk_cache import SiteDiskCache
+
+logger = logging.getLogger(__name__)
+
+# Error fragments that mean the browser session is gone and must be replaced
+CRASH_ERROR_MARKERS = (
+    "invalid session id",
+    "chrome not reachable",
+    "disconnected",
+    "session deleted",
+    "no such window",
+    "target window already closed",
+    "connection refused",
+    "max retries exceeded",
+)
+
+
+@dataclass
+class BrowserHealthPolicy:
+    """Thresholds that decide when a pooled browser is retired."""
+
+    max_navigations: int = 200
+    max_rss_growth_mb: float = 512.0
+    max_detection_events: int = 3
+
+
+class BrowserPool:
+    """
+    Pool of warm ScraperBrowser instances for a single site.
+
+    Workers acquire a browser, use it for as many SKUs as the health policy
+    allows, and hand it back through ``recycle`` (retire and replace) or
+    ``release`` (return to the pool). The pool always tries to keep ``spares``
+    browsers ready beyond those currently leased.
+    """
+
+    def __init__(
+        self,
+        site_name: str,
+        size: int = 1,
+        headless: bool = True,
+        policy: BrowserHealthPolicy | None = None,
+        spares: int = 1,
+        browser_factory: Callable[[], ScraperBrowser] | None = None,
+        capture_http_status: bool = False,
+        blocked_urls: list[str] | None = None,
+        profile_template: str | Path | None = None,
+        disk_cache: SiteDiskCache | None = None,
+    ):
+        """
+        Initialize the pool and start warming browsers in the background.
+
+        Args:
+            site_name: Name of the site the browsers are used for
+            size: Number of browsers expected to be leased concurrently
+            headless: Whether to run browsers in headless mode
+            policy: Health policy used to decide when to recycle a browser
+            spares: Number of extra browsers kept warm for instant replacement
+            browser_factory: Optional callable creating a browser (defaults to create_browser)
+            capture_http_status: Whether created browsers capture navigation statuses
+                from DevTools Network events
+            blocked_urls: URL patterns created browsers must not request
+            profile_template: Pre-warmed profile created browsers start from
+            disk_cache: Persistent HTTP cache shared by the site's browsers
+        """
+        self.site_name = site_name
+        self.size = max(1, size)
+        self.headless = headless
+        self.policy = policy or BrowserHealthPolicy()
+        self.spares = max(0, spares)
+        self.capture_http_status = capture_http_status
+        self.blocked_urls = blocked_urls
+        self.profile_template = profile_template
+        self.disk_cache = disk_cache
+        self._browser_factory = browser_factory or self._create_browser
+
+        self._lock = threading.Lock()
+        self._ready: queue.Queue[ScraperBrowser | Exception] = queue.Queue()
+        self._leased: set[int] = set()
+        self._all: dict[int, ScraperBrowser] = {}
+        self._pending_spawns = 0
+        self._closed = False
+
+        self.stats: dict[str, Any] = {
+            "spawned": 0,
+            "spawn_failures": 0,
+            "recycled": 0,
+            "recycle_reasons": defaultdict(int),
+        }
+
+        for _ in range(self.size + self.spares):
+            self._spawn_async()
+
+    def _create_browser(self) -> ScraperBrowser:
+        """Create a browser with a unique profile directory."""
+        return create_browser(
+            site_name=self.site_name,
+            headless=self.headless,
+            profile_suffix=f"pool_{int(time.time())}_{uuid.uuid4().hex[:8]}",
+            capture_http_status=self.capture_http_status,
+            blocked_urls=self.blocked_urls,
+            profile_template=self.profile_template,
+            disk_cache=self.disk_cache,
+        )
+
+    def _spawn_async(self) -> None:
+        """Start a browser in a background thread and add it to the ready queue."""
+        with self._lock:
+            if self._closed:
+                return
+            self._pending_spawns += 1
+        threading.Thread(target=self._spawn, daemon=True).start()
+
+    def _spawn(self) -> None:
+        try:
+            browser = self._browser_factory()
+        except Exception as e:
+            logger.error(f"[{self.site_name}] Failed to spawn pooled browser: {e}")
+            with self._lock:
+                self._pending_spawns -= 1
+                self.stats["spawn_failures"] += 1
+            self._ready.put(e)
+            return
+
+        with self._lock:
+            self._pending_spawns -= 1
+            if self._closed:
+                discard = True
+            else:
+                discard = False
+                self._all[id(browser)] = browser
+                self.stats["spawned"] += 1
+
+        if discard:
+            self._quit(browser)
+        else:
+            self._ready.put(browser)
+
+    def _quit(self, browser: ScraperBrowser) -> None:
+        try:
+            browser.quit()
+        except Exception as e:
+            logger.debug(f"[{self.site_name}] Error closing pooled browser: {e}")
+
+    def _retire_async(self, browser: ScraperBrowser) -> None:
+        """Forget a browser and close it without blocking the caller."""
+        with self._lock:
+            self._leased.discard(id(browser))
+            self._all.pop(id(browser), None)
+        threading.Thread(target=self._quit, args=(browser,), daemon=True).start()
+
+    def acquire(self, timeout: float | None = None) -> ScraperBrowser:
+        """
+        Lease a ready browser from the pool.
+
+        Args:
+            timeout: Maximum seconds to wait for a browser (None waits indefinitely)
+
+        Returns:
+            A warm ScraperBrowser
+
+        Raises:
+            RuntimeError: If the pool is closed, a spawn failed or no browser became ready in time
+        """
+        if self._closed:
+            raise RuntimeError(f"Browser pool for {self.site_name} is closed")
+
+        try:
+            item = self._ready.get(timeout=timeout)
+        except queue.Empty:
+            raise RuntimeError(f"No browser ready for {self.site_name} within {timeout}s")
+
+        if isinstance(item, Exception):
+            # Try again in the background so later acquires can succeed
+            self._spawn_async()
+            raise RuntimeError(f"Failed to start browser for {self.site_name}: {item}")
+
+        with self._lock:
+            self._leased.add(id(item))
+        return item
+
+    def release(self, browser: ScraperBrowser, replace: bool = True) -> None:
+        """
+        Return a leased browser to the pool.
+
+        Healthy browsers go back to the ready queue; unhealthy ones are retired
+        and, if ``replace`` is set, replaced in the background.
+
+        Args:
+            browser: The leased browser
+            replace: Spawn a replacement for an unhealthy browser; a worker that
+                is done with the pool passes False so no Chrome is started that
+                nobody will lease
+        """
+        reason = self.needs_recycle(browser)
+        if reason or self._closed:
+            if reason:
+                self._record_recycle(reason)
+            self._retire_async(browser)
+            if reason and replace:
+                self._spawn_async()
+            return
+
+        with self._lock:
+            self._leased.discard(id(browser))
+        self._ready.put(browser)
+
+    def recycle(self, browser: ScraperBrowser, reason: str = "manual") -> ScraperBrowser:
+        """
+        Retire a leased browser and lease its replacement.
+
+        The replacement normally comes from the warm spares, and a new spare is
+        spawned in the background so the next recycle is also instant.
+
+        Args:
+            browser: The browser being retired
+            reason: Why the browser is being retired (for stats)
+
+        Returns:
+            A ready replacement browser
+        """
+        self._record_recycle(reason)
+        self._retire_async(browser)
+        self._spawn_async()
+        return self.acquire()
+
+    def needs_recycle(self, browser: ScraperBrowser) -> str | None:
+        """
+        Evaluate the health policy for a browser.
+
+        Args:
+            browser: Browser to check
+
+        Returns:
+            The reason the browser should be recycled, or None if it is healthy
+        """
+        if not browser.is_alive():
+            return "crashed"
+
+        if browser.navigation_count >= self.policy.max_navigations:
+            return "navigations"
+
+        if browser.detection_events >= self.policy.max_detection_events:
+            return "detection"
+
+        if self.policy.max_rss_growth_mb > 0 and browser.baseline_rss_mb > 0:
+            growth = browser.get_memory_usage_mb() - browser.baseline_rss_mb
+            if growth >= self.policy.max_rss_growth_mb:
+                return "memory"
+
+        return None
+
+    def _record_recycle(self, reason: str) -> None:
+        with self._lock:
+            self.stats["recycled"] += 1
+            self.stats["recycle_reasons"][reason] += 1
+        logger.info(f"[{self.site_name}] Recycling browser ({reason})")
+
+    @contextmanager
+    def lease(self, timeout: float | None = None) -> Iterator[ScraperBrowser]:
+        """Context manager that acquires a browser and releases it on exit."""
+        browser = self.acquire(timeout=timeout)
+        try:
+            yield browser
+        finally:
+            self.release(browser)
+
+    @staticmethod
+    def is_crash_error(error: Exception) -> bool:
+        """Check whether an exception indicates the browser session has died."""
+        message = str(error).lower()
+        return any(marker in message for marker in CRASH_ERROR_MARKERS)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pool statistics."""
+        with self._lock:
+            return {
+                "site": self.site_name,
+                "spawned": self.stats["spawned"],
+                "spawn_failures": self.stats["spawn_failures"],
+                "recycled": self.stats["recycled"],
+                "recycle_reasons": dict(self.stats["recycle_reasons"]),
+                "leased": len(self._leased),
+                "ready": self._ready.qsize(),
+            }
+
+    def shutdown(self) -> None:
+        """Close every browser owned by the pool, including leased ones."""
+        with self._lock:
+            self._closed = True
+            browsers = list(self._all.values())
+            self._all.clear()
+            self._leased.clear()
+
+        while True:
+            try:
+                self._ready.get_nowait()
+            except queue.Empty:
+                break
+
+        for browser in browsers:
+            self._quit(browser)
+
+        logger.info(f"[{self.site_name}] Browser pool shut down ({len(browsers)} browsers closed)")
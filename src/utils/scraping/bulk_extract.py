@@ -0,0 +1,105 @@
+"""
+Single-round-trip field extraction inside the browser.
+
+Live extraction sends chromedriver one command per ``find_element(s)`` and
+one per ``.text``/``get_attribute`` on every matched element. BULK_EXTRACT_SCRIPT
+evaluates every field's CSS or XPath selector in the page and returns the
+raw text/attribute values of all matches in a single ``execute_script`` call.
+
+Scrapers opt in with ``extraction: script`` in their YAML.
+"""
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Attributes WebDriver reports as "true" or None
+BOOLEAN_ATTRIBUTES = (
+    "async autofocus autoplay checked compact complete controls declare defaultchecked "
+    "defaultselected defer disabled draggable ended formnovalidate hidden indeterminate "
+    "iscontenteditable ismap itemscope loop multiple muted nohref noresize noshade novalidate "
+    "nowrap open paused pubdate readonly required reversed scoped seamless seeking selected "
+    "spellcheck truespeed willvalidate"
+).split()
+
+# arguments[0]: [{name, selector, xpath, attribute, multiple}]
+# arguments[1]: attribute names WebDriver treats as booleans
+# Returns {name: value | [values] | null}; a missing single element is null,
+# an element whose value cannot be read is {"error": message}.
+BULK_EXTRACT_SCRIPT = """
+var fields = arguments[0];
+var booleans = arguments[1];
+
+function find(field) {
+    if (field.xpath) {
+        var result = document.evaluate(field.selector, document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < result.snapshotLength; i++) {
+            var node = result.snapshotItem(i);
+            if (node.nodeType === 1) nodes.push(node);
+        }
+        return nodes;
+    }
+    return Array.prototype.slice.call(document.querySelectorAll(field.selector));
+}
+
+function read(element, attribute) {
+    try {
+        if (!attribute || attribute === "text") {
+            return (element.innerText || "").replace(/\\u00a0/g, " ");
+        }
+        var name = attribute.toLowerCase();
+        if (booleans.indexOf(name) !== -1) {
+            return element.hasAttribute(attribute) || element[attribute] === true ? "true" : null;
+        }
+        if (name === "class") return element.getAttribute("class");
+        if (name === "style") return element.style.cssText;
+        var property = element[attribute];
+        if (property === undefined || property === null || typeof property === "object"
+                || typeof property === "function") {
+            return element.getAttribute(attribute);
+        }
+        return String(property);
+    } catch (e) {
+        return {error: String(e)};
+    }
+}
+
+var results = {};
+fields.forEach(function (field) {
+    var elements;
+    try {
+        elements = find(field);
+    } catch (e) {
+        results[field.name] = {error: String(e)};
+        return;
+    }
+    if (field.multiple) {
+        results[field.name] = elements.map(function (element) {
+            return read(element, field.attribute);
+        });
+    } else {
+        results[field.name] = elements.length ? read(elements[0], field.attribute) : null;
+    }
+});
+return results;
+"""
+
+
+def bulk_extract(driver: Any, fields: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Read the raw values of every field in one execute_script call.
+
+    Args:
+        driver: Selenium WebDriver showing the page
+        fields: Field specs with ``name``, ``selector``, ``xpath`` (bool),
+            ``attribute`` and ``multiple`` keys
+
+    Returns:
+        Mapping of field name to its raw value (None if no element matched) or
+        list of raw values for ``multiple`` fields. Values are strings before
+        ``.strip()``; a value that could not be read is ``{"error": message}``.
+    """
+    return driver.execute_script(BULK_EXTRACT_SCRIPT, fields, BOOLEAN_ATTRIBUTES) or {}
@@ -0,0 +1,147 @@
+"""
+Persistent per-site Chrome HTTP caches.
+
+Browser profiles are deleted when a browser quits, and the HTTP cache went
+with them, so every new browser downloaded the site's stylesheets, scripts
+and fonts again. Chrome's cache can only be used by one running browser at
+a time, so each site keeps a set of cache slots under
+data/browser_cache/<site>/<n>: a browser leases a free slot for its lifetime
+(``--disk-cache-dir``) and the next browser of the site reuses it.
+
+Chrome keeps each slot under ``--disk-cache-size``; when the site's slots
+together exceed the site's limit, the least recently used free slots are
+deleted.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+from src.utils.scraping.browser_lifecycle import current_process_entry, dir_size, is_running
+from src.utils.scraping.scraping import get_profiles_root
+
+# Exists while a browser uses the slot; names the Python process that owns it
+LEASE_FILE = "lease.json"
+
+# Slots a site may hold; a browser starts without a cache when all are leased
+MAX_SLOTS = 64
+
+
+def get_disk_cache_root() -> Path:
+    """Directory holding the per-site caches (data/browser_cache)."""
+    return Path(get_profiles_root()).parent / "browser_cache"
+
+
+def _age(path: Path) -> float:
+    try:
+        return time.time() - path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+class SiteDiskCache:
+    """Cache slots of one site, leased by its browsers."""
+
+    def __init__(
+        self,
+        site_name: str,
+        max_bytes: int,
+        slots: int = 1,
+        root: str | Path | None = None,
+    ):
+        """
+        Initialize the site's cache.
+
+        Args:
+            site_name: Scraper name
+            max_bytes: Size limit of all the site's slots together
+            slots: Browsers expected to run at once; each slot gets an equal share
+            root: Caches directory (defaults to data/browser_cache)
+        """
+        self.site_name = site_name
+        self.max_bytes = max_bytes
+        self.slot_bytes = max(1, max_bytes // max(1, slots))
+        self.directory = Path(root or get_disk_cache_root()) / site_name.replace(" ", "_")
+        self._lock = threading.Lock()
+        self.stats = {"leased": 0, "reused": 0, "evicted": 0, "evicted_bytes": 0}
+
+    def chrome_arguments(self, slot: Path) -> list[str]:
+        """Chrome options that put a browser's HTTP cache in a slot."""
+        return [f"--disk-cache-dir={slot}", f"--disk-cache-size={self.slot_bytes}"]
+
+    def _try_lease(self, slot: Path) -> bool:
+        """Take a slot if no live process holds it."""
+        lease = slot / LEASE_FILE
+        for _ in range(2):
+            try:
+                fd = os.open(lease, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    with open(lease, encoding="utf-8") as f:
+                        owner = json.load(f)
+                except (OSError, ValueError):
+                    if _age(lease) < 10:  # Possibly still being written by its owner
+                        return False
+                    owner = {}
+                if owner and is_running(owner):
+                    return False
+                # Left behind by a process that died; take it over
+                lease.unlink(missing_ok=True)
+                continue
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(current_process_entry(), f)
+            return True
+        return False
+
+    def lease(self) -> Path | None:
+        """
+        Lease a slot for a new browser, preferring one that already has a cache.
+
+        Returns:
+            The slot directory, or None if every slot is in use
+        """
+        with self._lock:
+            for index in range(MAX_SLOTS):
+                slot = self.directory / str(index)
+                existed = slot.exists()
+                slot.mkdir(parents=True, exist_ok=True)
+                if self._try_lease(slot):
+                    self.stats["leased"] += 1
+                    if existed and any(p.name != LEASE_FILE for p in slot.iterdir()):
+                        self.stats["reused"] += 1
+                    return slot
+        return None
+
+    def release(self, slot: str | Path) -> None:
+        """Return a slot after its browser quit, then enforce the site's size limit."""
+        slot = Path(slot)
+        with self._lock:
+            try:
+                os.remove(slot / LEASE_FILE)
+            except FileNotFoundError:
+                pass
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently released free slots until the site fits in max_bytes."""
+        if not self.directory.is_dir():
+            return
+        slots = [path for path in self.directory.iterdir() if path.is_dir()]
+        sizes = {slot: dir_size(slot) for slot in slots}
+        total = sum(sizes.values())
+        # A slot directory's mtime changes when its lease file is created or removed
+        for slot in sorted(slots, key=lambda path: path.stat().st_mtime):
+            if total <= self.max_bytes:
+                break
+            if not self._try_lease(slot):
+                continue
+            shutil.rmtree(slot, ignore_errors=True)
+            if slot.exists():
+                (slot / LEASE_FILE).unlink(missing_ok=True)
+                continue
+            total -= sizes[slot]
+            self.stats["evicted"] += 1
+            self.stats["evicted_bytes"] += sizes[slot]
@@ -0,0 +1,545 @@
+"""
+HTTP-only browser for scrapers whose pages are rendered on the server.
+
+HttpBrowser exposes the subset of the ScraperBrowser/WebDriver interface that
+workflow actions use (get, find_element(s), page_source, title, current_url,
+element text/attributes, link clicks and form submission) on top of a pooled
+httpx client and lxml. Scrapers opt in with ``engine: http`` in their YAML;
+anything that needs JavaScript marks the browser with ``browser_required`` so
+the executor can re-run the SKU in Chrome.
+
+Requires the optional ``lxml`` and ``cssselect`` packages
+(``pip install .[http]``).
+"""
+
+import logging
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import Any
+from urllib.parse import urljoin
+
+import httpx
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Attributes that WebDriver resolves to absolute URLs
+URL_ATTRIBUTES = ("href", "src", "action")
+
+# Elements whose content is never rendered
+NON_RENDERED_TAGS = frozenset({"head", "script", "style", "noscript", "template"})
+
+# Elements rendered on their own line(s), so WebElement.text breaks lines around them
+BLOCK_TAGS = frozenset(
+    {
+        "address", "article", "aside", "blockquote", "caption", "dd", "div", "dl", "dt",
+        "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5",
+        "h6", "header", "hr", "li", "main", "nav", "ol", "option", "p", "pre", "section",
+        "table", "tbody", "tfoot", "thead", "tr", "ul",
+    }
+)  # fmt: skip
+
+_HIDDEN_STYLE = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _import_lxml():
+    try:
+        import lxml.html
+        from cssselect import HTMLTranslator
+    except ImportError:
+        raise ImportError(
+            "lxml and cssselect are required for the HTTP scraping engine.\n"
+            "Install with: pip install lxml cssselect"
+        )
+    return lxml.html, HTMLTranslator
+
+
+class BrowserRequiredError(Exception):
+    """Raised when a step needs a real browser (JavaScript, non-link clicks, ...)."""
+
+    pass
+
+
+@lru_cache(maxsize=512)
+def _css_to_xpath(selector: str) -> str:
+    _, translator = _import_lxml()
+    return translator().css_to_xpath(selector)
+
+
+def _to_xpath(by: str, value: str) -> str:
+    """Translate a WebDriver locator into an XPath expression."""
+    if by == By.XPATH:
+        return value
+    if by == By.CSS_SELECTOR:
+        return _css_to_xpath(value)
+    if by == By.ID:
+        return f"descendant-or-self::*[@id={_xpath_literal(value)}]"
+    if by == By.NAME:
+        return f"descendant-or-self::*[@name={_xpath_literal(value)}]"
+    if by == By.TAG_NAME:
+        return _css_to_xpath(value)
+    if by == By.CLASS_NAME:
+        return _css_to_xpath(f".{value}")
+    if by == By.LINK_TEXT:
+        return f"descendant-or-self::a[normalize-space(.)={_xpath_literal(value)}]"
+    if by == By.PARTIAL_LINK_TEXT:
+        return f"descendant-or-self::a[contains(normalize-space(.), {_xpath_literal(value)})]"
+    raise BrowserRequiredError(f"Unsupported locator strategy for HTTP engine: {by}")
+
+
+def _xpath_literal(value: str) -> str:
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ', "\'", '.join(f"'{part}'" for part in parts) + ")"
+
+
+def _is_hidden(node: Any) -> bool:
+    """Whether markup alone hides the element (stylesheets are not evaluated)."""
+    return (
+        node.tag in NON_RENDERED_TAGS
+        or node.get("hidden") is not None
+        or bool(_HIDDEN_STYLE.search(node.get("style") or ""))
+    )
+
+
+def _collect_text(node: Any, parts: list[str]) -> None:
+    block = node.tag in BLOCK_TAGS
+    if block or node.tag == "br":
+        parts.append("\n")
+    elif node.tag in ("td", "th"):
+        parts.append(" ")
+    if node.text:
+        parts.append(_WHITESPACE.sub(" ", node.text))
+    for child in node:
+        if isinstance(child.tag, str) and not _is_hidden(child):
+            _collect_text(child, parts)
+        if child.tail:
+            parts.append(_WHITESPACE.sub(" ", child.tail))
+    if block:
+        parts.append("\n")
+
+
+def _visible_text(node: Any) -> str:
+    """
+    Rendered text of an element, like WebElement.text.
+
+    Whitespace is collapsed within lines, block elements and <br> start new
+    lines, and hidden or non-rendered elements yield no text.
+    """
+    if _is_hidden(node) or any(_is_hidden(parent) for parent in node.iterancestors()):
+        return ""
+    parts: list[str] = []
+    _collect_text(node, parts)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+class HttpElement:
+    """An element of a fetched page with the WebElement methods used by actions."""
+
+    def __init__(self, driver: "HttpDriver", node: Any):
+        self._driver = driver
+        self._node = node
+
+    @property
+    def tag_name(self) -> str:
+        return str(self._node.tag).lower()
+
+    @property
+    def text(self) -> str:
+        return _visible_text(self._node)
+
+    def get_attribute(self, name: str) -> str | None:
+        """Get an attribute or DOM property the way WebDriver reports it."""
+        if name == "textContent":
+            return self._node.text_content()
+        if name == "innerText":
+            return self.text
+        if name in ("innerHTML", "outerHTML"):
+            lxml_html, _ = _import_lxml()
+            outer = lxml_html.tostring(self._node, encoding="unicode", with_tail=False)
+            if name == "outerHTML":
+                return outer
+            inner = self._node.text or ""
+            return inner + "".join(
+                lxml_html.tostring(child, encoding="unicode") for child in self._node
+            )
+        value = self._node.get(name)
+        if value is not None and name in URL_ATTRIBUTES:
+            return urljoin(self._driver.base_url, value.strip())
+        return value
+
+    def _closest(self, tag: str) -> Any:
+        """This element or its nearest ancestor with the given tag."""
+        if self._node.tag == tag:
+            return self._node
+        return next(self._node.iterancestors(tag), None)
+
+    def get_property(self, name: str) -> str | None:
+        return self.get_attribute(name)
+
+    def get_dom_attribute(self, name: str) -> str | None:
+        return self._node.get(name)
+
+    def is_displayed(self) -> bool:
+        return self._node.get("hidden") is None and self._node.get("type") != "hidden"
+
+    def is_enabled(self) -> bool:
+        return self._node.get("disabled") is None
+
+    def find_element(self, by: str = By.CSS_SELECTOR, value: str = "") -> "HttpElement":
+        return self._driver._find(self._node, by, value, single=True)[0]
+
+    def find_elements(self, by: str = By.CSS_SELECTOR, value: str = "") -> list["HttpElement"]:
+        return self._driver._find(self._node, by, value)
+
+    def clear(self) -> None:
+        self._node.set("value", "")
+
+    def send_keys(self, *values: Any) -> None:
+        current = self._node.get("value", "")
+        self._node.set("value", current + "".join(str(v) for v in values))
+
+    def click(self) -> None:
+        """Follow a link or submit a form; any other click needs a browser."""
+        link = self._closest("a")
+        href = link.get("href", "").strip() if link is not None else ""
+        if href and not href.startswith(("javascript:", "#")):
+            self._driver.get(urljoin(self._driver.base_url, href))
+            return
+
+        node_type = (self._node.get("type") or "").lower()
+        is_submit = (self._node.tag == "button" and node_type in ("", "submit")) or (
+            self._node.tag == "input" and node_type in ("submit", "image")
+        )
+        form = self._closest("form")
+        if is_submit and form is not None:
+            self._driver.submit_form(form, self._node)
+            return
+
+        raise self._driver.require_browser(f"click on <{self.tag_name}> needs JavaScript")
+
+    def submit(self) -> None:
+        form = self._closest("form")
+        if form is None:
+            raise self._driver.require_browser("submit outside of a form")
+        self._driver.submit_form(form, None)
+
+
+class HttpDriver:
+    """WebDriver look-alike that fetches pages over HTTP and queries them with lxml."""
+
+    name = "http"
+    capabilities: dict[str, Any] = {"browserName": "http"}
+
+    def __init__(self, client: httpx.Client | None):
+        self.client = client
+        self.response: httpx.Response | None = None
+        self.status_code: int | None = None
+        self.browser_required: str | None = None
+        self.base_url = "about:blank"  # Resolves relative links (honours <base href>)
+        self._document: Any = None
+
+    # Navigation -----------------------------------------------------------
+
+    def get(self, url: str) -> None:
+        self._load(self.client.get(url))
+
+    def submit_form(self, form: Any, submitter: Any) -> None:
+        """Submit a form with its current field values (set through send_keys)."""
+        fields: list[tuple[str, str]] = []
+        for field in form.xpath(".//input|.//textarea|.//select|.//button"):
+            name = field.get("name")
+            if not name or field.get("disabled") is not None:
+                continue
+            field_type = (field.get("type") or "").lower()
+            if field.tag == "select":
+                selected = field.xpath(".//option[@selected]") or field.xpath(".//option")[:1]
+                if selected:
+                    fields.append((name, selected[0].get("value", selected[0].text_content())))
+            elif field.tag == "textarea":
+                fields.append((name, field.get("value", field.text or "")))
+            elif field.tag == "button" or field_type in ("submit", "image", "reset"):
+                if field is submitter:
+                    fields.append((name, field.get("value", "")))
+            elif field_type in ("checkbox", "radio"):
+                if field.get("checked") is not None:
+                    fields.append((name, field.get("value", "on")))
+            else:
+                fields.append((name, field.get("value", "")))
+
+        action = urljoin(self.base_url, form.get("action") or self.current_url)
+        method = (form.get("method") or "get").upper()
+        logger.debug(f"Submitting form {method} {action} ({len(fields)} fields)")
+        if method == "POST":
+            self._load(self.client.post(action, data=dict(fields)))
+        else:
+            self._load(self.client.get(action, params=fields))
+
+    def _load(self, response: httpx.Response) -> None:
+        self.response = response
+        self.status_code = response.status_code
+        self.load_html(response.content, str(response.url), encoding=response.encoding)
+
+    def load_html(self, content: str | bytes, url: str, encoding: str | None = None) -> None:
+        """
+        Parse markup as the current document.
+
+        Args:
+            content: HTML to parse
+            url: URL the markup was served from (resolves relative links)
+            encoding: Encoding of byte content, if known
+        """
+        lxml_html, _ = _import_lxml()
+        parser = lxml_html.HTMLParser(encoding=encoding if isinstance(content, bytes) else None)
+        try:
+            self._document = lxml_html.document_fromstring(
+                content or "<html></html>", parser=parser
+            )
+        except Exception:
+            self._document = lxml_html.document_fromstring("<html></html>")
+        base_href = self._document.xpath("string(//base/@href)").strip()
+        self.base_url = urljoin(url, base_href) if base_href else url
+
+    # Queries --------------------------------------------------------------
+
+    def _find(self, root: Any, by: str, value: str, single: bool = False) -> list[HttpElement]:
+        if root is None:
+            raise NoSuchElementException("No page has been loaded")
+        try:
+            nodes = root.xpath(_to_xpath(by, value))
+        except BrowserRequiredError:
+            raise
+        except Exception as e:
+            logger.debug(f"Invalid selector {value!r} for HTTP engine: {e}")
+            nodes = []
+        elements = [HttpElement(self, node) for node in nodes if hasattr(node, "tag")]
+        if single and not elements:
+            raise NoSuchElementException(f"Unable to locate element: {value}")
+        return elements
+
+    def find_element(self, by: str = By.CSS_SELECTOR, value: str = "") -> HttpElement:
+        return self._find(self._document, by, value, single=True)[0]
+
+    def find_elements(self, by: str = By.CSS_SELECTOR, value: str = "") -> list[HttpElement]:
+        if self._document is None:
+            return []
+        return self._find(self._document, by, value)
+
+    @property
+    def page_source(self) -> str:
+        return self.response.text if self.response is not None else ""
+
+    @property
+    def title(self) -> str:
+        if self._document is None:
+            return ""
+        return (self._document.findtext(".//title") or "").strip()
+
+    @property
+    def current_url(self) -> str:
+        return str(self.response.url) if self.response is not None else "about:blank"
+
+    # Cookies (same shapes as WebDriver, so utils.general.cookies works) --
+
+    def get_cookies(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "secure": cookie.secure,
+                **({"expiry": int(cookie.expires)} if cookie.expires else {}),
+            }
+            for cookie in self.client.cookies.jar
+        ]
+
+    def add_cookie(self, cookie: dict[str, Any]) -> None:
+        self.client.cookies.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain", ""),
+            path=cookie.get("path", "/"),
+        )
+
+    def delete_all_cookies(self) -> None:
+        self.client.cookies.clear()
+
+    # Browser-only features ------------------------------------------------
+
+    def require_browser(self, reason: str) -> BrowserRequiredError:
+        """Record that the current workflow needs a real browser and build the error."""
+        self.browser_required = reason
+        return BrowserRequiredError(reason)
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        raise self.require_browser("JavaScript execution")
+
+    def execute_async_script(self, script: str, *args: Any) -> Any:
+        raise self.require_browser("JavaScript execution")
+
+    def execute_cdp_cmd(self, cmd: str, params: dict[str, Any]) -> Any:
+        raise self.require_browser(f"DevTools command {cmd}")
+
+    def implicitly_wait(self, seconds: float) -> None:
+        pass
+
+    def set_window_size(self, width: int, height: int) -> None:
+        pass
+
+    def maximize_window(self) -> None:
+        pass
+
+    def quit(self) -> None:
+        self.response = None
+        self._document = None
+
+
+class HttpBrowser:
+    """
+    Drop-in replacement for ScraperBrowser backed by HTTP requests.
+
+    Pages are static, so ``is_static`` tells waits to check once instead of
+    polling and fixed sleeps to be skipped.
+    """
+
+    is_static = True
+
+    def __init__(self, site_name: str, client: httpx.Client | None = None, timeout: float = 30):
+        """
+        Initialize the HTTP browser.
+
+        Args:
+            site_name: Name of the site (used for logging and the shared client)
+            client: Client to send requests with (defaults to the site's shared client)
+            timeout: Request timeout in seconds for a newly created shared client
+        """
+        _import_lxml()
+        self.site_name = site_name
+        self.driver = HttpDriver(client or get_http_client(site_name, timeout))
+
+        # saved_at of the stored login session this browser uses (see utils.general.cookies)
+        self.login_session: float | None = None
+
+        # Health bookkeeping used by BrowserPool recycling policies
+        self.navigation_count = 0
+        self.detection_events = 0
+        self.crashed = False
+        self.created_at = time.time()
+        self.baseline_rss_mb = 0.0
+
+    def __getattr__(self, name):
+        """Delegate WebDriver methods to the underlying driver."""
+        return getattr(self.driver, name)
+
+    @property
+    def browser_required(self) -> str | None:
+        """Why the current workflow needs a real browser, if it does."""
+        return self.driver.browser_required
+
+    @browser_required.setter
+    def browser_required(self, reason: str | None) -> None:
+        self.driver.browser_required = reason
+
+    def get(self, url):
+        """Navigate to URL."""
+        self.navigation_count += 1
+        self.driver.get(url)
+
+    def get_memory_usage_mb(self) -> float:
+        return 0.0
+
+    def is_alive(self) -> bool:
+        return not self.crashed
+
+    def check_http_status(self) -> int | None:
+        """Status code of the last response (after redirects)."""
+        return self.driver.status_code
+
+    @property
+    def redirect_statuses(self) -> list[int]:
+        """Status codes of the redirects that led to the last response."""
+        response = self.driver.response
+        return [r.status_code for r in response.history] if response is not None else []
+
+    def quit(self):
+        """Drop the loaded page; the shared client stays open for other workers."""
+        self.driver.quit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.quit()
+
+
+_clients: dict[str, httpx.Client] = {}
+_clients_lock = threading.Lock()
+
+
+def get_http_client(site_name: str, timeout: float = 30) -> httpx.Client:
+    """
+    Get the process-wide HTTP client for a site, creating it on first use.
+
+    Every HttpBrowser of a site shares the client, so workers reuse pooled
+    keep-alive connections and one cookie jar (a login by one worker is
+    visible to all of them).
+
+    Args:
+        site_name: Site the client is used for
+        timeout: Request timeout in seconds
+
+    Returns:
+        The shared httpx.Client
+    """
+    with _clients_lock:
+        client = _clients.get(site_name)
+        if client is None:
+            client = httpx.Client(
+                follow_redirects=True,
+                timeout=timeout,
+                headers={
+                    "User-Agent": DEFAULT_USER_AGENT,
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                    "Accept-Language": "en-US,en;q=0.9",
+                },
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+            _clients[site_name] = client
+        return client
+
+
+def close_http_clients() -> None:
+    """Close every shared HTTP client (at the end of a run and in tests)."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+def create_http_browser(site_name: str, timeout: float = 30) -> HttpBrowser:
+    """
+    Factory function to create an HTTP browser using the site's shared client.
+
+    Args:
+        site_name: Name of the site
+        timeout: Request timeout in seconds
+
+    Returns:
+        HttpBrowser instance
+    """
+    return HttpBrowser(site_name, timeout=timeout)
@@ -0,0 +1,255 @@
+"""
+Condition-based waits that replace fixed sleeps in workflows.
+
+Each condition returns as soon as the page is ready instead of always sleeping
+for the configured number of seconds, which becomes the upper bound:
+
+- ``network_idle``: the document has loaded and no resource (XHR, fetch,
+  image, script, ...) finished for ``quiet_ms``
+- ``dom_stable``: no DOM mutation for ``quiet_ms``
+- ``url_changed``: the URL differs from ``from_url`` (e.g. after a click that
+  navigates)
+- ``element_count_stable``: ``selector`` matches at least one element and the
+  count did not change for ``quiet_ms`` (e.g. lazily appended results)
+
+The DOM and network checks run inside the page in a single
+``execute_async_script`` round trip.
+
+``wait_for_any`` waits for the first of several selectors to match with a
+MutationObserver, so a match is reported as soon as the DOM changes instead
+of at the next WebDriverWait poll.
+"""
+
+import logging
+import time
+from typing import Any
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+CONDITIONS = ("network_idle", "dom_stable", "url_changed", "element_count_stable")
+
+DEFAULT_QUIET_MS = 500
+
+# Selenium's default async script timeout
+SCRIPT_TIMEOUT = 30
+
+# arguments: quietMs, timeoutMs, done; resolves to true once quiet, false on timeout
+NETWORK_IDLE_SCRIPT = """
+var quietMs = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+if (performance.setResourceTimingBufferSize) performance.setResourceTimingBufferSize(100000);
+var start = Date.now(), last = start;
+var count = performance.getEntriesByType("resource").length;
+var timer = setInterval(function () {
+    var now = Date.now(), current = performance.getEntriesByType("resource").length;
+    if (current !== count || document.readyState !== "complete") {
+        count = current;
+        last = now;
+    }
+    if (now - last >= quietMs || now - start >= timeoutMs) {
+        clearInterval(timer);
+        done(now - last >= quietMs);
+    }
+}, 50);
+"""
+
+DOM_STABLE_SCRIPT = """
+var quietMs = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var start = Date.now(), last = start;
+var observer = new MutationObserver(function () { last = Date.now(); });
+observer.observe(document.documentElement || document,
+    {childList: true, subtree: true, attributes: true, characterData: true});
+var timer = setInterval(function () {
+    var now = Date.now();
+    if (now - last >= quietMs || now - start >= timeoutMs) {
+        clearInterval(timer);
+        observer.disconnect();
+        done(now - last >= quietMs);
+    }
+}, 50);
+"""
+
+# Extra arguments: selector, isXPath
+ELEMENT_COUNT_STABLE_SCRIPT = """
+var quietMs = arguments[0], timeoutMs = arguments[1], selector = arguments[2],
+    isXPath = arguments[3], done = arguments[arguments.length - 1];
+function countMatches() {
+    if (isXPath) {
+        return document.evaluate("count(" + selector + ")", document, null,
+            XPathResult.NUMBER_TYPE, null).numberValue;
+    }
+    return document.querySelectorAll(selector).length;
+}
+var start = Date.now(), last = start, count = countMatches();
+var timer = setInterval(function () {
+    var now = Date.now(), current = countMatches();
+    if (current !== count || current === 0) {
+        count = current;
+        last = now;
+    }
+    if (now - last >= quietMs || now - start >= timeoutMs) {
+        clearInterval(timer);
+        done(now - last >= quietMs);
+    }
+}, 50);
+"""
+
+# Scroll an element to the centre and resolve once the scroll has been painted
+# (two animation frames; the timer covers throttled background tabs)
+SCROLL_INTO_VIEW_SCRIPT = """
+var element = arguments[0], done = arguments[arguments.length - 1], finished = false;
+function finish() { if (!finished) { finished = true; done(true); } }
+element.scrollIntoView({block: "center", inline: "center"});
+requestAnimationFrame(function () { requestAnimationFrame(finish); });
+setTimeout(finish, 100);
+"""
+
+# arguments: [[selector, isXPath], ...], timeoutMs, done
+# Resolves to the index of the first selector (in list order) that matches,
+# -1 on timeout, or {error: message} for an invalid selector.
+WAIT_FOR_ANY_SCRIPT = """
+var specs = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var finished = false, observer = null, timer = null;
+function find() {
+    for (var i = 0; i < specs.length; i++) {
+        var found = specs[i][1]
+            ? document.evaluate(specs[i][0], document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(specs[i][0]);
+        if (found) return i;
+    }
+    return -1;
+}
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    done(result);
+}
+function check() {
+    try {
+        var index = find();
+        if (index !== -1) finish(index);
+    } catch (e) {
+        finish({error: String(e)});
+    }
+}
+check();
+if (!finished) {
+    observer = new MutationObserver(check);
+    observer.observe(document,
+        {childList: true, subtree: true, attributes: true, characterData: true});
+    timer = setTimeout(function () { finish(-1); }, timeoutMs);
+}
+"""
+
+SCRIPTS = {
+    "network_idle": NETWORK_IDLE_SCRIPT,
+    "dom_stable": DOM_STABLE_SCRIPT,
+    "element_count_stable": ELEMENT_COUNT_STABLE_SCRIPT,
+}
+
+
+def _execute_async(driver: Any, script: str, timeout: float, *args: Any) -> Any:
+    """Run an async script that resolves within ``timeout`` seconds."""
+    if timeout + 1 <= SCRIPT_TIMEOUT:
+        return driver.execute_async_script(script, *args)
+    driver.set_script_timeout(timeout + 5)
+    try:
+        return driver.execute_async_script(script, *args)
+    finally:
+        driver.set_script_timeout(SCRIPT_TIMEOUT)
+
+
+def wait_until(
+    driver: Any,
+    condition: str,
+    timeout: float,
+    quiet_ms: int = DEFAULT_QUIET_MS,
+    selector: str | None = None,
+    from_url: str | None = None,
+) -> bool:
+    """
+    Wait until a page condition holds, for at most ``timeout`` seconds.
+
+    Args:
+        driver: Selenium WebDriver
+        condition: One of CONDITIONS
+        timeout: Maximum seconds to wait
+        quiet_ms: Milliseconds without activity that count as stable/idle
+        selector: CSS or XPath selector (``element_count_stable`` only)
+        from_url: URL to move away from (``url_changed``; defaults to the current URL)
+
+    Returns:
+        True if the condition was met, False if the timeout expired first
+
+    Raises:
+        ValueError: For an unknown condition or a missing selector
+    """
+    if condition not in CONDITIONS:
+        raise ValueError(f"Unknown wait condition '{condition}' (expected one of {CONDITIONS})")
+
+    if condition == "url_changed":
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                EC.url_changes(from_url if from_url is not None else driver.current_url)
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    args: list[Any] = [int(quiet_ms), int(timeout * 1000)]
+    if condition == "element_count_stable":
+        if not selector:
+            raise ValueError("element_count_stable requires a 'selector'")
+        args += [selector, selector.startswith(("//", ".//"))]
+
+    started = time.monotonic()
+    met = bool(_execute_async(driver, SCRIPTS[condition], timeout, *args))
+    logger.debug(
+        f"Wait until {condition}: {'met' if met else 'timed out'} "
+        f"after {time.monotonic() - started:.2f}s (max {timeout}s)"
+    )
+    return met
+
+
+def scroll_into_view(driver: Any, element: Any) -> None:
+    """
+    Scroll an element into the centre of the viewport and wait for the scroll to settle.
+
+    Args:
+        driver: Selenium WebDriver
+        element: WebElement to scroll to
+    """
+    driver.execute_async_script(SCROLL_INTO_VIEW_SCRIPT, element)
+
+
+def wait_for_any(driver: Any, selectors: list[str], timeout: float) -> str | None:
+    """
+    Wait until any of the selectors matches an element, for at most ``timeout`` seconds.
+
+    Args:
+        driver: Selenium WebDriver
+        selectors: CSS or XPath selectors (XPath starts with ``//`` or ``.//``)
+        timeout: Maximum seconds to wait
+
+    Returns:
+        The first selector in list order that matched, or None on timeout
+
+    Raises:
+        WebDriverException: If the page navigated away while waiting
+        ValueError: If a selector is invalid or the script returned something unexpected
+    """
+    specs = [[selector, selector.startswith(("//", ".//"))] for selector in selectors]
+    result = _execute_async(driver, WAIT_FOR_ANY_SCRIPT, timeout, specs, int(timeout * 1000))
+    if isinstance(result, dict) and "error" in result:
+        raise ValueError(f"Invalid selector in {selectors}: {result['error']}")
+    if isinstance(result, bool) or not isinstance(result, int):
+        raise ValueError(f"Unexpected wait_for result: {result!r}")
+    if result < 0:
+        return None
+    return selectors[result]
@@ -0,0 +1,64 @@
+"""
+Offline DOM snapshots for selector-heavy extraction.
+
+Extracting a product with live WebDriver lookups costs one chromedriver
+round trip per ``find_element(s)`` plus one per ``.text``/``get_attribute``
+on every matched element. A PageSnapshot pulls the rendered DOM once and
+answers the same CSS/XPath queries in-process with lxml, returning elements
+with the WebElement text/attribute semantics used by the extract actions.
+
+Scrapers opt in with ``extraction: snapshot`` in their YAML.
+"""
+
+import logging
+from typing import Any
+
+from selenium.webdriver.common.by import By
+
+from src.utils.scraping.http_browser import HttpDriver, HttpElement
+
+logger = logging.getLogger(__name__)
+
+# Serialized DOM (including script-rendered content) and the URL that
+# relative links resolve against, in a single round trip
+CAPTURE_SCRIPT = "return [document.documentElement.outerHTML, document.baseURI];"
+
+
+class PageSnapshot:
+    """Parsed copy of a page that answers find_element(s) without round trips."""
+
+    def __init__(self, html: str, url: str):
+        """
+        Initialize the snapshot.
+
+        Args:
+            html: Serialized DOM of the page
+            url: Base URL of the page
+        """
+        self.url = url
+        self._document = HttpDriver(client=None)
+        self._document.load_html(html, url)
+
+    @classmethod
+    def capture(cls, driver: Any) -> "PageSnapshot":
+        """
+        Snapshot the page currently loaded in a WebDriver.
+
+        Args:
+            driver: Selenium WebDriver (or compatible) showing the page
+
+        Returns:
+            PageSnapshot of the rendered DOM
+        """
+        try:
+            html, url = driver.execute_script(CAPTURE_SCRIPT)
+        except Exception as e:
+            logger.debug(f"DOM capture script failed, using page_source: {e}")
+            html, url = driver.page_source, driver.current_url
+        return cls(html, url)
+
+    def find_element(self, by: str = By.CSS_SELECTOR, value: str = "") -> HttpElement:
+        return self._document.find_element(by, value)
+
+    def find_elements(self, by: str = By.CSS_SELECTOR, value: str = "") -> list[HttpElement]:
+        return self._document.find_elements(by, value)
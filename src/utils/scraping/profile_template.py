@@ -0,0 +1,191 @@
+"""
+Pre-warmed Chrome profile templates.
+
+Every pooled browser gets its own profile directory, so each launch used to
+start from an empty profile and pay profile creation and first-run work.
+A site's template is built once by visiting the site's start page and
+accepting its cookie banner; new browsers start from a copy of it, which
+also carries the consent cookies. Caches and lock files are left out of the
+template so copies stay small and never look like a running Chrome.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from src.utils.scraping.browser_lifecycle import OWNER_FILE
+from src.utils.scraping.scraping import get_profile_dir, get_profiles_root
+
+# Templates older than this are rebuilt (consent cookies expire)
+TEMPLATE_MAX_AGE = 7 * 86400.0
+
+# Written last when a template is complete
+TEMPLATE_MARKER = "template.json"
+
+# Profile entries not copied into templates: caches, crash data and locks
+EXCLUDED_ENTRIES = frozenset(
+    {
+        "Cache",
+        "Code Cache",
+        "GPUCache",
+        "GrShaderCache",
+        "ShaderCache",
+        "GraphiteDawnCache",
+        "DawnCache",
+        "Service Worker",
+        "Crashpad",
+        "Crash Reports",
+        "BrowserMetrics",
+        "SingletonLock",
+        "SingletonCookie",
+        "SingletonSocket",
+        "DevToolsActivePort",
+        "lockfile",
+        "LOCK",
+        OWNER_FILE,
+    }
+)
+
+_build_locks: dict[str, threading.Lock] = {}
+_build_locks_lock = threading.Lock()
+
+
+def get_template_dir(site_name: str) -> Path:
+    """Template directory of a site (data/browser_profiles/_templates/<site>)."""
+    return Path(get_profiles_root()) / "_templates" / site_name.replace(" ", "_")
+
+
+def _ignore_entries(directory: str, names: list[str]) -> set[str]:
+    return {name for name in names if name in EXCLUDED_ENTRIES}
+
+
+def is_template_fresh(
+    template_dir: Path, base_url: str, max_age: float = TEMPLATE_MAX_AGE, now: float | None = None
+) -> bool:
+    """Whether a complete template exists for base_url and is younger than max_age."""
+    now = time.time() if now is None else now
+    try:
+        with open(template_dir / TEMPLATE_MARKER, encoding="utf-8") as f:
+            marker = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return marker.get("base_url") == base_url and now - marker.get("built_at", 0) < max_age
+
+
+def copy_profile_template(template_dir: str | Path, profile_dir: str | Path) -> bool:
+    """
+    Start a profile directory from a template.
+
+    Args:
+        template_dir: Complete template directory
+        profile_dir: New (missing or empty) profile directory
+
+    Returns:
+        True if the template was copied
+    """
+    template_dir = Path(template_dir)
+    profile_dir = Path(profile_dir)
+    if not (template_dir / TEMPLATE_MARKER).exists():
+        return False
+    if profile_dir.exists() and any(profile_dir.iterdir()):
+        return False
+    shutil.copytree(template_dir, profile_dir, ignore=_ignore_entries, dirs_exist_ok=True)
+    return True
+
+
+def build_profile_template(
+    site_name: str,
+    base_url: str,
+    consent_selectors: list[str] | None = None,
+    headless: bool = True,
+    template_dir: Path | None = None,
+) -> Path:
+    """
+    Build a site's template from a cold browser.
+
+    The start page is loaded, consent banners are clicked and Chrome is quit
+    so it writes its cookies and preferences; the profile is then moved into
+    place, replacing an older template.
+
+    Args:
+        site_name: Scraper name
+        base_url: Page to warm the profile with
+        consent_selectors: CSS selectors of cookie banner buttons to click if present
+        headless: Whether to run Chrome headless
+        template_dir: Destination (defaults to get_template_dir(site_name))
+
+    Returns:
+        The template directory
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    from src.utils.scraping.browser import create_browser, no_implicit_wait
+
+    template_dir = template_dir or get_template_dir(site_name)
+    staging_suffix = f"_templates/{site_name}.{uuid.uuid4().hex[:8]}.staging"
+    browser = create_browser(
+        site_name, headless=headless, profile_suffix=staging_suffix, keep_profile=True
+    )
+    try:
+        browser.get(base_url)
+        WebDriverWait(browser.driver, 30).until(
+            lambda driver: driver.execute_script("return document.readyState") == "complete"
+        )
+        with no_implicit_wait(browser.driver):
+            for selector in consent_selectors or []:
+                for element in browser.driver.find_elements(By.CSS_SELECTOR, selector)[:1]:
+                    try:
+                        element.click()
+                    except Exception as e:
+                        print(f"[WEB] [{site_name}] Could not click consent banner {selector}: {e}")
+        time.sleep(1)  # Let consent handlers store their cookies
+    finally:
+        browser.quit()
+
+    staging_dir = Path(get_profile_dir(staging_suffix))
+    with open(staging_dir / TEMPLATE_MARKER, "w", encoding="utf-8") as f:
+        json.dump({"base_url": base_url, "built_at": time.time()}, f)
+
+    # Swap in the new template; browsers copying the old one keep their copy
+    old_dir = template_dir.with_name(f"{template_dir.name}.{uuid.uuid4().hex[:8]}.old")
+    if template_dir.exists():
+        os.replace(template_dir, old_dir)
+    shutil.copytree(staging_dir, template_dir, ignore=_ignore_entries)
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    return template_dir
+
+
+def ensure_profile_template(
+    site_name: str,
+    base_url: str,
+    consent_selectors: list[str] | None = None,
+    headless: bool = True,
+) -> Path | None:
+    """
+    Get a site's template, building it if it is missing or stale.
+
+    Workers of a site calling this concurrently build the template once.
+
+    Returns:
+        The template directory, or None if it could not be built
+    """
+    template_dir = get_template_dir(site_name)
+    with _build_locks_lock:
+        lock = _build_locks.setdefault(site_name, threading.Lock())
+    with lock:
+        if is_template_fresh(template_dir, base_url):
+            return template_dir
+        started = time.time()
+        try:
+            build_profile_template(site_name, base_url, consent_selectors, headless, template_dir)
+        except Exception as e:
+            print(f"[WEB] [{site_name}] Failed to build profile template: {e}")
+            return None
+        print(f"[WEB] [{site_name}] Built profile template in {time.time() - started:.2f}s")
+        return template_dir
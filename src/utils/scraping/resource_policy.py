@@ -0,0 +1,94 @@
+"""
+Resource blocking for Chrome scrapers.
+
+Scrapers read image URLs from ``src`` attributes and never use rendered
+images, fonts or media, and ad/analytics scripts only slow pages down. The
+URL patterns built here are passed to DevTools ``Network.setBlockedURLs`` so
+Chrome never requests them; blocked requests then fail with
+``blockedReason: inspector`` and are counted per resource type.
+"""
+
+from collections.abc import Iterable
+
+# URL patterns (``*`` wildcards) per blockable resource type
+TYPE_PATTERNS: dict[str, tuple[str, ...]] = {
+    "image": ("jpg", "jpeg", "png", "gif", "webp", "avif", "svg", "ico", "bmp"),
+    "media": ("mp4", "webm", "ogg", "ogv", "mp3", "m4a", "m4v", "mov", "wav"),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "stylesheet": ("css",),
+}
+
+# Ad, analytics and session-recording hosts that scraped pages do not need
+TRACKER_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googleadservices.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "connect.facebook.net",
+    "facebook.net",
+    "bat.bing.com",
+    "clarity.ms",
+    "hotjar.com",
+    "fullstory.com",
+    "segment.io",
+    "segment.com",
+    "mixpanel.com",
+    "criteo.com",
+    "criteo.net",
+    "adnxs.com",
+    "taboola.com",
+    "outbrain.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "nr-data.net",
+    "js-agent.newrelic.com",
+)
+
+
+def host_patterns(host: str) -> list[str]:
+    """URL patterns matching a host and its subdomains."""
+    return [f"*://{host}/*", f"*.{host}/*"]
+
+
+def blocked_url_patterns(
+    block_types: Iterable[str],
+    block_trackers: bool = True,
+    block_hosts: Iterable[str] = (),
+    allow_hosts: Iterable[str] = (),
+    block_patterns: Iterable[str] = (),
+) -> list[str]:
+    """
+    Build the URL patterns for Network.setBlockedURLs.
+
+    Args:
+        block_types: Resource types to block (keys of TYPE_PATTERNS)
+        block_trackers: Whether to block TRACKER_HOSTS
+        block_hosts: Extra hosts to block
+        allow_hosts: Hosts exempted from TRACKER_HOSTS and block_hosts
+        block_patterns: Extra raw URL patterns
+
+    Returns:
+        URL patterns with ``*`` wildcards
+
+    Raises:
+        ValueError: For an unknown resource type
+    """
+    patterns: list[str] = []
+    for resource_type in block_types:
+        if resource_type not in TYPE_PATTERNS:
+            raise ValueError(
+                f"Unknown resource type '{resource_type}' (expected one of {list(TYPE_PATTERNS)})"
+            )
+        for extension in TYPE_PATTERNS[resource_type]:
+            patterns += [f"*.{extension}", f"*.{extension}?*"]
+
+    allowed = set(allow_hosts)
+    hosts = [*(TRACKER_HOSTS if block_trackers else ()), *block_hosts]
+    for host in dict.fromkeys(hosts):
+        if host not in allowed:
+            patterns += host_patterns(host)
+
+    return patterns + list(block_patterns)
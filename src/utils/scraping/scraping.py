@@ -97,27 +97,43 @@ def _add_automation_options(options: Options) -> None:
     options.add_argument("--disable-popup-blocking")
 
 
+def get_profiles_root() -> str:
+    """Directory holding the Chrome profile directories (data/browser_profiles)."""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = current_dir
+    while not os.path.exists(os.path.join(project_root, "main.py")):
+        project_root = os.path.dirname(project_root)
+        if project_root == os.path.dirname(project_root):
+            break
+    return os.path.join(project_root, "data", "browser_profiles")
+
+
+def get_profile_dir(profile_suffix: str) -> str:
+    """Chrome profile directory for a profile suffix."""
+    return os.path.join(get_profiles_root(), profile_suffix.replace(" ", "_"))
+
+
 def _add_profile_options(options: Options, profile_suffix: str) -> None:
     """Add Chrome profile options."""
     if profile_suffix:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = current_dir
-        while not os.path.exists(os.path.join(project_root, "main.py")):
-            project_root = os.path.dirname(project_root)
-            if project_root == os.path.dirname(project_root):
-                break
-
-        profile_dir = os.path.join(
-            project_root, "data", "browser_profiles", profile_suffix.replace(" ", "_")
-        )
+        profile_dir = get_profile_dir(profile_suffix)
         os.makedirs(profile_dir, exist_ok=True)
         options.add_argument(f"--user-data-dir={profile_dir}")
 
 
 def get_standard_chrome_options(
-    headless=True, profile_suffix="default", enable_devtools=False, devtools_port=9222
+    headless=True,
+    profile_suffix="default",
+    enable_devtools=False,
+    devtools_port=9222,
+    capture_network=False,
 ):
-    """Get standardized Chrome options that suppress common errors and warnings."""
+    """
+    Get standardized Chrome options that suppress common errors and warnings.
+
+    With ``capture_network``, DevTools Network events are recorded in the
+    performance log (read with ``driver.get_log("performance")``).
+    """
     options = Options()
 
     if headless:
@@ -136,8 +152,13 @@ def get_standard_chrome_options(
     _add_profile_options(options, profile_suffix)
 
     options.set_capability(
-        "goog:loggingPrefs", {"browser": "OFF", "driver": "OFF", "performance": "OFF"}
+        "goog:loggingPrefs",
+        {"browser": "OFF", "driver": "OFF", "performance": "ALL" if capture_network else "OFF"},
     )
+    if capture_network:
+        options.add_experimental_option(
+            "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False}
+        )
 
     return options
 
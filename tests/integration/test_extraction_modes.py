@@ -0,0 +1,89 @@
+"""
+Integration tests checking that every extraction mode returns the live values in Chrome
+"""
+
+from urllib.parse import quote
+
+import pytest
+
+from src.scrapers.executor.workflow_executor import WorkflowExecutor
+from src.scrapers.models.config import ScraperConfig, SelectorConfig, WorkflowStep
+
+PRODUCT_PAGE = """<!DOCTYPE html>
+<html><head><title>KONG Toy</title></head><body>
+  <span id="productTitle">  KONG Classic
+      Dog <b>Toy</b>&nbsp;</span>
+  <a id="bylineInfo" href="https://shop.example.com/stores/kong" title="KONG">Visit the KONG Store</a>
+  <div id="altImages"><ul>
+    <li class="imageThumbnail"><img src="https://cdn.example.com/1.jpg" alt="front"></li>
+    <li class="imageThumbnail"><img src="https://cdn.example.com/2.jpg" alt="side"></li>
+    <li class="imageThumbnail"><img src="https://cdn.example.com/1.jpg" alt="front"></li>
+  </ul></div>
+  <table><tr><th>Item Weight</th><td>1.5 Pounds</td></tr></table>
+  <ul><li>Size: Medium</li><li>Weight: 7 ounces</li></ul>
+  <div class="description"><p>Durable rubber.</p><p>Bounces<br>unpredictably.</p></div>
+  <div style="display: none" class="price">$9.99</div>
+  <input id="qty" type="number" value="2" disabled>
+</body></html>
+"""
+
+SELECTORS = [
+    SelectorConfig(name="Name", selector="#productTitle", attribute="text"),
+    SelectorConfig(name="Brand", selector="#bylineInfo"),
+    SelectorConfig(name="Brand URL", selector="#bylineInfo", attribute="href"),
+    SelectorConfig(name="Brand Title", selector="#bylineInfo", attribute="title"),
+    SelectorConfig(
+        name="Images", selector="#altImages li.imageThumbnail img", attribute="src", multiple=True
+    ),
+    SelectorConfig(name="Image Alts", selector="#altImages img", attribute="alt", multiple=True),
+    SelectorConfig(
+        name="Weight",
+        selector="//tr[.//th[contains(., 'Weight')]] | //li[contains(., 'ounces')]",
+        attribute="text",
+    ),
+    SelectorConfig(name="Description", selector=".description"),
+    SelectorConfig(name="Price", selector=".price"),
+    SelectorConfig(name="Quantity", selector="#qty", attribute="value"),
+    SelectorConfig(name="UPC", selector="#upc"),
+]
+
+
+@pytest.fixture(scope="module")
+def chrome():
+    """Headless Chrome showing the product page (skips when Chrome is unavailable)."""
+    from src.utils.scraping.browser import create_browser
+
+    try:
+        browser = create_browser("extraction_modes", headless=True)
+    except Exception as e:
+        pytest.skip(f"Chrome is not available: {e}")
+    browser.get("data:text/html;charset=utf-8," + quote(PRODUCT_PAGE))
+    yield browser
+    browser.quit()
+
+
+def extract(chrome, extraction):
+    config = ScraperConfig(
+        name="extraction_modes",
+        base_url="https://shop.example.com",
+        extraction=extraction,
+        selectors=SELECTORS,
+        workflows=[WorkflowStep(action="extract", params={"fields": [s.name for s in SELECTORS]})],
+    )
+    executor = WorkflowExecutor(config, browser=chrome)
+    executor.execute_steps(config.workflows)
+    return executor.results
+
+
+@pytest.mark.integration
+class TestExtractionModes:
+    """Integration tests for live, snapshot and script extraction."""
+
+    @pytest.mark.parametrize("extraction", ["snapshot", "script"])
+    def test_mode_matches_live_extraction(self, chrome, extraction):
+        live = extract(chrome, "live")
+
+        assert extract(chrome, extraction) == live
+        assert live["Name"] == "KONG Classic Dog Toy"
+        assert live["Images"] == ["https://cdn.example.com/1.jpg", "https://cdn.example.com/2.jpg"]
+        assert live["UPC"] is None
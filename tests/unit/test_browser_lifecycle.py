@@ -0,0 +1,106 @@
+"""
+Unit tests for cleanup of Chrome profile directories and processes.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.scraping.browser import create_browser
+from src.utils.scraping.browser_lifecycle import (
+    LEGACY_PROFILE_AGE,
+    OWNER_FILE,
+    get_browser_lifecycle,
+    release_profile,
+    reset_browser_lifecycle,
+    sweep_orphans,
+    write_owner_file,
+)
+
+NOW = 1_700_000_000.0
+DEAD_OWNER = {"pid": 2**22 + 17, "create_time": 0.0}
+
+
+@pytest.fixture(autouse=True)
+def fresh_totals():
+    reset_browser_lifecycle()
+    yield
+    reset_browser_lifecycle()
+
+
+def make_profile(root, name, owner=None, mtime=NOW):
+    profile = root / name
+    (profile / "Default").mkdir(parents=True)
+    (profile / "Default" / "Cookies").write_bytes(b"x" * 1000)
+    if owner is not None:
+        (profile / OWNER_FILE).write_text(json.dumps({"owner": owner, "processes": []}))
+    os.utime(profile, (mtime, mtime))
+    return profile
+
+
+class TestSweepOrphans:
+    """Test cases for sweep_orphans."""
+
+    def test_profiles_of_dead_owners_are_removed(self, tmp_path):
+        dead = make_profile(tmp_path, "1001", owner=DEAD_OWNER)
+        live = make_profile(tmp_path, "1002")
+        write_owner_file(live, None)
+
+        report = sweep_orphans(tmp_path, now=NOW)
+
+        assert not dead.exists()
+        assert live.exists()
+        assert report.profiles_removed == 1
+        assert report.bytes_reclaimed >= 1000
+
+    def test_profiles_without_owner_file_are_removed_once_old(self, tmp_path):
+        old = make_profile(tmp_path, "old", mtime=NOW - LEGACY_PROFILE_AGE - 60)
+        recent = make_profile(tmp_path, "recent", mtime=NOW - 60)
+
+        sweep_orphans(tmp_path, now=NOW)
+
+        assert not old.exists()
+        assert recent.exists()
+
+    def test_templates_are_never_swept(self, tmp_path):
+        template = make_profile(tmp_path / "_templates", "shop", mtime=NOW - 86400)
+
+        assert sweep_orphans(tmp_path, now=NOW).profiles_removed == 0
+        assert template.exists()
+
+
+class TestReleaseProfile:
+    """Test cases for release_profile and ScraperBrowser.quit."""
+
+    def test_release_removes_the_profile_and_records_it(self, tmp_path):
+        profile = make_profile(tmp_path, "1001")
+        write_owner_file(profile, None)
+
+        report = release_profile(profile)
+
+        assert not profile.exists()
+        assert report.profiles_removed == 1
+        assert get_browser_lifecycle().totals.bytes_reclaimed == report.bytes_reclaimed
+
+    def test_quit_releases_the_profile_unless_kept(self, tmp_path):
+        with (
+            patch("src.utils.scraping.browser.webdriver.Chrome") as chrome,
+            patch("src.utils.scraping.scraping._add_profile_options"),
+            patch(
+                "src.utils.scraping.browser.get_profile_dir",
+                side_effect=lambda suffix: str(make_profile(tmp_path, suffix)),
+            ),
+        ):
+            chrome.return_value.service.process.pid = None
+            browser = create_browser("shop", profile_suffix="p1")
+            kept = create_browser("shop", profile_suffix="p2", keep_profile=True)
+
+        assert (tmp_path / "p1" / OWNER_FILE).exists()
+        browser.quit()
+        kept.quit()
+
+        assert browser.driver.quit.call_count == 2  # Both share the mocked driver
+        assert not (tmp_path / "p1").exists()
+        assert (tmp_path / "p2").exists()
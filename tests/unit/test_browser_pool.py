@@ -0,0 +1,178 @@
+"""
+Unit tests for the warm browser pool.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.utils.scraping.browser_pool import BrowserHealthPolicy, BrowserPool
+
+
+def make_browser():
+    """Create a fake ScraperBrowser with the health attributes used by the pool."""
+    browser = Mock()
+    browser.navigation_count = 0
+    browser.detection_events = 0
+    browser.baseline_rss_mb = 100.0
+    browser.get_memory_usage_mb.return_value = 120.0
+    browser.is_alive.return_value = True
+    return browser
+
+
+@pytest.fixture
+def factory():
+    """Browser factory that records every browser it creates."""
+    created = []
+    lock = threading.Lock()
+
+    def create():
+        browser = make_browser()
+        with lock:
+            created.append(browser)
+        return browser
+
+    create.created = created
+    return create
+
+
+def wait_for_ready(pool, count, timeout=2.0):
+    """Wait until the pool has at least `count` ready browsers."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if pool.get_stats()["ready"] >= count:
+            return
+        time.sleep(0.01)
+    raise AssertionError(f"Pool never reached {count} ready browsers")
+
+
+class TestBrowserPool:
+    """Test cases for BrowserPool."""
+
+    def test_prewarms_size_plus_spares(self, factory):
+        pool = BrowserPool("test", size=2, spares=1, browser_factory=factory)
+        wait_for_ready(pool, 3)
+
+        assert len(factory.created) == 3
+        assert pool.get_stats()["spawned"] == 3
+        pool.shutdown()
+
+    def test_acquire_and_release_reuses_browser(self, factory):
+        pool = BrowserPool("test", size=1, spares=0, browser_factory=factory)
+
+        browser = pool.acquire(timeout=2)
+        assert pool.get_stats()["leased"] == 1
+
+        pool.release(browser)
+        assert pool.get_stats()["leased"] == 0
+        assert pool.acquire(timeout=2) is browser
+        assert len(factory.created) == 1
+        pool.shutdown()
+
+    def test_recycle_returns_warm_spare_and_replenishes(self, factory):
+        pool = BrowserPool("test", size=1, spares=1, browser_factory=factory)
+        wait_for_ready(pool, 2)
+
+        browser = pool.acquire(timeout=2)
+        replacement = pool.recycle(browser, "navigations")
+
+        assert replacement is not browser
+        wait_for_ready(pool, 1)
+        assert len(factory.created) == 3
+        stats = pool.get_stats()
+        assert stats["recycled"] == 1
+        assert stats["recycle_reasons"] == {"navigations": 1}
+
+        # Retired browser is closed in the background
+        deadline = time.time() + 2
+        while not browser.quit.called and time.time() < deadline:
+            time.sleep(0.01)
+        browser.quit.assert_called_once()
+        pool.shutdown()
+
+    @pytest.mark.parametrize(
+        "attribute,value,reason",
+        [
+            ("navigation_count", 5, "navigations"),
+            ("detection_events", 2, "detection"),
+        ],
+    )
+    def test_needs_recycle_thresholds(self, factory, attribute, value, reason):
+        policy = BrowserHealthPolicy(max_navigations=5, max_detection_events=2)
+        pool = BrowserPool("test", size=1, spares=0, policy=policy, browser_factory=factory)
+        browser = make_browser()
+
+        assert pool.needs_recycle(browser) is None
+        setattr(browser, attribute, value)
+        assert pool.needs_recycle(browser) == reason
+        pool.shutdown()
+
+    def test_needs_recycle_memory_growth(self, factory):
+        policy = BrowserHealthPolicy(max_rss_growth_mb=50)
+        pool = BrowserPool("test", size=1, spares=0, policy=policy, browser_factory=factory)
+        browser = make_browser()
+        browser.get_memory_usage_mb.return_value = 151.0
+
+        assert pool.needs_recycle(browser) == "memory"
+        pool.shutdown()
+
+    def test_needs_recycle_crashed(self, factory):
+        pool = BrowserPool("test", size=1, spares=0, browser_factory=factory)
+        browser = make_browser()
+        browser.is_alive.return_value = False
+
+        assert pool.needs_recycle(browser) == "crashed"
+        pool.shutdown()
+
+    def test_release_unhealthy_browser_is_retired(self, factory):
+        policy = BrowserHealthPolicy(max_navigations=1)
+        pool = BrowserPool("test", size=1, spares=0, policy=policy, browser_factory=factory)
+
+        browser = pool.acquire(timeout=2)
+        browser.navigation_count = 1
+        pool.release(browser)
+
+        replacement = pool.acquire(timeout=2)
+        assert replacement is not browser
+        assert pool.get_stats()["recycle_reasons"] == {"navigations": 1}
+        pool.shutdown()
+
+    def test_release_without_replacement_spawns_nothing(self, factory):
+        policy = BrowserHealthPolicy(max_navigations=1)
+        pool = BrowserPool("test", size=1, spares=0, policy=policy, browser_factory=factory)
+
+        browser = pool.acquire(timeout=2)
+        browser.navigation_count = 1
+        pool.release(browser, replace=False)
+
+        assert pool._pending_spawns == 0
+        assert len(factory.created) == 1
+        pool.shutdown()
+
+    def test_spawn_failure_surfaces_on_acquire(self):
+        pool = BrowserPool(
+            "test", size=1, spares=0, browser_factory=Mock(side_effect=Exception("no chrome"))
+        )
+
+        with pytest.raises(RuntimeError, match="no chrome"):
+            pool.acquire(timeout=2)
+        pool.shutdown()
+
+    def test_shutdown_closes_leased_and_ready_browsers(self, factory):
+        pool = BrowserPool("test", size=1, spares=1, browser_factory=factory)
+        wait_for_ready(pool, 2)
+        pool.acquire(timeout=2)
+
+        pool.shutdown()
+
+        for browser in factory.created:
+            browser.quit.assert_called_once()
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.acquire(timeout=0.1)
+
+    def test_is_crash_error(self):
+        assert BrowserPool.is_crash_error(Exception("invalid session id"))
+        assert BrowserPool.is_crash_error(Exception("Message: chrome not reachable"))
+        assert not BrowserPool.is_crash_error(Exception("Element not found"))
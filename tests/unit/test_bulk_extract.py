@@ -0,0 +1,89 @@
+"""
+Unit tests for single-round-trip script extraction.
+"""
+
+from unittest.mock import Mock
+
+from selenium.webdriver.common.by import By
+
+from src.scrapers.executor.workflow_executor import WorkflowExecutor
+from src.utils.scraping.bulk_extract import BULK_EXTRACT_SCRIPT
+from tests.unit.test_page_snapshot import PRODUCT_PAGE, CountingDriver, product_config
+
+
+class ScriptDriver(CountingDriver):
+    """Answers BULK_EXTRACT_SCRIPT the way the page script does, from a parsed page."""
+
+    def __init__(self, html, url, errors=None):
+        super().__init__(html, url)
+        self.errors = errors or {}
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.commands += 1
+        self.scripts.append(script)
+        fields, _booleans = args
+        results = {}
+        for field in fields:
+            if field["name"] in self.errors:
+                results[field["name"]] = {"error": self.errors[field["name"]]}
+                continue
+            by = By.XPATH if field["xpath"] else By.CSS_SELECTOR
+            elements = self.page.find_elements(by, field["selector"])
+            values = [
+                element.text
+                if field["attribute"] in (None, "text")
+                else element.get_attribute(field["attribute"])
+                for element in elements
+            ]
+            if field["multiple"]:
+                results[field["name"]] = values
+            else:
+                results[field["name"]] = values[0] if values else None
+        return results
+
+
+def run_extraction(extraction, driver):
+    browser = Mock(spec=["driver", "quit"])
+    browser.driver = driver
+    executor = WorkflowExecutor(product_config(extraction), browser=browser)
+    executor.execute_steps(executor.config.workflows)
+    return executor.results
+
+
+class TestScriptExtraction:
+    """Test cases for the extraction: script mode of the extract action."""
+
+    def test_script_matches_live_results_in_one_round_trip(self):
+        live_driver = CountingDriver(PRODUCT_PAGE, "https://shop.example.com/dp/1")
+        script_driver = ScriptDriver(PRODUCT_PAGE, "https://shop.example.com/dp/1")
+
+        live = run_extraction("live", live_driver)
+        script = run_extraction("script", script_driver)
+
+        assert script == live
+        assert script["Images"] == [
+            "https://cdn.example.com/1.jpg",
+            "https://shop.example.com/img/2.jpg",
+        ]
+        assert script["UPC"] is None
+        assert script_driver.scripts == [BULK_EXTRACT_SCRIPT]
+        assert script_driver.commands == 1
+
+    def test_live_mode_does_not_run_scripts(self):
+        driver = ScriptDriver(PRODUCT_PAGE, "https://shop.example.com/dp/1")
+
+        run_extraction("live", driver)
+
+        assert driver.scripts == []
+
+    def test_selector_error_falls_back_to_element_by_element(self):
+        live = run_extraction("live", CountingDriver(PRODUCT_PAGE, "https://shop.example.com"))
+        driver = ScriptDriver(
+            PRODUCT_PAGE, "https://shop.example.com", errors={"Weight": "SyntaxError"}
+        )
+
+        script = run_extraction("script", driver)
+
+        assert script == live
+        assert driver.commands == 1 + 8
@@ -0,0 +1,121 @@
+"""
+Unit tests for the adaptive (AIMD) concurrency controller.
+"""
+
+from unittest.mock import Mock
+
+from src.core.failure_classifier import FailureType
+from src.scrapers.concurrency_controller import ConcurrencyController
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_controller(max_workers=4, health=1.0, failures=None, **kwargs):
+    analytics = Mock()
+    analytics.get_health_score.return_value = health
+    analytics.get_recent_failure_counts.return_value = failures or {}
+    clock = FakeClock()
+    log = Mock()
+    controller = ConcurrencyController(
+        "TestSite", max_workers, analytics, log, evaluation_interval=30, clock=clock, **kwargs
+    )
+    return controller, analytics, clock, log
+
+
+def run_interval(controller, clock, latency=2.0):
+    clock.now += 30
+    controller.record(latency)
+
+
+class TestConcurrencyController:
+    """Test cases for ConcurrencyController."""
+
+    def test_starts_with_one_active_worker(self):
+        controller, _, _, _ = make_controller()
+
+        assert controller.acquire(timeout=0)
+        assert not controller.acquire(timeout=0)
+        controller.release()
+        assert controller.acquire(timeout=0)
+
+    def test_increases_additively_while_healthy_up_to_ceiling(self):
+        controller, _, clock, log = make_controller(max_workers=3)
+
+        for _ in range(5):
+            run_interval(controller, clock)
+
+        assert controller.limit == 3
+        assert [(a["from"], a["to"]) for a in controller.adjustments] == [(1, 2), (2, 3)]
+        assert log.call_count == 2
+        assert "📈" in log.call_args_list[0].args[0]
+
+    def test_halves_on_rate_limit_spike(self):
+        controller, analytics, clock, log = make_controller(max_workers=8, initial_workers=8)
+        analytics.get_recent_failure_counts.return_value = {
+            FailureType.RATE_LIMITED: 1,
+            FailureType.CAPTCHA_DETECTED: 1,
+            FailureType.NO_RESULTS: 5,
+        }
+
+        run_interval(controller, clock)
+        assert controller.limit == 4
+        run_interval(controller, clock)
+        assert controller.limit == 2
+        assert log.call_args.args[1] == "WARNING"
+        assert "📉" in log.call_args.args[0]
+
+        # Counts are requested for the interval that just ended
+        analytics.get_recent_failure_counts.assert_called_with("TestSite", clock.now - 30)
+
+    def test_never_drops_below_minimum(self):
+        controller, _, clock, _ = make_controller(
+            failures={FailureType.ACCESS_DENIED: 10}, initial_workers=2
+        )
+
+        run_interval(controller, clock)
+        run_interval(controller, clock)
+
+        assert controller.limit == 1
+
+    def test_holds_when_unhealthy_or_latency_degrades(self):
+        controller, analytics, clock, log = make_controller()
+        run_interval(controller, clock, latency=2.0)  # baseline, grows to 2
+        assert controller.limit == 2
+
+        run_interval(controller, clock, latency=10.0)  # latency well above baseline
+        assert controller.limit == 2
+
+        analytics.get_health_score.return_value = 0.5
+        run_interval(controller, clock, latency=2.0)
+        assert controller.limit == 2
+        assert log.call_count == 1
+
+    def test_waits_for_interval_before_adjusting(self):
+        controller, analytics, clock, _ = make_controller()
+
+        clock.now += 10
+        controller.record(1.0)
+
+        assert controller.limit == 1
+        analytics.get_health_score.assert_not_called()
+
+    def test_recent_failure_counts_from_analytics(self, tmp_path):
+        from src.core.failure_analytics import FailureAnalytics
+
+        analytics = FailureAnalytics(data_dir=str(tmp_path))
+        analytics.record_failure("TestSite", FailureType.RATE_LIMITED)
+        analytics.record_failure("OtherSite", FailureType.RATE_LIMITED)
+        analytics.record_success("TestSite")
+
+        since = analytics._records[0].timestamp
+        assert analytics.get_recent_failure_counts("TestSite", since) == {
+            FailureType.RATE_LIMITED: 1
+        }
+        assert analytics.get_recent_failure_counts("TestSite", since + 3600) == {}
+        assert analytics.get_site_metrics("TestSite").success_rate == 0.5
@@ -72,6 +72,7 @@ class TestSelectorConfig:
             "selector": ".test",
             "attribute": "href",
             "multiple": True,
+            "optional": False,
         }
         assert data == expected
 
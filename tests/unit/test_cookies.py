@@ -0,0 +1,163 @@
+"""
+Unit tests for shared login session cookies.
+"""
+
+import os
+import stat
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.scrapers.executor.workflow_executor import WorkflowExecutor
+from src.scrapers.models.config import ScraperConfig
+from src.utils.general.cookies import CookieStore, inject_cookies
+
+NOW = 1_700_000_000.0
+COOKIE = {"name": "ASP.NET_SessionId", "value": "abc", "domain": ".shop.example.com", "path": "/"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CookieStore("shop", tmp_path / "shop_session.json", max_age_seconds=3600)
+
+
+class TestCookieStore:
+    """Test cases for CookieStore."""
+
+    def test_round_trip_drops_expired_cookies(self, store):
+        expired = {**COOKIE, "name": "old", "expiry": int(NOW - 1)}
+        store.save([COOKIE, expired], now=NOW)
+
+        session = store.load(now=NOW)
+
+        assert session.cookies == [COOKIE]
+        assert session.saved_at == NOW
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    def test_session_file_is_readable_by_owner_only(self, store):
+        store.save([COOKIE], now=NOW)
+
+        assert stat.S_IMODE(store.path.stat().st_mode) == 0o600
+
+    def test_old_or_missing_sessions_are_not_used(self, store):
+        assert store.load(now=NOW) is None
+
+        store.save([COOKIE], now=NOW)
+        assert store.load(now=NOW + 7200) is None
+
+    def test_discard_keeps_a_refreshed_session(self, store):
+        first = store.save([COOKIE], now=NOW)
+        store.save([COOKIE], now=NOW + 60)
+
+        assert store.discard(first) is False
+        assert store.discard(NOW + 60) is True
+        assert store.load(now=NOW + 60) is None
+
+    def test_corrupt_file_is_ignored(self, store):
+        store.path.write_text("{not json")
+
+        assert store.load(now=NOW) is None
+
+
+class TestInjectCookies:
+    """Test cases for inject_cookies."""
+
+    def test_chrome_gets_cookies_through_devtools(self):
+        driver = Mock()
+        cookie = {**COOKIE, "httpOnly": True, "expiry": 1900000000, "sameSite": "Lax"}
+
+        assert inject_cookies(driver, [cookie]) == 1
+
+        driver.execute_cdp_cmd.assert_called_once_with(
+            "Network.setCookies",
+            {
+                "cookies": [
+                    {
+                        "name": "ASP.NET_SessionId",
+                        "value": "abc",
+                        "domain": ".shop.example.com",
+                        "path": "/",
+                        "httpOnly": True,
+                        "expires": 1900000000,
+                        "sameSite": "Lax",
+                    }
+                ]
+            },
+        )
+        driver.get.assert_not_called()
+
+    def test_http_driver_uses_add_cookie(self):
+        driver = Mock()
+
+        inject_cookies(driver, [COOKIE], use_cdp=False)
+
+        driver.add_cookie.assert_called_once_with(COOKIE)
+        driver.execute_cdp_cmd.assert_not_called()
+
+
+class TestLoginSession:
+    """Test cases for WorkflowExecutor._login_session."""
+
+    @pytest.fixture
+    def executor(self, store):
+        browser = Mock(spec=["driver", "quit", "get", "login_session"])
+        browser.login_session = None
+        browser.driver.current_url = "about:blank"
+        browser.driver.get_cookies.return_value = [COOKIE]
+        config = ScraperConfig(name="shop", base_url="https://shop.example.com")
+        with patch("src.scrapers.executor.workflow_executor.get_cookie_store", return_value=store):
+            yield WorkflowExecutor(config, browser=browser)
+
+    def test_first_login_is_stored_and_reused_by_other_browsers(self, executor, store):
+        submit = Mock()
+
+        executor._login_session(".account", submit)
+
+        submit.assert_called_once()
+        assert store.load().cookies == [COOKIE]
+        assert executor.browser.login_session is not None
+
+        # A second browser of the site injects the stored cookies instead
+        executor.browser.login_session = None
+        executor._login_session(".account", submit)
+
+        submit.assert_called_once()
+        assert executor.restored_logins == 1
+        executor.browser.driver.execute_cdp_cmd.assert_called_once()
+        executor.browser.get.assert_called_once_with("https://shop.example.com")
+
+    def test_stored_session_that_is_logged_out_is_replaced(self, executor, store):
+        store.save([{**COOKIE, "value": "stale"}])
+        executor.browser.driver.current_url = "https://shop.example.com/"
+        executor.browser.driver.find_elements.return_value = []
+        submit = Mock()
+
+        executor._login_session(".account", submit)
+
+        submit.assert_called_once()
+        assert executor.restored_logins == 0
+        assert executor.logins == 1
+        assert store.load().cookies == [COOKIE]
+
+    def test_logged_in_browser_only_checks_the_indicator(self, executor):
+        executor.browser.login_session = NOW
+        executor.browser.driver.current_url = "https://shop.example.com/p/1"
+        executor.browser.driver.find_elements.return_value = [Mock()]
+        submit = Mock()
+
+        executor._login_session(".account", submit)
+
+        submit.assert_not_called()
+        executor.browser.driver.get.assert_not_called()
+
+    def test_expired_session_logs_in_again(self, executor, store):
+        executor.browser.login_session = store.save([COOKIE])
+        executor.browser.driver.current_url = "https://shop.example.com/p/1"
+        executor.browser.driver.find_elements.return_value = []
+        submit = Mock()
+
+        executor._login_session(".account", submit)
+
+        submit.assert_called_once()
+        assert executor.logins == 1
+        executor.browser.driver.execute_cdp_cmd.assert_not_called()
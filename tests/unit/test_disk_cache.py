@@ -0,0 +1,69 @@
+"""
+Unit tests for persistent per-site Chrome HTTP caches.
+"""
+
+import json
+import os
+
+import pytest
+
+from src.utils.scraping.browser_lifecycle import current_process_entry
+from src.utils.scraping.disk_cache import LEASE_FILE, SiteDiskCache
+
+DEAD_OWNER = {"pid": 2**22 + 17, "create_time": 0.0}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SiteDiskCache("shop", max_bytes=10_000, slots=2, root=tmp_path)
+
+
+def fill(slot, size, mtime):
+    (slot / "Cache_Data").mkdir(exist_ok=True)
+    (slot / "Cache_Data" / "data_1").write_bytes(b"x" * size)
+    os.utime(slot, (mtime, mtime))
+
+
+class TestSiteDiskCache:
+    """Test cases for SiteDiskCache."""
+
+    def test_concurrent_browsers_get_separate_slots(self, cache):
+        first = cache.lease()
+        second = cache.lease()
+
+        assert first != second
+        assert cache.chrome_arguments(first) == [
+            f"--disk-cache-dir={first}",
+            "--disk-cache-size=5000",
+        ]
+
+    def test_released_slot_is_reused_with_its_cache(self, cache):
+        slot = cache.lease()
+        fill(slot, 100, mtime=1_700_000_000)
+        cache.release(slot)
+
+        assert cache.lease() == slot
+        assert cache.stats["reused"] == 1
+
+    def test_slot_of_a_dead_process_is_taken_over(self, cache):
+        stale = cache.directory / "0"
+        stale.mkdir(parents=True)
+        (stale / LEASE_FILE).write_text(json.dumps(DEAD_OWNER))
+
+        assert cache.lease() == stale
+
+    def test_least_recently_used_free_slots_are_evicted(self, cache):
+        old, recent, busy = (cache.directory / name for name in ("0", "1", "2"))
+        for slot in (old, recent, busy):
+            slot.mkdir(parents=True)
+        (busy / LEASE_FILE).write_text(json.dumps(current_process_entry()))
+        fill(old, 6000, mtime=1_700_000_000)
+        fill(recent, 3000, mtime=1_700_000_100)
+        fill(busy, 3000, mtime=1_600_000_000)
+
+        cache.release(cache.directory / "3")
+
+        assert not old.exists()
+        assert recent.exists() and busy.exists()
+        assert cache.stats["evicted"] == 1
+        assert cache.stats["evicted_bytes"] >= 6000
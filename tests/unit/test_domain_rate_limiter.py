@@ -0,0 +1,132 @@
+"""
+Unit tests for the shared per-domain rate limiter.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.anti_detection_manager import AntiDetectionConfig, AntiDetectionManager, RateLimiter
+from src.core.domain_rate_limiter import (
+    DomainRateLimiter,
+    domain_from_url,
+    get_domain_limiter,
+    reset_domain_limiters,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    reset_domain_limiters()
+    yield
+    reset_domain_limiters()
+
+
+class TestDomainRateLimiter:
+    """Test cases for DomainRateLimiter."""
+
+    def test_burst_is_free_then_paced(self):
+        limiter = DomainRateLimiter("example.com", requests_per_second=20, burst=2)
+
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == pytest.approx(0.05, abs=0.02)
+
+    def test_workers_share_the_budget(self):
+        limiter = DomainRateLimiter("example.com", requests_per_second=50, burst=1)
+
+        def worker():
+            for _ in range(5):
+                limiter.acquire()
+
+        start = time.monotonic()
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 20 requests at 50/s with one free token take at least 19 intervals
+        assert time.monotonic() - start >= 19 / 50 - 0.02
+        assert limiter.get_stats()["requests"] == 20
+
+    def test_pause_holds_every_worker(self):
+        limiter = DomainRateLimiter("example.com", requests_per_second=1000, burst=5)
+
+        limiter.pause(0.1)
+
+        assert limiter.acquire() == pytest.approx(0.1, abs=0.03)
+        assert limiter.get_stats()["pauses"] == 1
+
+    def test_unpaced_limiter_never_waits(self):
+        limiter = DomainRateLimiter("example.com")
+
+        assert all(limiter.acquire() == 0 for _ in range(10))
+
+    def test_session_cap(self):
+        limiter = DomainRateLimiter("example.com", max_concurrent_sessions=2)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def worker():
+            with limiter.session():
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                time.sleep(0.02)
+                with lock:
+                    active.pop()
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) == 2
+
+
+class TestRegistry:
+    """Test cases for the process-wide limiter registry."""
+
+    def test_same_domain_shares_one_limiter(self):
+        first = get_domain_limiter("example.com", requests_per_second=1)
+        second = get_domain_limiter("example.com", requests_per_second=5)
+
+        assert first is second
+        assert second.requests_per_second == 1
+        assert get_domain_limiter("other.com") is not first
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://www.Amazon.com/s?k=1", "amazon.com"),
+            ("https://shop.example.com", "shop.example.com"),
+            ("not a url", "fallback"),
+        ],
+    )
+    def test_domain_from_url(self, url, expected):
+        assert domain_from_url(url, "fallback") == expected
+
+
+class TestRateLimiterSharing:
+    """Test cases for RateLimiter pacing against a domain limiter."""
+
+    def test_only_request_actions_take_tokens(self):
+        limiter = DomainRateLimiter("example.com", requests_per_second=1000, burst=5)
+        rate_limiter = RateLimiter(AntiDetectionConfig(), domain_limiter=limiter)
+
+        for action in ["navigate", "wait_for", "extract", "click", "input_text", "login"]:
+            rate_limiter.apply_delay(action=action)
+
+        assert limiter.get_stats()["requests"] == 3
+
+    def test_domain_is_unpaced_without_requests_per_minute(self):
+        config = AntiDetectionConfig(enable_rate_limiting=True)
+
+        manager = AntiDetectionManager(MagicMock(), config, "shop", domain="shop.example.com")
+
+        assert manager.domain_limiter.requests_per_second is None
@@ -0,0 +1,142 @@
+"""
+Unit tests for the batched scraping event bus.
+"""
+
+import threading
+import time
+
+from src.core.event_bus import EventBus, EventCounters, EventType, ScrapeEvent
+
+
+def log_event(message):
+    return ScrapeEvent(EventType.LOG, message=message)
+
+
+class TestEventBus:
+    """Test cases for EventBus."""
+
+    def test_flush_delivers_one_batch_in_order(self):
+        bus = EventBus()
+        batches = []
+        bus.subscribe(batches.append)
+
+        bus.publish(log_event("a"))
+        bus.publish(log_event("b"))
+
+        assert bus.flush() == 2
+        assert bus.flush() == 0
+        assert [[e.message for e in batch] for batch in batches] == [["a", "b"]]
+
+    def test_status_progress_and_metrics_are_coalesced(self):
+        bus = EventBus()
+        batches = []
+        bus.subscribe(batches.append)
+
+        for pct in range(5):
+            bus.publish(ScrapeEvent(EventType.PROGRESS, data=pct))
+            bus.publish(ScrapeEvent(EventType.STATUS, message=f"status {pct}"))
+            bus.publish(log_event(f"log {pct}"))
+        bus.flush()
+
+        (batch,) = batches
+        assert [e.data for e in batch if e.type == EventType.PROGRESS] == [4]
+        assert [e.message for e in batch if e.type == EventType.STATUS] == ["status 4"]
+        assert len([e for e in batch if e.type == EventType.LOG]) == 5
+
+    def test_background_thread_and_close_deliver_everything(self):
+        bus = EventBus(flush_interval=0.01).start()
+        received = []
+        bus.subscribe(received.extend)
+
+        bus.publish(log_event("early"))
+        time.sleep(0.1)
+        assert [e.message for e in received] == ["early"]
+
+        bus.publish(log_event("late"))
+        bus.close()
+        assert [e.message for e in received] == ["early", "late"]
+
+    def test_slow_subscriber_does_not_block_publishers(self):
+        bus = EventBus(flush_interval=0.01).start()
+        release = threading.Event()
+        bus.subscribe(lambda batch: release.wait(2))
+
+        bus.publish(log_event("first"))
+        time.sleep(0.05)  # Flusher is now stuck in the subscriber
+
+        start = time.perf_counter()
+        for i in range(1000):
+            bus.publish(log_event(str(i)))
+        assert time.perf_counter() - start < 0.5
+
+        release.set()
+        bus.close()
+
+    def test_failing_subscriber_does_not_stop_others(self):
+        bus = EventBus()
+        received = []
+
+        def broken(batch):
+            raise RuntimeError("boom")
+
+        bus.subscribe(broken)
+        bus.subscribe(received.extend)
+        bus.publish(log_event("a"))
+        bus.flush()
+
+        assert len(received) == 1
+
+    def test_counters_track_sku_and_worker_events(self):
+        bus = EventBus()
+
+        bus.publish(ScrapeEvent(EventType.WORKER_STARTED, scraper="A", worker_id="W1"))
+        bus.publish(ScrapeEvent(EventType.SKU_FINISHED, sku="1", status="success"))
+        bus.publish(ScrapeEvent(EventType.SKU_FINISHED, sku="2", status="failed"))
+        bus.publish(ScrapeEvent(EventType.SKU_FINISHED, sku="3", status="success"))
+
+        assert bus.counters.snapshot() == {
+            "worker_started": 1,
+            "sku_finished.success": 2,
+            "sku_finished.failed": 1,
+        }
+
+    def test_worker_fixed_sleeps_are_counted_in_ms(self):
+        bus = EventBus()
+        sleeps = {"wait step": 2.0, "click wait_after": 0.25}
+
+        bus.publish(ScrapeEvent(EventType.WORKER_STOPPED, data={"fixed_sleep_seconds": sleeps}))
+        bus.publish(ScrapeEvent(EventType.WORKER_STOPPED, data={"fixed_sleep_seconds": sleeps}))
+
+        assert bus.counters.get("fixed_sleep_ms.wait step") == 4000
+        assert bus.counters.get("fixed_sleep_ms.click wait_after") == 500
+        assert bus.counters.get("worker_stopped") == 2
+
+    def test_worker_blocked_requests_and_bytes_are_counted(self):
+        bus = EventBus()
+        data = {"blocked_requests": {"image": 12, "font": 3}, "transferred_bytes": 4096}
+
+        bus.publish(ScrapeEvent(EventType.WORKER_STOPPED, data=data))
+        bus.publish(ScrapeEvent(EventType.WORKER_STOPPED, data=data))
+
+        assert bus.counters.get("blocked_requests.image") == 24
+        assert bus.counters.get("blocked_requests.font") == 6
+        assert bus.counters.get("transferred_bytes") == 8192
+
+
+class TestEventCounters:
+    """Test cases for EventCounters."""
+
+    def test_concurrent_increments_are_not_lost(self):
+        counters = EventCounters()
+
+        def work():
+            for _ in range(1000):
+                counters.increment("done")
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counters.get("done") == 8000
@@ -289,3 +289,18 @@ class TestFailureClassifierNoResults:
             result.failure_type != FailureType.NO_RESULTS
             or result.confidence < low_confidence_threshold
         )
+
+    def test_no_results_selector_probes_skip_implicit_wait(self, classifier, mock_driver):
+        """Test that selector probes miss immediately instead of waiting implicitly."""
+        implicit_wait = [2]
+        waits_during_probes = []
+        mock_driver.implicitly_wait.side_effect = implicit_wait.append
+        mock_driver.find_elements.side_effect = (
+            lambda by, selector: waits_during_probes.append(implicit_wait[-1]) or []
+        )
+
+        classifier.classify_page_content(mock_driver, {})
+
+        assert waits_during_probes
+        assert set(waits_during_probes) == {0}
+        assert implicit_wait[-1] == 2
@@ -0,0 +1,192 @@
+"""
+Unit tests for the HTTP-only scraping engine.
+"""
+
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from src.scrapers.executor.workflow_executor import WorkflowExecutionError, WorkflowExecutor
+from src.scrapers.models.config import ScraperConfig, SelectorConfig, WorkflowStep
+from src.utils.scraping.http_browser import BrowserRequiredError, HttpBrowser
+
+SEARCH_PAGE = """
+<html><head><title>Search results</title></head><body>
+  <h1>Search results for 123</h1>
+  <article><a href="/products/kong-toy">KONG Toy</a></article>
+  <button class="load-more">More</button>
+</body></html>
+"""
+
+PRODUCT_PAGE = """
+<html><head><title>KONG Toy</title><script>var x = "not text";</script></head><body>
+  <h1>  KONG   Toy </h1>
+  <p><a href="/brands/kong">KONG</a></p>
+  <ul><li>Weight: 1.5 lbs</li><li>Color: red</li></ul>
+  <div class="gallery"><img src="/img/1.jpg"><img src="https://cdn.example.com/2.jpg"></div>
+</body></html>
+"""
+
+LOGIN_PAGE = """
+<html><body><form action="/session" method="post">
+  <input type="hidden" name="token" value="abc">
+  <input id="email" name="email"><input id="password" name="password" type="password">
+  <button id="submit" type="submit" name="go" value="1">Sign in</button>
+</form></body></html>
+"""
+
+
+def handler(request):
+    if request.url.path == "/search":
+        return httpx.Response(200, html=SEARCH_PAGE)
+    if request.url.path == "/products/kong-toy":
+        return httpx.Response(200, html=PRODUCT_PAGE)
+    if request.url.path == "/login":
+        return httpx.Response(200, html=LOGIN_PAGE)
+    if request.url.path == "/session" and request.method == "POST":
+        form = dict(httpx.QueryParams(request.content.decode()))
+        assert form == {"token": "abc", "email": "me@example.com", "password": "pw", "go": "1"}
+        return httpx.Response(303, headers={"Location": "/account", "Set-Cookie": "sid=s1; Path=/"})
+    if request.url.path == "/account":
+        logged_in = request.headers.get("cookie") == "sid=s1"
+        return httpx.Response(200, html="<h2>Welcome</h2>" if logged_in else "<h2>Login</h2>")
+    return httpx.Response(404, html="<h1>Not found</h1>")
+
+
+@pytest.fixture
+def browser():
+    client = httpx.Client(transport=httpx.MockTransport(handler), follow_redirects=True)
+    yield HttpBrowser("test", client=client)
+    client.close()
+
+
+class TestHttpBrowser:
+    """Test cases for HttpBrowser."""
+
+    def test_css_and_xpath_queries_match_webdriver_semantics(self, browser):
+        browser.get("https://shop.example.com/products/kong-toy")
+
+        assert browser.title == "KONG Toy"
+        assert browser.find_element(By.CSS_SELECTOR, "h1").text == "KONG Toy"
+        weight = browser.find_element(By.XPATH, "//li[contains(text(), 'Weight:')]")
+        assert weight.text == "Weight: 1.5 lbs"
+        images = browser.find_elements(By.CSS_SELECTOR, ".gallery img")
+        assert [img.get_attribute("src") for img in images] == [
+            "https://shop.example.com/img/1.jpg",
+            "https://cdn.example.com/2.jpg",
+        ]
+        assert "not text" not in browser.find_element(By.CSS_SELECTOR, "html").text
+        with pytest.raises(NoSuchElementException):
+            browser.find_element(By.CSS_SELECTOR, ".missing")
+
+    def test_click_follows_links_and_reports_status(self, browser):
+        browser.get("https://shop.example.com/search?term=123")
+        browser.find_element(By.CSS_SELECTOR, "article a").click()
+
+        assert browser.current_url == "https://shop.example.com/products/kong-toy"
+        assert browser.check_http_status() == 200
+        assert browser.navigation_count == 1
+
+        browser.get("https://shop.example.com/nope")
+        assert browser.check_http_status() == 404
+
+    def test_browser_only_features_mark_browser_required(self, browser):
+        browser.get("https://shop.example.com/search?term=123")
+
+        with pytest.raises(BrowserRequiredError):
+            browser.find_element(By.CSS_SELECTOR, "button.load-more").click()
+        assert "needs JavaScript" in browser.browser_required
+
+        browser.browser_required = None
+        with pytest.raises(BrowserRequiredError):
+            browser.execute_script("return 1")
+        assert browser.browser_required == "JavaScript execution"
+
+    def test_form_login_keeps_cookies_in_shared_jar(self, browser):
+        browser.get("https://shop.example.com/login")
+        browser.find_element(By.CSS_SELECTOR, "#email").send_keys("me@example.com")
+        browser.find_element(By.CSS_SELECTOR, "#password").send_keys("pw")
+        browser.find_element(By.CSS_SELECTOR, "#submit").click()
+
+        assert browser.find_element(By.CSS_SELECTOR, "h2").text == "Welcome"
+        assert [c["name"] for c in browser.get_cookies()] == ["sid"]
+
+
+def http_config(wait_selector):
+    return ScraperConfig(
+        name="Test Scraper",
+        base_url="https://shop.example.com",
+        engine="http",
+        selectors=[
+            SelectorConfig(name="Name", selector="h1", attribute="text"),
+            SelectorConfig(name="Weight", selector="//li[contains(text(), 'Weight:')]"),
+            SelectorConfig(name="Images", selector=".gallery img", attribute="src", multiple=True),
+        ],
+        workflows=[
+            WorkflowStep(
+                action="navigate", params={"url": "https://shop.example.com/search?term={sku}"}
+            ),
+            WorkflowStep(action="wait_for", params={"selector": wait_selector, "timeout": 20}),
+            WorkflowStep(action="click", params={"selector": "article a", "wait_after": 3}),
+            WorkflowStep(action="wait", params={"seconds": 2}),
+            WorkflowStep(action="extract", params={"fields": ["Name", "Weight", "Images"]}),
+        ],
+    )
+
+
+class TestHttpEngineWorkflows:
+    """Test cases for running workflows on the HTTP engine."""
+
+    def test_workflow_runs_without_chrome_or_sleeps(self, browser):
+        executor = WorkflowExecutor(
+            http_config("//h1[contains(text(), 'Search')]"), browser=browser
+        )
+
+        with patch("src.scrapers.executor.workflow_executor.create_browser") as create_chrome:
+            with patch("time.sleep") as sleep:
+                result = executor.execute_workflow({"sku": "123"}, quit_browser=False)
+
+        assert result["engine"] == "http"
+        assert result["results"]["Name"] == "KONG Toy"
+        assert result["results"]["Weight"] == "Weight: 1.5 lbs"
+        assert len(result["results"]["Images"]) == 2
+        create_chrome.assert_not_called()
+        sleep.assert_not_called()
+
+    def test_missing_wait_selector_falls_back_to_chrome_once(self, browser):
+        executor = WorkflowExecutor(http_config(".rendered-by-js"), browser=browser)
+        chrome = Mock()
+        chrome.is_alive.return_value = True
+        chrome.driver.find_elements.return_value = [Mock()]
+
+        with patch(
+            "src.scrapers.executor.workflow_executor.create_browser", return_value=chrome
+        ) as create_chrome:
+            with patch("time.sleep"):
+                result = executor.execute_workflow({"sku": "123"}, quit_browser=False)
+                executor.execute_workflow({"sku": "456"}, quit_browser=False)
+
+        assert result["engine"] == "browser"
+        assert "not found" in result["http_fallback_reason"]
+        assert executor.http_fallbacks == 2
+        assert executor.browser is browser
+        create_chrome.assert_called_once()
+
+        executor.close()
+        chrome.quit.assert_called_once()
+
+    def test_errors_that_do_not_need_chrome_are_raised(self, browser):
+        executor = WorkflowExecutor(
+            http_config("//h1[contains(text(), 'Search')]"), browser=browser
+        )
+
+        with patch("src.scrapers.executor.workflow_executor.create_browser") as create_chrome:
+            with patch.object(executor, "_run_steps", side_effect=httpx.ConnectError("down")):
+                with pytest.raises(WorkflowExecutionError, match="down"):
+                    executor.execute_workflow({"sku": "123"}, quit_browser=False)
+
+        create_chrome.assert_not_called()
+        assert executor.http_fallbacks == 0
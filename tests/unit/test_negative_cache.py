@@ -0,0 +1,86 @@
+"""
+Unit tests for the persistent negative (no results) cache.
+"""
+
+import pytest
+
+from src.scrapers.negative_cache import NegativeCache, normalize_sku
+
+DAY = 86400.0
+NOW = 1_700_000_000.0
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = NegativeCache(tmp_path / "negative_cache.db", ttl_days=7, recheck_ratio=0.0)
+    yield cache
+    cache.close()
+
+
+class TestNegativeCache:
+    """Test cases for NegativeCache."""
+
+    def test_normalize_sku(self):
+        assert normalize_sku(" ab-12 3 ") == "AB123"
+
+    def test_fresh_entries_are_skipped(self, cache):
+        cache.add("amazon", "ab-123", now=NOW)
+
+        scheduled, skipped = cache.filter("amazon", ["AB123", "XYZ"], now=NOW + DAY)
+
+        assert scheduled == ["XYZ"]
+        assert skipped == ["AB123"]
+        # Other sites are unaffected
+        assert cache.filter("chewy", ["AB123"], now=NOW) == (["AB123"], [])
+
+    def test_expired_entries_are_scheduled(self, cache):
+        cache.add("amazon", "1", now=NOW)
+
+        assert cache.filter("amazon", ["1"], now=NOW + 8 * DAY) == (["1"], [])
+        assert not cache.is_fresh("amazon", "1", now=NOW + 8 * DAY)
+        assert cache.is_fresh("amazon", "1", now=NOW + DAY)
+
+    def test_recheck_ratio_schedules_some_fresh_entries(self, tmp_path):
+        cache = NegativeCache(tmp_path / "nc.db", recheck_ratio=0.5)
+        for sku in ("1", "2"):
+            cache.add("amazon", sku, now=NOW)
+
+        rolls = iter([0.1, 0.9])
+        scheduled, skipped = cache.filter("amazon", ["1", "2"], now=NOW, rng=lambda: next(rolls))
+        cache.close()
+
+        assert scheduled == ["1"]
+        assert skipped == ["2"]
+
+    def test_repeat_observations_refresh_entry(self, cache):
+        cache.add("amazon", "1", now=NOW)
+        cache.add("amazon", "1", now=NOW + 6 * DAY)
+
+        (entry,) = cache.entries()
+        assert entry["hits"] == 2
+        assert entry["first_seen"] == NOW
+        assert cache.is_fresh("amazon", "1", now=NOW + 12 * DAY)
+
+    def test_discard_and_purge(self, cache):
+        cache.add("amazon", "1", now=NOW)
+        cache.add("amazon", "2", now=NOW - 30 * DAY)
+        cache.add("chewy", "1", now=NOW)
+
+        assert cache.discard("amazon", "1")
+        assert not cache.discard("amazon", "1")
+        assert cache.get_stats(now=NOW) == {
+            "amazon": {"fresh": 0, "expired": 1},
+            "chewy": {"fresh": 1, "expired": 0},
+        }
+
+        assert cache.purge(expired_only=True, now=NOW) == 1
+        assert cache.purge(site="chewy", sku="1") == 1
+        assert cache.entries() == []
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        path = tmp_path / "nc.db"
+        NegativeCache(path).add("amazon", "1")
+
+        cache = NegativeCache(path)
+        assert [e["sku"] for e in cache.entries("amazon")] == ["1"]
+        cache.close()
@@ -0,0 +1,203 @@
+"""
+Unit tests for condition-based waits and the fixed-sleep lint.
+"""
+
+from unittest.mock import Mock, call, patch
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from src.scrapers.executor.workflow_executor import WorkflowExecutionError, WorkflowExecutor
+from src.scrapers.models.config import ScraperConfig, ValidationConfig, WorkflowStep
+from src.scrapers.parser.workflow_lint import lint_steps
+from src.utils.scraping.page_conditions import (
+    DOM_STABLE_SCRIPT,
+    ELEMENT_COUNT_STABLE_SCRIPT,
+    SCRIPT_TIMEOUT,
+    WAIT_FOR_ANY_SCRIPT,
+    wait_for_any,
+    wait_until,
+)
+
+
+def make_executor(driver, **config):
+    browser = Mock(spec=["driver", "quit"])
+    browser.driver = driver
+    config = ScraperConfig(name="Test Scraper", base_url="https://shop.example.com", **config)
+    return WorkflowExecutor(config, browser=browser)
+
+
+class TestWaitUntil:
+    """Test cases for wait_until."""
+
+    def test_dom_stable_runs_one_async_script(self):
+        driver = Mock()
+        driver.execute_async_script.return_value = True
+
+        assert wait_until(driver, "dom_stable", 2, quiet_ms=300) is True
+        driver.execute_async_script.assert_called_once_with(DOM_STABLE_SCRIPT, 300, 2000)
+        driver.set_script_timeout.assert_not_called()
+
+    def test_long_waits_raise_the_script_timeout(self):
+        driver = Mock()
+        driver.execute_async_script.return_value = False
+
+        assert wait_until(driver, "network_idle", 45) is False
+        assert driver.set_script_timeout.call_args_list[-1].args == (SCRIPT_TIMEOUT,)
+        assert driver.set_script_timeout.call_args_list[0].args == (50,)
+
+    def test_element_count_stable_passes_the_selector(self):
+        driver = Mock()
+        driver.execute_async_script.return_value = True
+
+        wait_until(driver, "element_count_stable", 3, selector="//li[@class='result']")
+
+        driver.execute_async_script.assert_called_once_with(
+            ELEMENT_COUNT_STABLE_SCRIPT, 500, 3000, "//li[@class='result']", True
+        )
+        with pytest.raises(ValueError):
+            wait_until(driver, "element_count_stable", 3)
+
+    def test_url_changed_compares_with_the_starting_url(self):
+        driver = Mock()
+        driver.current_url = "https://shop.example.com/product/1"
+
+        assert wait_until(driver, "url_changed", 1, from_url="https://shop.example.com/search")
+        assert not wait_until(driver, "url_changed", 0.2)
+
+    def test_unknown_condition_is_rejected(self):
+        with pytest.raises(ValueError):
+            wait_until(Mock(), "page_ready", 1)
+
+
+class TestWaitForAny:
+    """Test cases for the MutationObserver-based wait_for."""
+
+    def test_reports_the_matched_selector(self):
+        driver = Mock()
+        driver.execute_async_script.return_value = 1
+
+        assert wait_for_any(driver, [".no-results", "//h1"], 10) == "//h1"
+        driver.execute_async_script.assert_called_once_with(
+            WAIT_FOR_ANY_SCRIPT, [[".no-results", False], ["//h1", True]], 10000
+        )
+
+    def test_timeout_and_invalid_selectors(self):
+        driver = Mock()
+        driver.execute_async_script.return_value = -1
+        assert wait_for_any(driver, ["h1"], 1) is None
+
+        driver.execute_async_script.return_value = {"error": "SyntaxError"}
+        with pytest.raises(ValueError):
+            wait_for_any(driver, ["h1["], 1)
+
+    def test_check_no_results_uses_the_wait_for_match(self):
+        driver = Mock()
+        driver.execute_async_script.return_value = 0
+        executor = make_executor(
+            driver, validation=ValidationConfig(no_results_selectors=[".no-results"])
+        )
+        executor.failure_classifier = Mock()
+
+        executor.execute_steps(
+            [
+                WorkflowStep(action="wait_for", params={"selector": [".no-results", "h1"]}),
+                WorkflowStep(action="check_no_results"),
+            ]
+        )
+
+        assert executor.results["no_results_found"] is True
+        assert executor.wait_match == ([".no-results", "h1"], ".no-results")
+        executor.failure_classifier.classify_page_content.assert_not_called()
+        driver.find_elements.assert_not_called()
+
+    def test_navigation_during_the_wait_falls_back_to_polling(self):
+        driver = Mock()
+        driver.execute_async_script.side_effect = WebDriverException("document unloaded")
+        driver.find_elements.side_effect = lambda by, selector: [Mock()] if selector == "h1" else []
+        executor = make_executor(driver)
+
+        executor.execute_steps(
+            [WorkflowStep(action="wait_for", params={"selector": [".missing", "h1"], "timeout": 1})]
+        )
+
+        assert executor.wait_match == ([".missing", "h1"], "h1")
+
+
+class TestPause:
+    """Test cases for WorkflowExecutor fixed-sleep accounting."""
+
+    @patch("src.scrapers.executor.workflow_executor.time.sleep")
+    def test_fixed_waits_are_reported_by_source(self, sleep):
+        executor = make_executor(Mock())
+
+        executor.execute_steps(
+            [
+                WorkflowStep(action="wait", params={"seconds": 2}),
+                WorkflowStep(action="wait", params={"seconds": 1.5}),
+            ]
+        )
+
+        assert executor.fixed_sleeps == {"wait step": 3.5}
+        sleep.assert_any_call(2)
+        sleep.assert_any_call(1.5)
+
+    @patch("src.scrapers.executor.workflow_executor.time.sleep")
+    def test_conditional_waits_are_not_fixed_sleeps(self, sleep):
+        driver = Mock()
+        driver.execute_async_script.return_value = True
+        executor = make_executor(driver)
+
+        executor.execute_steps(
+            [WorkflowStep(action="wait", params={"seconds": 2, "until": "dom_stable"})]
+        )
+
+        assert executor.fixed_sleeps == {}
+        assert call(2) not in sleep.call_args_list
+        driver.execute_async_script.assert_called_once()
+
+    def test_unknown_condition_fails_the_step(self):
+        executor = make_executor(Mock())
+
+        with pytest.raises(WorkflowExecutionError):
+            executor._pause(2, "page_ready", "wait step")
+
+
+class TestWorkflowLint:
+    """Test cases for the fixed-sleep lint."""
+
+    def test_fixed_sleeps_are_flagged_with_suggestions(self):
+        steps = [
+            {"action": "navigate", "params": {"url": "https://x", "wait_after": 2}},
+            {"action": "wait", "params": {"seconds": 3}},
+            {"action": "wait_for", "params": {"selector": "h1"}},
+            {"action": "click", "params": {"selector": "a", "wait_after": 3}},
+            {
+                "action": "conditional",
+                "params": {"then": [{"action": "wait", "params": {"seconds": 1}}]},
+            },
+        ]
+
+        findings = lint_steps(steps)
+
+        assert [(f.step, f.action) for f in findings] == [
+            ("0", "navigate"),
+            ("1", "wait"),
+            ("3", "click"),
+            ("4.then.0", "wait"),
+        ]
+        assert "network_idle" in findings[0].suggestion
+        assert "before a wait_for" in findings[1].message
+        assert "url_changed" in findings[2].suggestion
+
+    def test_conditions_are_validated(self):
+        steps = [
+            {"action": "wait", "params": {"seconds": 2, "until": "dom_stable"}},
+            {"action": "wait", "params": {"seconds": 2, "until": "page_ready"}},
+            {"action": "wait", "params": {"seconds": 2, "until": "element_count_stable"}},
+            {"action": "click", "params": {"wait_after": 2, "wait_until": "url_changed"}},
+        ]
+
+        findings = lint_steps(steps)
+
+        assert [f.step for f in findings] == ["1", "2"]
@@ -0,0 +1,167 @@
+"""
+Unit tests for snapshot-based extraction.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from src.scrapers.executor.workflow_executor import WorkflowExecutor
+from src.scrapers.models.config import ScraperConfig, SelectorConfig, WorkflowStep
+from src.utils.scraping.http_browser import HttpDriver
+from src.utils.scraping.page_snapshot import PageSnapshot
+
+PRODUCT_PAGE = """
+<html><head><title>KONG Toy</title><script>var hidden = "script text";</script></head><body>
+  <span id="productTitle">  KONG Classic
+      Dog <b>Toy</b> </span>
+  <a id="bylineInfo" href="/stores/kong">Visit the KONG Store</a>
+  <div id="altImages"><ul>
+    <li class="imageThumbnail"><img src="https://cdn.example.com/1.jpg"></li>
+    <li class="imageThumbnail"><img src="/img/2.jpg"></li>
+    <li class="imageThumbnail"><img src="https://cdn.example.com/1.jpg"></li>
+  </ul></div>
+  <table><tr><th>Item Weight</th><td>1.5 Pounds</td></tr></table>
+  <div class="description"><p>Durable rubber.</p><p>Bounces<br>unpredictably.</p></div>
+  <div style="display: none" class="price">$9.99</div>
+</body></html>
+"""
+
+
+class CountingDriver:
+    """Live-driver stand-in over a parsed page that counts WebDriver commands."""
+
+    def __init__(self, html, url):
+        self.page = HttpDriver(client=None)
+        self.page.load_html(html, url)
+        self.html = html
+        self.url = url
+        self.commands = 0
+
+    def find_element(self, by, value):
+        self.commands += 1
+        return self.page.find_element(by, value)
+
+    def find_elements(self, by, value):
+        self.commands += 1
+        return self.page.find_elements(by, value)
+
+    def execute_script(self, script, *args):
+        self.commands += 1
+        return [self.html, self.url]
+
+
+def product_config(extraction):
+    return ScraperConfig(
+        name="Test Scraper",
+        base_url="https://shop.example.com",
+        extraction=extraction,
+        selectors=[
+            SelectorConfig(name="Name", selector="#productTitle", attribute="text"),
+            SelectorConfig(name="Brand", selector="#bylineInfo", attribute="text"),
+            SelectorConfig(name="Brand URL", selector="#bylineInfo", attribute="href"),
+            SelectorConfig(
+                name="Images",
+                selector="#altImages li.imageThumbnail img",
+                attribute="src",
+                multiple=True,
+            ),
+            SelectorConfig(
+                name="Weight", selector="//tr[.//th[contains(., 'Weight')]]", attribute="text"
+            ),
+            SelectorConfig(name="Description", selector=".description"),
+            SelectorConfig(name="Price", selector=".price"),
+            SelectorConfig(name="UPC", selector="#upc"),
+        ],
+        workflows=[
+            WorkflowStep(
+                action="extract",
+                params={
+                    "fields": [
+                        "Name",
+                        "Brand",
+                        "Brand URL",
+                        "Images",
+                        "Weight",
+                        "Description",
+                        "Price",
+                        "UPC",
+                    ]
+                },
+            )
+        ],
+    )
+
+
+def run_extraction(extraction, driver):
+    browser = Mock(spec=["driver", "quit"])
+    browser.driver = driver
+    executor = WorkflowExecutor(product_config(extraction), browser=browser)
+    executor.execute_steps(executor.config.workflows)
+    return executor.results
+
+
+class TestPageSnapshot:
+    """Test cases for PageSnapshot."""
+
+    def test_text_follows_rendered_text_semantics(self):
+        snapshot = PageSnapshot(PRODUCT_PAGE, "https://shop.example.com/dp/1")
+
+        assert snapshot.find_element(By.CSS_SELECTOR, "#productTitle").text == (
+            "KONG Classic Dog Toy"
+        )
+        description = snapshot.find_element(By.CSS_SELECTOR, ".description").text
+        assert description == "Durable rubber.\nBounces\nunpredictably."
+        assert snapshot.find_element(By.CSS_SELECTOR, ".price").text == ""
+        assert "script text" not in snapshot.find_element(By.TAG_NAME, "html").text
+        with pytest.raises(NoSuchElementException):
+            snapshot.find_element(By.CSS_SELECTOR, "#upc")
+
+    def test_capture_falls_back_to_page_source(self):
+        driver = Mock()
+        driver.execute_script.side_effect = Exception("no script support")
+        driver.page_source = PRODUCT_PAGE
+        driver.current_url = "https://shop.example.com/dp/1"
+
+        snapshot = PageSnapshot.capture(driver)
+
+        link = snapshot.find_element(By.CSS_SELECTOR, "#bylineInfo")
+        assert link.get_attribute("href") == "https://shop.example.com/stores/kong"
+
+
+class TestSnapshotExtraction:
+    """Test cases for the extraction: snapshot mode of the extract action."""
+
+    def test_snapshot_matches_live_results_in_one_round_trip(self):
+        live_driver = CountingDriver(PRODUCT_PAGE, "https://shop.example.com/dp/1")
+        snapshot_driver = CountingDriver(PRODUCT_PAGE, "https://shop.example.com/dp/1")
+
+        live = run_extraction("live", live_driver)
+        snapshot = run_extraction("snapshot", snapshot_driver)
+
+        assert snapshot == live
+        assert live["Name"] == "KONG Classic Dog Toy"
+        assert live["Weight"] == "Item Weight 1.5 Pounds"
+        assert live["Images"] == [
+            "https://cdn.example.com/1.jpg",
+            "https://shop.example.com/img/2.jpg",
+        ]
+        assert live["UPC"] is None
+        assert live_driver.commands == 8
+        assert snapshot_driver.commands == 1
+
+    def test_snapshot_is_retaken_after_page_changing_steps(self):
+        driver = CountingDriver(PRODUCT_PAGE, "https://shop.example.com/dp/1")
+        browser = Mock(spec=["driver", "quit"])
+        browser.driver = driver
+        executor = WorkflowExecutor(product_config("snapshot"), browser=browser)
+        extract_name = WorkflowStep(action="extract", params={"fields": ["Name"]})
+        extract_brand = WorkflowStep(action="extract", params={"fields": ["Brand"]})
+
+        executor.execute_steps([extract_name, extract_brand])
+        assert driver.commands == 1
+
+        executor.execute_steps([WorkflowStep(action="wait", params={"seconds": 0}), extract_name])
+        assert driver.commands == 2
@@ -0,0 +1,122 @@
+"""
+Unit tests for the learned SKU → product URL index.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.scrapers.executor.workflow_executor import WorkflowExecutionError, WorkflowExecutor
+from src.scrapers.models.config import ScraperConfig, SelectorConfig, WorkflowStep
+from src.scrapers.product_url_index import ProductUrlIndex
+
+SEARCH_URL = "https://shop.example.com/search?q={sku}"
+PRODUCT_URL = "https://shop.example.com/p/123"
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = ProductUrlIndex(tmp_path / "product_urls.db")
+    yield index
+    index.close()
+
+
+class TestProductUrlIndex:
+    """Test cases for ProductUrlIndex."""
+
+    def test_urls_are_keyed_by_site_and_normalized_sku(self, index):
+        index.put("amazon", "ab-123", PRODUCT_URL)
+
+        assert index.get("amazon", "AB123") == PRODUCT_URL
+        assert index.get("chewy", "AB123") is None
+
+    def test_discard_and_purge(self, index):
+        index.put("amazon", "1", PRODUCT_URL)
+        index.put("amazon", "2", PRODUCT_URL)
+        index.put("chewy", "1", PRODUCT_URL)
+
+        assert index.discard("amazon", "1") is True
+        assert index.discard("amazon", "1") is False
+        assert index.purge("amazon") == 1
+        assert index.get("chewy", "1") == PRODUCT_URL
+
+
+def make_executor(index, page_fields):
+    """
+    Executor whose steps are simulated: navigate sets the URL, click opens
+    PRODUCT_URL and extract returns ``page_fields[url]``.
+    """
+    driver = Mock()
+    driver.current_url = "about:blank"
+    browser = Mock(spec=["driver", "quit"])
+    browser.driver = driver
+    config = ScraperConfig(
+        name="shop",
+        base_url="https://shop.example.com",
+        selectors=[SelectorConfig(name="Name", selector="h1")],
+        workflows=[
+            WorkflowStep(action="conditional_click", params={"selector": "#cookies"}),
+            WorkflowStep(action="navigate", params={"url": SEARCH_URL}),
+            WorkflowStep(action="wait_for", params={"selector": ".result"}),
+            WorkflowStep(action="click", params={"selector": ".result a"}),
+            WorkflowStep(action="wait_for", params={"selector": "h1"}),
+            WorkflowStep(action="extract", params={"fields": ["Name"]}),
+        ],
+    )
+    executor = WorkflowExecutor(config, browser=browser, product_urls=index)
+    executor.actions = []
+
+    def execute_step(step, context=None):
+        executor.actions.append(step.action)
+        if step.action == "navigate":
+            driver.current_url = executor._substitute_variables(step.params["url"], context)
+        elif step.action == "click":
+            driver.current_url = PRODUCT_URL
+        elif step.action == "extract":
+            fields = page_fields.get(driver.current_url)
+            if fields is None:
+                raise WorkflowExecutionError("Failed to execute step 'extract'")
+            executor.results.update(fields)
+
+    executor._execute_step = execute_step
+    return executor
+
+
+class TestDirectProductUrls:
+    """Test cases for opening SKUs from learned product URLs."""
+
+    def test_search_path_learns_the_clicked_url(self, index):
+        executor = make_executor(index, {PRODUCT_URL: {"Name": "Kibble"}})
+
+        executor.execute_workflow(context={"sku": "123"}, quit_browser=False)
+
+        assert index.get("shop", "123") == PRODUCT_URL
+        assert "click" in executor.actions
+
+    def test_known_sku_skips_search_and_click(self, index):
+        index.put("shop", "123", PRODUCT_URL)
+        executor = make_executor(index, {PRODUCT_URL: {"Name": "Kibble"}})
+
+        result = executor.execute_workflow(context={"sku": "123"}, quit_browser=False)
+
+        assert executor.actions == ["conditional_click", "navigate", "wait_for", "extract"]
+        assert result["product_url"] == PRODUCT_URL
+        assert result["results"]["Name"] == "Kibble"
+        assert executor.direct_hits == 1
+
+    def test_stale_url_falls_back_to_search(self, index):
+        index.put("shop", "123", "https://shop.example.com/p/gone")
+        executor = make_executor(index, {PRODUCT_URL: {"Name": "Kibble"}})
+
+        result = executor.execute_workflow(context={"sku": "123"}, quit_browser=False)
+
+        assert result["results"]["Name"] == "Kibble"
+        assert executor.direct_misses == 1
+        assert index.get("shop", "123") == PRODUCT_URL
+
+    def test_nothing_is_learned_without_a_product(self, index):
+        executor = make_executor(index, {PRODUCT_URL: {"Name": None}})
+
+        executor.execute_workflow(context={"sku": "123"}, quit_browser=False)
+
+        assert index.get("shop", "123") is None
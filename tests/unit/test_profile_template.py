@@ -0,0 +1,118 @@
+"""
+Unit tests for pre-warmed Chrome profile templates.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.scrapers.models.config import ScraperConfig, WorkflowStep
+from src.utils.scraping.browser import create_browser
+from src.utils.scraping.profile_template import (
+    TEMPLATE_MARKER,
+    build_profile_template,
+    copy_profile_template,
+    is_template_fresh,
+)
+
+NOW = 1_700_000_000.0
+BASE_URL = "https://shop.example.com"
+
+
+@pytest.fixture
+def template(tmp_path):
+    template = tmp_path / "template"
+    (template / "Default" / "Cache").mkdir(parents=True)
+    (template / "Default" / "Cache" / "data_0").write_text("cached")
+    (template / "Default" / "Cookies").write_text("consent=yes")
+    (template / "SingletonLock").write_text("host-123")
+    (template / TEMPLATE_MARKER).write_text(json.dumps({"base_url": BASE_URL, "built_at": NOW}))
+    return template
+
+
+class TestProfileTemplate:
+    """Test cases for copying and validating templates."""
+
+    def test_copy_leaves_out_caches_and_locks(self, template, tmp_path):
+        profile = tmp_path / "profile"
+
+        assert copy_profile_template(template, profile) is True
+        assert (profile / "Default" / "Cookies").read_text() == "consent=yes"
+        assert not (profile / "Default" / "Cache").exists()
+        assert not (profile / "SingletonLock").exists()
+
+    def test_incomplete_template_or_used_profile_is_not_copied(self, template, tmp_path):
+        assert copy_profile_template(tmp_path / "missing", tmp_path / "a") is False
+
+        used = tmp_path / "used"
+        used.mkdir()
+        (used / "Local State").write_text("{}")
+        assert copy_profile_template(template, used) is False
+
+    def test_freshness_depends_on_age_and_base_url(self, template):
+        assert is_template_fresh(template, BASE_URL, max_age=3600, now=NOW + 60)
+        assert not is_template_fresh(template, BASE_URL, max_age=3600, now=NOW + 7200)
+        assert not is_template_fresh(template, "https://other.example.com", now=NOW)
+
+    def test_build_visits_the_site_and_clicks_consent(self, tmp_path):
+        browser = Mock()
+        browser.driver.execute_script.return_value = "complete"
+        consent_button = Mock()
+        browser.driver.find_elements.return_value = [consent_button]
+
+        def fake_create_browser(site_name, headless, profile_suffix, keep_profile):
+            staging = tmp_path / profile_suffix
+            (staging / "Default").mkdir(parents=True)
+            (staging / "Default" / "Preferences").write_text("{}")
+            return browser
+
+        with (
+            patch("src.utils.scraping.browser.create_browser", side_effect=fake_create_browser),
+            patch(
+                "src.utils.scraping.profile_template.get_profile_dir",
+                side_effect=lambda suffix: str(tmp_path / suffix),
+            ),
+            patch("src.utils.scraping.profile_template.time.sleep"),
+        ):
+            template = build_profile_template(
+                "shop", BASE_URL, ["#accept"], template_dir=tmp_path / "built"
+            )
+
+        browser.get.assert_called_once_with(BASE_URL)
+        browser.driver.find_elements.assert_called_once_with("css selector", "#accept")
+        consent_button.click.assert_called_once()
+        browser.quit.assert_called_once()
+        assert (template / "Default" / "Preferences").exists()
+        assert is_template_fresh(template, BASE_URL)
+        assert not list(tmp_path.glob("_templates/*.staging"))
+
+    def test_browser_starts_from_the_template(self, template, tmp_path):
+        with (
+            patch("src.utils.scraping.browser.webdriver.Chrome"),
+            patch("src.utils.scraping.scraping._add_profile_options"),
+            patch(
+                "src.utils.scraping.browser.get_profile_dir",
+                side_effect=lambda suffix: str(tmp_path / suffix),
+            ),
+        ):
+            browser = create_browser("shop", profile_suffix="p1", profile_template=template)
+            cold = create_browser("shop", profile_suffix="p2")
+
+        assert browser.templated is True
+        assert (tmp_path / "p1" / "Default" / "Cookies").exists()
+        assert cold.templated is False
+        assert isinstance(browser.init_time, float)
+
+    def test_consent_selectors_come_before_the_first_navigate(self):
+        config = ScraperConfig(
+            name="shop",
+            base_url=BASE_URL,
+            workflows=[
+                WorkflowStep(action="conditional_click", params={"selector": "#sp-cc-accept"}),
+                WorkflowStep(action="navigate", params={"url": BASE_URL}),
+                WorkflowStep(action="conditional_click", params={"selector": ".close"}),
+            ],
+        )
+
+        assert config.consent_selectors() == ["#sp-cc-accept"]
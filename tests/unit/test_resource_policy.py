@@ -0,0 +1,58 @@
+"""
+Unit tests for resource blocking patterns.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from src.scrapers.models.config import ResourcePolicyConfig, ScraperConfig
+from src.utils.scraping.resource_policy import TRACKER_HOSTS, blocked_url_patterns
+
+
+class TestBlockedUrlPatterns:
+    """Test cases for blocked_url_patterns."""
+
+    def test_types_match_extensions_with_and_without_query(self):
+        patterns = blocked_url_patterns(["font"], block_trackers=False)
+
+        assert "*.woff2" in patterns
+        assert "*.woff2?*" in patterns
+        assert not any("png" in p for p in patterns)
+
+    def test_allow_hosts_exempt_trackers(self):
+        patterns = blocked_url_patterns(
+            [], block_hosts=["ads.example.com"], allow_hosts=["hotjar.com"]
+        )
+
+        assert "*://doubleclick.net/*" in patterns
+        assert "*.doubleclick.net/*" in patterns
+        assert "*://ads.example.com/*" in patterns
+        assert not any("hotjar.com" in p for p in patterns)
+        assert len(patterns) == 2 * len(TRACKER_HOSTS)
+
+    def test_unknown_type_is_rejected(self):
+        with pytest.raises(ValueError):
+            blocked_url_patterns(["script"])
+
+
+class TestResourcePolicyConfig:
+    """Test cases for the per-scraper resource policy."""
+
+    def test_default_blocks_images_media_fonts_and_trackers(self):
+        config = ScraperConfig(name="Test", base_url="https://shop.example.com")
+        patterns = config.resource_policy.blocked_urls()
+
+        assert "*.jpg" in patterns
+        assert "*.mp4" in patterns
+        assert "*.woff" in patterns
+        assert "*.css" not in patterns
+        assert "*://google-analytics.com/*" in patterns
+
+    def test_disabled_policy_blocks_nothing(self):
+        policy = ResourcePolicyConfig(enabled=False)
+
+        assert policy.blocked_urls() == []
+
+    def test_block_types_are_validated(self):
+        with pytest.raises(ValidationError):
+            ResourcePolicyConfig(block_types=["script"])
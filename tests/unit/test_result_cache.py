@@ -0,0 +1,77 @@
+"""
+Unit tests for the cross-run result cache.
+"""
+
+import pytest
+
+from src.scrapers.models.config import ScraperConfig, SelectorConfig
+from src.scrapers.result_cache import ResultCache, config_hash
+
+HOUR = 3600.0
+NOW = 1_700_000_000.0
+DATA = {"Name": "Dog Food", "Brand": "Acme", "Images": ["a.jpg"]}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResultCache(tmp_path / "result_cache.db")
+    yield cache
+    cache.close()
+
+
+def make_config(selector=".title", **kwargs):
+    return ScraperConfig(
+        name="amazon",
+        base_url="https://www.amazon.com",
+        selectors=[SelectorConfig(name="Name", selector=selector)],
+        **kwargs,
+    )
+
+
+class TestConfigHash:
+    """Test cases for config_hash."""
+
+    def test_selector_changes_change_hash(self):
+        assert config_hash(make_config()) == config_hash(make_config())
+        assert config_hash(make_config()) != config_hash(make_config(selector="h1"))
+
+    def test_unrelated_settings_keep_hash(self):
+        assert config_hash(make_config()) == config_hash(make_config(timeout=90, retries=5))
+        assert config_hash(make_config()) == config_hash(make_config(cache_ttl_hours=1))
+
+
+class TestResultCache:
+    """Test cases for ResultCache."""
+
+    def test_serves_fresh_results(self, cache):
+        cache.put("amazon", "ab-1", "h1", DATA, now=NOW)
+
+        fresh = cache.get_fresh("amazon", ["AB1", "2"], "h1", 24 * HOUR, now=NOW + HOUR)
+
+        assert fresh == {"AB1": DATA}
+
+    def test_expired_results_are_not_served(self, cache):
+        cache.put("amazon", "1", "h1", DATA, now=NOW)
+
+        assert cache.get_fresh("amazon", ["1"], "h1", 24 * HOUR, now=NOW + 25 * HOUR) == {}
+
+    def test_results_from_other_config_versions_are_not_served(self, cache):
+        cache.put("amazon", "1", "old", DATA, now=NOW)
+        cache.put("chewy", "1", "other", DATA, now=NOW)
+
+        assert cache.get_fresh("amazon", ["1"], "new", 24 * HOUR, now=NOW) == {}
+        assert cache.invalidate_stale_configs("amazon", "new") == 1
+        # Only the edited site loses its entries
+        assert cache.get_fresh("chewy", ["1"], "other", 24 * HOUR, now=NOW) == {"1": DATA}
+
+    def test_put_replaces_and_persists(self, tmp_path):
+        path = tmp_path / "rc.db"
+        first = ResultCache(path)
+        first.put("amazon", "1", "h1", {"Name": "Old"}, now=NOW)
+        first.put("amazon", "1", "h1", DATA, now=NOW + HOUR)
+        first.close()
+
+        second = ResultCache(path)
+        assert second.get_fresh("amazon", ["1"], "h1", HOUR, now=NOW + 1.5 * HOUR) == {"1": DATA}
+        assert second.purge("amazon") == 1
+        second.close()
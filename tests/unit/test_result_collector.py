@@ -0,0 +1,130 @@
+"""
+Unit tests for the result collector, including the streaming JSONL sink.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.scrapers.result_collector import ResultCollector
+
+COMPRESSIONS = [None, "gzip"]
+try:
+    import zstandard
+
+    COMPRESSIONS.append("zstd")
+except ImportError:
+    pass
+
+
+def without_timestamps(results):
+    """Drop per-entry timestamps from {scraper: entry} or {scraper: {sku: entry}}."""
+    stripped = {}
+    for key, value in results.items():
+        if "timestamp" in value:
+            stripped[key] = {k: v for k, v in value.items() if k != "timestamp"}
+        else:
+            stripped[key] = without_timestamps(value)
+    return stripped
+
+
+def fill(collector):
+    collector.add_result("SKU1", "Amazon", {"Name": "Dog Food"})
+    collector.add_result("SKU1", "Chewy", {"Name": "Dog Food 2"})
+    collector.add_result("SKU2", "Amazon", {"Name": "Cat Food"})
+
+
+class TestResultCollector:
+    """Test cases for ResultCollector."""
+
+    def test_in_memory_session(self, tmp_path):
+        collector = ResultCollector(tmp_path, session_id="s1")
+        fill(collector)
+
+        with open(collector.save_session(metadata={"price": {"SKU1": "9.99"}})) as f:
+            data = json.load(f)
+
+        assert data["total_results"] == 3
+        assert data["metadata"] == {"price": {"SKU1": "9.99"}}
+        assert data["results"]["Amazon"]["SKU2"]["data"] == {"Name": "Cat Food"}
+        assert not collector.stream_path.exists()
+
+    @pytest.mark.parametrize("compression", COMPRESSIONS)
+    def test_stream_matches_in_memory_output(self, tmp_path, compression):
+        memory = ResultCollector(tmp_path / "memory", session_id="s1")
+        stream = ResultCollector(
+            tmp_path / "stream", session_id="s1", stream=True, compression=compression
+        )
+        fill(memory)
+        fill(stream)
+
+        assert stream.results == {}
+        assert stream.get_stats() == memory.get_stats()
+        assert stream.get_all_skus() == memory.get_all_skus()
+        assert without_timestamps(stream.get_results_by_sku("SKU1")) == without_timestamps(
+            memory.get_results_by_sku("SKU1")
+        )
+        assert stream.get_results_by_sku("missing") == {}
+
+        with open(memory.save_session({"price": {}})) as f:
+            expected = json.load(f)
+        with open(stream.save_session({"price": {}})) as f:
+            actual = json.load(f)
+        for key in ("scrapers", "total_results", "metadata"):
+            assert actual[key] == expected[key]
+        assert without_timestamps(actual["results"]) == without_timestamps(expected["results"])
+
+    def test_save_session_reads_the_stream_once(self, tmp_path):
+        collector = ResultCollector(tmp_path, session_id="s1", stream=True, compression="gzip")
+        fill(collector)
+
+        with patch.object(collector, "_read_lines", wraps=collector._read_lines) as read_lines:
+            with open(collector.save_session()) as f:
+                data = json.load(f)
+
+        assert read_lines.call_count == 1
+        assert data["results"]["Amazon"]["SKU2"]["data"] == {"Name": "Cat Food"}
+        assert not list(tmp_path.glob("tmp*"))
+
+    def test_latest_result_wins_in_stream(self, tmp_path):
+        collector = ResultCollector(tmp_path, session_id="s1", stream=True)
+        collector.add_result("SKU1", "Amazon", {"Name": "Old"})
+        collector.add_result("SKU1", "Amazon", {"Name": "New"})
+
+        assert collector.get_stats()["total_results"] == 1
+        assert collector.get_results_by_sku("SKU1")["Amazon"]["data"] == {"Name": "New"}
+        assert [e["data"]["Name"] for e in collector.iter_results()] == ["New"]
+
+    @pytest.mark.parametrize("compression", COMPRESSIONS)
+    def test_reopened_stream_rebuilds_index(self, tmp_path, compression):
+        first = ResultCollector(tmp_path, session_id="s1", stream=True, compression=compression)
+        fill(first)
+        first.close(metadata={"price": {"SKU2": "5.00"}})
+
+        reopened = ResultCollector.from_stream(first.stream_path)
+        reopened.add_result("SKU3", "Chewy", {"Name": "Bird Seed"})
+
+        assert reopened.compression == compression
+        assert reopened.has_result("SKU1", "Chewy")
+        assert reopened.get_stats()["total_results"] == 4
+        assert reopened.get_results_by_sku("SKU3")["Chewy"]["data"] == {"Name": "Bird Seed"}
+        with open(reopened.save_session()) as f:
+            assert json.load(f)["metadata"] == {"price": {"SKU2": "5.00"}}
+
+    def test_truncated_stream_line_is_ignored(self, tmp_path):
+        collector = ResultCollector(tmp_path, session_id="s1", stream=True)
+        fill(collector)
+        collector.close()
+        with open(collector.stream_path, "a", encoding="utf-8") as f:
+            f.write('{"sku": "SKU9", "scr')
+
+        reopened = ResultCollector(tmp_path, session_id="s1", stream=True)
+        reopened.add_result("SKU4", "Amazon", {"Name": "Hay"})
+
+        assert reopened.get_all_skus() == {"SKU1", "SKU2", "SKU4"}
+        assert reopened.get_results_by_sku("SKU4")["Amazon"]["data"] == {"Name": "Hay"}
+
+    def test_unknown_compression_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            ResultCollector(tmp_path, stream=True, compression="lz4")
@@ -0,0 +1,235 @@
+"""
+Unit tests for ScraperBrowser HTTP status capture.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.utils.scraping.browser import create_browser
+from src.utils.scraping.disk_cache import SiteDiskCache
+
+TARGET = "PAGE-TARGET"
+
+
+def network_event(method, webview=TARGET, **params):
+    message = {"message": {"method": method, "params": params}, "webview": webview}
+    return {"level": "INFO", "message": json.dumps(message), "timestamp": 0}
+
+
+def navigation(url, loader, frame=TARGET, redirect=None):
+    params = {"requestId": loader, "loaderId": loader, "frameId": frame, "type": "Document"}
+    if redirect:
+        params["redirectResponse"] = {"status": redirect, "url": url}
+    return network_event("Network.requestWillBeSent", request={"url": url}, **params)
+
+
+def response(status, loader, frame=TARGET, resource_type="Document"):
+    return network_event(
+        "Network.responseReceived",
+        requestId=loader,
+        loaderId=loader,
+        frameId=frame,
+        type=resource_type,
+        response={"status": status},
+    )
+
+
+@pytest.fixture
+def chrome():
+    """Patched webdriver.Chrome returning a Mock driver (no profile directory is created)."""
+    with (
+        patch("src.utils.scraping.browser.webdriver.Chrome") as chrome,
+        patch("src.utils.scraping.scraping._add_profile_options"),
+    ):
+        chrome.return_value = Mock()
+        yield chrome
+
+
+class TestHttpStatusCapture:
+    """Test cases for reading navigation statuses from DevTools Network events."""
+
+    def test_network_events_are_only_recorded_when_capturing(self, chrome):
+        create_browser("test", capture_http_status=True)
+        options = chrome.call_args.kwargs["options"]
+        assert options.to_capabilities()["goog:loggingPrefs"]["performance"] == "ALL"
+        assert options.experimental_options["perfLoggingPrefs"]["enableNetwork"] is True
+
+        create_browser("test")
+        options = chrome.call_args.kwargs["options"]
+        assert options.to_capabilities()["goog:loggingPrefs"]["performance"] == "OFF"
+
+    def test_status_comes_from_the_main_frame_document(self, chrome):
+        browser = create_browser("test", capture_http_status=True)
+        browser.driver.get_log.return_value = [
+            navigation("https://shop.example.com/old", "L1"),
+            navigation("https://shop.example.com/new", "L1", redirect=301),
+            response(404, "L1"),
+            response(200, "R2", resource_type="Script"),
+            response(200, "F1", frame="IFRAME"),
+        ]
+
+        assert browser.check_http_status() == 404
+        assert browser.redirect_statuses == [301]
+        browser.driver.execute_script.assert_not_called()
+
+        # The log is drained; the status of the current page is kept
+        browser.driver.get_log.return_value = []
+        assert browser.check_http_status() == 404
+
+    def test_a_new_navigation_replaces_the_status(self, chrome):
+        browser = create_browser("test", capture_http_status=True)
+        browser.driver.get_log.return_value = [
+            navigation("https://shop.example.com/a", "L1"),
+            response(500, "L1"),
+            navigation("https://shop.example.com/b", "L2"),
+            response(200, "L2"),
+        ]
+
+        assert browser.check_http_status() == 200
+        assert browser.redirect_statuses == []
+
+    def test_navigation_timing_without_network_capture(self, chrome):
+        browser = create_browser("test")
+        browser.driver.execute_script.return_value = 403
+
+        assert browser.check_http_status() == 403
+        browser.driver.get_log.assert_not_called()
+
+        browser.driver.execute_script.return_value = 0
+        assert browser.check_http_status() is None
+
+
+class TestResourceBlocking:
+    """Test cases for Network.setBlockedURLs and the resource counters."""
+
+    def test_blocked_urls_are_sent_to_devtools(self, chrome):
+        browser = create_browser("test", blocked_urls=["*.png"])
+
+        browser.driver.execute_cdp_cmd.assert_any_call(
+            "Network.setBlockedURLs", {"urls": ["*.png"]}
+        )
+        options = chrome.call_args.kwargs["options"]
+        assert options.to_capabilities()["goog:loggingPrefs"]["performance"] == "ALL"
+
+    def test_take_network_stats_counts_and_resets(self, chrome):
+        browser = create_browser("test", blocked_urls=["*.png"])
+        browser.driver.get_log.return_value = [
+            network_event("Network.loadingFailed", type="Image", blockedReason="inspector"),
+            network_event("Network.loadingFailed", type="Font", blockedReason="inspector"),
+            network_event("Network.loadingFailed", type="Image", blockedReason="inspector"),
+            network_event("Network.loadingFailed", type="Script", errorText="net::ERR_FAILED"),
+            network_event("Network.loadingFinished", encodedDataLength=2048),
+            network_event("Network.loadingFinished", encodedDataLength=1024),
+        ]
+
+        stats = browser.take_network_stats()
+
+        assert stats == {
+            "blocked_requests": {"image": 2, "font": 1},
+            "transferred_bytes": 3072,
+            "cache_hit_bytes": 0,
+        }
+        browser.driver.get_log.return_value = []
+        assert browser.take_network_stats() == {
+            "blocked_requests": {},
+            "transferred_bytes": 0,
+            "cache_hit_bytes": 0,
+        }
+
+    def test_disk_cache_hits_are_counted_apart_from_network_bytes(self, chrome, tmp_path):
+        disk_cache = SiteDiskCache("test", 10 * 1024 * 1024, root=tmp_path)
+        browser = create_browser("test", disk_cache=disk_cache)
+        cached = {"status": 200, "fromDiskCache": True}
+        browser.driver.get_log.return_value = [
+            network_event("Network.responseReceived", requestId="1", response=cached),
+            network_event("Network.dataReceived", requestId="1", dataLength=50_000),
+            network_event("Network.loadingFinished", requestId="1", encodedDataLength=120),
+            network_event("Network.responseReceived", requestId="2", response={"status": 200}),
+            network_event("Network.dataReceived", requestId="2", dataLength=9_000),
+            network_event("Network.loadingFinished", requestId="2", encodedDataLength=4096),
+        ]
+
+        stats = browser.take_network_stats()
+
+        assert stats["cache_hit_bytes"] == 50_000
+        assert stats["transferred_bytes"] == 4096
+        options = chrome.call_args.kwargs["options"]
+        assert f"--disk-cache-dir={tmp_path / 'test' / '0'}" in options.arguments
+
+    def test_no_devtools_calls_without_a_policy(self, chrome):
+        browser = create_browser("test")
+
+        browser.driver.execute_cdp_cmd.assert_not_called()
+        assert browser.take_network_stats() == {
+            "blocked_requests": {},
+            "transferred_bytes": 0,
+            "cache_hit_bytes": 0,
+        }
+        browser.driver.get_log.assert_not_called()
+
+
+class TestTabs:
+    """Test cases for driving several tabs of one browser."""
+
+    @pytest.fixture
+    def browser(self, chrome):
+        driver = chrome.return_value
+        driver.current_window_handle = TARGET
+        driver.window_handles = [TARGET]
+
+        def new_window(kind):
+            driver.current_window_handle = f"TAB-{len(driver.window_handles)}"
+            driver.window_handles = [*driver.window_handles, driver.current_window_handle]
+
+        driver.switch_to.new_window.side_effect = new_window
+        return create_browser("test", capture_http_status=True)
+
+    def test_open_tabs_returns_the_current_tab_first(self, browser):
+        assert browser.open_tabs(3) == [TARGET, "TAB-1", "TAB-2"]
+        assert browser.current_tab == TARGET
+        browser.driver.switch_to.window.assert_called_with(TARGET)
+
+    def test_resource_blocking_is_applied_in_every_tab(self, browser):
+        browser.blocked_urls = ["*.png"]
+        browser.driver.execute_cdp_cmd.reset_mock()
+
+        browser.open_tabs(3)
+
+        commands = [c.args[0] for c in browser.driver.execute_cdp_cmd.call_args_list]
+        assert commands.count("Network.enable") == 2
+        assert commands.count("Network.setBlockedURLs") == 2  # One per new tab
+
+    def test_prefetched_page_is_not_requested_again(self, browser):
+        tabs = browser.open_tabs(2)
+        browser.switch_tab(tabs[1])
+        browser.driver.get_log.return_value = []
+        browser.prefetch("https://shop.example.com/search?q=1")
+
+        browser.get("https://shop.example.com/search?q=1")
+        browser.get("https://shop.example.com/search?q=1")
+
+        assert browser.driver.get.call_count == 1  # Only the second get navigates
+
+    def test_statuses_are_kept_per_tab(self, browser):
+        tabs = browser.open_tabs(2)
+        browser.driver.get_log.return_value = [
+            navigation("https://shop.example.com/a", "L1"),
+            response(200, "L1"),
+            network_event(
+                "Network.responseReceived",
+                webview="TAB-1",
+                requestId="L2",
+                frameId="TAB-1",
+                type="Document",
+                response={"status": 404},
+            ),
+        ]
+
+        assert browser.check_http_status() == 200
+        browser.driver.get_log.return_value = []
+        browser.switch_tab(tabs[1])
+        assert browser.check_http_status() == 404
+        browser.switch_tab(tabs[0])
+        assert browser.check_http_status() == 200
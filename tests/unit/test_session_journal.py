@@ -0,0 +1,60 @@
+"""
+Unit tests for the per-SKU session journal.
+"""
+
+import pytest
+
+from src.scrapers.session_journal import SessionJournal
+
+
+class TestSessionJournal:
+    """Test cases for SessionJournal."""
+
+    def test_records_are_durable_across_instances(self, tmp_path):
+        journal = SessionJournal("20250101_000000", tmp_path)
+        journal.record("Amazon", "SKU1", "success", {"Name": "Dog Food"})
+        journal.record("Amazon", "SKU2", "no_result")
+        journal.record("Chewy", "SKU1", "failed")
+
+        # Read back without closing, as after a crash
+        entries = SessionJournal("20250101_000000", tmp_path).load()
+
+        assert entries[("Amazon", "SKU1")]["data"] == {"Name": "Dog Food"}
+        assert entries[("Amazon", "SKU2")]["status"] == "no_result"
+        assert entries[("Chewy", "SKU1")]["session"] == "20250101_000000"
+        journal.close()
+
+    def test_completed_keys_exclude_failures(self, tmp_path):
+        journal = SessionJournal("s1", tmp_path)
+        journal.record("Amazon", "SKU1", "success", {"Name": "A"})
+        journal.record("Amazon", "SKU2", "no_result")
+        journal.record("Amazon", "SKU3", "failed")
+        journal.close()
+
+        assert journal.completed_keys() == {("Amazon", "SKU1"), ("Amazon", "SKU2")}
+
+    def test_latest_entry_wins(self, tmp_path):
+        journal = SessionJournal("s1", tmp_path)
+        journal.record("Amazon", "SKU1", "failed")
+        journal.record("Amazon", "SKU1", "success", {"Name": "A"})
+        journal.close()
+
+        assert journal.load()[("Amazon", "SKU1")]["status"] == "success"
+
+    def test_truncated_last_line_is_skipped(self, tmp_path):
+        journal = SessionJournal("s1", tmp_path)
+        journal.record("Amazon", "SKU1", "success", {"Name": "A"})
+        journal.close()
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"scraper": "Amazon", "sku": "SK')
+
+        assert list(journal.load()) == [("Amazon", "SKU1")]
+
+    def test_missing_journal_is_empty(self, tmp_path):
+        assert SessionJournal("missing", tmp_path).load() == {}
+
+    def test_rejects_unknown_status(self, tmp_path):
+        journal = SessionJournal("s1", tmp_path)
+
+        with pytest.raises(ValueError):
+            journal.record("Amazon", "SKU1", "maybe")
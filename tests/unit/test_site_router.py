@@ -0,0 +1,139 @@
+"""
+Unit tests for learned site routing.
+"""
+
+from src.scrapers.session_journal import SessionJournal
+from src.scrapers.site_router import FoundSKUs, SiteRouter, upc_prefix
+
+FOUND = {"Name": "Dog Food", "Brand": "Acme", "Weight": "5 lb"}
+
+
+def make_router(outcomes, **kwargs):
+    router = SiteRouter(**kwargs)
+    for site, sku, status in outcomes:
+        router.observe(site, sku, status, FOUND if status == "success" else None)
+    return router
+
+
+class TestSiteRouter:
+    """Test cases for SiteRouter."""
+
+    def test_sites_without_history_use_default_probability(self):
+        router = SiteRouter()
+
+        assert router.hit_probability("A", "123") == 0.5
+
+    def test_sku_history_outweighs_site_rate(self):
+        router = make_router(
+            [("A", "1", "success"), ("A", "2", "no_result"), ("A", "3", "no_result")]
+        )
+
+        assert router.hit_probability("A", "1") > 0.5
+        assert router.hit_probability("A", "2") < router.hit_probability("A", "new")
+
+    def test_brand_history_generalises_to_new_skus(self):
+        outcomes = [("A", str(i), "success") for i in range(3)]
+        outcomes += [("B", str(i), "no_result") for i in range(3)]
+        outcomes += [("B", "other", "success")]
+        router = make_router(outcomes)
+
+        assert router.hit_probability("A", "new", brand="ACME") > 0.7
+        assert router.hit_probability("B", "new", brand="Acme") < 0.3
+        # Without a known brand only the site rates are left
+        assert router.hit_probability("B", "new") > router.hit_probability("B", "new", brand="Acme")
+
+    def test_upc_prefix_feature(self):
+        assert upc_prefix("012345678905") == "012345"
+        assert upc_prefix("ABC-1") is None
+
+        router = make_router(
+            [("A", f"01234567890{i}", "no_result") for i in range(4)]
+            + [("A", "99999999999", "success"), ("A", "99999999998", "success")]
+        )
+        assert router.hit_probability("A", "012345000000") < router.hit_probability("A", "x")
+
+    def test_failed_outcomes_are_not_learned(self):
+        router = make_router([("A", "1", "failed")])
+
+        assert router.hit_probability("A", "1") == 0.5
+
+    def test_plan_orders_by_rank_and_skips_unlikely_pairs(self):
+        outcomes = [("A", sku, "success") for sku in ("1", "2")]
+        outcomes += [("B", sku, "no_result") for sku in ("1", "2")]
+        outcomes += [("B", "3", "success"), ("A", "3", "no_result")]
+        router = make_router(outcomes)
+        records = [{"SKU": "1"}, {"SKU": "2"}, {"SKU": "3"}]
+
+        plan = router.plan(["A", "B"], records)
+        # Each site starts with the SKUs it is the first choice for
+        assert plan["A"] == ["1", "2", "3"]
+        assert plan["B"] == ["3", "1", "2"]
+
+        pruned = router.plan(["A", "B"], records, min_probability=0.5)
+        assert pruned == {"A": ["1", "2"], "B": ["3"]}
+
+    def test_plan_keeps_best_site_for_every_sku(self):
+        router = make_router([("A", "1", "no_result"), ("B", "1", "no_result")])
+
+        plan = router.plan(["A", "B"], [{"SKU": "1"}], min_probability=0.9)
+
+        assert sum(len(skus) for skus in plan.values()) == 1
+
+    def test_plan_explores_a_share_of_pruned_pairs(self):
+        outcomes = [("A", str(i), "success") for i in range(5)]
+        outcomes += [("B", str(i), "no_result") for i in range(5)]
+        router = make_router(outcomes, seed=1)
+        records = [{"SKU": f"new{i}"} for i in range(1000)]
+
+        assert router.plan(["A", "B"], records, min_probability=0.5)["B"] == []
+        explored = router.plan(["A", "B"], records, min_probability=0.5, exploration=0.1)["B"]
+        assert 50 < len(explored) < 150
+        assert len(router.plan(["A", "B"], records, 0.5, exploration=1.0)["B"]) == 1000
+
+    def test_learns_from_session_journals(self, tmp_path):
+        journal = SessionJournal("20240101_000000", tmp_path)
+        journal.record("A", "1", "success", FOUND)
+        journal.record("B", "1", "no_result")
+        journal.record("B", "2", "failed")
+        journal.close()
+        (tmp_path / "scrape_session_x.journal.jsonl").write_text("{truncated\n")
+
+        router = SiteRouter()
+        assert router.learn_from_journals(tmp_path) == 2
+        assert router.sessions_loaded == 2
+        assert router.hit_probability("A", "1") > router.hit_probability("B", "1")
+
+    def test_learns_from_the_most_recent_sessions_only(self, tmp_path):
+        for day, status in (("01", "no_result"), ("02", "success"), ("03", "success")):
+            journal = SessionJournal(f"202401{day}_000000", tmp_path)
+            journal.record("A", "1", status, FOUND if status == "success" else None)
+            journal.close()
+
+        router = SiteRouter()
+
+        assert router.learn_from_journals(tmp_path, max_sessions=2) == 2
+        assert router.sessions_loaded == 2
+        assert router.hit_probability("A", "2") > 0.7
+
+    def test_cached_results_are_not_learned_again(self, tmp_path):
+        for session in ("20240101_000000", "20240102_000000"):
+            journal = SessionJournal(session, tmp_path)
+            journal.record("A", "1", "success", FOUND, cached=session != "20240101_000000")
+            journal.close()
+
+        router = SiteRouter()
+
+        assert router.learn_from_journals(tmp_path) == 1
+
+
+class TestFoundSKUs:
+    """Test cases for the early-stop set."""
+
+    def test_requires_enough_fields(self):
+        found = FoundSKUs(required_fields=3)
+
+        assert not found.add("1", {"Name": "Dog Food", "Brand": "Acme"})
+        assert "1" not in found
+        assert found.add("1", FOUND)
+        assert "1" in found
+        assert len(found) == 1
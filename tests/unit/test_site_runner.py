@@ -0,0 +1,210 @@
+"""
+Unit tests for the site runner (shared worker loop and process mode).
+"""
+
+import os
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock, call, patch
+
+from src.scrapers.site_runner import run_sites_in_processes, scrape_worker
+from src.scrapers.sku_queue import SKUWorkQueue
+
+
+def fake_site(config, skus, worker_count, pool_spares, event_queue, stop_event):
+    """Process target that "finds" every SKU without starting a browser."""
+    for sku in skus:
+        data = {"Name": f"{config.name}-{sku}"}
+        event_queue.put(("result", sku, config.name, "success", data))
+        event_queue.put(("progress", {"scraper": config.name}))
+    event_queue.put(("done", config.name, len(skus), 0))
+
+
+def crashing_site(config, skus, worker_count, pool_spares, event_queue, stop_event):
+    """Process target that streams one result and then dies hard."""
+    event_queue.put(("result", skus[0], config.name, "success", {"Name": "partial"}))
+    event_queue.close()
+    event_queue.join_thread()
+    os._exit(3)
+
+
+def run_and_collect(site_names, skus, target, stop_event=None):
+    events = []
+    run_sites_in_processes(
+        [(SimpleNamespace(name=name), skus, 1) for name in site_names],
+        max_processes=2,
+        pool_spares=0,
+        handle_event=events.append,
+        stop_event=stop_event,
+        target=target,
+    )
+    return events
+
+
+class TestRunSitesInProcesses:
+    """Test cases for process mode."""
+
+    def test_streams_results_from_every_site(self):
+        events = run_and_collect(["A", "B", "C"], ["1", "2"], fake_site)
+
+        results = sorted((e[2], e[1]) for e in events if e[0] == "result" and e[3] == "success")
+        assert results == [(s, k) for s in ["A", "B", "C"] for k in ["1", "2"]]
+        done = sorted(e for e in events if e[0] == "done")
+        assert done == [("done", "A", 2, 0), ("done", "B", 2, 0), ("done", "C", 2, 0)]
+        assert sum(1 for e in events if e[0] == "progress") == 6
+
+    def test_crashed_site_is_reported_without_stopping_others(self):
+        events = run_and_collect(["A"], ["1", "2"], crashing_site)
+
+        assert ("result", "1", "A", "success", {"Name": "partial"}) in events
+        assert ("done", "A", None, None) in events
+        assert any(e[0] == "log" and "exited unexpectedly" in e[1] for e in events)
+
+    def test_cancelled_run_does_not_start_pending_sites(self):
+        stop_event = threading.Event()
+        stop_event.set()
+
+        events = run_and_collect(["A", "B", "C"], ["1"], fake_site, stop_event)
+
+        # Every site reports done exactly once, even those never started
+        assert sorted(e[1] for e in events if e[0] == "done") == ["A", "B", "C"]
+
+
+class TestScrapeWorker:
+    """Test cases for the shared worker loop."""
+
+    def make_pool(self):
+        pool = Mock()
+        pool.needs_recycle.return_value = None
+        return pool
+
+    @patch("src.scrapers.executor.workflow_executor.WorkflowExecutor")
+    def test_drains_queue_and_reports_results(self, mock_executor_cls):
+        executor = mock_executor_cls.return_value
+        executor.execute_workflow.side_effect = [
+            {"success": True, "results": {"Name": "Dog Food"}},
+            {"success": True, "results": {}},
+            {"success": False},
+            {"success": True, "results": {"no_results_found": True}},
+        ]
+        work_queue = SKUWorkQueue("Test", ["1", "2", "3", "4"])
+        on_outcome = Mock()
+        on_progress = Mock()
+
+        success, failed = scrape_worker(
+            SimpleNamespace(name="Test"),
+            "Main",
+            self.make_pool(),
+            work_queue,
+            Mock(),
+            Mock(),
+            on_outcome,
+            on_progress,
+        )
+
+        assert (success, failed) == (1, 3)
+        assert on_outcome.call_args_list == [
+            call("1", "Test", "success", {"Name": "Dog Food"}),
+            call("2", "Test", "no_result", None),
+            call("3", "Test", "failed", None),
+            call("4", "Test", "no_result", {"no_results_found": True}),
+        ]
+        assert on_progress.call_count == 4
+        assert work_queue.snapshot()["completed"] == 4
+
+    @patch("src.scrapers.executor.workflow_executor.WorkflowExecutor")
+    def test_stops_when_cancelled(self, mock_executor_cls):
+        stop_event = threading.Event()
+        stop_event.set()
+        work_queue = SKUWorkQueue("Test", ["1", "2"])
+
+        result = scrape_worker(
+            SimpleNamespace(name="Test"),
+            "Main",
+            self.make_pool(),
+            work_queue,
+            Mock(),
+            Mock(),
+            Mock(),
+            Mock(),
+            stop_event,
+        )
+
+        assert result == (0, 0)
+        assert work_queue.depth == 2
+        mock_executor_cls.return_value.execute_workflow.assert_not_called()
+
+    @patch("src.scrapers.executor.workflow_executor.WorkflowExecutor")
+    def test_skips_skus_found_elsewhere(self, mock_executor_cls):
+        mock_executor_cls.return_value.execute_workflow.return_value = {"success": False}
+        work_queue = SKUWorkQueue("Test", ["1", "2"])
+        on_outcome = Mock()
+
+        result = scrape_worker(
+            SimpleNamespace(name="Test"),
+            "Main",
+            self.make_pool(),
+            work_queue,
+            Mock(),
+            Mock(),
+            on_outcome,
+            Mock(),
+            skip_sku=lambda sku: sku == "1",
+        )
+
+        assert result == (0, 1)
+        assert on_outcome.call_args_list == [
+            call("1", "Test", "skipped", None),
+            call("2", "Test", "failed", None),
+        ]
+        assert mock_executor_cls.return_value.execute_workflow.call_count == 1
+        assert work_queue.snapshot()["completed"] == 2
+
+    @patch("src.scrapers.executor.workflow_executor.WorkflowExecutor")
+    def test_takes_a_controller_slot_per_sku(self, mock_executor_cls):
+        mock_executor_cls.return_value.execute_workflow.return_value = {"success": False}
+        controller = Mock()
+        controller.acquire.return_value = True
+        work_queue = SKUWorkQueue("Test", ["1", "2"])
+
+        result = scrape_worker(
+            SimpleNamespace(name="Test"),
+            "Main",
+            self.make_pool(),
+            work_queue,
+            Mock(),
+            Mock(),
+            Mock(),
+            Mock(),
+            controller=controller,
+        )
+
+        assert result == (0, 2)
+        assert controller.record.call_count == 2
+        # One slot per SKU plus the one given back when the queue ran dry
+        assert controller.acquire.call_count == controller.release.call_count == 3
+        analytics = mock_executor_cls.call_args.kwargs["failure_analytics"]
+        assert analytics is controller.failure_analytics
+
+    @patch("src.scrapers.executor.workflow_executor.WorkflowExecutor")
+    def test_sku_goes_back_to_the_queue_when_recycling_fails(self, mock_executor_cls):
+        pool = self.make_pool()
+        pool.needs_recycle.return_value = "crashed"
+        pool.recycle.side_effect = RuntimeError("no browser")
+        work_queue = SKUWorkQueue("Test", ["1", "2"])
+
+        result = scrape_worker(
+            SimpleNamespace(name="Test"),
+            "Main",
+            pool,
+            work_queue,
+            Mock(),
+            Mock(),
+            Mock(),
+            Mock(),
+        )
+
+        assert result == (0, 0)
+        assert work_queue.drain() == ["1", "2"]
+        assert work_queue.in_flight == 0
+        mock_executor_cls.return_value.execute_workflow.assert_not_called()
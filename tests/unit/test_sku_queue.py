@@ -0,0 +1,88 @@
+"""
+Unit tests for the shared SKU work queue.
+"""
+
+import threading
+import time
+
+from src.scrapers.sku_queue import SKUWorkQueue
+
+
+class TestSKUWorkQueue:
+    """Test cases for SKUWorkQueue."""
+
+    def test_hands_out_skus_in_order(self):
+        queue = SKUWorkQueue("test", ["A", "B", "C"])
+
+        assert queue.get("W1") == "A"
+        assert queue.get("W2") == "B"
+        assert queue.get("W1") == "C"
+        assert queue.get("W2") is None
+
+    def test_tracks_depth_in_flight_and_completed(self):
+        queue = SKUWorkQueue("test", ["A", "B", "C"])
+
+        queue.get("W1")
+        queue.get("W2")
+        assert queue.snapshot() == {
+            "scraper": "test",
+            "total": 3,
+            "depth": 1,
+            "in_flight": 2,
+            "completed": 0,
+        }
+
+        queue.task_done("W1")
+        assert queue.in_flight == 1
+        assert queue.depth == 1
+        assert queue.snapshot()["completed"] == 1
+
+    def test_task_done_without_work_is_ignored(self):
+        queue = SKUWorkQueue("test", ["A"])
+
+        queue.task_done("W1")
+        assert queue.completed == 0
+
+    def test_drain_returns_unclaimed_skus(self):
+        queue = SKUWorkQueue("test", ["A", "B", "C"])
+        queue.get("W1")
+
+        assert queue.drain() == ["B", "C"]
+        assert queue.depth == 0
+        assert queue.get("W2") is None
+
+    def test_worker_can_hold_several_skus(self):
+        queue = SKUWorkQueue("test", ["A", "B", "C"])
+        queue.get("W1")
+        queue.get("W1")
+        queue.get("W1")
+
+        queue.task_done("W1", "B")
+        queue.requeue("W1", "C")
+
+        assert queue.in_flight == 1
+        assert queue.completed == 1
+        assert queue.get("W2") == "C"
+
+    def test_fast_worker_steals_work_from_slow_worker(self):
+        queue = SKUWorkQueue("test", [str(i) for i in range(20)])
+        processed: dict[str, list[str]] = {"slow": [], "fast": []}
+
+        def worker(worker_id, delay):
+            while (sku := queue.get(worker_id)) is not None:
+                time.sleep(delay)
+                processed[worker_id].append(sku)
+                queue.task_done(worker_id)
+
+        threads = [
+            threading.Thread(target=worker, args=("slow", 0.05)),
+            threading.Thread(target=worker, args=("fast", 0.001)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(processed["slow"] + processed["fast"], key=int) == [str(i) for i in range(20)]
+        assert len(processed["fast"]) > len(processed["slow"])
+        assert queue.completed == 20
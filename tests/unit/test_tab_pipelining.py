@@ -0,0 +1,125 @@
+"""
+Unit tests for pipelining SKUs through several tabs of one browser.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, call, patch
+
+import pytest
+
+from src.core.anti_detection_manager import AntiDetectionConfig
+from src.scrapers.executor.workflow_executor import WorkflowExecutor
+from src.scrapers.models.config import ScraperConfig, WorkflowStep
+from src.scrapers.site_runner import scrape_worker
+from src.scrapers.sku_queue import SKUWorkQueue
+
+SEARCH_URL = "https://shop.example.com/search?q={sku}"
+
+
+def make_executor(workflows, tabs_per_browser=3, anti_detection=None):
+    browser = Mock(spec=["driver", "quit", "open_tabs", "switch_tab", "prefetch"])
+    browser.open_tabs.side_effect = lambda count: [f"T{i}" for i in range(count)]
+    config = ScraperConfig(
+        name="shop",
+        base_url="https://shop.example.com",
+        workflows=workflows,
+        tabs_per_browser=tabs_per_browser,
+        anti_detection=anti_detection,
+    )
+    return WorkflowExecutor(config, browser=browser)
+
+
+class TestExecutorTabs:
+    """Test cases for WorkflowExecutor.prefetch and tab selection."""
+
+    @pytest.fixture
+    def executor(self):
+        return make_executor(
+            [
+                WorkflowStep(action="conditional_click", params={"selector": "#cookies"}),
+                WorkflowStep(action="navigate", params={"url": SEARCH_URL}),
+            ]
+        )
+
+    def test_workflow_runs_in_the_tab_its_page_loads_in(self, executor):
+        assert executor.open_tabs() == 3
+        assert executor.prefetch({"sku": "1"}) is True
+        assert executor.prefetch({"sku": "2"}) is True
+        executor.browser.prefetch.assert_called_with("https://shop.example.com/search?q=2")
+
+        with patch.object(executor, "_run_workflow", return_value={"success": True}):
+            executor.execute_workflow({"sku": "2"}, quit_browser=False)
+            executor.execute_workflow({"sku": "3"}, quit_browser=False)
+
+        # SKU 2 loads in T1; SKU 3 was not prefetched and takes a free tab
+        assert executor.browser.switch_tab.call_args_list[-2:] == [call("T1"), call("T1")]
+        assert executor.prefetch({"sku": "4"}) is True
+        assert executor.prefetch({"sku": "5"}) is True
+        assert executor.prefetch({"sku": "6"}) is False  # Every tab is loading a SKU
+
+    def test_no_prefetch_when_an_earlier_step_leaves_the_page(self):
+        executor = make_executor(
+            [
+                WorkflowStep(action="login", params={"url": "https://shop.example.com/login"}),
+                WorkflowStep(action="navigate", params={"url": SEARCH_URL}),
+            ]
+        )
+        executor.open_tabs()
+
+        assert executor.prefetch({"sku": "1"}) is False
+        executor.browser.prefetch.assert_not_called()
+
+    def test_single_tab_config_is_not_pipelined(self):
+        executor = make_executor([], tabs_per_browser=1)
+
+        assert executor.open_tabs() == 1
+        executor.browser.open_tabs.assert_not_called()
+
+    def test_anti_detection_without_rate_limiting_is_pipelined(self):
+        config = AntiDetectionConfig(enable_rate_limiting=False, enable_session_rotation=False)
+        executor = make_executor([], anti_detection=config)
+
+        assert executor.anti_detection_manager is not None
+        assert executor.open_tabs() == 3
+
+    def test_rate_limiting_keeps_one_tab(self, caplog):
+        config = AntiDetectionConfig(enable_rate_limiting=True, enable_session_rotation=False)
+        executor = make_executor([], anti_detection=config)
+
+        assert executor.open_tabs() == 1
+        executor.browser.open_tabs.assert_not_called()
+        assert "tabs_per_browser=3 ignored" in caplog.text
+
+
+class TestPipelinedWorker:
+    """Test cases for scrape_worker with several tabs."""
+
+    @patch("src.scrapers.executor.workflow_executor.WorkflowExecutor")
+    def test_next_skus_load_while_one_is_scraped(self, mock_executor_cls):
+        executor = mock_executor_cls.return_value
+        executor.open_tabs.return_value = 2
+        executor.execute_workflow.return_value = {"success": True, "results": {"Name": "x"}}
+        pool = MagicMock()
+        pool.needs_recycle.return_value = None
+        work_queue = SKUWorkQueue("Test", ["1", "2", "3"])
+
+        result = scrape_worker(
+            SimpleNamespace(name="Test"), "W1", pool, work_queue, Mock(), Mock(), Mock(), Mock()
+        )
+
+        assert result == (3, 0)
+        order = [
+            (c[0], (c.kwargs.get("context") or c.args[0])["sku"])
+            for c in executor.method_calls
+            if c[0] in ("prefetch", "execute_workflow")
+        ]
+        assert order == [
+            ("prefetch", "1"),
+            ("prefetch", "2"),
+            ("execute_workflow", "1"),
+            ("prefetch", "3"),
+            ("execute_workflow", "2"),
+            ("execute_workflow", "3"),
+        ]
+        assert work_queue.snapshot()["completed"] == 3
+        assert work_queue.in_flight == 0
@@ -950,3 +950,74 @@ class TestWorkflowExecutor:
                     assert (
                         call_args[1]["context"]["failure_details"]["no_results_indicated"] is True
                     )
+
+
+class TestFastMiss:
+    """Test cases for looking up optional elements without the implicit wait."""
+
+    def record_waits(self, mock_browser):
+        """Record implicit-wait changes and lookups on the mock driver in order."""
+        calls = []
+        driver = mock_browser.driver
+        driver.implicitly_wait.side_effect = lambda seconds: calls.append(("wait", seconds))
+
+        def find_element(by, value):
+            calls.append(("find", value))
+            if value == ".upc":
+                raise NoSuchElementException(value)
+            return Mock(text=" value ")
+
+        def find_elements(by, value):
+            calls.append(("find", value))
+            return []
+
+        driver.find_element.side_effect = find_element
+        driver.find_elements.side_effect = find_elements
+        return calls
+
+    def test_optional_selectors_skip_implicit_wait(
+        self, sample_config, mock_create_browser, mock_browser
+    ):
+        """Only optional fields are looked up with the implicit wait disabled."""
+        sample_config.selectors.append(
+            SelectorConfig(name="upc", selector=".upc", attribute="text", optional=True)
+        )
+        executor = WorkflowExecutor(sample_config, headless=True)
+        calls = self.record_waits(mock_browser)
+
+        executor._execute_step(
+            WorkflowStep(action="extract", params={"fields": ["product_name", "upc"]})
+        )
+
+        assert calls == [("find", ".product-title"), ("wait", 0), ("find", ".upc"), ("wait", 2)]
+        assert executor.results == {"product_name": "value", "upc": None}
+
+    def test_step_wait_zero_applies_to_every_field(
+        self, sample_config, mock_create_browser, mock_browser
+    ):
+        """wait: 0 on an extract step disables the implicit wait for all fields."""
+        executor = WorkflowExecutor(sample_config, headless=True)
+        calls = self.record_waits(mock_browser)
+
+        executor._execute_step(
+            WorkflowStep(action="extract", params={"fields": ["price", "image_urls"], "wait": 0})
+        )
+
+        assert ("find", ".price") in calls
+        assert calls[0] == ("wait", 0)
+        assert calls[-1] == ("wait", 2)
+        assert executor.results == {"price": "value", "image_urls": []}
+
+    def test_conditional_click_wait_zero_checks_once(
+        self, sample_config, mock_create_browser, mock_browser
+    ):
+        """conditional_click with wait: 0 checks the page once instead of polling."""
+        executor = WorkflowExecutor(sample_config, headless=True)
+        calls = self.record_waits(mock_browser)
+
+        with patch("src.scrapers.executor.workflow_executor.WebDriverWait") as mock_wait:
+            executor._action_conditional_click({"selector": "#sp-cc-accept", "wait": 0})
+
+        mock_wait.assert_not_called()
+        assert calls == [("wait", 0), ("find", "#sp-cc-accept"), ("wait", 2)]
+        mock_browser.driver.find_element.assert_not_called()